@@ -11,15 +11,59 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import inspect
+import json
 import time
 from types import UnionType
-from typing import get_args, get_origin
+from typing import NamedTuple, get_args, get_origin
 
 import wrapt
 from assertionengine import AssertionOperator
 
+from .generated.playwright_pb2 import Request
 from .utils import logger
 
+NODE_POLLED_OPERATORS = {
+    AssertionOperator["=="],
+    AssertionOperator["!="],
+    AssertionOperator["<"],
+    AssertionOperator[">"],
+    AssertionOperator["<="],
+    AssertionOperator[">="],
+    AssertionOperator["*="],
+    AssertionOperator["not contains"],
+    AssertionOperator["^="],
+    AssertionOperator["$="],
+    AssertionOperator["matches"],
+}
+
+# Operators whose check in Node.js is the same as in the library when the value
+# and the expected value are strings, so a failure there needs no retries here.
+NODE_VERDICT_OPERATORS = {
+    AssertionOperator["=="],
+    AssertionOperator["!="],
+    AssertionOperator["*="],
+    AssertionOperator["not contains"],
+    AssertionOperator["^="],
+    AssertionOperator["$="],
+}
+
+
+class NodePoll(NamedTuple):
+    tries: int
+    # The assertion failed in Node.js with a check known to agree with the library.
+    failed: bool
+
+
+def _node_failure_is_final(response, operator, expected) -> bool:
+    if response.status != "failed" or operator not in NODE_VERDICT_OPERATORS:
+        return False
+    try:
+        value = json.loads(response.value)
+    except ValueError:
+        return False
+    return isinstance(value, str) and isinstance(expected, str)
+
 
 def assertion_operator_is_set(wrapped, args, kwargs):
     assertion_operator = None
@@ -40,6 +84,65 @@ def assertion_operator_is_set(wrapped, args, kwargs):
     return assertion_operator
 
 
+def _poll_on_node(wrapped, instance, args, kwargs, *, timeout: float, retry_for: float):
+    """Retry the assertion of a getter marked with `polled_on_node` in the Node side.
+
+    Returns None when the assertion can only be done by the library, because
+    of its operator, an assertion formatter or presenter mode. Raises the error
+    of the getter when its last try failed.
+    """
+    getter = getattr(wrapped, "node_assertion_getter", None)
+    library = instance.library
+    if (
+        getter is None
+        or not library.poll_assertions_in_node
+        or library.presenter_mode
+        or instance.get_assertion_formatter(instance.method_to_kw_str(wrapped))
+    ):
+        return None
+    call = inspect.signature(wrapped).bind(*args, **kwargs)
+    call.apply_defaults()
+    params = call.arguments
+    if (
+        params.get("assertion_operator") not in NODE_POLLED_OPERATORS
+        or params.get("text_type") is not None
+    ):
+        return None
+    try:
+        expected = json.dumps(params.get("assertion_expected"))
+    except TypeError:
+        return None
+    argument = params.get(getter.argument) if getter.argument else None
+    with instance.playwright.grpc_channel() as stub:
+        response = stub.AssertPoll(
+            Request().AssertPoll(
+                getter=getter.name,
+                selector=instance.resolve_selector(params["selector"]),
+                strict=instance.strict_mode,
+                argument=str(argument or ""),
+                pseudo=str(params.get("pseudo_element") or ""),
+                operator=params["assertion_operator"].value,
+                expected=expected,
+                timeout=int(timeout * 1000),
+                retryFor=int(retry_for * 1000),
+                polling=library.polling_strategy.name,
+            )
+        )
+    logger.debug(response.log)
+    if response.status == "error":
+        raise AssertionError(response.error)
+    if response.status == "unsupported":
+        return None
+    return NodePoll(
+        response.tries,
+        _node_failure_is_final(
+            response,
+            params["assertion_operator"],
+            params.get("assertion_expected"),
+        ),
+    )
+
+
 @wrapt.decorator
 def with_assertion_polling(wrapped, instance, args, kwargs):
     start = time.time()
@@ -47,9 +150,25 @@ def with_assertion_polling(wrapped, instance, args, kwargs):
     retry_assertions_until = instance.retry_assertions_for / 1000
     retries_start: float | None = None
     last_error: AssertionError | None = None
-    tries = 1
+    poller = instance.poller()
+    node_tries = 0
+    retried_on_node = False
     try:
         logger.stash_this_thread()
+        polled = _poll_on_node(
+            wrapped,
+            instance,
+            args,
+            kwargs,
+            timeout=timeout,
+            retry_for=retry_assertions_until,
+        )
+        if polled is not None:
+            # The retries are done, this call only builds the return value or the
+            # error. A value which passed in Node.js but not here, or failed there
+            # with a check which may differ from the library's, is retried as usual.
+            node_tries = polled.tries
+            retried_on_node = polled.failed
         while True:
             if retries_start is not None:
                 elapsed = time.time() - start
@@ -57,19 +176,27 @@ def with_assertion_polling(wrapped, instance, args, kwargs):
                 if elapsed >= timeout or elapsed_retries >= retry_assertions_until:
                     raise last_error  # type: ignore[misc]
             try:
-                return wrapped(*args, **kwargs)
+                result = wrapped(*args, **kwargs)
             except AssertionError as e:
+                poller.record(passed=False)
                 last_error = e
                 if retries_start is None:
                     retries_start = time.time()
                 elapsed = time.time() - start
                 elapsed_retries = time.time() - retries_start
-                if elapsed >= timeout or elapsed_retries >= retry_assertions_until:
+                if (
+                    retried_on_node
+                    or elapsed >= timeout
+                    or elapsed_retries >= retry_assertions_until
+                ):
                     raise e
-                tries += 1
-                if timeout - elapsed > 0.01:  # noqa: PLR2004
-                    time.sleep(0.01)
+                poller.wait(
+                    min(timeout - elapsed, retry_assertions_until - elapsed_retries)
+                )
                 logger.clear_thread_stash()
+            else:
+                poller.record(passed=True)
+                return result
     finally:
         logger.flush_and_delete_thread_stash()
         if retry_assertions_until and assertion_operator_is_set(wrapped, args, kwargs):
@@ -77,7 +204,8 @@ def with_assertion_polling(wrapped, instance, args, kwargs):
             logger.debug(
                 f"Assertion polling statistics:\n"
                 f"First element asserted in: {(retries_start or now) - start} seconds\n"
-                f"Total tries: {tries}\n"
+                f"{poller.statistics()}\n"
+                f"Tries in Node.js: {node_tries}\n"
                 f"Elapsed time in retries {now - (retries_start or now)} seconds"
             )
 
@@ -85,3 +213,23 @@ def with_assertion_polling(wrapped, instance, args, kwargs):
 def assertion_formatter_used(func):
     func.assertion_formatter_used = True
     return func
+
+
+class NodeAssertionGetter:
+    def __init__(self, name: str, argument: str | None = None):
+        self.name = name
+        self.argument = argument
+
+
+def polled_on_node(getter: str, argument: str | None = None):
+    """Marks a getter whose assertion the Node side can retry, see `_poll_on_node`.
+
+    ``getter`` is the getter name of ``Request.AssertPoll`` and ``argument`` the
+    keyword argument sent with it, like the property name.
+    """
+
+    def decorator(func):
+        func.node_assertion_getter = NodeAssertionGetter(getter, argument)
+        return func
+
+    return decorator
@@ -25,7 +25,8 @@ from typing import TYPE_CHECKING, Any
 
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 
-from ..generated.playwright_pb2 import Response
+from ..generated.playwright_pb2 import Request, Response
+from ..polling import Poller
 from ..utils import SettingsStack, get_variable_value, logger
 from ..utils.data_types import (
     AutoClosingLevel,
@@ -120,6 +121,17 @@ class LibraryComponent:
     def method_to_kw_str(self, keyword: Callable) -> str:
         return self.library._assertion_formatter.method_to_kw_str(keyword)
 
+    def poller(self) -> Poller:
+        """New `Poller` for one retry loop, using the ``polling_strategy`` of the library."""
+        return Poller(self.library.polling_strategy, self._wait_for_page_change)
+
+    def _wait_for_page_change(self, kind: str, timeout: float) -> bool:
+        with self.playwright.grpc_channel() as stub:
+            response = stub.WaitForPageChange(
+                Request().PageChange(kind=kind, timeout=int(timeout * 1000))
+            )
+        return response.body
+
     @property
     def timeout(self) -> float:
         return self.library.scope_stack["timeout"].get()
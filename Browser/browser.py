@@ -20,8 +20,9 @@ import string
 import sys
 import time
 import types
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from concurrent.futures._base import Future
+from contextlib import closing
 from copy import copy
 from datetime import timedelta
 from pathlib import Path
@@ -40,6 +41,7 @@ from robotlibcore import DynamicCore, PluginParser  # type: ignore
 from .base import ContextCache, LibraryComponent
 from .generated.playwright_pb2 import Request, Response
 from .keywords import (
+    Batching,
     Clock,
     Control,
     Cookie,
@@ -56,6 +58,7 @@ from .keywords import (
     Pdf,
     PlaywrightState,
     Promises,
+    Routing,
     RunOnFailureKeywords,
     StrictMode,
     Waiter,
@@ -65,10 +68,12 @@ from .keywords.crawling import Crawling
 from .playwright import Playwright
 from .python_arguments import add_argument_conversion
 from .utils import (
+    SPILL_THRESHOLD_BYTES,
     AutoClosingLevel,
     PlaywrightLogTypes,
     Scope,
     SettingsStack,
+    StreamedBody,
     get_normalized_keyword,
     keyword,
     logger,
@@ -81,15 +86,30 @@ from .utils.data_types import (
     HighLightElement,
     KeywordCallStackEntry,
     LambdaFunction,
+    PollingStrategy,
     RegExp,
     RobotTypeConverter,
-    SelectionType,
     SupportedBrowsers,
     TracingGroupMode,
 )
 from .version import __version__ as VERSION
 
 
+def _read_js_keyword_responses(responses: Iterable, spill_threshold: int) -> Any:
+    with closing(StreamedBody(spill_threshold)) as body:
+        last_json = ""
+        for response in responses:
+            logger.info(response.log)
+            body.write(response.bodyPart)
+            if response.json:
+                last_json = response.json
+        if body.size:
+            return body.json()
+    if not last_json:
+        return None
+    return json.loads(last_json)
+
+
 class _RFContextTracker:
     def __init__(self) -> None:
         self._suite_stack: list[tuple[str, str]] = []
@@ -309,7 +329,8 @@ class Browser(DynamicCore):
     Keywords taking ``assertion_operator`` <`AssertionOperator`> and
     ``assertion_expected`` can assert on the value they return, and still return
     it. An assertion retries until it passes or ``retry_assertions_for`` expires;
-    see `Importing` for that setting, which defaults to 1 second.
+    see `Importing` for that setting, which defaults to 1 second. The wait
+    between tries is set with ``polling_strategy``, see `PollingStrategy`.
 
     %ASSERTION_TABLE%
 
@@ -371,10 +392,26 @@ class Browser(DynamicCore):
     ``ROBOT_FRAMEWORK_BROWSER_NODE_PORT`` environment variable, for example
     ``ROBOT_FRAMEWORK_BROWSER_NODE_PORT=PORT pabot ..``.
 
+    On Linux and macOS a Node.js process started by the library listens on a unix
+    domain socket in the ``browser`` output folder instead of a TCP port, unless
+    ``playwright_process_host`` names a network interface such as ``0.0.0.0``.
+    A shared process can do the same: give ``unix:/path/to/socket`` as the PORT
+    argument of ``index.js`` and as the value of ``playwright_process_port`` or
+    ``ROBOT_FRAMEWORK_BROWSER_NODE_PORT``.
+
     What this costs, how to run it under Pabot, and how to pass Node flags such as
     ``--inspect``:
     https://robotframework-browser.org/docs/operations/node-process
 
+    Alternatively ``rfbrowser pool`` keeps Node.js processes with a browser already
+    launched, and each run pointed to it with the ``ROBOT_FRAMEWORK_BROWSER_POOL``
+    environment variable leases one of them for itself, see ``rfbrowser pool --help``.
+
+    Setting the ``ROBOT_FRAMEWORK_BROWSER_SESSION_STREAM`` environment variable to
+    ``1`` sends the calls of all keywords over one long lived stream to the Node.js
+    process, instead of a separate gRPC call per keyword. This lowers the overhead
+    of each keyword, most when the Node.js process runs on another machine.
+
     = Scope Setting =
 
     Some keywords which manipulates library settings have a scope argument.
@@ -429,6 +466,7 @@ class Browser(DynamicCore):
     | ``ROBOT_FRAMEWORK_BROWSER_NODE_PORT``          | Port number for connecting to an existing node process. This is an alternative to ``playwright_process_port`` import argument. |
     | ``ROBOT_FRAMEWORK_BROWSER_NODE_COVERAGE``      | If set to ``1``, will collect code coverage for the node process. This must not be used in production environments and is not supported on Windows. |
     | ``ROBOT_FRAMEWORK_BROWSER_NODE_DEBUG_OPTIONS`` | Debug options for the node process. This is a comma-separated list of arguments, for example ``--inspect``. This must not be used in production environments. |
+    | ``ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY``  | How many contexts are closed at the same time by `Close Context`, `Close Browser`, `Close All Browsers` and automatic closing. Defaults to ``4``. |
 
     Which of these to prefer over an import parameter, and how they behave with
     BrowserBatteries:
@@ -456,12 +494,17 @@ class Browser(DynamicCore):
         jsextension: list[str] | str | None = None,
         language: str | None = None,
         playwright_process_host: str | None = None,
-        playwright_process_port: int | None = None,
+        playwright_process_port: int | str | None = None,
         plugins: list[str] | str | None = None,
+        poll_assertions_in_node: bool = False,
+        polling_strategy: PollingStrategy = PollingStrategy.fixed,
+        promise_timeout: timedelta | None = None,
         retry_assertions_for: timedelta = timedelta(seconds=1),
         run_on_failure: str = "Take Screenshot  fail-screenshot-{index}",
+        run_on_failure_in_background: bool = False,
         selector_prefix: str | None = None,
         show_keyword_call_banner: bool | None = None,
+        streamed_body_memory_limit: int = SPILL_THRESHOLD_BYTES,
         strict: bool = True,
         timeout: timedelta = timedelta(seconds=10),
         tracing_group_mode: TracingGroupMode = TracingGroupMode.Full,
@@ -480,10 +523,15 @@ class Browser(DynamicCore):
         | ``playwright_process_host``       | Hostname / Host address which should be used when spawning the Playwright process. Defaults to 127.0.0.1. |
         | ``playwright_process_port``       | Experimental reusing of playwright process. ``playwright_process_port`` is preferred over environment variable ``ROBOT_FRAMEWORK_BROWSER_NODE_PORT``. See `Experimental: Re-using same node process` for more details. |
         | ``plugins``                       | Allows extending the Browser library with external Python classes, which can add keywords and modify some internal behaviour without forking the library. Can be a single class/module, a comma-separated list or a real list of strings. See https://robotframework-browser.org/docs/extending/python-plugins |
+        | ``poll_assertions_in_node``       | If set to ``True``, `Get Text`, `Get Property`, `Get Attribute`, `Get Element Count` and `Get Style` retry their assertion in the Node.js process, which tries again as soon as the page changes instead of calling the keyword every 10 milliseconds. Assertions with ``validate``, ``then`` or an assertion formatter are still retried by the library. Defaults to ``False``. |
+        | ``polling_strategy``              | How long assertions, `Wait For Condition`, `Wait For Elements State` and `Wait For Function` wait before trying again. Default is ``fixed``, for more details, see `PollingStrategy`. |
+        | ``promise_timeout``               | Maximum time a promise created with `Promise To`, `Promise To Wait For Download` or `Promise To Upload File` may take. When it is reached, the calls of the promise to the Playwright process are cancelled and the promise fails. Defaults to ``None``, which means promises run until the keyword they run finishes. See `Get Promise Statistics` for the number of cancelled promises. |
         | ``retry_assertions_for``          | Timeout for retrying assertions on keywords before failing the keywords. This timeout starts counting from the first failure. Global ``timeout`` will still be in effect. This allows stopping execution faster to assertion failure when element is found fast. |
         | ``run_on_failure``                | Sets the keyword to execute in case of a failing Browser keyword. It can be the name of any keyword. If the keyword has arguments those must be separated with two spaces for example ``My keyword \\ arg1 \\ arg2``. If no extra action should be done after a failure, set it to ``None`` or any other robot falsy value. Run on failure is not applied when library methods are executed directly from Python. |
+        | ``run_on_failure_in_background``  | If set to ``True`` and the ``run_on_failure`` keyword is `Take Screenshot`, the failing keyword only waits until the page is captured. Saving the image, or encoding it for embedding, is done in the background and the screenshots are logged in order at the end of the test or suite. Defaults to ``False``. |
         | ``selector_prefix``               | Prefix for all selectors. This is useful when you need to use add an iframe selector before each selector. |
         | ``show_keyword_call_banner``      | If set to ``True``, will show a banner with the keyword name and arguments before the keyword is executed at the bottom of the page. If set to ``False``, will not show the banner. If set to None, which is the default, will show the banner only if the presenter mode is enabled. `Get Page Source` and `Take Screenshot` will not show the banner, because that could negatively affect your test cases/tasks. This feature may be super helpful when you are debugging your tests and using tracing from `New Context` or `Video recording` features. |
+        | ``streamed_body_memory_limit``    | Size in bytes up to which a response body streamed from the Playwright process, like the body of `Wait For Response`, `HTTP` or a JavaScript extension keyword, is collected in memory. A larger body is collected in a temporary file instead. ``0`` keeps every body in memory. Defaults to 64 MB. |
         | ``strict``                        | If keyword selector points multiple elements and keywords should interact with one element, keyword will fail if ``strict`` mode is true. Strict mode can be changed individually in keywords or by ``Set Strict Mode`` keyword. |
         | ``timeout``                       | Timeout for keywords that operate on elements. The keywords will wait for this time for the element to appear into the page. Defaults to "10s" => 10 seconds. |
         | ``tracing_group_mode``            | Defines how Robot Framework keyword calls are logged in Playwright trace log. Default is `Full`. For more details, see `TracingGroupMode`. |
@@ -502,6 +550,7 @@ class Browser(DynamicCore):
         libraries = [
             self._playwright_state,
             self._browser_control,
+            Batching(self),
             Cookie(self),
             Clock(self),
             Credential(self),
@@ -515,6 +564,7 @@ class Browser(DynamicCore):
             LocatorHandler(self),
             Network(self),
             Pdf(self),
+            Routing(self),
             RunOnFailureKeywords(self),
             StrictMode(self),
             Promises(self),
@@ -535,6 +585,11 @@ class Browser(DynamicCore):
         self._playwright: Playwright | None = None
         self._auto_closing_level = auto_closing_level
         self.auto_delete_passed_tracing = auto_delete_passed_tracing
+        self.poll_assertions_in_node = poll_assertions_in_node
+        self.polling_strategy = polling_strategy
+        self.promise_timeout = promise_timeout
+        self.streamed_body_memory_limit = streamed_body_memory_limit
+        self.run_on_failure_in_background = run_on_failure_in_background
         # Parsing needs keywords to be discovered.
         self.external_browser_executable: dict[SupportedBrowsers, str] = (
             external_browser_executable or {}
@@ -554,7 +609,8 @@ class Browser(DynamicCore):
             self._plugin_keywords = []
         self.presenter_mode = enable_presenter_mode
         self.tracing_group_mode = tracing_group_mode
-        self._execution_stack: list[dict] = []
+        # Ids of the suites and tests whose contexts and pages are closed when they end.
+        self._execution_stack: list[str] = []
         self._running_on_failure_keyword = False
         self.pause_on_failure: set[str] = set()
         self._unresolved_promises: set[Future] = set()
@@ -721,13 +777,11 @@ class Browser(DynamicCore):
             if arg
         ]
         argument_names_and_default_values_texts = []
-        arg_set_texts = []
+        arg_value_texts = []
         for item in argument_names_and_vals:
             arg_name = item[0]
-            if arg_name in ["logger", "playwright", "page", "context", "browser"]:
-                arg_set_texts.append(f'("{arg_name}", "RESERVED")')
-            else:
-                arg_set_texts.append(f'("{arg_name}", {arg_name})')
+            if arg_name not in ["logger", "playwright", "page", "context", "browser"]:
+                arg_value_texts.append(arg_name)
                 if arg_name == "args":
                     argument_names_and_default_values_texts.append("*args")
                 elif len(item) > 1:
@@ -740,26 +794,16 @@ class Browser(DynamicCore):
 @keyword
 def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
     \"\"\"{doc}\"\"\"
-    _args_browser_internal = dict()
-    _args_browser_internal["arguments"] = [{", ".join(arg_set_texts)}]
     with self.playwright.grpc_channel() as stub:
         responses = stub.CallExtensionKeyword(
-            Request().KeywordCall(name="{name}", arguments=json.dumps(_args_browser_internal))
+            Request().KeywordCall(
+                name="{name}",
+                positionalArguments=json.dumps([{", ".join(arg_value_texts)}]),
+            )
+        )
+        return _read_js_keyword_responses(
+            responses, self.library.streamed_body_memory_limit
         )
-        body_parts: list[str] = []
-        last_json = ""
-        for response in responses:
-            logger.info(response.log)
-            if response.bodyPart:
-                body_parts.append(response.bodyPart)
-            if response.json:
-                last_json = response.json
-        if body_parts:
-            body = "".join(body_parts)
-            return json.loads(body)
-        if not last_json:
-            return
-        return json.loads(last_json)
 """
         try:
             exec(
@@ -793,20 +837,9 @@ def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
                     name=keyword_name, arguments=json.dumps(_args_browser_internal)
                 )
             )
-            body_parts: list[str] = []
-            last_json = ""
-            for response in responses:
-                logger.info(response.log)
-                if response.bodyPart:
-                    body_parts.append(response.bodyPart)
-                if response.json:
-                    last_json = response.json
-            if body_parts:
-                body = "".join(body_parts)
-                return json.loads(body)
-            if not last_json:
-                return None
-            return json.loads(last_json)
+            return _read_js_keyword_responses(
+                responses, self.streamed_body_memory_limit
+            )
 
     @property
     def outputdir(self) -> str:
@@ -864,14 +897,7 @@ def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
                     logger.trace(f"Removing: {path}")
                     shutil.rmtree(str(path), ignore_errors=True)
         if self._auto_closing_level in [AutoClosingLevel.TEST, AutoClosingLevel.SUITE]:
-            try:
-                self._execution_stack.append(
-                    []  # type: ignore
-                    if self._playwright is None
-                    else self._playwright_state._get_browser_catalog()
-                )
-            except ConnectionError as e:
-                logger.trace(f"Browser._start_suite connection problem: {e}")
+            self._execution_stack.append(attrs["id"])
 
     def _start_test(self, name, attrs):
         self.current_test_id = attrs["id"]
@@ -880,14 +906,7 @@ def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
         self._rf_context.start_test(attrs["id"], attrs.get("longname", name))
         self._playwright_state.set_rf_context(**self._rf_context.context())
         if self._auto_closing_level == AutoClosingLevel.TEST:
-            try:
-                self._execution_stack.append(
-                    []  # type: ignore
-                    if self._playwright is None
-                    else self._playwright_state._get_browser_catalog()
-                )
-            except ConnectionError as e:
-                logger.trace(f"Browser._start_test connection problem: {e}")
+            self._execution_stack.append(attrs["id"])
 
     def _resolve_path(self, attrs: dict) -> Path | None:
         source = (
@@ -1032,6 +1051,7 @@ def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
         if len(self._unresolved_promises) > 0:
             logger.warn(f"Waiting unresolved promises at the end of test '{name}'")
             self.wait_for_all_promises()
+        self._browser_control._log_queued_screenshots()
         if self._auto_closing_level == AutoClosingLevel.TEST:
             if self.presenter_mode:
                 logger.trace("Presenter mode: Wait for 5 seconds before pruning pages")
@@ -1043,6 +1063,7 @@ def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
         self.suite_ids.pop(attrs["id"], None)
         self._rf_context.end_suite()
         self._playwright_state.set_rf_context(**self._rf_context.context())
+        self._browser_control._log_queued_screenshots()
         if self._auto_closing_level in [AutoClosingLevel.TEST, AutoClosingLevel.SUITE]:
             self.execute_auto_closing(name, attrs, "Suite", attrs["status"])
 
@@ -1056,15 +1077,20 @@ def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
         if len(self._execution_stack) == 0:
             logger.trace(f"Browser._end_{typ.lower()} empty execution stack")
             return
+        scope_id = self._execution_stack.pop()
+        if self._playwright is None:
+            return
         try:
-            catalog_before = self._execution_stack.pop()
-            self._playwright_state.open_trace_group(
+            self._playwright_state._close_scope(
+                scope_id,
                 f"Auto Closing    {typ}: {name}",  # noqa: RUF001
                 file=attrs.get("source"),
                 line=attrs.get("lineno", 0),
+                save_trace=not bool(
+                    self.auto_delete_passed_tracing and status == "PASS"
+                ),
+                run_before_unload=self.auto_closing_default_run_before_unload,
             )
-            self._prune_execution_stack(catalog_before, status)
-            self._playwright_state.close_trace_group()
         except AssertionError as e:
             logger.trace(f"{typ}: {name}, End {typ}: {e}")
         except ConnectionError as e:
@@ -1078,54 +1104,6 @@ def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
         for stack in self.scope_stack.values():
             stack.end(scope_id)
 
-    def _prune_execution_stack(self, catalog_before: dict, status: str) -> None:
-        catalog_after = self._playwright_state._get_browser_catalog()
-        ctx_before_ids: list[str] = [
-            c["id"] for b in catalog_before for c in b["contexts"]
-        ]
-        ctx_after_ids: list[str] = [
-            c["id"] for b in catalog_after for c in b["contexts"]
-        ]
-        new_ctx_ids: list[str] = [c for c in ctx_after_ids if c not in ctx_before_ids]
-        for ctx_id in new_ctx_ids:
-            self._playwright_state.open_trace_group(
-                f"Auto Closing Context    {ctx_id}",  # noqa: RUF001
-                None,
-            )
-            self._playwright_state.close_context(
-                ctx_id,
-                SelectionType.ALL,
-                save_trace=not bool(
-                    self.auto_delete_passed_tracing and status == "PASS"
-                ),
-            )
-            self._playwright_state.close_trace_group()
-        pages_before = [
-            (p["id"], c["id"])
-            for b in catalog_before
-            for c in b["contexts"]
-            for p in c["pages"]
-        ]
-        pages_after = [
-            (p["id"], c["id"])
-            for b in catalog_after
-            for c in b["contexts"]
-            for p in c["pages"]
-            if c["id"] not in new_ctx_ids
-        ]
-        new_page_ids = [p for p in pages_after if p not in pages_before]
-        for page_id, ctx_id in new_page_ids:
-            self._playwright_state.open_trace_group(
-                f"Auto Closing Page    {page_id}",  # noqa: RUF001
-                None,
-            )
-            self._playwright_state.close_page(
-                page_id,
-                ctx_id,
-                runBeforeUnload=self.auto_closing_default_run_before_unload,
-            )
-            self._playwright_state.close_trace_group()
-
     def _alter_keyword_error(self, name: str, args: tuple) -> tuple:
         if not (args and isinstance(args, tuple)):
             return args
@@ -1168,7 +1146,10 @@ def {name}(self, {", ".join(argument_names_and_default_values_texts)}):
                     and "filename" not in kwargs
                 ):
                     varargs = (self._failure_screenshot_path(),)
-                self.keywords[self.run_on_failure_keyword.name](*varargs, **kwargs)
+                with self._browser_control.screenshots_in_background(
+                    self.run_on_failure_in_background
+                ):
+                    self.keywords[self.run_on_failure_keyword.name](*varargs, **kwargs)
             else:
                 BuiltIn().run_keyword(
                     self.run_on_failure_keyword.name, *varargs, **kwargs
@@ -0,0 +1,89 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+from collections.abc import Callable
+
+import grpc  # type: ignore
+
+from Browser.generated import playwright_pb2_grpc
+from Browser.generated.playwright_pb2 import Request
+
+from .utils import logger
+
+
+class CatalogFeed:
+    """Browser catalog without page details, kept current by ``WatchBrowserCatalog``.
+
+    The Node.js side sends the catalog once when watching starts and again each
+    time a browser, context or page is opened, closed or activated, so reading
+    it needs no call. A keyword which changes the catalog calls `invalidate`,
+    because its response may arrive before the change is read from the stream.
+    Until the next change arrives, or if the stream is not available, the
+    catalog is fetched with the given function instead.
+    """
+
+    def __init__(self, channel: grpc.Channel):
+        self._lock = threading.Lock()
+        self._catalog: str | None = None
+        self._generation = 0
+        self._changes: list[str] = []
+        self._alive = True
+        stub = playwright_pb2_grpc.PlaywrightStub(channel)
+        self._events = stub.WatchBrowserCatalog(Request.Empty())
+        self._reader = threading.Thread(
+            target=self._read, name="browser-catalog-feed", daemon=True
+        )
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._alive
+
+    def _read(self):
+        try:
+            for event in self._events:
+                with self._lock:
+                    self._catalog = event.json
+                    self._generation += 1
+                    self._changes.extend(
+                        f"{change.kind} {change.id}" for change in event.changes
+                    )
+        except grpc.RpcError:
+            pass
+        with self._lock:
+            self._alive = False
+            self._catalog = None
+
+    def catalog(self, fetch: Callable[[], str]) -> list:
+        with self._lock:
+            catalog, generation = self._catalog, self._generation
+            changes, self._changes = self._changes, []
+        if changes:
+            logger.debug(f"Browser catalog changes: {', '.join(changes)}")
+        if catalog is None:
+            catalog = fetch()
+            with self._lock:
+                if self._alive and self._generation == generation:
+                    self._catalog = catalog
+        return json.loads(catalog)
+
+    def invalidate(self):
+        with self._lock:
+            self._catalog = None
+
+    def close(self):
+        self._events.cancel()
+        self._reader.join(timeout=5)
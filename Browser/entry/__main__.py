@@ -18,6 +18,7 @@ import json
 import shutil
 import subprocess
 import sys
+import tempfile
 import traceback
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -467,6 +468,76 @@ def launch_browser_server(browser, options):
         log("Browser server stopped")
 
 
+@cli.command()
+@click.option(
+    "--size",
+    "-n",
+    type=click.IntRange(1),
+    default=2,
+    show_default=True,
+    help="Number of warm processes kept ready.",
+)
+@click.option(
+    "--browser",
+    "-b",
+    type=click.Choice(("chromium", "firefox", "webkit"), case_sensitive=False),
+    default="chromium",
+    show_default=True,
+    help="Browser launched in each warm process.",
+)
+@click.option(
+    "--headless/--headed",
+    default=True,
+    show_default=True,
+    help="Launch the browsers headless or headed.",
+)
+@click.option(
+    "--directory",
+    "-d",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Registry directory shared with the test runs. Defaults to a new temporary directory.",
+)
+def pool(size: int, browser: str, headless: bool, directory: Path | None):
+    """Keeps warm Playwright processes, with a browser already launched, for test runs to lease.
+
+    Starting the Playwright process and the first browser is a large share of
+    the run time of short suites, especially when many pabot workers start
+    them at the same time. The pool starts them ahead of time.
+
+    \b
+    Example:
+      rfbrowser pool --size 16 --browser chromium --directory /tmp/browser-pool
+
+    \b
+    Point the test runs to the same directory:
+      ROBOT_FRAMEWORK_BROWSER_POOL=/tmp/browser-pool pabot --processes 16 tests
+
+    Each library leases one process for its whole run. A `New Browser` with
+    the same browser and headless setting as the pool reuses the warm browser.
+    A process is used only by one run: when the run ends, or its Python
+    process dies, the pool closes the process and starts a new one. When no
+    warm process is ready, the library starts its own, as it does without
+    the pool.
+    """
+    from ..process_pool import POOL_ENV, ProcessPool  # noqa: PLC0415
+
+    if directory is None:
+        directory = Path(tempfile.mkdtemp(prefix="rfbrowser-pool-"))
+    process_pool = ProcessPool(
+        directory.resolve(), size, SupportedBrowsers[browser], headless
+    )
+    log(
+        f"Starting pool of {size} warm processes, use it with:\n\n{POOL_ENV}={directory.resolve()}\n"
+    )
+    log("Press Ctrl-C to stop the pool")
+    try:
+        process_pool.run()
+    except (KeyboardInterrupt, SystemExit):
+        log("Stopping pool by user request")
+    log("Pool stopped")
+
+
 def convert_options_types(options: list[str], browser_lib: "Browser"):
     from Browser.utils.data_types import RobotTypeConverter  # noqa: PLC0415
 
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: playwright.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'playwright.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10playwright.proto\"\xa6,\n\x07Request\x1a\x07\n\x05\x45mpty\x1a[\n\x0c\x41riaSnapShot\x12\x0f\n\x07locator\x18\x01 \x01(\t\x12\x0e\n\x06strict\x18\x02 \x01(\x08\x12\x0c\n\x04mode\x18\x03 \x01(\t\x12\r\n\x05\x64\x65pth\x18\x04 \x01(\x05\x12\r\n\x05\x62oxes\x18\x05 \x01(\x08\x1a$\n\tClosePage\x12\x17\n\x0frunBeforeUnload\x18\x01 \x01(\x08\x1a\x87\x01\n\nCloseScope\x12\x0f\n\x07scopeId\x18\x01 \x01(\t\x12\x11\n\tsaveTrace\x18\x02 \x01(\x08\x12\x17\n\x0frunBeforeUnload\x18\x03 \x01(\x08\x12\'\n\ntraceGroup\x18\x04 \x01(\x0b\x32\x13.Request.TraceGroup\x12\x13\n\x0b\x63oncurrency\x18\x05 \x01(\r\x1a\x44\n\rCloseContexts\x12\x0b\n\x03ids\x18\x01 \x03(\t\x12\x11\n\tsaveTrace\x18\x02 \x01(\x08\x12\x13\n\x0b\x63oncurrency\x18\x03 \x01(\r\x1a-\n\x0c\x43lockSetTime\x12\x0c\n\x04time\x18\x01 \x01(\x05\x12\x0f\n\x07setType\x18\x02 \x01(\t\x1a\x31\n\x0c\x43lockAdvance\x12\x0c\n\x04time\x18\x01 \x01(\x05\x12\x13\n\x0b\x61\x64vanceType\x18\x02 \x01(\t\x1a\x96\x01\n\rCoverageStart\x12\x14\n\x0c\x63overageType\x18\x01 \x01(\t\x12\x19\n\x11resetOnNavigation\x18\x02 \x01(\x08\x12\x1e\n\x16reportAnonymousScripts\x18\x03 \x01(\x08\x12\x12\n\nconfigFile\x18\x04 \x01(\t\x12\x13\n\x0b\x63overageDir\x18\x05 \x01(\t\x12\x0b\n\x03raw\x18\x06 \x01(\x08\x1ak\n\rCoverageMerge\x12\x14\n\x0cinput_folder\x18\x01 \x01(\t\x12\x15\n\routput_folder\x18\x02 \x01(\t\x12\x0e\n\x06\x63onfig\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x0f\n\x07reports\x18\x05 \x03(\t\x1aY\n\nTraceGroup\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x66ile\x18\x02 \x01(\t\x12\x0c\n\x04line\x18\x03 \x01(\x05\x12\x0e\n\x06\x63olumn\x18\x04 \x01(\x05\x12\x11\n\tcontextId\x18\x05 \x01(\t\x1aU\n\tRFContext\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12\x11\n\ttest_name\x18\x02 \x01(\t\x12\x10\n\x08suite_id\x18\x03 \x01(\t\x12\x12\n\nsuite_name\x18\x04 \x01(\t\x1a\x16\n\x05Label\x12\r\n\x05label\x18\x01 \x01(\t\x1as\n\x0cGetByOptions\x12\x10\n\x08strategy\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x0f\n\x07options\x18\x03 \x01(\t\x12\x0e\n\x06strict\x18\x04 \x01(\x08\x12\x0b\n\x03\x61ll\x18\x05 \x01(\x08\x12\x15\n\rframeSelector\x18\x06 \x01(\t\x1a\xaa\x02\n\x03Pdf\x12\x1b\n\x13\x64isplayHeaderFooter\x18\x01 \x01(\x08\x12\x16\n\x0e\x66ooterTemplate\x18\x02 \x01(\t\x12\x0e\n\x06\x66ormat\x18\x03 \x01(\t\x12\x16\n\x0eheaderTemplate\x18\x04 \x01(\t\x12\x0e\n\x06height\x18\x05 \x01(\t\x12\x11\n\tlandscape\x18\x06 \x01(\x08\x12\x0e\n\x06margin\x18\x07 \x01(\t\x12\x0f\n\x07outline\x18\x08 \x01(\x08\x12\x12\n\npageRanges\x18\t \x01(\t\x12\x0c\n\x04path\x18\n \x01(\t\x12\x19\n\x11preferCSSPageSize\x18\x0b \x01(\x08\x12\x17\n\x0fprintBackground\x18\x0c \x01(\x08\x12\r\n\x05scale\x18\r \x01(\x02\x12\x0e\n\x06tagged\x18\x0e \x01(\x08\x12\r\n\x05width\x18\x0f \x01(\t\x1a_\n\x0c\x45mulateMedia\x12\x13\n\x0b\x63olorScheme\x18\x01 \x01(\t\x12\x14\n\x0c\x66orcedColors\x18\x02 \x01(\t\x12\r\n\x05media\x18\x03 \x01(\t\x12\x15\n\rreducedMotion\x18\x04 \x01(\t\x1aT\n\x11ScreenshotOptions\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0c\n\x04mask\x18\x02 \x01(\t\x12\x0f\n\x07options\x18\x03 \x01(\t\x12\x0e\n\x06strict\x18\x04 \x01(\x08\x1a!\n\nPageSource\x12\x13\n\x0b\x63ompression\x18\x01 \x01(\t\x1aK\n\x0bKeywordCall\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\targuments\x18\x02 \x01(\t\x12\x1b\n\x13positionalArguments\x18\x03 \x01(\t\x1a\x18\n\x08\x46ilePath\x12\x0c\n\x04path\x18\x01 \x01(\t\x1a\x44\n\x0cStorageState\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x11\n\tindexedDB\x18\x02 \x01(\x08\x12\x13\n\x0b\x63redentials\x18\x03 \x01(\x08\x1a`\n\x0fSetStorageState\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x05\x12\x13\n\x0breloadPages\x18\x03 \x01(\t\x12\x19\n\x11navigationTimeout\x18\x04 \x01(\x05\x1a\xa6\x01\n\x0e\x46ileBySelector\x12\x0c\n\x04path\x18\x01 \x03(\t\x12\x10\n\x08selector\x18\x02 \x01(\t\x12\x0e\n\x06strict\x18\x03 \x01(\x08\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x10\n\x08mimeType\x18\x05 \x01(\t\x12\x0e\n\x06\x62uffer\x18\x06 \x01(\t\x12\x10\n\x08\x66ileName\x18\x07 \x01(\t\x12\x11\n\tfileIndex\x18\x08 \x01(\r\x12\x0f\n\x07\x63ontent\x18\t \x01(\x0c\x1a\x8d\x01\n\x17LocatorHandlerAddCustom\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x13\n\x0bnoWaitAfter\x18\x02 \x01(\x08\x12\r\n\x05times\x18\x03 \x01(\t\x12<\n\x0chandlerSpecs\x18\x04 \x03(\x0b\x32&.Request.LocatorHandlerAddCustomAction\x1ag\n\x1dLocatorHandlerAddCustomAction\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\x10\n\x08selector\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\x12\x15\n\roptionsAsJson\x18\x04 \x01(\t\x1a(\n\x14LocatorHandlerRemove\x12\x10\n\x08selector\x18\x01 \x01(\t\x1a\x14\n\x04Json\x12\x0c\n\x04\x62ody\x18\x01 \x01(\t\x1a\x32\n\x12MouseButtonOptions\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\x0c\n\x04json\x18\x02 \x01(\t\x1a,\n\nMouseWheel\x12\x0e\n\x06\x64\x65ltaX\x18\x01 \x01(\x05\x12\x0e\n\x06\x64\x65ltaY\x18\x02 \x01(\x05\x1a>\n\x10KeyboardKeypress\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\x12\r\n\x05\x64\x65lay\x18\x03 \x01(\x05\x1a\x44\n\x14KeyboardInputOptions\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\r\n\x05input\x18\x02 \x01(\t\x12\r\n\x05\x64\x65lay\x18\x03 \x01(\x05\x1a.\n\x07\x42rowser\x12\x0f\n\x07\x62rowser\x18\x01 \x01(\t\x12\x12\n\nrawOptions\x18\x02 \x01(\t\x1aH\n\x07\x43ontext\x12\x12\n\nrawOptions\x18\x01 \x01(\t\x12\x16\n\x0e\x64\x65\x66\x61ultTimeout\x18\x02 \x01(\x05\x12\x11\n\ttraceFile\x18\x03 \x01(\t\x1a\x63\n\x11PersistentContext\x12\x0f\n\x07\x62rowser\x18\x01 \x01(\t\x12\x12\n\nrawOptions\x18\x02 \x01(\t\x12\x16\n\x0e\x64\x65\x66\x61ultTimeout\x18\x03 \x01(\x05\x12\x11\n\ttraceFile\x18\x04 \x01(\t\x1a\x32\n\x0bPermissions\x12\x13\n\x0bpermissions\x18\x01 \x03(\t\x12\x0e\n\x06origin\x18\x02 \x01(\t\x1a*\n\x03Url\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x16\n\x0e\x64\x65\x66\x61ultTimeout\x18\x02 \x01(\x05\x1a\\\n\x0f\x44ownloadOptions\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x15\n\rwaitForFinish\x18\x03 \x01(\x08\x12\x17\n\x0f\x64ownloadTimeout\x18\x04 \x01(\x05\x1a\x18\n\nDownloadID\x12\n\n\x02id\x18\x01 \x01(\t\x1a:\n\nUrlOptions\x12\x19\n\x03url\x18\x01 \x01(\x0b\x32\x0c.Request.Url\x12\x11\n\twaitUntil\x18\x02 \x01(\t\x1a/\n\rPageLoadState\x12\r\n\x05state\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x05\x1aS\n\x0e\x43onnectBrowser\x12\x0f\n\x07\x62rowser\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x12\n\nconnectCDP\x18\x03 \x01(\x08\x12\x0f\n\x07timeout\x18\x04 \x01(\x05\x1a:\n\tTextInput\x12\r\n\x05input\x18\x01 \x01(\t\x12\x10\n\x08selector\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\x08\x1a\x45\n\x0f\x45lementProperty\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x10\n\x08property\x18\x02 \x01(\t\x12\x0e\n\x06strict\x18\x03 \x01(\x08\x1aX\n\x08TypeText\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\r\n\x05\x64\x65lay\x18\x03 \x01(\x05\x12\r\n\x05\x63lear\x18\x04 \x01(\x08\x12\x0e\n\x06strict\x18\x05 \x01(\x08\x1aI\n\x08\x46illText\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x0e\n\x06strict\x18\x03 \x01(\x08\x12\r\n\x05\x66orce\x18\x04 \x01(\x08\x1a-\n\tClearText\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0e\n\x06strict\x18\x02 \x01(\x08\x1a`\n\tPressKeys\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0e\n\x06strict\x18\x02 \x01(\x08\x12\x0b\n\x03key\x18\x03 \x03(\t\x12\x12\n\npressDelay\x18\x04 \x01(\x05\x12\x10\n\x08keyDelay\x18\x05 \x01(\x05\x1a\x42\n\x0f\x45lementSelector\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0e\n\x06strict\x18\x02 \x01(\x08\x12\r\n\x05\x66orce\x18\x03 \x01(\x08\x1aQ\n\x1b\x45lementSelectorWithTextType\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0e\n\x06strict\x18\x02 \x01(\x08\x12\x10\n\x08textType\x18\x03 \x01(\t\x1a\x1a\n\x07Timeout\x12\x0f\n\x07timeout\x18\x01 \x01(\x02\x1a\x16\n\x05Index\x12\r\n\x05index\x18\x01 \x01(\t\x1a,\n\rIdWithTimeout\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x02\x1a\x1b\n\x08StyleTag\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x1aO\n\x1a\x45lementSelectorWithOptions\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0f\n\x07options\x18\x02 \x01(\t\x12\x0e\n\x06strict\x18\x03 \x01(\x08\x1a\x8c\x01\n\x1b\x45lementSelectorWithDuration\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x10\n\x08\x64uration\x18\x02 \x01(\x05\x12\r\n\x05width\x18\x03 \x01(\t\x12\r\n\x05style\x18\x04 \x01(\t\x12\r\n\x05\x63olor\x18\x05 \x01(\t\x12\x0e\n\x06strict\x18\x06 \x01(\x08\x12\x0c\n\x04mode\x18\x07 \x01(\t\x1aN\n\x15SelectElementSelector\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x13\n\x0bmatcherJson\x18\x02 \x01(\t\x12\x0e\n\x06strict\x18\x03 \x01(\x08\x1a[\n\x16WaitForFunctionOptions\x12\x0e\n\x06script\x18\x01 \x01(\t\x12\x10\n\x08selector\x18\x02 \x01(\t\x12\x0f\n\x07options\x18\x03 \x01(\t\x12\x0e\n\x06strict\x18\x04 \x01(\x08\x1a \n\x10PlaywrightObject\x12\x0c\n\x04info\x18\x01 \x01(\t\x1a)\n\x08Viewport\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x1a]\n\x0bHttpRequest\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x0c\n\x04\x62ody\x18\x03 \x01(\t\x12\x0f\n\x07headers\x18\x04 \x01(\t\x12\x12\n\nbinaryBody\x18\x05 \x01(\x0c\x1a\x36\n\x0bHttpCapture\x12\x16\n\x0eurlOrPredicate\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x02\x1a\xa0\x01\n\x05Route\x12\x16\n\x0eurlOrPredicate\x18\x01 \x01(\t\x12\x0e\n\x06\x61\x63tion\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\x05\x12\x0f\n\x07headers\x18\x04 \x01(\t\x12\x0c\n\x04\x62ody\x18\x05 \x01(\x0c\x12\x0c\n\x04path\x18\x06 \x01(\t\x12\x11\n\terrorCode\x18\x07 \x01(\t\x12\r\n\x05times\x18\x08 \x01(\x05\x12\x10\n\x08notFound\x18\t \x01(\t\x1a\x15\n\x07RouteId\x12\n\n\x02id\x18\x01 \x01(\t\x1aK\n\x10NetworkRecording\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\x0eurlOrPredicate\x18\x02 \x01(\t\x12\x13\n\x0bmaxBodySize\x18\x03 \x01(\x05\x1a\x16\n\x06\x44\x65vice\x12\x0c\n\x04name\x18\x01 \x01(\t\x1aH\n\x0b\x41lertAction\x12\x13\n\x0b\x61lertAction\x18\x01 \x01(\t\x12\x13\n\x0bpromptInput\x18\x02 \x01(\t\x12\x0f\n\x07timeout\x18\x03 \x01(\x02\x1a\x33\n\x0c\x41lertActions\x12#\n\x05items\x18\x01 \x03(\x0b\x32\x14.Request.AlertAction\x1a\x15\n\x04\x42ool\x12\r\n\x05value\x18\x01 \x01(\x08\x1a\x61\n\x0b\x45valuateAll\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0e\n\x06script\x18\x02 \x01(\t\x12\x0b\n\x03\x61rg\x18\x03 \x01(\t\x12\x13\n\x0b\x61llElements\x18\x04 \x01(\x08\x12\x0e\n\x06strict\x18\x05 \x01(\x08\x1aR\n\x0c\x45lementStyle\x12\x10\n\x08selector\x18\x01 \x01(\t\x12\x0e\n\x06pseudo\x18\x02 \x01(\t\x12\x10\n\x08styleKey\x18\x03 \x01(\t\x12\x0e\n\x06strict\x18\x04 \x01(\x08\x1a\xb8\x01\n\nAssertPoll\x12\x0e\n\x06getter\x18\x01 \x01(\t\x12\x10\n\x08selector\x18\x02 \x01(\t\x12\x0e\n\x06strict\x18\x03 \x01(\x08\x12\x10\n\x08\x61rgument\x18\x04 \x01(\t\x12\x0e\n\x06pseudo\x18\x05 \x01(\t\x12\x10\n\x08operator\x18\x06 \x01(\t\x12\x10\n\x08\x65xpected\x18\x07 \x01(\t\x12\x0f\n\x07timeout\x18\x08 \x01(\r\x12\x10\n\x08retryFor\x18\t \x01(\r\x12\x0f\n\x07polling\x18\n \x01(\t\x1a+\n\nPageChange\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\r\x1ag\n\x10\x43reateCredential\x12\x0c\n\x04rpId\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12\x12\n\nprivateKey\x18\x03 \x01(\t\x12\x11\n\tpublicKey\x18\x04 \x01(\t\x12\x12\n\nuserHandle\x18\x05 \x01(\t\x1a/\n\x13\x43redentialIdAndRpId\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04rpId\x18\x02 \x01(\t\x1a,\n\tBatchStep\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\x0f\n\x07request\x18\x02 \x01(\x0c\x1a*\n\x05\x42\x61tch\x12!\n\x05steps\x18\x01 \x03(\x0b\x32\x12.Request.BatchStep\x1a\x37\n\x08\x45nvelope\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x0f\n\x07request\x18\x03 \x01(\x0c\"U\n\x05Types\x1aL\n\x0bSelectEntry\x12\r\n\x05value\x18\x02 \x01(\t\x12\r\n\x05label\x18\x03 \x01(\t\x12\r\n\x05index\x18\x04 \x01(\x05\x12\x10\n\x08selected\x18\x05 \x01(\x08\"\xf8\x0c\n\x08Response\x1a\x14\n\x05\x45mpty\x12\x0b\n\x03log\x18\x01 \x01(\t\x1a#\n\x06String\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0c\n\x04\x62ody\x18\x02 \x01(\t\x1a(\n\nListString\x12\r\n\x05items\x18\x01 \x03(\t\x12\x0b\n\x03log\x18\x02 \x01(\t\x1a\x62\n\x08Keywords\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x10\n\x08keywords\x18\x02 \x03(\t\x12\x1d\n\x15keywordDocumentations\x18\x03 \x03(\t\x12\x18\n\x10keywordArguments\x18\x04 \x03(\t\x1a!\n\x04\x42ool\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0c\n\x04\x62ody\x18\x02 \x01(\x08\x1a \n\x03Int\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0c\n\x04\x62ody\x18\x02 \x01(\x05\x1a+\n\x06Select\x12!\n\x05\x65ntry\x18\x01 \x03(\x0b\x32\x12.Types.SelectEntry\x1a\x33\n\x04Json\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0c\n\x04json\x18\x02 \x01(\t\x12\x10\n\x08\x62odyPart\x18\x03 \x01(\t\x1a\"\n\x05\x42ytes\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0c\n\x04\x62ody\x18\x02 \x01(\x0c\x1a\x37\n\x0cHttpResponse\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0c\n\x04json\x18\x02 \x01(\t\x12\x0c\n\x04\x62ody\x18\x03 \x01(\x0c\x1a\x38\n\x19JavascriptExecutionResult\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\t\x1aY\n\x12NewContextResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0b\n\x03log\x18\x02 \x01(\t\x12\x16\n\x0e\x63ontextOptions\x18\x03 \x01(\t\x12\x12\n\nnewBrowser\x18\x04 \x01(\x08\x1a\x95\x01\n\x1cNewPersistentContextResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0b\n\x03log\x18\x02 \x01(\t\x12\x16\n\x0e\x63ontextOptions\x18\x03 \x01(\t\x12\x12\n\nnewBrowser\x18\x04 \x01(\x08\x12\r\n\x05video\x18\x05 \x01(\t\x12\x0e\n\x06pageId\x18\x06 \x01(\t\x12\x11\n\tbrowserId\x18\x07 \x01(\t\x1a\x63\n\x0fNewPageResponse\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0c\n\x04\x62ody\x18\x02 \x01(\t\x12\r\n\x05video\x18\x03 \x01(\t\x12\x12\n\nnewBrowser\x18\x04 \x01(\x08\x12\x12\n\nnewContext\x18\x05 \x01(\x08\x1aR\n\x12PageReportResponse\x12\x0b\n\x03log\x18\x01 \x01(\t\x12\x0e\n\x06\x65rrors\x18\x02 \x01(\t\x12\x0f\n\x07\x63onsole\x18\x03 \x01(\t\x12\x0e\n\x06pageId\x18\x04 \x01(\t\x1aq\n\rGetCredential\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04rpId\x18\x02 \x01(\t\x12\x12\n\nuserHandle\x18\x03 \x01(\t\x12\x12\n\nprivateKey\x18\x04 \x01(\t\x12\x11\n\tpublicKey\x18\x05 \x01(\t\x12\x0b\n\x03log\x18\x06 \x01(\t\x1aN\n\x0f\x42\x61tchStepResult\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\n\n\x02ok\x18\x02 \x01(\x08\x12\x10\n\x08response\x18\x03 \x01(\x0c\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x1a@\n\x05\x42\x61tch\x12\x0b\n\x03log\x18\x01 \x01(\t\x12*\n\x07results\x18\x02 \x03(\x0b\x32\x19.Response.BatchStepResult\x1a\x45\n\x08\x45nvelope\x12\n\n\x02id\x18\x01 \x01(\r\x12\x10\n\x08response\x18\x02 \x01(\x0c\x12\x0c\n\x04\x63ode\x18\x03 \x01(\x05\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x1a`\n\rClosedContext\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tbrowserId\x18\x02 \x01(\t\x12\x11\n\ttraceFile\x18\x03 \x01(\t\x12\x0e\n\x06videos\x18\x04 \x03(\t\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x1a\x86\x01\n\nAssertPoll\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\x12\r\n\x05tries\x18\x04 \x01(\r\x12\x17\n\x0fmutationWakeups\x18\x05 \x01(\r\x12\x0b\n\x03log\x18\x06 \x01(\t\x12\x15\n\rwastedWakeups\x18\x07 \x01(\r\x1a)\n\rCatalogChange\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x1aW\n\x0c\x43\x61talogEvent\x12\x0f\n\x07version\x18\x01 \x01(\r\x12(\n\x07\x63hanges\x18\x02 \x03(\x0b\x32\x17.Response.CatalogChange\x12\x0c\n\x04json\x18\x03 \x01(\t2\xd0\x39\n\nPlaywright\x12\x37\n\x0c\x41riaSnapShot\x12\x15.Request.AriaSnapShot\x1a\x10.Response.String\x12+\n\tAddCookie\x12\r.Request.Json\x1a\x0f.Response.Empty\x12,\n\nGetCookies\x12\x0e.Request.Empty\x1a\x0e.Response.Json\x12\x33\n\x10\x44\x65leteAllCookies\x12\x0e.Request.Empty\x1a\x0f.Response.Empty\x12>\n\x0eTakeScreenshot\x12\x1a.Request.ScreenshotOptions\x1a\x10.Response.String\x12\x44\n\x13TakeScreenshotBytes\x12\x1a.Request.ScreenshotOptions\x1a\x0f.Response.Bytes0\x01\x12-\n\x04GoTo\x12\x13.Request.UrlOptions\x1a\x10.Response.String\x12)\n\x06GoBack\x12\x0e.Request.Empty\x1a\x0f.Response.Empty\x12,\n\tGoForward\x12\x0e.Request.Empty\x1a\x0f.Response.Empty\x12,\n\x08GetTitle\x12\x0e.Request.Empty\x1a\x10.Response.String\x12:\n\x0fGetElementCount\x12\x18.Request.ElementSelector\x1a\r.Response.Int\x12.\n\x08TypeText\x12\x11.Request.TypeText\x1a\x0f.Response.Empty\x12.\n\x08\x46illText\x12\x11.Request.FillText\x1a\x0f.Response.Empty\x12\x30\n\tClearText\x12\x12.Request.ClearText\x1a\x0f.Response.Empty\x12<\n\x0eGetDomProperty\x12\x18.Request.ElementProperty\x1a\x10.Response.String\x12\x45\n\x07GetText\x12$.Request.ElementSelectorWithTextType\x1a\x14.Response.ListString\x12\x41\n\x13GetElementAttribute\x12\x18.Request.ElementProperty\x1a\x10.Response.String\x12;\n\x0fGetBoolProperty\x12\x18.Request.ElementProperty\x1a\x0e.Response.Bool\x12\x31\n\x0fGetViewportSize\x12\x0e.Request.Empty\x1a\x0e.Response.Json\x12*\n\x06GetUrl\x12\x0e.Request.Empty\x1a\x10.Response.String\x12\x31\n\rGetPageSource\x12\x0e.Request.Empty\x1a\x0e.Response.Json0\x01\x12<\n\x12GetPageSourceBytes\x12\x13.Request.PageSource\x1a\x0f.Response.Bytes0\x01\x12,\n\x05Press\x12\x12.Request.PressKeys\x1a\x0f.Response.Empty\x12>\n\x10GetSelectContent\x12\x18.Request.ElementSelector\x1a\x10.Response.Select\x12@\n\x0cSelectOption\x12\x1e.Request.SelectElementSelector\x1a\x10.Response.Select\x12;\n\x0e\x44\x65selectOption\x12\x18.Request.ElementSelector\x1a\x0f.Response.Empty\x12:\n\rCheckCheckbox\x12\x18.Request.ElementSelector\x1a\x0f.Response.Empty\x12<\n\x0fUncheckCheckbox\x12\x18.Request.ElementSelector\x1a\x0f.Response.Empty\x12*\n\x06Health\x12\x0e.Request.Empty\x1a\x10.Response.String\x12\x38\n\nGetElement\x12\x18.Request.ElementSelector\x1a\x10.Response.String\x12\x37\n\x0bGetElements\x12\x18.Request.ElementSelector\x1a\x0e.Response.Json\x12/\n\x06GetByX\x12\x15.Request.GetByOptions\x1a\x0e.Response.Json\x12<\n\x10GetElementStates\x12\x18.Request.ElementSelector\x1a\x0e.Response.Json\x12/\n\nSetTimeout\x12\x10.Request.Timeout\x1a\x0f.Response.Empty\x12\x31\n\x0b\x41\x64\x64StyleTag\x12\x11.Request.StyleTag\x1a\x0f.Response.Empty\x12H\n\x11HighlightElements\x12$.Request.ElementSelectorWithDuration\x1a\r.Response.Int\x12\x34\n\x08\x44ownload\x12\x18.Request.DownloadOptions\x1a\x0e.Response.Json\x12=\n\x05\x43lick\x12#.Request.ElementSelectorWithOptions\x1a\x0f.Response.Empty\x12;\n\x03Tap\x12#.Request.ElementSelectorWithOptions\x1a\x0f.Response.Empty\x12=\n\x05Hover\x12#.Request.ElementSelectorWithOptions\x1a\x0f.Response.Empty\x12\x32\n\x05\x46ocus\x12\x18.Request.ElementSelector\x1a\x0f.Response.Empty\x12L\n\x14WaitForElementsState\x12#.Request.ElementSelectorWithOptions\x1a\x0f.Response.Empty\x12\x42\n\x0fWaitForFunction\x12\x1f.Request.WaitForFunctionOptions\x1a\x0e.Response.Json\x12O\n\x12\x45valuateJavascript\x12\x14.Request.EvaluateAll\x1a#.Response.JavascriptExecutionResult\x12\x45\n\x0eRecordSelector\x12\x0e.Request.Label\x1a#.Response.JavascriptExecutionResult\x12\x35\n\x0fSetViewportSize\x12\x11.Request.Viewport\x1a\x0f.Response.Empty\x12\x31\n\x08GetStyle\x12\x15.Request.ElementStyle\x1a\x0e.Response.Json\x12\x37\n\nAssertPoll\x12\x13.Request.AssertPoll\x1a\x14.Response.AssertPoll\x12\x38\n\x11WaitForPageChange\x12\x13.Request.PageChange\x1a\x0e.Response.Bool\x12:\n\x0eGetBoundingBox\x12\x18.Request.ElementSelector\x1a\x0e.Response.Json\x12\x33\n\x0bHttpRequest\x12\x14.Request.HttpRequest\x1a\x0e.Response.Json\x12<\n\nApiRequest\x12\x14.Request.HttpRequest\x1a\x16.Response.HttpResponse0\x01\x12\x36\n\x0eWaitForRequest\x12\x14.Request.HttpCapture\x1a\x0e.Response.Json\x12\x39\n\x0fWaitForResponse\x12\x14.Request.HttpCapture\x1a\x0e.Response.Json0\x01\x12,\n\x08\x41\x64\x64Route\x12\x0e.Request.Route\x1a\x10.Response.String\x12\x30\n\x0bRemoveRoute\x12\x10.Request.RouteId\x1a\x0f.Response.Empty\x12+\n\tGetRoutes\x12\x0e.Request.Empty\x1a\x0e.Response.Json\x12\x43\n\x14RecordNetworkTraffic\x12\x19.Request.NetworkRecording\x1a\x0e.Response.Json0\x01\x12\x42\n\x14StopNetworkRecording\x12\x19.Request.NetworkRecording\x1a\x0f.Response.Empty\x12;\n\x0fWaitForDownload\x12\x18.Request.DownloadOptions\x1a\x0e.Response.Json\x12\x39\n\x11WaitForNavigation\x12\x13.Request.UrlOptions\x1a\x0f.Response.Empty\x12?\n\x14WaitForPageLoadState\x12\x16.Request.PageLoadState\x1a\x0f.Response.Empty\x12\x30\n\x0eSetGeolocation\x12\r.Request.Json\x1a\x0f.Response.Empty\x12,\n\tGetDevice\x12\x0f.Request.Device\x1a\x0e.Response.Json\x12,\n\nGetDevices\x12\x0e.Request.Empty\x1a\x0e.Response.Json\x12L\n\x17\x41\x64\x64LocatorHandlerCustom\x12 .Request.LocatorHandlerAddCustom\x1a\x0f.Response.Empty\x12\x46\n\x14RemoveLocatorHandler\x12\x1d.Request.LocatorHandlerRemove\x1a\x0f.Response.Empty\x12\x34\n\x0bHandleAlert\x12\x14.Request.AlertAction\x1a\x0f.Response.Empty\x12<\n\rWaitForAlerts\x12\x15.Request.AlertActions\x1a\x14.Response.ListString\x12;\n\x0bMouseButton\x12\x1b.Request.MouseButtonOptions\x1a\x0f.Response.Empty\x12+\n\tMouseMove\x12\r.Request.Json\x1a\x0f.Response.Empty\x12\x32\n\nMouseWheel\x12\x13.Request.MouseWheel\x1a\x0f.Response.Empty\x12\x39\n\x0bKeyboardKey\x12\x19.Request.KeyboardKeypress\x1a\x0f.Response.Empty\x12?\n\rKeyboardInput\x12\x1d.Request.KeyboardInputOptions\x1a\x0f.Response.Empty\x12;\n\x10GetTableRowIndex\x12\x18.Request.ElementSelector\x1a\r.Response.Int\x12<\n\x11GetTableCellIndex\x12\x18.Request.ElementSelector\x1a\r.Response.Int\x12\x30\n\nUploadFile\x12\x11.Request.FilePath\x1a\x0f.Response.Empty\x12\x42\n\x14UploadFileBySelector\x12\x17.Request.FileBySelector\x1a\x0f.Response.Empty(\x01\x12<\n\x0fScrollToElement\x12\x18.Request.ElementSelector\x1a\x0f.Response.Empty\x12,\n\nSetOffline\x12\r.Request.Bool\x1a\x0f.Response.Empty\x12(\n\x06Reload\x12\r.Request.Json\x1a\x0f.Response.Empty\x12\x36\n\nSwitchPage\x12\x16.Request.IdWithTimeout\x1a\x10.Response.String\x12\x31\n\rSwitchContext\x12\x0e.Request.Index\x1a\x10.Response.String\x12\x31\n\rSwitchBrowser\x12\x0e.Request.Index\x1a\x10.Response.String\x12\x39\n\x07NewPage\x12\x13.Request.UrlOptions\x1a\x19.Response.NewPageResponse\x12<\n\nNewContext\x12\x10.Request.Context\x1a\x1c.Response.NewContextResponse\x12\x30\n\nNewBrowser\x12\x10.Request.Browser\x1a\x10.Response.String\x12\x39\n\x13LaunchBrowserServer\x12\x10.Request.Browser\x1a\x10.Response.String\x12>\n\x12\x43loseBrowserServer\x12\x17.Request.ConnectBrowser\x1a\x0f.Response.Empty\x12Z\n\x14NewPersistentContext\x12\x1a.Request.PersistentContext\x1a&.Response.NewPersistentContextResponse\x12=\n\x10\x43onnectToBrowser\x12\x17.Request.ConnectBrowser\x1a\x10.Response.String\x12\x30\n\x0c\x43loseBrowser\x12\x0e.Request.Empty\x1a\x10.Response.String\x12\x33\n\x10\x43loseAllBrowsers\x12\x0e.Request.Empty\x1a\x0f.Response.Empty\x12.\n\x0c\x43loseContext\x12\r.Request.Bool\x1a\x0f.Response.Empty\x12\x42\n\rCloseContexts\x12\x16.Request.CloseContexts\x1a\x17.Response.ClosedContext0\x01\x12=\n\tClosePage\x12\x12.Request.ClosePage\x1a\x1c.Response.PageReportResponse\x12\x31\n\nCloseScope\x12\x13.Request.CloseScope\x1a\x0e.Response.Json\x12\x36\n\x0eOpenTraceGroup\x12\x13.Request.TraceGroup\x1a\x0f.Response.Empty\x12\x32\n\x0f\x43loseTraceGroup\x12\x0e.Request.Empty\x1a\x0f.Response.Empty\x12\x33\n\x0cSetRFContext\x12\x12.Request.RFContext\x1a\x0f.Response.Empty\x12.\n\rGetConsoleLog\x12\r.Request.Bool\x1a\x0e.Response.Json\x12\x31\n\x10GetErrorMessages\x12\r.Request.Bool\x1a\x0e.Response.Json\x12\x32\n\x11GetBrowserCatalog\x12\r.Request.Bool\x1a\x0e.Response.Json\x12?\n\x13WatchBrowserCatalog\x12\x0e.Request.Empty\x1a\x16.Response.CatalogEvent0\x01\x12\x37\n\x10GetDownloadState\x12\x13.Request.DownloadID\x1a\x0e.Response.Json\x12\x36\n\x0e\x43\x61ncelDownload\x12\x13.Request.DownloadID\x1a\x0f.Response.Empty\x12:\n\x10SaveStorageState\x12\x15.Request.StorageState\x1a\x0f.Response.Empty\x12<\n\x0fSetStorageState\x12\x18.Request.SetStorageState\x1a\x0f.Response.Empty\x12\x39\n\x10GrantPermissions\x12\x14.Request.Permissions\x1a\x0f.Response.Empty\x12\x33\n\x11\x45xecutePlaywright\x12\r.Request.Json\x1a\x0f.Response.Empty\x12\x33\n\x10\x43learPermissions\x12\x0e.Request.Empty\x1a\x0f.Response.Empty\x12<\n\x13InitializeExtension\x12\x11.Request.FilePath\x1a\x12.Response.Keywords\x12>\n\x14\x43\x61llExtensionKeyword\x12\x14.Request.KeywordCall\x1a\x0e.Response.Json0\x01\x12-\n\tSetPeerId\x12\x0e.Request.Index\x1a\x10.Response.String\x12%\n\x03Pdf\x12\x0c.Request.Pdf\x1a\x10.Response.String\x12\x37\n\x0c\x45mulateMedia\x12\x15.Request.EmulateMedia\x1a\x10.Response.String\x12\x31\n\x07SetTime\x12\x15.Request.ClockSetTime\x1a\x0f.Response.Empty\x12.\n\x0b\x43lockResume\x12\x0e.Request.Empty\x1a\x0f.Response.Empty\x12\x36\n\x0c\x43lockPauseAt\x12\x15.Request.ClockSetTime\x1a\x0f.Response.Empty\x12\x36\n\x0c\x41\x64vanceClock\x12\x15.Request.ClockAdvance\x1a\x0f.Response.Empty\x12\x38\n\rStartCoverage\x12\x16.Request.CoverageStart\x1a\x0f.Response.Empty\x12\x30\n\x0cStopCoverage\x12\x0e.Request.Empty\x1a\x10.Response.String\x12\x38\n\rMergeCoverage\x12\x16.Request.CoverageMerge\x1a\x0f.Response.Empty\x12>\n\x10\x43reateCredential\x12\x19.Request.CreateCredential\x1a\x0f.Response.Empty\x12\x34\n\x11InstallCredential\x12\x0e.Request.Empty\x1a\x0f.Response.Empty\x12\x46\n\rGetCredential\x12\x1c.Request.CredentialIdAndRpId\x1a\x17.Response.GetCredential\x12\x41\n\x10\x44\x65leteCredential\x12\x1c.Request.CredentialIdAndRpId\x1a\x0f.Response.Empty\x12/\n\x0c\x45xecuteBatch\x12\x0e.Request.Batch\x1a\x0f.Response.Batch\x12\x34\n\x07Session\x12\x11.Request.Envelope\x1a\x12.Response.Envelope(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'playwright_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_REQUEST']._serialized_start=21
+  _globals['_REQUEST']._serialized_end=5691
+  _globals['_REQUEST_EMPTY']._serialized_start=32
+  _globals['_REQUEST_EMPTY']._serialized_end=39
+  _globals['_REQUEST_ARIASNAPSHOT']._serialized_start=41
+  _globals['_REQUEST_ARIASNAPSHOT']._serialized_end=132
+  _globals['_REQUEST_CLOSEPAGE']._serialized_start=134
+  _globals['_REQUEST_CLOSEPAGE']._serialized_end=170
+  _globals['_REQUEST_CLOSESCOPE']._serialized_start=173
+  _globals['_REQUEST_CLOSESCOPE']._serialized_end=308
+  _globals['_REQUEST_CLOSECONTEXTS']._serialized_start=310
+  _globals['_REQUEST_CLOSECONTEXTS']._serialized_end=378
+  _globals['_REQUEST_CLOCKSETTIME']._serialized_start=380
+  _globals['_REQUEST_CLOCKSETTIME']._serialized_end=425
+  _globals['_REQUEST_CLOCKADVANCE']._serialized_start=427
+  _globals['_REQUEST_CLOCKADVANCE']._serialized_end=476
+  _globals['_REQUEST_COVERAGESTART']._serialized_start=479
+  _globals['_REQUEST_COVERAGESTART']._serialized_end=629
+  _globals['_REQUEST_COVERAGEMERGE']._serialized_start=631
+  _globals['_REQUEST_COVERAGEMERGE']._serialized_end=738
+  _globals['_REQUEST_TRACEGROUP']._serialized_start=740
+  _globals['_REQUEST_TRACEGROUP']._serialized_end=829
+  _globals['_REQUEST_RFCONTEXT']._serialized_start=831
+  _globals['_REQUEST_RFCONTEXT']._serialized_end=916
+  _globals['_REQUEST_LABEL']._serialized_start=918
+  _globals['_REQUEST_LABEL']._serialized_end=940
+  _globals['_REQUEST_GETBYOPTIONS']._serialized_start=942
+  _globals['_REQUEST_GETBYOPTIONS']._serialized_end=1057
+  _globals['_REQUEST_PDF']._serialized_start=1060
+  _globals['_REQUEST_PDF']._serialized_end=1358
+  _globals['_REQUEST_EMULATEMEDIA']._serialized_start=1360
+  _globals['_REQUEST_EMULATEMEDIA']._serialized_end=1455
+  _globals['_REQUEST_SCREENSHOTOPTIONS']._serialized_start=1457
+  _globals['_REQUEST_SCREENSHOTOPTIONS']._serialized_end=1541
+  _globals['_REQUEST_PAGESOURCE']._serialized_start=1543
+  _globals['_REQUEST_PAGESOURCE']._serialized_end=1576
+  _globals['_REQUEST_KEYWORDCALL']._serialized_start=1578
+  _globals['_REQUEST_KEYWORDCALL']._serialized_end=1653
+  _globals['_REQUEST_FILEPATH']._serialized_start=1655
+  _globals['_REQUEST_FILEPATH']._serialized_end=1679
+  _globals['_REQUEST_STORAGESTATE']._serialized_start=1681
+  _globals['_REQUEST_STORAGESTATE']._serialized_end=1749
+  _globals['_REQUEST_SETSTORAGESTATE']._serialized_start=1751
+  _globals['_REQUEST_SETSTORAGESTATE']._serialized_end=1847
+  _globals['_REQUEST_FILEBYSELECTOR']._serialized_start=1850
+  _globals['_REQUEST_FILEBYSELECTOR']._serialized_end=2016
+  _globals['_REQUEST_LOCATORHANDLERADDCUSTOM']._serialized_start=2019
+  _globals['_REQUEST_LOCATORHANDLERADDCUSTOM']._serialized_end=2160
+  _globals['_REQUEST_LOCATORHANDLERADDCUSTOMACTION']._serialized_start=2162
+  _globals['_REQUEST_LOCATORHANDLERADDCUSTOMACTION']._serialized_end=2265
+  _globals['_REQUEST_LOCATORHANDLERREMOVE']._serialized_start=2267
+  _globals['_REQUEST_LOCATORHANDLERREMOVE']._serialized_end=2307
+  _globals['_REQUEST_JSON']._serialized_start=2309
+  _globals['_REQUEST_JSON']._serialized_end=2329
+  _globals['_REQUEST_MOUSEBUTTONOPTIONS']._serialized_start=2331
+  _globals['_REQUEST_MOUSEBUTTONOPTIONS']._serialized_end=2381
+  _globals['_REQUEST_MOUSEWHEEL']._serialized_start=2383
+  _globals['_REQUEST_MOUSEWHEEL']._serialized_end=2427
+  _globals['_REQUEST_KEYBOARDKEYPRESS']._serialized_start=2429
+  _globals['_REQUEST_KEYBOARDKEYPRESS']._serialized_end=2491
+  _globals['_REQUEST_KEYBOARDINPUTOPTIONS']._serialized_start=2493
+  _globals['_REQUEST_KEYBOARDINPUTOPTIONS']._serialized_end=2561
+  _globals['_REQUEST_BROWSER']._serialized_start=2563
+  _globals['_REQUEST_BROWSER']._serialized_end=2609
+  _globals['_REQUEST_CONTEXT']._serialized_start=2611
+  _globals['_REQUEST_CONTEXT']._serialized_end=2683
+  _globals['_REQUEST_PERSISTENTCONTEXT']._serialized_start=2685
+  _globals['_REQUEST_PERSISTENTCONTEXT']._serialized_end=2784
+  _globals['_REQUEST_PERMISSIONS']._serialized_start=2786
+  _globals['_REQUEST_PERMISSIONS']._serialized_end=2836
+  _globals['_REQUEST_URL']._serialized_start=2838
+  _globals['_REQUEST_URL']._serialized_end=2880
+  _globals['_REQUEST_DOWNLOADOPTIONS']._serialized_start=2882
+  _globals['_REQUEST_DOWNLOADOPTIONS']._serialized_end=2974
+  _globals['_REQUEST_DOWNLOADID']._serialized_start=2976
+  _globals['_REQUEST_DOWNLOADID']._serialized_end=3000
+  _globals['_REQUEST_URLOPTIONS']._serialized_start=3002
+  _globals['_REQUEST_URLOPTIONS']._serialized_end=3060
+  _globals['_REQUEST_PAGELOADSTATE']._serialized_start=3062
+  _globals['_REQUEST_PAGELOADSTATE']._serialized_end=3109
+  _globals['_REQUEST_CONNECTBROWSER']._serialized_start=3111
+  _globals['_REQUEST_CONNECTBROWSER']._serialized_end=3194
+  _globals['_REQUEST_TEXTINPUT']._serialized_start=3196
+  _globals['_REQUEST_TEXTINPUT']._serialized_end=3254
+  _globals['_REQUEST_ELEMENTPROPERTY']._serialized_start=3256
+  _globals['_REQUEST_ELEMENTPROPERTY']._serialized_end=3325
+  _globals['_REQUEST_TYPETEXT']._serialized_start=3327
+  _globals['_REQUEST_TYPETEXT']._serialized_end=3415
+  _globals['_REQUEST_FILLTEXT']._serialized_start=3417
+  _globals['_REQUEST_FILLTEXT']._serialized_end=3490
+  _globals['_REQUEST_CLEARTEXT']._serialized_start=3492
+  _globals['_REQUEST_CLEARTEXT']._serialized_end=3537
+  _globals['_REQUEST_PRESSKEYS']._serialized_start=3539
+  _globals['_REQUEST_PRESSKEYS']._serialized_end=3635
+  _globals['_REQUEST_ELEMENTSELECTOR']._serialized_start=3637
+  _globals['_REQUEST_ELEMENTSELECTOR']._serialized_end=3703
+  _globals['_REQUEST_ELEMENTSELECTORWITHTEXTTYPE']._serialized_start=3705
+  _globals['_REQUEST_ELEMENTSELECTORWITHTEXTTYPE']._serialized_end=3786
+  _globals['_REQUEST_TIMEOUT']._serialized_start=3788
+  _globals['_REQUEST_TIMEOUT']._serialized_end=3814
+  _globals['_REQUEST_INDEX']._serialized_start=3816
+  _globals['_REQUEST_INDEX']._serialized_end=3838
+  _globals['_REQUEST_IDWITHTIMEOUT']._serialized_start=3840
+  _globals['_REQUEST_IDWITHTIMEOUT']._serialized_end=3884
+  _globals['_REQUEST_STYLETAG']._serialized_start=3886
+  _globals['_REQUEST_STYLETAG']._serialized_end=3913
+  _globals['_REQUEST_ELEMENTSELECTORWITHOPTIONS']._serialized_start=3915
+  _globals['_REQUEST_ELEMENTSELECTORWITHOPTIONS']._serialized_end=3994
+  _globals['_REQUEST_ELEMENTSELECTORWITHDURATION']._serialized_start=3997
+  _globals['_REQUEST_ELEMENTSELECTORWITHDURATION']._serialized_end=4137
+  _globals['_REQUEST_SELECTELEMENTSELECTOR']._serialized_start=4139
+  _globals['_REQUEST_SELECTELEMENTSELECTOR']._serialized_end=4217
+  _globals['_REQUEST_WAITFORFUNCTIONOPTIONS']._serialized_start=4219
+  _globals['_REQUEST_WAITFORFUNCTIONOPTIONS']._serialized_end=4310
+  _globals['_REQUEST_PLAYWRIGHTOBJECT']._serialized_start=4312
+  _globals['_REQUEST_PLAYWRIGHTOBJECT']._serialized_end=4344
+  _globals['_REQUEST_VIEWPORT']._serialized_start=4346
+  _globals['_REQUEST_VIEWPORT']._serialized_end=4387
+  _globals['_REQUEST_HTTPREQUEST']._serialized_start=4389
+  _globals['_REQUEST_HTTPREQUEST']._serialized_end=4482
+  _globals['_REQUEST_HTTPCAPTURE']._serialized_start=4484
+  _globals['_REQUEST_HTTPCAPTURE']._serialized_end=4538
+  _globals['_REQUEST_ROUTE']._serialized_start=4541
+  _globals['_REQUEST_ROUTE']._serialized_end=4701
+  _globals['_REQUEST_ROUTEID']._serialized_start=4703
+  _globals['_REQUEST_ROUTEID']._serialized_end=4724
+  _globals['_REQUEST_NETWORKRECORDING']._serialized_start=4726
+  _globals['_REQUEST_NETWORKRECORDING']._serialized_end=4801
+  _globals['_REQUEST_DEVICE']._serialized_start=4803
+  _globals['_REQUEST_DEVICE']._serialized_end=4825
+  _globals['_REQUEST_ALERTACTION']._serialized_start=4827
+  _globals['_REQUEST_ALERTACTION']._serialized_end=4899
+  _globals['_REQUEST_ALERTACTIONS']._serialized_start=4901
+  _globals['_REQUEST_ALERTACTIONS']._serialized_end=4952
+  _globals['_REQUEST_BOOL']._serialized_start=4954
+  _globals['_REQUEST_BOOL']._serialized_end=4975
+  _globals['_REQUEST_EVALUATEALL']._serialized_start=4977
+  _globals['_REQUEST_EVALUATEALL']._serialized_end=5074
+  _globals['_REQUEST_ELEMENTSTYLE']._serialized_start=5076
+  _globals['_REQUEST_ELEMENTSTYLE']._serialized_end=5158
+  _globals['_REQUEST_ASSERTPOLL']._serialized_start=5161
+  _globals['_REQUEST_ASSERTPOLL']._serialized_end=5345
+  _globals['_REQUEST_PAGECHANGE']._serialized_start=5347
+  _globals['_REQUEST_PAGECHANGE']._serialized_end=5390
+  _globals['_REQUEST_CREATECREDENTIAL']._serialized_start=5392
+  _globals['_REQUEST_CREATECREDENTIAL']._serialized_end=5495
+  _globals['_REQUEST_CREDENTIALIDANDRPID']._serialized_start=5497
+  _globals['_REQUEST_CREDENTIALIDANDRPID']._serialized_end=5544
+  _globals['_REQUEST_BATCHSTEP']._serialized_start=5546
+  _globals['_REQUEST_BATCHSTEP']._serialized_end=5590
+  _globals['_REQUEST_BATCH']._serialized_start=5592
+  _globals['_REQUEST_BATCH']._serialized_end=5634
+  _globals['_REQUEST_ENVELOPE']._serialized_start=5636
+  _globals['_REQUEST_ENVELOPE']._serialized_end=5691
+  _globals['_TYPES']._serialized_start=5693
+  _globals['_TYPES']._serialized_end=5778
+  _globals['_TYPES_SELECTENTRY']._serialized_start=5702
+  _globals['_TYPES_SELECTENTRY']._serialized_end=5778
+  _globals['_RESPONSE']._serialized_start=5781
+  _globals['_RESPONSE']._serialized_end=7437
+  _globals['_RESPONSE_EMPTY']._serialized_start=5793
+  _globals['_RESPONSE_EMPTY']._serialized_end=5813
+  _globals['_RESPONSE_STRING']._serialized_start=5815
+  _globals['_RESPONSE_STRING']._serialized_end=5850
+  _globals['_RESPONSE_LISTSTRING']._serialized_start=5852
+  _globals['_RESPONSE_LISTSTRING']._serialized_end=5892
+  _globals['_RESPONSE_KEYWORDS']._serialized_start=5894
+  _globals['_RESPONSE_KEYWORDS']._serialized_end=5992
+  _globals['_RESPONSE_BOOL']._serialized_start=5994
+  _globals['_RESPONSE_BOOL']._serialized_end=6027
+  _globals['_RESPONSE_INT']._serialized_start=6029
+  _globals['_RESPONSE_INT']._serialized_end=6061
+  _globals['_RESPONSE_SELECT']._serialized_start=6063
+  _globals['_RESPONSE_SELECT']._serialized_end=6106
+  _globals['_RESPONSE_JSON']._serialized_start=6108
+  _globals['_RESPONSE_JSON']._serialized_end=6159
+  _globals['_RESPONSE_BYTES']._serialized_start=6161
+  _globals['_RESPONSE_BYTES']._serialized_end=6195
+  _globals['_RESPONSE_HTTPRESPONSE']._serialized_start=6197
+  _globals['_RESPONSE_HTTPRESPONSE']._serialized_end=6252
+  _globals['_RESPONSE_JAVASCRIPTEXECUTIONRESULT']._serialized_start=6254
+  _globals['_RESPONSE_JAVASCRIPTEXECUTIONRESULT']._serialized_end=6310
+  _globals['_RESPONSE_NEWCONTEXTRESPONSE']._serialized_start=6312
+  _globals['_RESPONSE_NEWCONTEXTRESPONSE']._serialized_end=6401
+  _globals['_RESPONSE_NEWPERSISTENTCONTEXTRESPONSE']._serialized_start=6404
+  _globals['_RESPONSE_NEWPERSISTENTCONTEXTRESPONSE']._serialized_end=6553
+  _globals['_RESPONSE_NEWPAGERESPONSE']._serialized_start=6555
+  _globals['_RESPONSE_NEWPAGERESPONSE']._serialized_end=6654
+  _globals['_RESPONSE_PAGEREPORTRESPONSE']._serialized_start=6656
+  _globals['_RESPONSE_PAGEREPORTRESPONSE']._serialized_end=6738
+  _globals['_RESPONSE_GETCREDENTIAL']._serialized_start=6740
+  _globals['_RESPONSE_GETCREDENTIAL']._serialized_end=6853
+  _globals['_RESPONSE_BATCHSTEPRESULT']._serialized_start=6855
+  _globals['_RESPONSE_BATCHSTEPRESULT']._serialized_end=6933
+  _globals['_RESPONSE_BATCH']._serialized_start=6935
+  _globals['_RESPONSE_BATCH']._serialized_end=6999
+  _globals['_RESPONSE_ENVELOPE']._serialized_start=7001
+  _globals['_RESPONSE_ENVELOPE']._serialized_end=7070
+  _globals['_RESPONSE_CLOSEDCONTEXT']._serialized_start=7072
+  _globals['_RESPONSE_CLOSEDCONTEXT']._serialized_end=7168
+  _globals['_RESPONSE_ASSERTPOLL']._serialized_start=7171
+  _globals['_RESPONSE_ASSERTPOLL']._serialized_end=7305
+  _globals['_RESPONSE_CATALOGCHANGE']._serialized_start=7307
+  _globals['_RESPONSE_CATALOGCHANGE']._serialized_end=7348
+  _globals['_RESPONSE_CATALOGEVENT']._serialized_start=7350
+  _globals['_RESPONSE_CATALOGEVENT']._serialized_end=7437
+  _globals['_PLAYWRIGHT']._serialized_start=7440
+  _globals['_PLAYWRIGHT']._serialized_end=14816
+# @@protoc_insertion_point(module_scope)
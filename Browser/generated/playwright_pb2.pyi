@@ -0,0 +1,2503 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+limitations under the License."""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf.internal import containers as _containers
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class Request(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Empty(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        def __init__(
+            self,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class AriaSnapShot(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOCATOR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        MODE_FIELD_NUMBER: _builtins.int
+        DEPTH_FIELD_NUMBER: _builtins.int
+        BOXES_FIELD_NUMBER: _builtins.int
+        locator: _builtins.str
+        strict: _builtins.bool
+        mode: _builtins.str
+        depth: _builtins.int
+        boxes: _builtins.bool
+        def __init__(
+            self,
+            *,
+            locator: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            mode: _builtins.str = ...,
+            depth: _builtins.int = ...,
+            boxes: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["boxes", b"boxes", "depth", b"depth", "locator", b"locator", "mode", b"mode", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ClosePage(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        RUNBEFOREUNLOAD_FIELD_NUMBER: _builtins.int
+        runBeforeUnload: _builtins.bool
+        def __init__(
+            self,
+            *,
+            runBeforeUnload: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["runBeforeUnload", b"runBeforeUnload"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CloseScope(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SCOPEID_FIELD_NUMBER: _builtins.int
+        SAVETRACE_FIELD_NUMBER: _builtins.int
+        RUNBEFOREUNLOAD_FIELD_NUMBER: _builtins.int
+        TRACEGROUP_FIELD_NUMBER: _builtins.int
+        CONCURRENCY_FIELD_NUMBER: _builtins.int
+        scopeId: _builtins.str
+        """Robot Framework suite or test id, also covers the tests and suites inside it"""
+        saveTrace: _builtins.bool
+        runBeforeUnload: _builtins.bool
+        concurrency: _builtins.int
+        """How many contexts and pages are closed at the same time, 0 uses the default"""
+        @_builtins.property
+        def traceGroup(self) -> Global___Request.TraceGroup:
+            """Group around the closing in the traces, skipped when it has no name"""
+
+        def __init__(
+            self,
+            *,
+            scopeId: _builtins.str = ...,
+            saveTrace: _builtins.bool = ...,
+            runBeforeUnload: _builtins.bool = ...,
+            traceGroup: Global___Request.TraceGroup | None = ...,
+            concurrency: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["traceGroup", b"traceGroup"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["concurrency", b"concurrency", "runBeforeUnload", b"runBeforeUnload", "saveTrace", b"saveTrace", "scopeId", b"scopeId", "traceGroup", b"traceGroup"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CloseContexts(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        IDS_FIELD_NUMBER: _builtins.int
+        SAVETRACE_FIELD_NUMBER: _builtins.int
+        CONCURRENCY_FIELD_NUMBER: _builtins.int
+        saveTrace: _builtins.bool
+        concurrency: _builtins.int
+        """How many contexts are closed at the same time, 0 uses the default"""
+        @_builtins.property
+        def ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            ids: _abc.Iterable[_builtins.str] | None = ...,
+            saveTrace: _builtins.bool = ...,
+            concurrency: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["concurrency", b"concurrency", "ids", b"ids", "saveTrace", b"saveTrace"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ClockSetTime(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TIME_FIELD_NUMBER: _builtins.int
+        SETTYPE_FIELD_NUMBER: _builtins.int
+        time: _builtins.int
+        setType: _builtins.str
+        def __init__(
+            self,
+            *,
+            time: _builtins.int = ...,
+            setType: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["setType", b"setType", "time", b"time"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ClockAdvance(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TIME_FIELD_NUMBER: _builtins.int
+        ADVANCETYPE_FIELD_NUMBER: _builtins.int
+        time: _builtins.int
+        advanceType: _builtins.str
+        def __init__(
+            self,
+            *,
+            time: _builtins.int = ...,
+            advanceType: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["advanceType", b"advanceType", "time", b"time"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CoverageStart(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        COVERAGETYPE_FIELD_NUMBER: _builtins.int
+        RESETONNAVIGATION_FIELD_NUMBER: _builtins.int
+        REPORTANONYMOUSSCRIPTS_FIELD_NUMBER: _builtins.int
+        CONFIGFILE_FIELD_NUMBER: _builtins.int
+        COVERAGEDIR_FIELD_NUMBER: _builtins.int
+        RAW_FIELD_NUMBER: _builtins.int
+        coverageType: _builtins.str
+        resetOnNavigation: _builtins.bool
+        reportAnonymousScripts: _builtins.bool
+        configFile: _builtins.str
+        coverageDir: _builtins.str
+        raw: _builtins.bool
+        def __init__(
+            self,
+            *,
+            coverageType: _builtins.str = ...,
+            resetOnNavigation: _builtins.bool = ...,
+            reportAnonymousScripts: _builtins.bool = ...,
+            configFile: _builtins.str = ...,
+            coverageDir: _builtins.str = ...,
+            raw: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["configFile", b"configFile", "coverageDir", b"coverageDir", "coverageType", b"coverageType", "raw", b"raw", "reportAnonymousScripts", b"reportAnonymousScripts", "resetOnNavigation", b"resetOnNavigation"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CoverageMerge(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        INPUT_FOLDER_FIELD_NUMBER: _builtins.int
+        OUTPUT_FOLDER_FIELD_NUMBER: _builtins.int
+        CONFIG_FIELD_NUMBER: _builtins.int
+        NAME_FIELD_NUMBER: _builtins.int
+        REPORTS_FIELD_NUMBER: _builtins.int
+        input_folder: _builtins.str
+        output_folder: _builtins.str
+        config: _builtins.str
+        name: _builtins.str
+        @_builtins.property
+        def reports(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            input_folder: _builtins.str = ...,
+            output_folder: _builtins.str = ...,
+            config: _builtins.str = ...,
+            name: _builtins.str = ...,
+            reports: _abc.Iterable[_builtins.str] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["config", b"config", "input_folder", b"input_folder", "name", b"name", "output_folder", b"output_folder", "reports", b"reports"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class TraceGroup(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        NAME_FIELD_NUMBER: _builtins.int
+        FILE_FIELD_NUMBER: _builtins.int
+        LINE_FIELD_NUMBER: _builtins.int
+        COLUMN_FIELD_NUMBER: _builtins.int
+        CONTEXTID_FIELD_NUMBER: _builtins.int
+        name: _builtins.str
+        file: _builtins.str
+        line: _builtins.int
+        column: _builtins.int
+        contextId: _builtins.str
+        def __init__(
+            self,
+            *,
+            name: _builtins.str = ...,
+            file: _builtins.str = ...,
+            line: _builtins.int = ...,
+            column: _builtins.int = ...,
+            contextId: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["column", b"column", "contextId", b"contextId", "file", b"file", "line", b"line", "name", b"name"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class RFContext(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TEST_ID_FIELD_NUMBER: _builtins.int
+        TEST_NAME_FIELD_NUMBER: _builtins.int
+        SUITE_ID_FIELD_NUMBER: _builtins.int
+        SUITE_NAME_FIELD_NUMBER: _builtins.int
+        test_id: _builtins.str
+        test_name: _builtins.str
+        suite_id: _builtins.str
+        suite_name: _builtins.str
+        def __init__(
+            self,
+            *,
+            test_id: _builtins.str = ...,
+            test_name: _builtins.str = ...,
+            suite_id: _builtins.str = ...,
+            suite_name: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["suite_id", b"suite_id", "suite_name", b"suite_name", "test_id", b"test_id", "test_name", b"test_name"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Label(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LABEL_FIELD_NUMBER: _builtins.int
+        label: _builtins.str
+        def __init__(
+            self,
+            *,
+            label: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["label", b"label"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class GetByOptions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        STRATEGY_FIELD_NUMBER: _builtins.int
+        TEXT_FIELD_NUMBER: _builtins.int
+        OPTIONS_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        ALL_FIELD_NUMBER: _builtins.int
+        FRAMESELECTOR_FIELD_NUMBER: _builtins.int
+        strategy: _builtins.str
+        text: _builtins.str
+        options: _builtins.str
+        strict: _builtins.bool
+        all: _builtins.bool
+        frameSelector: _builtins.str
+        def __init__(
+            self,
+            *,
+            strategy: _builtins.str = ...,
+            text: _builtins.str = ...,
+            options: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            all: _builtins.bool = ...,
+            frameSelector: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["all", b"all", "frameSelector", b"frameSelector", "options", b"options", "strategy", b"strategy", "strict", b"strict", "text", b"text"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Pdf(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        DISPLAYHEADERFOOTER_FIELD_NUMBER: _builtins.int
+        FOOTERTEMPLATE_FIELD_NUMBER: _builtins.int
+        FORMAT_FIELD_NUMBER: _builtins.int
+        HEADERTEMPLATE_FIELD_NUMBER: _builtins.int
+        HEIGHT_FIELD_NUMBER: _builtins.int
+        LANDSCAPE_FIELD_NUMBER: _builtins.int
+        MARGIN_FIELD_NUMBER: _builtins.int
+        OUTLINE_FIELD_NUMBER: _builtins.int
+        PAGERANGES_FIELD_NUMBER: _builtins.int
+        PATH_FIELD_NUMBER: _builtins.int
+        PREFERCSSPAGESIZE_FIELD_NUMBER: _builtins.int
+        PRINTBACKGROUND_FIELD_NUMBER: _builtins.int
+        SCALE_FIELD_NUMBER: _builtins.int
+        TAGGED_FIELD_NUMBER: _builtins.int
+        WIDTH_FIELD_NUMBER: _builtins.int
+        displayHeaderFooter: _builtins.bool
+        footerTemplate: _builtins.str
+        format: _builtins.str
+        headerTemplate: _builtins.str
+        height: _builtins.str
+        landscape: _builtins.bool
+        margin: _builtins.str
+        outline: _builtins.bool
+        pageRanges: _builtins.str
+        path: _builtins.str
+        preferCSSPageSize: _builtins.bool
+        printBackground: _builtins.bool
+        scale: _builtins.float
+        tagged: _builtins.bool
+        width: _builtins.str
+        def __init__(
+            self,
+            *,
+            displayHeaderFooter: _builtins.bool = ...,
+            footerTemplate: _builtins.str = ...,
+            format: _builtins.str = ...,
+            headerTemplate: _builtins.str = ...,
+            height: _builtins.str = ...,
+            landscape: _builtins.bool = ...,
+            margin: _builtins.str = ...,
+            outline: _builtins.bool = ...,
+            pageRanges: _builtins.str = ...,
+            path: _builtins.str = ...,
+            preferCSSPageSize: _builtins.bool = ...,
+            printBackground: _builtins.bool = ...,
+            scale: _builtins.float = ...,
+            tagged: _builtins.bool = ...,
+            width: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["displayHeaderFooter", b"displayHeaderFooter", "footerTemplate", b"footerTemplate", "format", b"format", "headerTemplate", b"headerTemplate", "height", b"height", "landscape", b"landscape", "margin", b"margin", "outline", b"outline", "pageRanges", b"pageRanges", "path", b"path", "preferCSSPageSize", b"preferCSSPageSize", "printBackground", b"printBackground", "scale", b"scale", "tagged", b"tagged", "width", b"width"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class EmulateMedia(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        COLORSCHEME_FIELD_NUMBER: _builtins.int
+        FORCEDCOLORS_FIELD_NUMBER: _builtins.int
+        MEDIA_FIELD_NUMBER: _builtins.int
+        REDUCEDMOTION_FIELD_NUMBER: _builtins.int
+        colorScheme: _builtins.str
+        forcedColors: _builtins.str
+        media: _builtins.str
+        reducedMotion: _builtins.str
+        def __init__(
+            self,
+            *,
+            colorScheme: _builtins.str = ...,
+            forcedColors: _builtins.str = ...,
+            media: _builtins.str = ...,
+            reducedMotion: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["colorScheme", b"colorScheme", "forcedColors", b"forcedColors", "media", b"media", "reducedMotion", b"reducedMotion"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ScreenshotOptions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        MASK_FIELD_NUMBER: _builtins.int
+        OPTIONS_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        mask: _builtins.str
+        options: _builtins.str
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            mask: _builtins.str = ...,
+            options: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["mask", b"mask", "options", b"options", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PageSource(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        COMPRESSION_FIELD_NUMBER: _builtins.int
+        compression: _builtins.str
+        """Empty or gzip"""
+        def __init__(
+            self,
+            *,
+            compression: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["compression", b"compression"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class KeywordCall(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        NAME_FIELD_NUMBER: _builtins.int
+        ARGUMENTS_FIELD_NUMBER: _builtins.int
+        POSITIONALARGUMENTS_FIELD_NUMBER: _builtins.int
+        name: _builtins.str
+        arguments: _builtins.str
+        positionalArguments: _builtins.str
+        """JSON list of the values of the arguments other than page, context, browser, logger and playwright, in order"""
+        def __init__(
+            self,
+            *,
+            name: _builtins.str = ...,
+            arguments: _builtins.str = ...,
+            positionalArguments: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["arguments", b"arguments", "name", b"name", "positionalArguments", b"positionalArguments"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class FilePath(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PATH_FIELD_NUMBER: _builtins.int
+        path: _builtins.str
+        def __init__(
+            self,
+            *,
+            path: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["path", b"path"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class StorageState(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PATH_FIELD_NUMBER: _builtins.int
+        INDEXEDDB_FIELD_NUMBER: _builtins.int
+        CREDENTIALS_FIELD_NUMBER: _builtins.int
+        path: _builtins.str
+        indexedDB: _builtins.bool
+        credentials: _builtins.bool
+        def __init__(
+            self,
+            *,
+            path: _builtins.str = ...,
+            indexedDB: _builtins.bool = ...,
+            credentials: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["credentials", b"credentials", "indexedDB", b"indexedDB", "path", b"path"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class SetStorageState(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PATH_FIELD_NUMBER: _builtins.int
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        RELOADPAGES_FIELD_NUMBER: _builtins.int
+        NAVIGATIONTIMEOUT_FIELD_NUMBER: _builtins.int
+        path: _builtins.str
+        timeout: _builtins.int
+        reloadPages: _builtins.str
+        navigationTimeout: _builtins.int
+        def __init__(
+            self,
+            *,
+            path: _builtins.str = ...,
+            timeout: _builtins.int = ...,
+            reloadPages: _builtins.str = ...,
+            navigationTimeout: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["navigationTimeout", b"navigationTimeout", "path", b"path", "reloadPages", b"reloadPages", "timeout", b"timeout"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class FileBySelector(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PATH_FIELD_NUMBER: _builtins.int
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        NAME_FIELD_NUMBER: _builtins.int
+        MIMETYPE_FIELD_NUMBER: _builtins.int
+        BUFFER_FIELD_NUMBER: _builtins.int
+        FILENAME_FIELD_NUMBER: _builtins.int
+        FILEINDEX_FIELD_NUMBER: _builtins.int
+        CONTENT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        strict: _builtins.bool
+        name: _builtins.str
+        mimeType: _builtins.str
+        buffer: _builtins.str
+        fileName: _builtins.str
+        """Chunk of a file streamed by the library, a new fileIndex starts the next file"""
+        fileIndex: _builtins.int
+        content: _builtins.bytes
+        """Without fileName a chunk of the buffer"""
+        @_builtins.property
+        def path(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            path: _abc.Iterable[_builtins.str] | None = ...,
+            selector: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            name: _builtins.str = ...,
+            mimeType: _builtins.str = ...,
+            buffer: _builtins.str = ...,
+            fileName: _builtins.str = ...,
+            fileIndex: _builtins.int = ...,
+            content: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["buffer", b"buffer", "content", b"content", "fileIndex", b"fileIndex", "fileName", b"fileName", "mimeType", b"mimeType", "name", b"name", "path", b"path", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class LocatorHandlerAddCustom(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        NOWAITAFTER_FIELD_NUMBER: _builtins.int
+        TIMES_FIELD_NUMBER: _builtins.int
+        HANDLERSPECS_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        noWaitAfter: _builtins.bool
+        times: _builtins.str
+        @_builtins.property
+        def handlerSpecs(self) -> _containers.RepeatedCompositeFieldContainer[Global___Request.LocatorHandlerAddCustomAction]: ...
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            noWaitAfter: _builtins.bool = ...,
+            times: _builtins.str = ...,
+            handlerSpecs: _abc.Iterable[Global___Request.LocatorHandlerAddCustomAction] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["handlerSpecs", b"handlerSpecs", "noWaitAfter", b"noWaitAfter", "selector", b"selector", "times", b"times"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class LocatorHandlerAddCustomAction(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ACTION_FIELD_NUMBER: _builtins.int
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        OPTIONSASJSON_FIELD_NUMBER: _builtins.int
+        action: _builtins.str
+        selector: _builtins.str
+        value: _builtins.str
+        optionsAsJson: _builtins.str
+        def __init__(
+            self,
+            *,
+            action: _builtins.str = ...,
+            selector: _builtins.str = ...,
+            value: _builtins.str = ...,
+            optionsAsJson: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["action", b"action", "optionsAsJson", b"optionsAsJson", "selector", b"selector", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class LocatorHandlerRemove(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["selector", b"selector"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Json(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        BODY_FIELD_NUMBER: _builtins.int
+        body: _builtins.str
+        def __init__(
+            self,
+            *,
+            body: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["body", b"body"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class MouseButtonOptions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ACTION_FIELD_NUMBER: _builtins.int
+        JSON_FIELD_NUMBER: _builtins.int
+        action: _builtins.str
+        json: _builtins.str
+        def __init__(
+            self,
+            *,
+            action: _builtins.str = ...,
+            json: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["action", b"action", "json", b"json"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class MouseWheel(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        DELTAX_FIELD_NUMBER: _builtins.int
+        DELTAY_FIELD_NUMBER: _builtins.int
+        deltaX: _builtins.int
+        deltaY: _builtins.int
+        def __init__(
+            self,
+            *,
+            deltaX: _builtins.int = ...,
+            deltaY: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["deltaX", b"deltaX", "deltaY", b"deltaY"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class KeyboardKeypress(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ACTION_FIELD_NUMBER: _builtins.int
+        KEY_FIELD_NUMBER: _builtins.int
+        DELAY_FIELD_NUMBER: _builtins.int
+        action: _builtins.str
+        key: _builtins.str
+        delay: _builtins.int
+        def __init__(
+            self,
+            *,
+            action: _builtins.str = ...,
+            key: _builtins.str = ...,
+            delay: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["action", b"action", "delay", b"delay", "key", b"key"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class KeyboardInputOptions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ACTION_FIELD_NUMBER: _builtins.int
+        INPUT_FIELD_NUMBER: _builtins.int
+        DELAY_FIELD_NUMBER: _builtins.int
+        action: _builtins.str
+        input: _builtins.str
+        delay: _builtins.int
+        def __init__(
+            self,
+            *,
+            action: _builtins.str = ...,
+            input: _builtins.str = ...,
+            delay: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["action", b"action", "delay", b"delay", "input", b"input"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Browser(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        BROWSER_FIELD_NUMBER: _builtins.int
+        RAWOPTIONS_FIELD_NUMBER: _builtins.int
+        browser: _builtins.str
+        rawOptions: _builtins.str
+        def __init__(
+            self,
+            *,
+            browser: _builtins.str = ...,
+            rawOptions: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["browser", b"browser", "rawOptions", b"rawOptions"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Context(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        RAWOPTIONS_FIELD_NUMBER: _builtins.int
+        DEFAULTTIMEOUT_FIELD_NUMBER: _builtins.int
+        TRACEFILE_FIELD_NUMBER: _builtins.int
+        rawOptions: _builtins.str
+        defaultTimeout: _builtins.int
+        traceFile: _builtins.str
+        def __init__(
+            self,
+            *,
+            rawOptions: _builtins.str = ...,
+            defaultTimeout: _builtins.int = ...,
+            traceFile: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["defaultTimeout", b"defaultTimeout", "rawOptions", b"rawOptions", "traceFile", b"traceFile"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PersistentContext(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        BROWSER_FIELD_NUMBER: _builtins.int
+        RAWOPTIONS_FIELD_NUMBER: _builtins.int
+        DEFAULTTIMEOUT_FIELD_NUMBER: _builtins.int
+        TRACEFILE_FIELD_NUMBER: _builtins.int
+        browser: _builtins.str
+        rawOptions: _builtins.str
+        defaultTimeout: _builtins.int
+        traceFile: _builtins.str
+        def __init__(
+            self,
+            *,
+            browser: _builtins.str = ...,
+            rawOptions: _builtins.str = ...,
+            defaultTimeout: _builtins.int = ...,
+            traceFile: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["browser", b"browser", "defaultTimeout", b"defaultTimeout", "rawOptions", b"rawOptions", "traceFile", b"traceFile"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Permissions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PERMISSIONS_FIELD_NUMBER: _builtins.int
+        ORIGIN_FIELD_NUMBER: _builtins.int
+        origin: _builtins.str
+        @_builtins.property
+        def permissions(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            permissions: _abc.Iterable[_builtins.str] | None = ...,
+            origin: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["origin", b"origin", "permissions", b"permissions"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Url(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        URL_FIELD_NUMBER: _builtins.int
+        DEFAULTTIMEOUT_FIELD_NUMBER: _builtins.int
+        url: _builtins.str
+        defaultTimeout: _builtins.int
+        def __init__(
+            self,
+            *,
+            url: _builtins.str = ...,
+            defaultTimeout: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["defaultTimeout", b"defaultTimeout", "url", b"url"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class DownloadOptions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        URL_FIELD_NUMBER: _builtins.int
+        PATH_FIELD_NUMBER: _builtins.int
+        WAITFORFINISH_FIELD_NUMBER: _builtins.int
+        DOWNLOADTIMEOUT_FIELD_NUMBER: _builtins.int
+        url: _builtins.str
+        path: _builtins.str
+        waitForFinish: _builtins.bool
+        downloadTimeout: _builtins.int
+        def __init__(
+            self,
+            *,
+            url: _builtins.str = ...,
+            path: _builtins.str = ...,
+            waitForFinish: _builtins.bool = ...,
+            downloadTimeout: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["downloadTimeout", b"downloadTimeout", "path", b"path", "url", b"url", "waitForFinish", b"waitForFinish"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class DownloadID(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class UrlOptions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        URL_FIELD_NUMBER: _builtins.int
+        WAITUNTIL_FIELD_NUMBER: _builtins.int
+        waitUntil: _builtins.str
+        @_builtins.property
+        def url(self) -> Global___Request.Url: ...
+        def __init__(
+            self,
+            *,
+            url: Global___Request.Url | None = ...,
+            waitUntil: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["url", b"url"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["url", b"url", "waitUntil", b"waitUntil"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PageLoadState(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        STATE_FIELD_NUMBER: _builtins.int
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        state: _builtins.str
+        timeout: _builtins.int
+        def __init__(
+            self,
+            *,
+            state: _builtins.str = ...,
+            timeout: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["state", b"state", "timeout", b"timeout"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ConnectBrowser(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        BROWSER_FIELD_NUMBER: _builtins.int
+        URL_FIELD_NUMBER: _builtins.int
+        CONNECTCDP_FIELD_NUMBER: _builtins.int
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        browser: _builtins.str
+        url: _builtins.str
+        connectCDP: _builtins.bool
+        timeout: _builtins.int
+        def __init__(
+            self,
+            *,
+            browser: _builtins.str = ...,
+            url: _builtins.str = ...,
+            connectCDP: _builtins.bool = ...,
+            timeout: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["browser", b"browser", "connectCDP", b"connectCDP", "timeout", b"timeout", "url", b"url"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class TextInput(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        INPUT_FIELD_NUMBER: _builtins.int
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        TYPE_FIELD_NUMBER: _builtins.int
+        input: _builtins.str
+        selector: _builtins.str
+        type: _builtins.bool
+        def __init__(
+            self,
+            *,
+            input: _builtins.str = ...,
+            selector: _builtins.str = ...,
+            type: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["input", b"input", "selector", b"selector", "type", b"type"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ElementProperty(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        PROPERTY_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        property: _builtins.str
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            property: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["property", b"property", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class TypeText(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        TEXT_FIELD_NUMBER: _builtins.int
+        DELAY_FIELD_NUMBER: _builtins.int
+        CLEAR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        text: _builtins.str
+        delay: _builtins.int
+        clear: _builtins.bool
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            text: _builtins.str = ...,
+            delay: _builtins.int = ...,
+            clear: _builtins.bool = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["clear", b"clear", "delay", b"delay", "selector", b"selector", "strict", b"strict", "text", b"text"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class FillText(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        TEXT_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        FORCE_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        text: _builtins.str
+        strict: _builtins.bool
+        force: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            text: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            force: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["force", b"force", "selector", b"selector", "strict", b"strict", "text", b"text"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ClearText(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PressKeys(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        KEY_FIELD_NUMBER: _builtins.int
+        PRESSDELAY_FIELD_NUMBER: _builtins.int
+        KEYDELAY_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        strict: _builtins.bool
+        pressDelay: _builtins.int
+        keyDelay: _builtins.int
+        @_builtins.property
+        def key(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            key: _abc.Iterable[_builtins.str] | None = ...,
+            pressDelay: _builtins.int = ...,
+            keyDelay: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "keyDelay", b"keyDelay", "pressDelay", b"pressDelay", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ElementSelector(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        FORCE_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        strict: _builtins.bool
+        force: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            force: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["force", b"force", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ElementSelectorWithTextType(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        TEXTTYPE_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        strict: _builtins.bool
+        textType: _builtins.str
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            textType: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["selector", b"selector", "strict", b"strict", "textType", b"textType"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Timeout(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        timeout: _builtins.float
+        def __init__(
+            self,
+            *,
+            timeout: _builtins.float = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["timeout", b"timeout"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Index(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        INDEX_FIELD_NUMBER: _builtins.int
+        index: _builtins.str
+        def __init__(
+            self,
+            *,
+            index: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["index", b"index"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class IdWithTimeout(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        timeout: _builtins.float
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+            timeout: _builtins.float = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id", "timeout", b"timeout"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class StyleTag(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        CONTENT_FIELD_NUMBER: _builtins.int
+        content: _builtins.str
+        def __init__(
+            self,
+            *,
+            content: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["content", b"content"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ElementSelectorWithOptions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        OPTIONS_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        options: _builtins.str
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            options: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["options", b"options", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ElementSelectorWithDuration(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        DURATION_FIELD_NUMBER: _builtins.int
+        WIDTH_FIELD_NUMBER: _builtins.int
+        STYLE_FIELD_NUMBER: _builtins.int
+        COLOR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        MODE_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        duration: _builtins.int
+        width: _builtins.str
+        style: _builtins.str
+        color: _builtins.str
+        strict: _builtins.bool
+        mode: _builtins.str
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            duration: _builtins.int = ...,
+            width: _builtins.str = ...,
+            style: _builtins.str = ...,
+            color: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            mode: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["color", b"color", "duration", b"duration", "mode", b"mode", "selector", b"selector", "strict", b"strict", "style", b"style", "width", b"width"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class SelectElementSelector(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        MATCHERJSON_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        matcherJson: _builtins.str
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            matcherJson: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["matcherJson", b"matcherJson", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class WaitForFunctionOptions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SCRIPT_FIELD_NUMBER: _builtins.int
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        OPTIONS_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        script: _builtins.str
+        selector: _builtins.str
+        options: _builtins.str
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            script: _builtins.str = ...,
+            selector: _builtins.str = ...,
+            options: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["options", b"options", "script", b"script", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PlaywrightObject(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        INFO_FIELD_NUMBER: _builtins.int
+        info: _builtins.str
+        def __init__(
+            self,
+            *,
+            info: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["info", b"info"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Viewport(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        WIDTH_FIELD_NUMBER: _builtins.int
+        HEIGHT_FIELD_NUMBER: _builtins.int
+        width: _builtins.int
+        height: _builtins.int
+        def __init__(
+            self,
+            *,
+            width: _builtins.int = ...,
+            height: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["height", b"height", "width", b"width"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class HttpRequest(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        URL_FIELD_NUMBER: _builtins.int
+        METHOD_FIELD_NUMBER: _builtins.int
+        BODY_FIELD_NUMBER: _builtins.int
+        HEADERS_FIELD_NUMBER: _builtins.int
+        BINARYBODY_FIELD_NUMBER: _builtins.int
+        url: _builtins.str
+        method: _builtins.str
+        body: _builtins.str
+        headers: _builtins.str
+        binaryBody: _builtins.bytes
+        """Used instead of body when not empty, only by ApiRequest"""
+        def __init__(
+            self,
+            *,
+            url: _builtins.str = ...,
+            method: _builtins.str = ...,
+            body: _builtins.str = ...,
+            headers: _builtins.str = ...,
+            binaryBody: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["binaryBody", b"binaryBody", "body", b"body", "headers", b"headers", "method", b"method", "url", b"url"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class HttpCapture(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        URLORPREDICATE_FIELD_NUMBER: _builtins.int
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        urlOrPredicate: _builtins.str
+        timeout: _builtins.float
+        def __init__(
+            self,
+            *,
+            urlOrPredicate: _builtins.str = ...,
+            timeout: _builtins.float = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["timeout", b"timeout", "urlOrPredicate", b"urlOrPredicate"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Route(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        URLORPREDICATE_FIELD_NUMBER: _builtins.int
+        ACTION_FIELD_NUMBER: _builtins.int
+        STATUS_FIELD_NUMBER: _builtins.int
+        HEADERS_FIELD_NUMBER: _builtins.int
+        BODY_FIELD_NUMBER: _builtins.int
+        PATH_FIELD_NUMBER: _builtins.int
+        ERRORCODE_FIELD_NUMBER: _builtins.int
+        TIMES_FIELD_NUMBER: _builtins.int
+        NOTFOUND_FIELD_NUMBER: _builtins.int
+        urlOrPredicate: _builtins.str
+        """Matches the request url, like HttpCapture.urlOrPredicate, but a function receives the URL object of it"""
+        action: _builtins.str
+        """fulfill, abort, continue or har"""
+        status: _builtins.int
+        headers: _builtins.str
+        """JSON object of the response headers, or of headers added to the request by continue"""
+        body: _builtins.bytes
+        path: _builtins.str
+        """HAR file of the har action"""
+        errorCode: _builtins.str
+        times: _builtins.int
+        """How many times the route is used, 0 is unlimited"""
+        notFound: _builtins.str
+        """abort or fallback, for a request not found in the HAR file"""
+        def __init__(
+            self,
+            *,
+            urlOrPredicate: _builtins.str = ...,
+            action: _builtins.str = ...,
+            status: _builtins.int = ...,
+            headers: _builtins.str = ...,
+            body: _builtins.bytes = ...,
+            path: _builtins.str = ...,
+            errorCode: _builtins.str = ...,
+            times: _builtins.int = ...,
+            notFound: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["action", b"action", "body", b"body", "errorCode", b"errorCode", "headers", b"headers", "notFound", b"notFound", "path", b"path", "status", b"status", "times", b"times", "urlOrPredicate", b"urlOrPredicate"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class RouteId(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class NetworkRecording(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        URLORPREDICATE_FIELD_NUMBER: _builtins.int
+        MAXBODYSIZE_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        urlOrPredicate: _builtins.str
+        """Records only responses matching it, like HttpCapture.urlOrPredicate. Empty records all."""
+        maxBodySize: _builtins.int
+        """Response bodies up to this many bytes are recorded, 0 records none."""
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+            urlOrPredicate: _builtins.str = ...,
+            maxBodySize: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id", "maxBodySize", b"maxBodySize", "urlOrPredicate", b"urlOrPredicate"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Device(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        NAME_FIELD_NUMBER: _builtins.int
+        name: _builtins.str
+        def __init__(
+            self,
+            *,
+            name: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["name", b"name"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class AlertAction(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ALERTACTION_FIELD_NUMBER: _builtins.int
+        PROMPTINPUT_FIELD_NUMBER: _builtins.int
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        alertAction: _builtins.str
+        promptInput: _builtins.str
+        timeout: _builtins.float
+        def __init__(
+            self,
+            *,
+            alertAction: _builtins.str = ...,
+            promptInput: _builtins.str = ...,
+            timeout: _builtins.float = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["alertAction", b"alertAction", "promptInput", b"promptInput", "timeout", b"timeout"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class AlertActions(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ITEMS_FIELD_NUMBER: _builtins.int
+        @_builtins.property
+        def items(self) -> _containers.RepeatedCompositeFieldContainer[Global___Request.AlertAction]: ...
+        def __init__(
+            self,
+            *,
+            items: _abc.Iterable[Global___Request.AlertAction] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["items", b"items"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Bool(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        VALUE_FIELD_NUMBER: _builtins.int
+        value: _builtins.bool
+        def __init__(
+            self,
+            *,
+            value: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class EvaluateAll(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        SCRIPT_FIELD_NUMBER: _builtins.int
+        ARG_FIELD_NUMBER: _builtins.int
+        ALLELEMENTS_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        script: _builtins.str
+        arg: _builtins.str
+        allElements: _builtins.bool
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            script: _builtins.str = ...,
+            arg: _builtins.str = ...,
+            allElements: _builtins.bool = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["allElements", b"allElements", "arg", b"arg", "script", b"script", "selector", b"selector", "strict", b"strict"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ElementStyle(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        PSEUDO_FIELD_NUMBER: _builtins.int
+        STYLEKEY_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        selector: _builtins.str
+        pseudo: _builtins.str
+        styleKey: _builtins.str
+        strict: _builtins.bool
+        def __init__(
+            self,
+            *,
+            selector: _builtins.str = ...,
+            pseudo: _builtins.str = ...,
+            styleKey: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["pseudo", b"pseudo", "selector", b"selector", "strict", b"strict", "styleKey", b"styleKey"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class AssertPoll(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        GETTER_FIELD_NUMBER: _builtins.int
+        SELECTOR_FIELD_NUMBER: _builtins.int
+        STRICT_FIELD_NUMBER: _builtins.int
+        ARGUMENT_FIELD_NUMBER: _builtins.int
+        PSEUDO_FIELD_NUMBER: _builtins.int
+        OPERATOR_FIELD_NUMBER: _builtins.int
+        EXPECTED_FIELD_NUMBER: _builtins.int
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        RETRYFOR_FIELD_NUMBER: _builtins.int
+        POLLING_FIELD_NUMBER: _builtins.int
+        getter: _builtins.str
+        """Text, Property, Attribute, ElementCount or Style"""
+        selector: _builtins.str
+        strict: _builtins.bool
+        argument: _builtins.str
+        """Property, attribute or style key name"""
+        pseudo: _builtins.str
+        operator: _builtins.str
+        """AssertionOperator value, for example == or *="""
+        expected: _builtins.str
+        """Expected value as JSON"""
+        timeout: _builtins.int
+        """Milliseconds left of the keyword timeout"""
+        retryFor: _builtins.int
+        """Milliseconds to keep retrying after the first failed try"""
+        polling: _builtins.str
+        """PollingStrategy name, mutation when empty"""
+        def __init__(
+            self,
+            *,
+            getter: _builtins.str = ...,
+            selector: _builtins.str = ...,
+            strict: _builtins.bool = ...,
+            argument: _builtins.str = ...,
+            pseudo: _builtins.str = ...,
+            operator: _builtins.str = ...,
+            expected: _builtins.str = ...,
+            timeout: _builtins.int = ...,
+            retryFor: _builtins.int = ...,
+            polling: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["argument", b"argument", "expected", b"expected", "getter", b"getter", "operator", b"operator", "polling", b"polling", "pseudo", b"pseudo", "retryFor", b"retryFor", "selector", b"selector", "strict", b"strict", "timeout", b"timeout"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PageChange(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KIND_FIELD_NUMBER: _builtins.int
+        TIMEOUT_FIELD_NUMBER: _builtins.int
+        kind: _builtins.str
+        """mutation or network_idle"""
+        timeout: _builtins.int
+        """Milliseconds to wait at most"""
+        def __init__(
+            self,
+            *,
+            kind: _builtins.str = ...,
+            timeout: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["kind", b"kind", "timeout", b"timeout"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CreateCredential(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        RPID_FIELD_NUMBER: _builtins.int
+        ID_FIELD_NUMBER: _builtins.int
+        PRIVATEKEY_FIELD_NUMBER: _builtins.int
+        PUBLICKEY_FIELD_NUMBER: _builtins.int
+        USERHANDLE_FIELD_NUMBER: _builtins.int
+        rpId: _builtins.str
+        id: _builtins.str
+        privateKey: _builtins.str
+        publicKey: _builtins.str
+        userHandle: _builtins.str
+        def __init__(
+            self,
+            *,
+            rpId: _builtins.str = ...,
+            id: _builtins.str = ...,
+            privateKey: _builtins.str = ...,
+            publicKey: _builtins.str = ...,
+            userHandle: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id", "privateKey", b"privateKey", "publicKey", b"publicKey", "rpId", b"rpId", "userHandle", b"userHandle"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CredentialIdAndRpId(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        RPID_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        rpId: _builtins.str
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+            rpId: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id", "rpId", b"rpId"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class BatchStep(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        METHOD_FIELD_NUMBER: _builtins.int
+        REQUEST_FIELD_NUMBER: _builtins.int
+        method: _builtins.str
+        request: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            method: _builtins.str = ...,
+            request: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["method", b"method", "request", b"request"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Batch(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        STEPS_FIELD_NUMBER: _builtins.int
+        @_builtins.property
+        def steps(self) -> _containers.RepeatedCompositeFieldContainer[Global___Request.BatchStep]: ...
+        def __init__(
+            self,
+            *,
+            steps: _abc.Iterable[Global___Request.BatchStep] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["steps", b"steps"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Envelope(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        METHOD_FIELD_NUMBER: _builtins.int
+        REQUEST_FIELD_NUMBER: _builtins.int
+        id: _builtins.int
+        method: _builtins.str
+        request: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            id: _builtins.int = ...,
+            method: _builtins.str = ...,
+            request: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id", "method", b"method", "request", b"request"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Request: _TypeAlias = Request  # noqa: Y015
+
+@_typing.final
+class Types(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class SelectEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        VALUE_FIELD_NUMBER: _builtins.int
+        LABEL_FIELD_NUMBER: _builtins.int
+        INDEX_FIELD_NUMBER: _builtins.int
+        SELECTED_FIELD_NUMBER: _builtins.int
+        value: _builtins.str
+        label: _builtins.str
+        index: _builtins.int
+        selected: _builtins.bool
+        def __init__(
+            self,
+            *,
+            value: _builtins.str = ...,
+            label: _builtins.str = ...,
+            index: _builtins.int = ...,
+            selected: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["index", b"index", "label", b"label", "selected", b"selected", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Types: _TypeAlias = Types  # noqa: Y015
+
+@_typing.final
+class Response(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Empty(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class String(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        BODY_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        body: _builtins.str
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            body: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["body", b"body", "log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ListString(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ITEMS_FIELD_NUMBER: _builtins.int
+        LOG_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        @_builtins.property
+        def items(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            items: _abc.Iterable[_builtins.str] | None = ...,
+            log: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["items", b"items", "log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Keywords(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        KEYWORDS_FIELD_NUMBER: _builtins.int
+        KEYWORDDOCUMENTATIONS_FIELD_NUMBER: _builtins.int
+        KEYWORDARGUMENTS_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        @_builtins.property
+        def keywords(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        @_builtins.property
+        def keywordDocumentations(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        @_builtins.property
+        def keywordArguments(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            keywords: _abc.Iterable[_builtins.str] | None = ...,
+            keywordDocumentations: _abc.Iterable[_builtins.str] | None = ...,
+            keywordArguments: _abc.Iterable[_builtins.str] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["keywordArguments", b"keywordArguments", "keywordDocumentations", b"keywordDocumentations", "keywords", b"keywords", "log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Bool(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        BODY_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        body: _builtins.bool
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            body: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["body", b"body", "log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Int(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        BODY_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        body: _builtins.int
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            body: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["body", b"body", "log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Select(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ENTRY_FIELD_NUMBER: _builtins.int
+        @_builtins.property
+        def entry(self) -> _containers.RepeatedCompositeFieldContainer[Global___Types.SelectEntry]: ...
+        def __init__(
+            self,
+            *,
+            entry: _abc.Iterable[Global___Types.SelectEntry] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["entry", b"entry"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Json(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        JSON_FIELD_NUMBER: _builtins.int
+        BODYPART_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        json: _builtins.str
+        bodyPart: _builtins.str
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            json: _builtins.str = ...,
+            bodyPart: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["bodyPart", b"bodyPart", "json", b"json", "log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Bytes(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        BODY_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        body: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            body: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["body", b"body", "log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class HttpResponse(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        JSON_FIELD_NUMBER: _builtins.int
+        BODY_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        json: _builtins.str
+        """Status, headers and url of the response, in the first message only"""
+        body: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            json: _builtins.str = ...,
+            body: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["body", b"body", "json", b"json", "log", b"log"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class JavascriptExecutionResult(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        RESULT_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        result: _builtins.str
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            result: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["log", b"log", "result", b"result"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class NewContextResponse(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        LOG_FIELD_NUMBER: _builtins.int
+        CONTEXTOPTIONS_FIELD_NUMBER: _builtins.int
+        NEWBROWSER_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        log: _builtins.str
+        contextOptions: _builtins.str
+        newBrowser: _builtins.bool
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+            log: _builtins.str = ...,
+            contextOptions: _builtins.str = ...,
+            newBrowser: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["contextOptions", b"contextOptions", "id", b"id", "log", b"log", "newBrowser", b"newBrowser"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class NewPersistentContextResponse(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        LOG_FIELD_NUMBER: _builtins.int
+        CONTEXTOPTIONS_FIELD_NUMBER: _builtins.int
+        NEWBROWSER_FIELD_NUMBER: _builtins.int
+        VIDEO_FIELD_NUMBER: _builtins.int
+        PAGEID_FIELD_NUMBER: _builtins.int
+        BROWSERID_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        log: _builtins.str
+        contextOptions: _builtins.str
+        newBrowser: _builtins.bool
+        video: _builtins.str
+        pageId: _builtins.str
+        browserId: _builtins.str
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+            log: _builtins.str = ...,
+            contextOptions: _builtins.str = ...,
+            newBrowser: _builtins.bool = ...,
+            video: _builtins.str = ...,
+            pageId: _builtins.str = ...,
+            browserId: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["browserId", b"browserId", "contextOptions", b"contextOptions", "id", b"id", "log", b"log", "newBrowser", b"newBrowser", "pageId", b"pageId", "video", b"video"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class NewPageResponse(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        BODY_FIELD_NUMBER: _builtins.int
+        VIDEO_FIELD_NUMBER: _builtins.int
+        NEWBROWSER_FIELD_NUMBER: _builtins.int
+        NEWCONTEXT_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        body: _builtins.str
+        video: _builtins.str
+        newBrowser: _builtins.bool
+        newContext: _builtins.bool
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            body: _builtins.str = ...,
+            video: _builtins.str = ...,
+            newBrowser: _builtins.bool = ...,
+            newContext: _builtins.bool = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["body", b"body", "log", b"log", "newBrowser", b"newBrowser", "newContext", b"newContext", "video", b"video"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PageReportResponse(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        ERRORS_FIELD_NUMBER: _builtins.int
+        CONSOLE_FIELD_NUMBER: _builtins.int
+        PAGEID_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        errors: _builtins.str
+        console: _builtins.str
+        pageId: _builtins.str
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            errors: _builtins.str = ...,
+            console: _builtins.str = ...,
+            pageId: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["console", b"console", "errors", b"errors", "log", b"log", "pageId", b"pageId"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class GetCredential(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        RPID_FIELD_NUMBER: _builtins.int
+        USERHANDLE_FIELD_NUMBER: _builtins.int
+        PRIVATEKEY_FIELD_NUMBER: _builtins.int
+        PUBLICKEY_FIELD_NUMBER: _builtins.int
+        LOG_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        rpId: _builtins.str
+        userHandle: _builtins.str
+        privateKey: _builtins.str
+        publicKey: _builtins.str
+        log: _builtins.str
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+            rpId: _builtins.str = ...,
+            userHandle: _builtins.str = ...,
+            privateKey: _builtins.str = ...,
+            publicKey: _builtins.str = ...,
+            log: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id", "log", b"log", "privateKey", b"privateKey", "publicKey", b"publicKey", "rpId", b"rpId", "userHandle", b"userHandle"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class BatchStepResult(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        METHOD_FIELD_NUMBER: _builtins.int
+        OK_FIELD_NUMBER: _builtins.int
+        RESPONSE_FIELD_NUMBER: _builtins.int
+        ERROR_FIELD_NUMBER: _builtins.int
+        method: _builtins.str
+        ok: _builtins.bool
+        response: _builtins.bytes
+        error: _builtins.str
+        def __init__(
+            self,
+            *,
+            method: _builtins.str = ...,
+            ok: _builtins.bool = ...,
+            response: _builtins.bytes = ...,
+            error: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "method", b"method", "ok", b"ok", "response", b"response"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Batch(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_FIELD_NUMBER: _builtins.int
+        RESULTS_FIELD_NUMBER: _builtins.int
+        log: _builtins.str
+        @_builtins.property
+        def results(self) -> _containers.RepeatedCompositeFieldContainer[Global___Response.BatchStepResult]: ...
+        def __init__(
+            self,
+            *,
+            log: _builtins.str = ...,
+            results: _abc.Iterable[Global___Response.BatchStepResult] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["log", b"log", "results", b"results"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Envelope(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        RESPONSE_FIELD_NUMBER: _builtins.int
+        CODE_FIELD_NUMBER: _builtins.int
+        ERROR_FIELD_NUMBER: _builtins.int
+        id: _builtins.int
+        response: _builtins.bytes
+        code: _builtins.int
+        error: _builtins.str
+        def __init__(
+            self,
+            *,
+            id: _builtins.int = ...,
+            response: _builtins.bytes = ...,
+            code: _builtins.int = ...,
+            error: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["code", b"code", "error", b"error", "id", b"id", "response", b"response"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ClosedContext(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ID_FIELD_NUMBER: _builtins.int
+        BROWSERID_FIELD_NUMBER: _builtins.int
+        TRACEFILE_FIELD_NUMBER: _builtins.int
+        VIDEOS_FIELD_NUMBER: _builtins.int
+        ERROR_FIELD_NUMBER: _builtins.int
+        id: _builtins.str
+        browserId: _builtins.str
+        traceFile: _builtins.str
+        """Saved trace, empty when the context was not traced or the trace was not saved"""
+        error: _builtins.str
+        @_builtins.property
+        def videos(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            id: _builtins.str = ...,
+            browserId: _builtins.str = ...,
+            traceFile: _builtins.str = ...,
+            videos: _abc.Iterable[_builtins.str] | None = ...,
+            error: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["browserId", b"browserId", "error", b"error", "id", b"id", "traceFile", b"traceFile", "videos", b"videos"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class AssertPoll(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        STATUS_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        ERROR_FIELD_NUMBER: _builtins.int
+        TRIES_FIELD_NUMBER: _builtins.int
+        MUTATIONWAKEUPS_FIELD_NUMBER: _builtins.int
+        LOG_FIELD_NUMBER: _builtins.int
+        WASTEDWAKEUPS_FIELD_NUMBER: _builtins.int
+        status: _builtins.str
+        """passed, failed, error or unsupported"""
+        value: _builtins.str
+        """Value of the last try as JSON"""
+        error: _builtins.str
+        tries: _builtins.int
+        mutationWakeups: _builtins.int
+        """Tries woken by a DOM change rather than by the interval"""
+        log: _builtins.str
+        wastedWakeups: _builtins.int
+        """Wakeups after which the try failed again"""
+        def __init__(
+            self,
+            *,
+            status: _builtins.str = ...,
+            value: _builtins.str = ...,
+            error: _builtins.str = ...,
+            tries: _builtins.int = ...,
+            mutationWakeups: _builtins.int = ...,
+            log: _builtins.str = ...,
+            wastedWakeups: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "log", b"log", "mutationWakeups", b"mutationWakeups", "status", b"status", "tries", b"tries", "value", b"value", "wastedWakeups", b"wastedWakeups"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CatalogChange(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KIND_FIELD_NUMBER: _builtins.int
+        ID_FIELD_NUMBER: _builtins.int
+        kind: _builtins.str
+        """opened, closed or activated"""
+        id: _builtins.str
+        def __init__(
+            self,
+            *,
+            kind: _builtins.str = ...,
+            id: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id", "kind", b"kind"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CatalogEvent(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        VERSION_FIELD_NUMBER: _builtins.int
+        CHANGES_FIELD_NUMBER: _builtins.int
+        JSON_FIELD_NUMBER: _builtins.int
+        version: _builtins.int
+        json: _builtins.str
+        """Browser catalog without page details, as returned by GetBrowserCatalog"""
+        @_builtins.property
+        def changes(self) -> _containers.RepeatedCompositeFieldContainer[Global___Response.CatalogChange]: ...
+        def __init__(
+            self,
+            *,
+            version: _builtins.int = ...,
+            changes: _abc.Iterable[Global___Response.CatalogChange] | None = ...,
+            json: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["changes", b"changes", "json", b"json", "version", b"version"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Response: _TypeAlias = Response  # noqa: Y015
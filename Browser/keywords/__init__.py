@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from .assertion_formatter import Formatter
+from .batching import Batching
 from .browser_control import Control
 from .clock import Clock
 from .cookie import Cookie
@@ -28,12 +29,14 @@ from .network import Network
 from .pdf import Pdf
 from .playwright_state import PlaywrightState
 from .promises import Promises
+from .routing import Routing
 from .runonfailure import RunOnFailureKeywords
 from .strict_mode import StrictMode
 from .waiter import Waiter
 from .webapp_state import WebAppState
 
 __all__ = [
+    "Batching",
     "Clock",
     "Control",
     "Cookie",
@@ -50,6 +53,7 @@ __all__ = [
     "Pdf",
     "PlaywrightState",
     "Promises",
+    "Routing",
     "RunOnFailureKeywords",
     "StrictMode",
     "Waiter",
@@ -0,0 +1,54 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from robot.libraries.BuiltIn import BuiltIn
+
+from ..base import LibraryComponent
+from ..utils import keyword
+
+
+class Batching(LibraryComponent):
+    @keyword(tags=("Setter",))
+    def run_batched(self, *keywords: str):
+        """Runs the given keywords and sends their browser calls in as few requests as possible.
+
+        | =Arguments= | =Description= |
+        | ``*keywords`` | Keywords to run, separated with ``AND`` like with `BuiltIn.Run Keywords`. |
+
+        Every keyword normally makes its own call to the Playwright process.
+        Inside this keyword, the calls of setters like `Set Viewport Size`,
+        `Set Offline`, `Set Geolocation`, `Grant Permissions`, `Add Cookie` or
+        `Set Browser Timeout` are queued and sent together in one request,
+        which saves a round trip per keyword. This matters most when the
+        Playwright process runs on another machine, see
+        ``playwright_process_host`` in `Importing`.
+
+        Any other call, like the ones made by `Click`, `Fill Text` or
+        `Get Text`, first sends the queue and then goes out on its own, so it
+        sees the effects of the keywords before it and its errors and retries
+        stay with its keyword. The queued calls are run in order and stop at
+        the first failure, which is reported by the keyword that sent the
+        queue or by this keyword, not by the setter which queued the call.
+
+        Only the keywords run in the calling thread are batched, keywords
+        started with `Promise To` are not.
+
+        Example:
+        | `Run Batched`
+        | ...    `Set Viewport Size`    1280    720
+        | ...    AND    `Set Geolocation`    60.173708    24.982263
+        | ...    AND    `Grant Permissions`    geolocation
+        | ...    AND    `Click`    id=locate_button
+        """
+        with self.playwright.batch():
+            BuiltIn().run_keywords(*keywords)
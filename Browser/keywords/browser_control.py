@@ -15,7 +15,8 @@ import base64
 import json
 import sys
 import uuid
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import timedelta
 from pathlib import Path
@@ -48,6 +49,14 @@ if TYPE_CHECKING:
 class Control(LibraryComponent):
     """Keywords to do things on the current browser page and modify the page"""
 
+    def __init__(self, library):
+        LibraryComponent.__init__(self, library)
+        self._in_background = False
+        # Queued screenshots are saved in order by one thread and logged when drained.
+        self._screenshot_writer = ThreadPoolExecutor(max_workers=1)
+        self._queued_screenshots: list[tuple[Future, bool]] = []
+        self._reserved_screenshot_paths: set[Path] = set()
+
     @keyword(tags=("Setter", "BrowserControl"))
     def go_forward(self):
         """Navigates to the next page in history.
@@ -115,7 +124,8 @@ class Control(LibraryComponent):
             index += 1
             indexed = self._format_path(filename, index)
             path = directory / indexed
-            if not path.with_suffix(f".{fileType}").is_file():
+            file = path.with_suffix(f".{fileType}")
+            if not file.is_file() and file not in self._reserved_screenshot_paths:
                 return path
         raise RuntimeError("Could not find a unique filename for the screenshot.")
 
@@ -156,7 +166,7 @@ class Control(LibraryComponent):
         """Takes a screenshot of the current window or element and saves it to disk.
 
         | =Arguments= | =Description= |
-        | ``filename`` | Filename into which to save. The file will be saved into the Robot Framework ${OUTPUTDIR}/browser/screenshot directory by default, but it can be overwritten by providing a custom path or filename. String ``{index}`` in the filename will be replaced with a rolling number. Use this to not overwrite filenames. If filename equals to UUID (case insensitive), then the filename is created by Python uuid; https://docs.python.org/3/library/uuid.html. If filename equals to EMBED (case insensitive) or ${NONE}, then the screenshot is embedded as a Base64 image into the log.html. The image is saved temporarily to the disk and a warning is displayed if removing the temporary file fails. The ${OUTPUTDIR}/browser/screenshot directory is removed at the first suite startup. |
+        | ``filename`` | Filename into which to save. The file will be saved into the Robot Framework ${OUTPUTDIR}/browser/screenshot directory by default, but it can be overwritten by providing a custom path or filename. String ``{index}`` in the filename will be replaced with a rolling number. Use this to not overwrite filenames. If filename equals to UUID (case insensitive), then the filename is created by Python uuid; https://docs.python.org/3/library/uuid.html. If filename equals to EMBED (case insensitive) or ${NONE}, then the screenshot is embedded as a Base64 image into the log.html. The image is then transferred from the browser in memory and not saved to the disk. The ${OUTPUTDIR}/browser/screenshot directory is removed at the first suite startup. |
         | ``selector`` | Take a screenshot of the element matched by selector. See the `Finding elements` section for details about the selectors. If not provided, take a screenshot of the current viewport. |
         | ``crop`` | Crops the taken screenshot to the given box. It takes the same dictionary as returned from `Get BoundingBox`. Cropping only works on a page screenshot, so when no selector is given. |
         | ``disableAnimations`` | When set to ``True``, stops CSS animations, CSS transitions and Web Animations. Animations get different treatment depending on their duration:  - finite animations are fast-forwarded to completion, so they'll fire the transitionend event.  - infinite animations are cancelled to initial state, and then played over after the screenshot. |
@@ -189,39 +199,51 @@ class Control(LibraryComponent):
             file_name = uuid.uuid4().hex
         else:
             file_name = filename
+        # A file which would be deleted right away is not written at all.
+        in_memory = self._in_background or (
+            return_as is not ScreenshotReturnType.path
+            and self._is_discarded(log_screenshot, filename, return_as)
+        )
         with self._highlighting(highlight_selector):
-            string_path_no_extension = str(
-                self._get_screenshot_path(file_name, fileType.name)
+            string_path_no_extension = (
+                None
+                if in_memory
+                else str(self._get_screenshot_path(file_name, fileType.name))
             )
-            with self.playwright.grpc_channel() as stub:
-                options = self._create_screenshot_options(
-                    crop,
-                    disableAnimations,
-                    fileType,
-                    fullPage,
-                    omitBackground,
-                    quality,
-                    string_path_no_extension,
-                    timeout,
-                    maskColor,
-                    scale,
-                )
-                response = stub.TakeScreenshot(
-                    Request().ScreenshotOptions(
-                        selector=self.resolve_selector(selector) or "",
-                        mask=json.dumps(self._get_mask_selectors(mask)),
-                        options=json.dumps(options),
-                        strict=self.strict_mode,
-                    )
+            options = self._create_screenshot_options(
+                crop,
+                disableAnimations,
+                fileType,
+                fullPage,
+                omitBackground,
+                quality,
+                string_path_no_extension,
+                timeout,
+                maskColor,
+                scale,
+            )
+            request = Request().ScreenshotOptions(
+                selector=self.resolve_selector(selector) or "",
+                mask=json.dumps(self._get_mask_selectors(mask)),
+                options=json.dumps(options),
+                strict=self.strict_mode,
+            )
+            if self._in_background:
+                self._queue_screenshot(
+                    request, file_name, fileType.name, log_screenshot, filename
                 )
-            logger.debug(response.log)
-            screenshot_path_str = response.body
-            screenshot_path = Path(screenshot_path_str)
+                return None
+            screenshot_path_str, screenshot_bytes = self._capture_screenshot(
+                request, in_memory
+            )
+            screenshot_path = Path(screenshot_path_str) if screenshot_path_str else None
             if (log_screenshot and self._is_embed(filename)) or return_as in (
                 ScreenshotReturnType.bytes,
                 ScreenshotReturnType.base64,
             ):
-                screenshot_bytes = screenshot_path.read_bytes()
+                screenshot_bytes = self._read_screenshot(
+                    screenshot_path_str, screenshot_bytes
+                )
                 base64_screenshot = base64.b64encode(screenshot_bytes)
                 if log_screenshot and self._is_embed(filename):
                     logger.debug("Embedding image to log.html.")
@@ -287,12 +309,13 @@ class Control(LibraryComponent):
         scale,
     ):
         options = {
-            "path": f"{string_path_no_extension}.{fileType.name}",
             "fileType": fileType.name,
             "fullPage": fullPage,
             "timeout": int(self.get_timeout(timeout)),
             "omitBackground": omitBackground,
         }
+        if string_path_no_extension is not None:
+            options["path"] = f"{string_path_no_extension}.{fileType.name}"
         if quality is not None:
             options["quality"] = max(min(100, quality), 0)
         if disableAnimations:
@@ -320,14 +343,92 @@ class Control(LibraryComponent):
             mask_selectors = None
         return mask_selectors
 
-    def _unlink_screenshot(self, log_screenshot, filename, return_as, screenshot_path):
-        if (
+    def _capture_screenshot(self, request, in_memory: bool) -> tuple[str, bytes | None]:
+        if in_memory:
+            return "", self._capture_screenshot_bytes(request)
+        with self.playwright.grpc_channel() as stub:
+            response = stub.TakeScreenshot(request)
+        logger.debug(response.log)
+        return response.body, None
+
+    def _capture_screenshot_bytes(self, request) -> bytes:
+        chunks = []
+        with self.playwright.grpc_channel() as stub:
+            for response in stub.TakeScreenshotBytes(request):
+                logger.debug(response.log)
+                chunks.append(response.body)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _read_screenshot(path: str, image: bytes | None) -> bytes:
+        return Path(path).read_bytes() if image is None else image
+
+    @contextmanager
+    def screenshots_in_background(self, enabled: bool) -> Iterator[None]:
+        """Queues the screenshots taken inside, see `_queue_screenshot`."""
+        self._in_background = enabled
+        try:
+            yield
+        finally:
+            self._in_background = False
+
+    def _queue_screenshot(
+        self, request, file_name: str, file_type: str, log_screenshot, filename
+    ) -> None:
+        """Captures the screenshot to memory and leaves saving and logging it for later.
+
+        The image is written, or encoded for embedding, by a background thread,
+        and `_log_queued_screenshots` logs it in the order it was taken.
+        """
+        image = self._capture_screenshot_bytes(request)
+        path = None
+        if not self._is_embed(filename):
+            path = Path(
+                f"{self._get_screenshot_path(file_name, file_type)}.{file_type}"
+            )
+            self._reserved_screenshot_paths.add(path)
+        elif not log_screenshot:
+            return
+        future = self._screenshot_writer.submit(self._save_screenshot, image, path)
+        self._queued_screenshots.append((future, log_screenshot))
+        logger.info(f"Screenshot of {len(image)} bytes queued for the log.")
+
+    def _save_screenshot(self, image: bytes, path: Path | None) -> str | bytes:
+        if path is None:
+            return base64.b64encode(image)
+        try:
+            path.write_bytes(image)
+        finally:
+            self._reserved_screenshot_paths.discard(path)
+        return str(path)
+
+    def _log_queued_screenshots(self):
+        """Waits for the queued screenshots and logs them."""
+        while self._queued_screenshots:
+            future, log_screenshot = self._queued_screenshots.pop(0)
+            try:
+                screenshot = future.result()
+            except OSError as error:
+                logger.warn(f"Could not save the screenshot: {error}")
+                continue
+            if isinstance(screenshot, bytes):
+                self._embed_to_log(screenshot)
+            elif log_screenshot:
+                self._log_image_link(screenshot)
+
+    def _is_discarded(self, log_screenshot, filename, return_as) -> bool:
+        return (
             filename is None
             or self._is_embed(filename)
             or (
                 return_as in (ScreenshotReturnType.bytes, ScreenshotReturnType.base64)
                 and not log_screenshot
             )
+        )
+
+    def _unlink_screenshot(self, log_screenshot, filename, return_as, screenshot_path):
+        if screenshot_path is not None and self._is_discarded(
+            log_screenshot, filename, return_as
         ):
             try:
                 screenshot_path.unlink()
@@ -1,11 +1,17 @@
 import urllib.parse
+from collections import deque
 
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
 
 from Browser.base import LibraryComponent
 
-from ..utils import logger
+from ..utils import PageLoadStates, SelectionType, logger
+
+# Collects the links of a page in one call, download links are not followed.
+GATHER_LINKS = (
+    "(links) => links.filter((link) => !link.download).map((link) => link.href)"
+)
 
 
 class Crawling(LibraryComponent):
@@ -16,32 +22,36 @@ class Crawling(LibraryComponent):
         page_crawl_keyword="take_screenshot",
         max_number_of_page_to_crawl: int = 1000,
         max_depth_to_crawl: int = 50,
+        concurrent_pages: int = 1,
     ):
         """
         Web crawler is a tool to go through all the pages on a specific URL domain.
         This happens by finding all links going to the same site and opening those.
         Links pointing to another scheme or host are ignored, as are download links.
 
-        Returns the list of crawled urls. The order of the returned urls is not
-        guaranteed to be the order in which the pages were crawled.
+        Returns the list of crawled urls in the order in which the pages were crawled.
+        Pages are crawled breadth first, so pages closer to the start page come first.
 
         | =Arguments= | =Description= |
         | ``url`` | is the page to start crawling from. If it is given, a `New Page` is opened with that url. If it is not given, crawling starts from the url of the current page. |
         | ``page_crawl_keyword`` | is the keyword that will be executed on every page. It is run without arguments. By default it will take a screenshot on every page. |
         | ``max_number_of_page_to_crawl`` | is the upper limit of pages to crawl. Crawling will stop when this number of pages has been crawled. |
         | ``max_depth_to_crawl`` | is the upper limit of consecutive links followed from the start page. The start page has depth ``0`` and links deeper than this limit are not followed. |
+        | ``concurrent_pages`` | is the number of pages in the current context which load urls at the same time. The ``page_crawl_keyword`` is still run on one page at a time, and that page is the active page while it runs. The extra pages are closed and the original page is made active again when crawling ends. Defaults to ``1``. |
+
+        Example:
+        | ${urls} =    `Crawl Site`    https://example.com    My Page Keyword    concurrent_pages=4
 
         [https://forum.robotframework.org/t//4243|Comment >>]
         """
         if url:
             self.library.new_page(url)
-        return list(
-            self._crawl(
-                str(self.library.get_url()) or "",
-                page_crawl_keyword,
-                max_number_of_page_to_crawl,
-                max_depth_to_crawl,
-            )
+        return self._crawl(
+            str(self.library.get_url()) or "",
+            page_crawl_keyword,
+            max_number_of_page_to_crawl,
+            max_depth_to_crawl,
+            max(concurrent_pages, 1),
         )
 
     def _crawl(
@@ -50,64 +60,77 @@ class Crawling(LibraryComponent):
         page_crawl_keyword: str,
         max_number_of_page_to_crawl: int,
         max_depth_to_crawl: int,
-    ):
-        hrefs_to_crawl: list[tuple[str, int]] = [(start_url, 0)]
+        concurrent_pages: int = 1,
+    ) -> list[str]:
         url_parts = urllib.parse.urlparse(start_url)
         baseurl = url_parts.scheme + "://" + url_parts.netloc
-        crawled: set[str] = set()
-        while hrefs_to_crawl and len(crawled) < max_number_of_page_to_crawl:
-            href, depth = hrefs_to_crawl.pop()
-            if not href.startswith(baseurl):
-                continue
-            if href in crawled:
-                continue
-            logger.info(f"Crawling url {href}")
-            logger.console(
-                f"{len(crawled) + 1} / {len(crawled) + 1 + len(hrefs_to_crawl)} : Crawling url {href}"
-            )
+        frontier: deque[tuple[str, int]] = deque([(start_url, 0)])
+        seen = {start_url}
+        crawled: list[str] = []
+        pages = self._open_crawl_pages(concurrent_pages)
+        try:
+            while frontier and len(crawled) < max_number_of_page_to_crawl:
+                batch_size = min(
+                    len(pages),
+                    len(frontier),
+                    max_number_of_page_to_crawl - len(crawled),
+                )
+                batch = [frontier.popleft() for _ in range(batch_size)]
+                for page, href, depth in self._start_loading(pages, batch):
+                    logger.info(f"Crawling url {href}")
+                    logger.console(
+                        f"{len(crawled) + 1} / {len(crawled) + 1 + len(frontier)} : Crawling url {href}"
+                    )
+                    self.library.switch_page(page)
+                    try:
+                        self.library.wait_for_load_state(PageLoadStates.load)
+                    except Exception as e:
+                        logger.warn(f"Exception while crawling {href}: {e}")
+                        continue
+                    BuiltIn().run_keyword(page_crawl_keyword)
+                    crawled.append(href)
+                    if depth >= max_depth_to_crawl:
+                        continue
+                    for link in self._gather_links():
+                        if link.startswith(baseurl) and link not in seen:
+                            logger.debug(f"Adding link to {link}")
+                            seen.add(link)
+                            frontier.append((link, depth + 1))
+        finally:
+            self._close_crawl_pages(pages)
+        return crawled
+
+    def _open_crawl_pages(self, count: int) -> list[str]:
+        original = self.library.get_page_ids(
+            SelectionType.ACTIVE, SelectionType.ACTIVE, SelectionType.ACTIVE
+        )
+        pages = original[:1]
+        while len(pages) < count:
+            pages.append(self.library.new_page()["page_id"])
+        return pages
+
+    def _close_crawl_pages(self, pages: list[str]):
+        for page in pages[1:]:
+            self.library.close_page(page)
+        if pages:
+            self.library.switch_page(pages[0])
+
+    def _start_loading(
+        self, pages: list[str], batch: list[tuple[str, int]]
+    ) -> list[tuple[str, str, int]]:
+        """Starts the navigation of every page, without waiting for the pages to load."""
+        loading = []
+        for page, (href, depth) in zip(pages, batch, strict=False):
+            self.library.switch_page(page)
             try:
-                self.library.go_to(href)
+                self.library.go_to(href, wait_until=PageLoadStates.commit)
             except Exception as e:
                 logger.warn(f"Exception while crawling {href}: {e}")
                 continue
-            BuiltIn().run_keyword(page_crawl_keyword)
-            child_hrefs = self._gather_links(depth)
-            crawled.add(href)
-            hrefs_to_crawl = self._build_urls_to_crawl(
-                child_hrefs, hrefs_to_crawl, crawled, baseurl, max_depth_to_crawl
-            )
-        return crawled
-
-    def _gather_links(self, parent_depth: int) -> list[tuple[str, int]]:
-        link_elements = self.library.get_elements("//a[@href]")
-        links: set[str] = set()
-        depth = parent_depth + 1
-        for link_element in link_elements:
-            href, normal_link = self.library.evaluate_javascript(
-                link_element, "(e) => [e.href, !e.download]"
-            )
-            if normal_link:
-                links.add(href)
-        return [(c, depth) for c in links]
+            loading.append((page, href, depth))
+        return loading
 
-    def _build_urls_to_crawl(
-        self,
-        new_hrefs_to_crawl: list[tuple[str, int]],
-        old_hrefs_to_crawl: list[tuple[str, int]],
-        crawled: set[str],
-        baseurl: str,
-        max_depth: int,
-    ) -> list[tuple[str, int]]:
-        new_hrefs = []
-        for href, depth in new_hrefs_to_crawl:
-            if depth > max_depth:
-                continue
-            if href in [h[0] for h in old_hrefs_to_crawl]:
-                continue
-            if href in crawled:
-                continue
-            if not href.startswith(baseurl):
-                continue
-            logger.debug(f"Adding link to {href}")
-            new_hrefs.append((href, depth))
-        return new_hrefs + old_hrefs_to_crawl
+    def _gather_links(self) -> list[str]:
+        return self.library.evaluate_javascript(
+            "//a[@href]", GATHER_LINKS, all_elements=True
+        )
@@ -11,9 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import codecs
+import hashlib
 import json
 import re
+import zlib
+from collections.abc import Iterable, Iterator
 from contextlib import suppress
+from os import PathLike
+from pathlib import Path
 from typing import Any
 
 import grpc  # type: ignore
@@ -33,7 +39,11 @@ from robot.utils import DotDict
 
 from Browser.utils.misc import get_download_id
 
-from ..assertion_engine import assertion_formatter_used, with_assertion_polling
+from ..assertion_engine import (
+    assertion_formatter_used,
+    polled_on_node,
+    with_assertion_polling,
+)
 from ..base import LibraryComponent
 from ..generated.playwright_pb2 import Request
 from ..utils import keyword, logger
@@ -180,6 +190,11 @@ class Getters(LibraryComponent):
         assertion_operator: AssertionOperator | None = None,
         assertion_expected: Any | None = None,
         message: str | None = None,
+        *,
+        compress: bool = False,
+        file_path: PathLike | None = None,
+        hash_algorithm: str | None = None,
+        max_length: int | None = None,
     ) -> str | dict | tuple:
         """Gets the page's HTML source as a string.
 
@@ -187,23 +202,45 @@ class Getters(LibraryComponent):
         | ``assertion_operator`` | See `Assertions` for further details. Defaults to None. |
         | ``assertion_expected`` | Expected value for the state |
         | ``message`` | overrides the default error message for assertion. |
+        | ``compress`` | If ``True``, the source is gzip compressed while it is transferred from the Playwright process. Useful when the process runs on another machine, see `Experimental: Re-using same node process`. |
+        | ``file_path`` | If given, the source is written to this file as it is received and the keyword returns the path of the file instead of the source. |
+        | ``hash_algorithm`` | If given, the keyword returns the hex digest of the UTF-8 encoded source instead of the source. Can be any algorithm supported by Python ``hashlib``, for example ``sha256`` or ``md5``. |
+        | ``max_length`` | If given, only this many characters from the start of the source are returned. |
 
         Optionally does a string assertion. See `Assertions` for further details for
-        the assertion arguments. By default assertion is not done.
+        the assertion arguments. By default assertion is not done. The assertion is
+        done on the value the keyword returns, for example the digest if
+        ``hash_algorithm`` is given.
 
         If the HTML of a single element is needed, use `Get Property` instead.
         Example:
         | ${html1} =    `Get Property`    ${selector}    innerHTML
         | ${html2} =    `Get Property`    ${selector}    outerHTML
 
+        Example:
+        | `Get Page Source`    file_path=${OUTPUT_DIR}/page.html
+        | `Get Page Source`    hash_algorithm=sha256    ==    ${expected_digest}
+        | `Get Page Source`    max_length=100    *=    <title>
+
         [https://forum.robotframework.org/t//4275|Comment >>]
         """
-        body_parts: list[str] = []
         with self.playwright.grpc_channel() as stub:
-            for response in stub.GetPageSource(Request().Empty()):
-                body_parts.append(response.bodyPart)
-                logger.debug(response.log)
-            value = json.loads("".join(body_parts))
+            responses = stub.GetPageSourceBytes(
+                Request().PageSource(compression="gzip" if compress else "")
+            )
+            chunks = self._page_source_chunks(responses, compress)
+            if file_path is not None:
+                value = self._write_page_source(chunks, Path(file_path))
+            elif hash_algorithm:
+                digest = hashlib.new(hash_algorithm)
+                for chunk in chunks:
+                    digest.update(chunk)
+                value = digest.hexdigest()
+            else:
+                value = self._decode_page_source(chunks, max_length)
+                # The rest of the source is not needed.
+                with suppress(AttributeError):
+                    responses.cancel()
             formatter = self.get_assertion_formatter("Get Page Source")
             return verify_assertion(
                 value,
@@ -214,6 +251,36 @@ class Getters(LibraryComponent):
                 formatter,
             )
 
+    @staticmethod
+    def _page_source_chunks(responses: Iterable, compressed: bool) -> Iterator[bytes]:
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        for response in responses:
+            logger.debug(response.log)
+            yield (
+                decompressor.decompress(response.body) if compressed else response.body
+            )
+
+    @staticmethod
+    def _write_page_source(chunks: Iterable[bytes], path: Path) -> str:
+        with path.open("wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+        return str(path)
+
+    @staticmethod
+    def _decode_page_source(chunks: Iterable[bytes], max_length: int | None) -> str:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        parts: list[str] = []
+        length = 0
+        for chunk in chunks:
+            parts.append(decoder.decode(chunk))
+            length += len(parts[-1])
+            if max_length is not None and length >= max_length:
+                break
+        else:
+            parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)[:max_length]
+
     @keyword(tags=("Getter", "Assertion", "PageContent"))
     @with_assertion_polling
     @assertion_formatter_used
@@ -252,6 +319,7 @@ class Getters(LibraryComponent):
 
     @keyword(tags=("Getter", "Assertion", "PageContent"))
     @with_assertion_polling
+    @polled_on_node("Text")
     @assertion_formatter_used
     def get_text(
         self,
@@ -325,6 +393,7 @@ class Getters(LibraryComponent):
 
     @keyword(tags=("Getter", "Assertion", "PageContent"))
     @with_assertion_polling
+    @polled_on_node("Property", "property")
     @assertion_formatter_used
     def get_property(
         self,
@@ -385,6 +454,7 @@ class Getters(LibraryComponent):
 
     @keyword(tags=("Getter", "Assertion", "PageContent"))
     @with_assertion_polling
+    @polled_on_node("Attribute", "attribute")
     @assertion_formatter_used
     def get_attribute(
         self,
@@ -720,6 +790,7 @@ class Getters(LibraryComponent):
 
     @keyword(tags=("Getter", "Assertion", "PageContent"))
     @with_assertion_polling
+    @polled_on_node("ElementCount")
     def get_element_count(
         self,
         selector: str,
@@ -1186,6 +1257,7 @@ class Getters(LibraryComponent):
 
     @keyword(tags=("Getter", "Assertion", "PageContent"))
     @with_assertion_polling
+    @polled_on_node("Style", "key")
     @assertion_formatter_used
     def get_style(  # ruff: ignore[PLR0917]
         self,
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import json
-import sys
 from collections.abc import Generator
 from datetime import timedelta
 from os import PathLike
@@ -23,6 +22,7 @@ from typing import Any
 
 from ..base import LibraryComponent
 from ..generated.playwright_pb2 import Request
+from ..playwright import is_local_host
 from ..utils import (
     get_abs_scroll_coordinates,
     get_rel_scroll_coordinates,
@@ -45,6 +45,9 @@ from ..utils.data_types import (
 )
 from ..utils.types import Secret
 
+# Well below the 4 MB message size limit of gRPC.
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
 
 class Interaction(LibraryComponent):
     @keyword(tags=("Setter", "PageContent"))
@@ -1422,6 +1425,9 @@ class Interaction(LibraryComponent):
         Subdirectories are not included. It is possible to upload files and directories
         with the same keyword. The keyword fails if a given path does not exist.
 
+        When the Playwright process runs on another host, where the paths do not
+        exist, the files are sent to it in chunks and uploaded from temporary files.
+
         Keyword uses strict mode, see `Finding elements` for more details about strict mode.
 
         | =Arguments= | =Description= |
@@ -1458,24 +1464,24 @@ class Interaction(LibraryComponent):
         selector = self.resolve_selector(selector)
         if isinstance(path, PathLike):
             files = self._get_files(path, *extra_paths)
-            name = ""
-            mimeType = ""
-            buffer = ""
+            if is_local_host(self.playwright.host):
+                requests = _file_path_requests(selector, self.strict_mode, files)
+            else:
+                requests = _streamed_file_requests(selector, self.strict_mode, files)
         else:
             if extra_paths:
                 raise ValueError(
                     "Extra paths are not supported when using FileUploadBuffer as path."
                 )
-            files = []
-            name = path["name"]
-            mimeType = path["mimeType"]
-            buffer = path["buffer"]
-        with self.playwright.grpc_channel() as stub:
-            response = stub.UploadFileBySelector(
-                _get_file_by_selectors(
-                    files, selector, self.strict_mode, name, mimeType, buffer
-                ),
+            requests = _upload_buffer_requests(
+                selector,
+                self.strict_mode,
+                path["name"],
+                path["mimeType"],
+                path["buffer"],
             )
+        with self.playwright.grpc_channel() as stub:
+            response = stub.UploadFileBySelector(requests)
             logger.debug(response.log)
 
     def _get_files(
@@ -1502,26 +1508,45 @@ class Interaction(LibraryComponent):
         return result_paths
 
 
-def _get_file_by_selectors(  # ruff: ignore[PLR0917]
-    path: list, selector: str, strict: bool, name: str, mimeType: str, buffer: str
+def _file_path_requests(
+    selector: str, strict: bool, files: list[str]
 ) -> Generator[Request.FileBySelector, None, None]:
-    grpc_max_zize = 4000000
-    if sys.getsizeof(buffer) > grpc_max_zize:
-        for index in range(0, len(buffer), grpc_max_zize):
-            yield Request().FileBySelector(
-                selector=selector,
-                strict=strict,
-                path=path,
-                name=name,
-                mimeType=mimeType,
-                buffer=buffer[index : index + grpc_max_zize],
-            )
-    else:
+    yield Request().FileBySelector(selector=selector, strict=strict, path=files)
+
+
+def _streamed_file_requests(
+    selector: str, strict: bool, files: list[str]
+) -> Generator[Request.FileBySelector, None, None]:
+    """Send the files themselves, for a Playwright process which can not read them.
+
+    Only one chunk of a file is in memory at a time. Every file is sent in at
+    least one message, so that also an empty file gets uploaded.
+    """
+    for file_index, file in enumerate(files, 1):
+        file_path = Path(file)
+        with file_path.open("rb") as source:
+            while True:
+                chunk = source.read(UPLOAD_CHUNK_BYTES)
+                yield Request().FileBySelector(
+                    selector=selector,
+                    strict=strict,
+                    fileName=file_path.name,
+                    fileIndex=file_index,
+                    content=chunk,
+                )
+                if len(chunk) < UPLOAD_CHUNK_BYTES:
+                    break
+
+
+def _upload_buffer_requests(
+    selector: str, strict: bool, name: str, mimeType: str, buffer: str
+) -> Generator[Request.FileBySelector, None, None]:
+    content = memoryview(buffer.encode("utf-8"))
+    for index in range(0, max(len(content), 1), UPLOAD_CHUNK_BYTES):
         yield Request().FileBySelector(
             selector=selector,
             strict=strict,
-            path=path,
             name=name,
             mimeType=mimeType,
-            buffer=buffer,
+            content=content[index : index + UPLOAD_CHUNK_BYTES].tobytes(),
         )
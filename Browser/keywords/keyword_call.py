@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 from collections.abc import Callable
 from typing import get_args
 
@@ -20,7 +19,6 @@ from robot.errors import DataError
 from robot.libraries.BuiltIn import BuiltIn
 
 from ..base import LibraryComponent
-from ..generated.playwright_pb2 import Request
 from ..utils import logger
 from ..utils.types import Secret
 
@@ -47,18 +45,6 @@ KW_CALL_CONTENT_TEMPLATE = """body::before {{
     {additional_styles}
 }}"""
 
-KW_CALL_BANNER_FUNCTION = """(content) => {
-    const kwCallBanner = document.getElementById('kwCallBanner');
-    if (kwCallBanner) {
-        kwCallBanner.textContent = content;
-    } else {
-        const kwCallBanner = document.createElement("style");
-        kwCallBanner.setAttribute("id", 'kwCallBanner');
-        kwCallBanner.textContent = content;
-        document.head.appendChild(kwCallBanner);
-    }
-}"""
-
 
 class KeywordCallObserver(LibraryComponent):
     """Paints the keyword call banner and hides secrets while a keyword runs.
@@ -73,6 +59,7 @@ class KeywordCallObserver(LibraryComponent):
         self._secret_arguments: dict[str, set[str]] = {}
         self._current_loglevel: str | None = None
         self._logging_suppressions = 0
+        self._banner: str | None = None
 
     def is_secret_keyword(self, name: str) -> bool:
         return bool(self._secret_argument_names(name))
@@ -107,16 +94,10 @@ class KeywordCallObserver(LibraryComponent):
             )
         else:
             content = "body::before{}"
-        with self.playwright.grpc_channel() as stub:
-            stub.EvaluateJavascript(
-                Request().EvaluateAll(
-                    selector="",
-                    script=KW_CALL_BANNER_FUNCTION,
-                    arg=json.dumps(content),
-                    allElements=False,
-                    strict=False,
-                )
-            )
+        if content == self._banner:
+            return
+        self._banner = content
+        self.playwright.queue_keyword_call_banner(content)
 
     def _set_logging(self, status: bool):
         try:
@@ -14,13 +14,17 @@
 
 import contextlib
 import json
+import re
 from datetime import timedelta
 from typing import Any
 
 from ..base import LibraryComponent
 from ..generated.playwright_pb2 import Request
-from ..utils import DotDict, keyword, logger
-from ..utils.data_types import PageLoadStates, RegExp, RequestMethod
+from ..network_recorder import NetworkRecorder
+from ..utils import DotDict, StreamedBody, keyword, logger
+from ..utils.data_types import HttpMode, PageLoadStates, RegExp, RequestMethod
+
+TEXT_CONTENT_TYPES = ("text/", "json", "xml", "javascript", "x-www-form-urlencoded")
 
 
 def _get_headers(body: str, headers: dict):
@@ -54,25 +58,48 @@ def _jsonize_content(data, bodykey):
             data[bodykey] = json.loads(data[bodykey])
 
 
+def _decode_body(body: bytes, headers: dict) -> str | bytes:
+    """Return a text body as a string and any other body as bytes."""
+    lower_headers = {k.lower(): v for k, v in headers.items()}
+    content_type = lower_headers.get("content-type", "")
+    if content_type and not any(kind in content_type for kind in TEXT_CONTENT_TYPES):
+        return body
+    charset = re.search(r"charset=\"?([\w-]+)", content_type)
+    try:
+        return body.decode(charset.group(1) if charset else "utf-8")
+    except (UnicodeDecodeError, LookupError):
+        return body
+
+
 class Network(LibraryComponent):
+    _network_recorder: NetworkRecorder | None = None
+
     @keyword(tags=("HTTP",))
     def http(
         self,
         url: str,
         method: RequestMethod = RequestMethod.GET,
-        body: str | None = None,
+        body: str | bytes | None = None,
         headers: dict | None = None,
+        mode: HttpMode = HttpMode.page,
     ) -> Any:
         """Performs an HTTP request in the current browser context
 
-        The request is sent with the browser's ``fetch`` from the currently active page,
+        By default the request is sent with the browser's ``fetch`` from the currently active page,
         so a relative ``url`` is resolved against the URL of that page.
 
+        With ``mode=context`` the request is sent by the request client of the active
+        context instead, which shares the cookies of the context and keeps its connections
+        open between requests. It needs no open page and is not bound by CORS, which makes it
+        the faster choice for many API calls, for example for seeding test data. A relative
+        ``url`` is still resolved against the URL of the active page. See `HttpMode`.
+
         | =Arguments= | =Description= |
         | ``url`` | The request url, e.g. ``/api/foo``. |
         | ``method`` | The HTTP method for the request. Defaults to GET. |
-        | ``body`` | The request body. It is ignored for GET requests, because GET requests cannot have a body. If the body can be parsed as JSON, the ``Content-Type`` header for the request is automatically set to ``application/json``, unless ``headers`` already contains that header. Defaults to None. |
+        | ``body`` | The request body. It is ignored for GET requests, because GET requests cannot have a body. If the body can be parsed as JSON, the ``Content-Type`` header for the request is automatically set to ``application/json``, unless ``headers`` already contains that header. A binary body, given as bytes, needs ``mode=context``. Defaults to None. |
         | ``headers`` | A dictionary of additional request headers. Defaults to None. |
+        | ``mode`` | Whether the request is sent by the page or by the context, see `HttpMode`. Defaults to ``page``. |
 
         The response is a Robot Framework dictionary with the following attributes:
           - ``status`` <int> The status code of the response.
@@ -83,7 +110,9 @@ class Network(LibraryComponent):
           - ``ok`` <bool> Whether the request was successful, i.e. the ``status`` is in the range 200-299.
           - ``url`` <str> The final URL of the response, after possible redirects.
           - ``redirected`` <bool> Whether the response is the result of a redirect.
-          - ``type`` <str> The type of the response, e.g. ``basic`` or ``cors``.
+          - ``type`` <str> The type of the response, e.g. ``basic`` or ``cors``. Not available with ``mode=context``.
+
+        With ``mode=context`` a ``body`` which is not text, for example an image, is returned as bytes.
 
         Here's an example of using Robot Framework dictionary variables and extended variable syntax to
         do assertions on the response object:
@@ -96,6 +125,10 @@ class Network(LibraryComponent):
         """
         if headers is None:
             headers = {}
+        if mode == HttpMode.context:
+            return self._api_request(url, method, body, headers)
+        if isinstance(body, bytes):
+            raise ValueError("A binary body can only be sent with mode=context.")
         body = body if body else ""
         with self.playwright.grpc_channel() as stub:
             response = stub.HttpRequest(
@@ -114,6 +147,38 @@ class Network(LibraryComponent):
                 logger.debug(f"Returned response is of type {type(response_dict)}")
                 return response_dict
 
+    def _api_request(
+        self,
+        url: str,
+        method: RequestMethod | None,
+        body: str | bytes | None,
+        headers: dict,
+    ) -> Any:
+        text_body = body if isinstance(body, str) else ""
+        request = Request().HttpRequest(
+            url=url,
+            method=method.name if method else "GET",
+            body=text_body,
+            binaryBody=body if isinstance(body, bytes) else b"",
+            headers=json.dumps(_get_headers(text_body, headers)),
+        )
+        response_dict: dict = {}
+        with (
+            self.playwright.grpc_channel() as stub,
+            contextlib.closing(
+                StreamedBody(self.library.streamed_body_memory_limit)
+            ) as response_body,
+        ):
+            for response in stub.ApiRequest(request):
+                if response.json:
+                    logger.debug(response.log)
+                    response_dict = json.loads(response.json)
+                response_body.write(response.body)
+            response_dict["body"] = _decode_body(
+                response_body.bytes(), json.loads(response_dict.get("headers", "{}"))
+            )
+        return DotDict(_format_response(response_dict))
+
     def _wait_for_http_request(self, matcher, timeout):
         with self.playwright.grpc_channel() as stub:
             response = stub.WaitForRequest(
@@ -132,22 +197,29 @@ class Network(LibraryComponent):
             return data
 
     def _wait_for_http_response(self, matcher, timeout):
-        body = ""
-        with self.playwright.grpc_channel() as stub:
-            for responce in stub.WaitForResponse(
-                Request().HttpCapture(
-                    urlOrPredicate=matcher,
-                    timeout=self.get_timeout(timeout),
-                )
-            ):
-                logger.info(responce.log)
-                body = body + responce.bodyPart
+        with (
+            self.playwright.grpc_channel() as stub,
+            contextlib.closing(
+                StreamedBody(self.library.streamed_body_memory_limit)
+            ) as body,
+        ):
+            responce = body.read_responses(
+                stub.WaitForResponse(
+                    Request().HttpCapture(
+                        urlOrPredicate=matcher,
+                        timeout=self.get_timeout(timeout),
+                    )
+                ),
+                "bodyPart",
+                logger.info,
+            )
             response_json = json.loads(responce.json)
             not_none = object()
-            with contextlib.suppress(json.decoder.JSONDecodeError):
-                body = json.loads(body)
-            if response_json.get("body", not_none) is not None and body:
-                response_json["body"] = body
+            if response_json.get("body", not_none) is not None and body.size:
+                try:
+                    response_json["body"] = body.json()
+                except json.decoder.JSONDecodeError:
+                    response_json["body"] = body.text()
             return _format_response(response_json)
 
     @keyword(tags=("Wait", "HTTP"))
@@ -272,6 +344,98 @@ class Network(LibraryComponent):
             logger.debug(f"Returned response is of type {type(response)}")
             return response
 
+    @keyword(tags=("Setter", "HTTP"))
+    def start_network_recording(
+        self,
+        matcher: str | RegExp = "",
+        max_body_size: int = 0,
+        max_entries: int = 1000,
+    ):
+        """Starts recording the responses of the active context.
+
+        All responses of the context, from all of its pages, are recorded with a single
+        listener until `Stop Network Recording` is called or the context is closed. So
+        instead of a `Wait For Response` for every expected response, the traffic of a
+        whole test can be recorded and then checked with `Get Recorded Network Traffic`,
+        without missing any response. Starting a new recording stops the earlier one.
+
+        | =Arguments= | =Description= |
+        | ``matcher`` | Records only responses matching it. Takes the same Glob-Pattern, JavaScript RegExp or arrow-function as ``matcher`` of `Wait For Response`. By default all responses are recorded. |
+        | ``max_body_size`` | Records the body, as text, of responses with a body of at most this many bytes. The body of a larger response is ``None``. Defaults to 0, which records no bodies. |
+        | ``max_entries`` | How many of the newest responses are kept. Older responses are dropped. Defaults to 1000. |
+
+        Each recorded response is a dictionary with the following keys:
+          - ``url`` <str> The url of the response.
+          - ``method`` <str> The method of the request, e.g. ``GET``.
+          - ``resourceType`` <str> The resource type of the request, e.g. ``document``, ``fetch`` or ``image``.
+          - ``status`` <int> The status code of the response.
+          - ``statusText`` <str> Status text corresponding to ``status``.
+          - ``ok`` <bool> Whether the status is in the range 200-299.
+          - ``requestHeaders`` <dict> The headers of the request.
+          - ``headers`` <dict> The headers of the response.
+          - ``startTime`` <float> When the request was started, in milliseconds since epoch.
+          - ``bodySize`` <int> The size of the body in bytes. Only with ``max_body_size``.
+          - ``body`` <str> The body of the response, or ``None`` if it is larger than ``max_body_size`` or could not be read. Only with ``max_body_size``.
+
+        Example:
+        | `Start Network Recording`    **/api/**    max_body_size=64000
+        | `Click`    \\#save
+        | ${saves} =    `Stop Network Recording`
+        | ${posts} =    `Get Recorded Network Traffic`    method=POST    status=${200}
+        """
+        if self._network_recorder is not None:
+            self._network_recorder.stop()
+            self._network_recorder = None
+        self._network_recorder = NetworkRecorder(
+            self.playwright._channel, matcher, max_body_size, max_entries
+        )
+
+    @keyword(tags=("Getter", "HTTP"))
+    def get_recorded_network_traffic(
+        self,
+        url: str | None = None,
+        method: RequestMethod | None = None,
+        status: int | None = None,
+        resource_type: str | None = None,
+    ) -> list[DotDict]:
+        """Returns the responses recorded by the current or last `Start Network Recording`.
+
+        The responses are returned oldest first, as dictionaries described in
+        `Start Network Recording`. The recording can still be running.
+
+        | =Arguments= | =Description= |
+        | ``url`` | Returns only responses whose url contains a match of this Python regular expression. |
+        | ``method`` | Returns only responses to requests of this method. |
+        | ``status`` | Returns only responses with this status code. |
+        | ``resource_type`` | Returns only responses of this resource type, e.g. ``fetch``. |
+
+        Example:
+        | ${failed} =    `Get Recorded Network Traffic`    url=/api/    status=${500}
+        | `Should Be Empty`    ${failed}
+        """
+        if self._network_recorder is None:
+            raise AssertionError("No network recording has been started.")
+        entries = self._network_recorder.entries(
+            url, method.name if method else None, status, resource_type
+        )
+        return [DotDict(entry) for entry in entries]
+
+    @keyword(tags=("Setter", "HTTP"))
+    def stop_network_recording(self) -> list[DotDict]:
+        """Stops the recording started by `Start Network Recording` and returns the recorded responses.
+
+        Responses received before the recording is stopped are all included. The
+        responses can still be filtered with `Get Recorded Network Traffic` afterwards.
+        """
+        if self._network_recorder is None:
+            raise AssertionError("No network recording has been started.")
+        self._network_recorder.stop()
+        if self._network_recorder.dropped:
+            logger.info(
+                f"{self._network_recorder.dropped} oldest responses were dropped from the recording."
+            )
+        return self.get_recorded_network_traffic()
+
     @keyword(tags=("Wait", "HTTP"))
     def wait_for_navigation(
         self,
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import json
 import os
 from contextlib import suppress
@@ -31,6 +32,7 @@ from Browser.utils.misc import get_download_id
 
 from ..assertion_engine import assertion_formatter_used, with_assertion_polling
 from ..base import LibraryComponent
+from ..catalog_feed import CatalogFeed
 from ..generated.playwright_pb2 import Request
 from ..utils import (
     ClientCertificate,
@@ -59,10 +61,25 @@ from ..utils import (
 )
 from ..utils.logger import LOGLEVEL
 
+CLOSE_CONCURRENCY_ENV = "ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY"
+# The concurrency the Node side uses when none is given.
+DEFAULT_CLOSE_CONCURRENCY = 4
+
+
+def close_concurrency() -> int:
+    """Contexts closed at the same time, 0 lets the Node side use its default."""
+    try:
+        return max(int(os.environ.get(CLOSE_CONCURRENCY_ENV, "0")), 0)
+    except ValueError:
+        return 0
+
 
 class PlaywrightState(LibraryComponent):
     """Keywords to manage Playwright side Browsers, Contexts and Pages."""
 
+    # Id only catalog pushed by the Node side, see `_get_browser_catalog`.
+    _catalog_feed: CatalogFeed | None = None
+
     # Helpers for Switch_ and Close_ keywords
 
     def _correct_browser(self, browser: SelectionType | str):
@@ -142,6 +159,7 @@ class PlaywrightState(LibraryComponent):
                 response = stub.CloseAllBrowsers(
                     Request().Empty(), timeout=self.timeout * 2
                 )
+                self._catalog_changed()
                 self.library.pause_on_failure.clear()
                 logger.info(response.log)
                 self.browser_arg_mapping.clear()
@@ -150,6 +168,7 @@ class PlaywrightState(LibraryComponent):
                 self.switch_browser(browser)
 
             response = stub.CloseBrowser(Request.Empty(), timeout=self.timeout * 2)
+            self._catalog_changed()
             closed_browser_id = response.body
             self.delete_browser_id_from_arg_mapping(closed_browser_id)
             self._update_tracing_contexts()
@@ -199,10 +218,13 @@ class PlaywrightState(LibraryComponent):
             )
             if active_browser["id"] != browser_instance["id"]:
                 self._switch_browser(browser_instance["id"], "TRACE")
+            contexts = []
             with suppress(Exception):
                 contexts = self._get_context(context, browser_instance["contexts"])
+            try:
                 self._close_pw_context(contexts, save_trace)
-        self._update_tracing_contexts()
+            finally:
+                self._update_tracing_contexts()
 
     def _update_tracing_contexts(self):
         if self.library.tracing_contexts:
@@ -214,14 +236,97 @@ class PlaywrightState(LibraryComponent):
             ]
 
     def _close_pw_context(self, contexts, save_trace=True):
+        ids = [context["id"] for context in contexts]
+        for context_id in ids:
+            self.context_cache.remove(context_id)
+        if not ids:
+            return
+        concurrency = close_concurrency() or DEFAULT_CLOSE_CONCURRENCY
+        # The contexts are closed concurrently, so the rounds of the concurrency
+        # each get the time a single context had.
+        rounds = -(-len(ids) // concurrency)
+        errors = []
         with self.playwright.grpc_channel() as stub:
-            for context in contexts:
-                self.context_cache.remove(context["id"])
-                self.switch_context(context["id"])
-                response = stub.CloseContext(
-                    Request().Bool(value=save_trace), timeout=self.timeout * 2
-                )
-                logger.info(response.log)
+            results = stub.CloseContexts(
+                Request().CloseContexts(
+                    ids=ids, saveTrace=save_trace, concurrency=concurrency
+                ),
+                timeout=self.timeout * 2 * rounds,
+            )
+            try:
+                for closed in results:
+                    if closed.error:
+                        errors.append(f"{closed.id}: {closed.error}")
+                        continue
+                    logger.info(f"Successfully closed {closed.id}")
+                    self._log_closed_artifacts(
+                        closed.id, [closed.traceFile], closed.videos
+                    )
+            finally:
+                self._catalog_changed()
+        if errors:
+            raise AssertionError("Closing context(s) failed:\n" + "\n".join(errors))
+
+    def _log_closed_artifacts(self, owner: str, traces: list[str], videos: list[str]):
+        for trace in filter(None, traces):
+            logger.info(
+                f'Trace of {owner}: <a href="{get_link_path(trace, self.outputdir)}">{trace}</a>',
+                html=True,
+            )
+        for video in videos:
+            logger.info(
+                f'Video of {owner}: <a href="{get_link_path(video, self.outputdir)}">{video}</a>',
+                html=True,
+            )
+
+    def _close_scope(
+        self,
+        scope_id: str,
+        trace_group: str,
+        file: Path | str | None = None,
+        line: int = 0,
+        *,
+        save_trace: bool = True,
+        run_before_unload: bool = False,
+    ) -> dict:
+        """Closes the contexts and pages opened while suite or test ``scope_id`` ran.
+
+        Contexts and pages of suites and tests inside it are closed too. All of
+        them are closed concurrently by one call, inside ``trace_group`` when tracing.
+        """
+        group = Request().TraceGroup(
+            name=trace_group if self.library.tracing_contexts else "",
+            file=str(file or ""),
+            line=line,
+        )
+        with self.playwright.grpc_channel() as stub:
+            response = stub.CloseScope(
+                Request().CloseScope(
+                    scopeId=scope_id,
+                    saveTrace=save_trace,
+                    runBeforeUnload=run_before_unload,
+                    traceGroup=group,
+                    concurrency=close_concurrency(),
+                ),
+                timeout=self.timeout * 2,
+            )
+            self._catalog_changed()
+        logger.debug(response.log)
+        closed = json.loads(response.json)
+        for context_id in closed["contexts"]:
+            self.context_cache.remove(context_id)
+        if self.library.tracing_contexts:
+            self.library.tracing_contexts = [
+                ctx_id
+                for ctx_id in self.library.tracing_contexts
+                if ctx_id not in closed["contexts"]
+            ]
+        for error in closed["errors"]:
+            logger.debug(f"Closing {scope_id} failed: {error}")
+        self._log_closed_artifacts(
+            scope_id, closed.get("traces", []), closed.get("videos", [])
+        )
+        return closed
 
     def _get_context(self, context, contexts):
         if context == SelectionType.ALL:
@@ -357,6 +462,7 @@ class PlaywrightState(LibraryComponent):
             response = stub.ClosePage(
                 Request().ClosePage(runBeforeUnload=runBeforeUnload)
             )
+            self._catalog_changed()
             if response.log:
                 logger.info(response.log)
             return {
@@ -421,6 +527,7 @@ class PlaywrightState(LibraryComponent):
                     timeout=timeout_ms,
                 )
             )
+            self._catalog_changed()
             logger.info(response.log)
             return response.body
 
@@ -491,6 +598,7 @@ class PlaywrightState(LibraryComponent):
             response = stub.NewBrowser(
                 Request().Browser(browser=browser.name, rawOptions=options)
             )
+            self._catalog_changed()
             logger.info(response.log)
             self.browser_arg_mapping[parameter_hash] = response.body
             return response.body
@@ -580,7 +688,9 @@ class PlaywrightState(LibraryComponent):
 
     def _get_parameter_hash(self, params: dict[str, Any]) -> int:
         params.pop("reuse_existing", None)
-        return hash(repr(params))
+        # Stable across processes, so a browser started by `rfbrowser pool` can be reused.
+        digest = hashlib.sha256(repr(params).encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big")
 
     @keyword(tags=("Setter", "BrowserControl"))
     def new_context(
@@ -819,6 +929,7 @@ class PlaywrightState(LibraryComponent):
                     traceFile=str(trace_file),
                 )
             )
+            self._catalog_changed()
             self.add_context_and_keyword_call_stack_to_trace(
                 trace_file=trace_file, ctx_id=response.id
             )
@@ -922,6 +1033,7 @@ class PlaywrightState(LibraryComponent):
                     traceFile=str(trace_file),
                 )
             )
+            self._catalog_changed()
             self.add_context_and_keyword_call_stack_to_trace(
                 trace_file=trace_file, ctx_id=context.id
             )
@@ -1027,6 +1139,7 @@ class PlaywrightState(LibraryComponent):
                     waitUntil=wait_until.name,
                 )
             )
+        self._catalog_changed()
         logger.info(response.log)
         if response.newBrowser:
             logger.info(
@@ -1145,7 +1258,7 @@ class PlaywrightState(LibraryComponent):
         """
 
         catalog = self._get_browser_catalog()
-        logger.debug(json.dumps(catalog, indent=2))
+        logger.debug(lambda: json.dumps(catalog, indent=2))
         formatter = self.get_assertion_formatter("Get Browser Catalog")
         return verify_assertion(
             catalog,
@@ -1157,11 +1270,27 @@ class PlaywrightState(LibraryComponent):
         )
 
     def _get_browser_catalog(self, include_page_details: bool = True) -> list:
+        if include_page_details:
+            return json.loads(self._fetch_browser_catalog(True))
+        feed = self._catalog_feed
+        if feed is None or not feed.alive:
+            catalog = self._fetch_browser_catalog(False)
+            if feed is None:
+                self._catalog_feed = CatalogFeed(self.playwright._channel)
+            return json.loads(catalog)
+        return feed.catalog(lambda: self._fetch_browser_catalog(False))
+
+    def _fetch_browser_catalog(self, include_page_details: bool) -> str:
         with self.playwright.grpc_channel() as stub:
             response = stub.GetBrowserCatalog(
                 Request().Bool(value=include_page_details)
             )
-            return json.loads(response.json)
+            return response.json
+
+    def _catalog_changed(self):
+        """Drop the cached catalog after a call which opens, closes or switches."""
+        if self._catalog_feed is not None:
+            self._catalog_feed.invalidate()
 
     @keyword(tags=("Getter", "BrowserControl", "Assertion"))
     def get_console_log(
@@ -1329,6 +1458,7 @@ class PlaywrightState(LibraryComponent):
     def _switch_browser(self, browser_id: str, loglevel: LOGLEVEL = "INFO") -> str:
         with self.playwright.grpc_channel() as stub:
             response = stub.SwitchBrowser(Request().Index(index=browser_id))
+            self._catalog_changed()
             logger.write(
                 response.log,
                 loglevel=loglevel,
@@ -1338,6 +1468,7 @@ class PlaywrightState(LibraryComponent):
     def _switch_context(self, context_id, loglevel: LOGLEVEL = "INFO") -> str:
         with self.playwright.grpc_channel() as stub:
             response = stub.SwitchContext(Request().Index(index=str(context_id)))
+            self._catalog_changed()
             logger.write(
                 response.log,
                 loglevel=loglevel,
@@ -1476,6 +1607,7 @@ class PlaywrightState(LibraryComponent):
             response = stub.SwitchPage(
                 Request().IdWithTimeout(id=str(uid), timeout=self.timeout)
             )
+            self._catalog_changed()
             logger.info(response.log)
             return response.body
 
@@ -1855,7 +1987,11 @@ class PlaywrightState(LibraryComponent):
         """
         with self.playwright.grpc_channel() as stub:
             response = stub.SetPeerId(Request().Index(index=new_id))
-            return response.body
+        # The feed watches the state of the old peer id.
+        if self._catalog_feed is not None:
+            self._catalog_feed.close()
+            self._catalog_feed = None
+        return response.body
 
     @keyword(tags=("Setter", "BrowserControl"))
     def cancel_download(self, download: DownloadInfo | str):
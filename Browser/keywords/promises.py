@@ -13,27 +13,42 @@
 # limitations under the License.
 import json
 import re
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 from datetime import timedelta
 from os import PathLike
 from pathlib import Path
 from sys import maxsize
-from time import sleep
-from typing import Any
+from threading import Event
+from typing import Any, NamedTuple
 
 from robot.api.deco import keyword
 from robot.utils import DotDict
 
 from ..base import LibraryComponent
 from ..generated.playwright_pb2 import Request
+from ..promise_executor import PromiseExecutor
 from ..utils import DownloadInfo, logger
 from ..utils.data_types import RobotTypeConverter as TypeConverter
 
 
+class _KeywordArguments(NamedTuple):
+    """Argument names of a keyword and the converters of its typed arguments."""
+
+    names: list[str]
+    index_of_varargs: int
+    converters: dict[str, Any]
+
+
 class Promises(LibraryComponent):
     def __init__(self, library):
         LibraryComponent.__init__(self, library)
-        self._executor = ThreadPoolExecutor(max_workers=256)
+        self._executor = PromiseExecutor()
+        # Keywords are registered after the components are created, and JS
+        # extensions and plugins add more, so the index is built on first use
+        # and rebuilt when the number of keywords changes.
+        self._keyword_count = -1
+        self._keyword_index: dict[str, str] = {}
+        self._keyword_arguments: dict[str, _KeywordArguments] = {}
 
     @keyword(tags=("Wait",))
     def promise_to(self, kw: str, *args) -> Future:
@@ -68,20 +83,36 @@ class Promises(LibraryComponent):
                 f"Unknown keyword '{kw}'! 'Promise To' can only be used with Browser keywords."
             )
         positional, named = self.resolve_arguments(known_keyword, *args)
-        promise = self._executor.submit(
-            self.library.keywords[known_keyword], *positional, **(named or {})
-        )
+        started = Event()
+
+        def run_keyword():
+            started.set()
+            return self.library.keywords[known_keyword](*positional, **named)
+
+        promise = self._executor.submit(run_keyword, timeout=self._promise_timeout)
+        promise.add_done_callback(lambda _: started.set())
         self.unresolved_promises.add(promise)
-        while not (promise.running() or promise.done()):
-            sleep(0.01)
+        started.wait()
         return promise
 
+    @property
+    def _promise_timeout(self) -> float | None:
+        timeout = self.library.promise_timeout
+        return timeout.total_seconds() if timeout else None
+
     def get_known_keyword(self, kw: str) -> str:
-        normalized_kw = self.normalized_keyword_name(kw)
-        for keyword_name in self.library.get_keyword_names():
-            if normalized_kw == self.normalized_keyword_name(keyword_name):
-                return keyword_name
-        return ""
+        return self._get_keyword_index().get(self.normalized_keyword_name(kw), "")
+
+    def _get_keyword_index(self) -> dict[str, str]:
+        keyword_count = len(self.library.keywords)
+        if keyword_count != self._keyword_count:
+            self._keyword_index = {
+                self.normalized_keyword_name(name): name
+                for name in reversed(self.library.get_keyword_names())
+            }
+            self._keyword_arguments = {}
+            self._keyword_count = keyword_count
+        return self._keyword_index
 
     def normalized_keyword_name(self, kw: str) -> str:
         """Returns normalized keyword name.
@@ -94,16 +125,7 @@ class Promises(LibraryComponent):
         positional: list[Any] = []
         named: dict[str, Any] = {}
         logger.debug(f"*args {args}")
-
-        arg_names = []
-        index_of_varargs = maxsize
-        for index, argument in enumerate(self.library.get_keyword_arguments(kw)):
-            arg_name = argument[0] if isinstance(argument, tuple) else argument
-            match = re.fullmatch(r"^\*(\w.*)", arg_name)
-            if match:
-                index_of_varargs = index
-                arg_name = match.group(1)
-            arg_names.append(arg_name)
+        arg_names, index_of_varargs, _ = self._get_keyword_arguments(kw)
 
         for index, arg in enumerate(args):
             arg_name, has_equal, arg_value = arg.partition("=")
@@ -129,15 +151,32 @@ class Promises(LibraryComponent):
         )
         return tuple(positional), named
 
-    def convert_keyword_arg(self, kw: str, arg_name: str, arg_value: Any) -> Any:
-        argument_type = self.library.get_keyword_types(kw).get(arg_name)
-        if argument_type is not None:
+    def _get_keyword_arguments(self, kw: str) -> _KeywordArguments:
+        self._get_keyword_index()
+        if kw in self._keyword_arguments:
+            return self._keyword_arguments[kw]
+        arg_names = []
+        index_of_varargs = maxsize
+        for index, argument in enumerate(self.library.get_keyword_arguments(kw)):
+            arg_name = argument[0] if isinstance(argument, tuple) else argument
+            match = re.fullmatch(r"^\*(\w.*)", arg_name)
+            if match:
+                index_of_varargs = index
+                arg_name = match.group(1)
+            arg_names.append(arg_name)
+        converters = {}
+        for arg_name, argument_type in self.library.get_keyword_types(kw).items():
             converter = TypeConverter.converter_for(argument_type)
-            return (
-                converter.convert(name=arg_name, value=arg_value)
-                if converter
-                else arg_value
-            )
+            if converter:
+                converters[arg_name] = converter
+        arguments = _KeywordArguments(arg_names, index_of_varargs, converters)
+        self._keyword_arguments[kw] = arguments
+        return arguments
+
+    def convert_keyword_arg(self, kw: str, arg_name: str, arg_value: Any) -> Any:
+        converter = self._get_keyword_arguments(kw).converters.get(arg_name)
+        if converter:
+            return converter.convert(name=arg_name, value=arg_value)
         return arg_value
 
     @keyword(tags=("Wait", "BrowserControl"))
@@ -202,6 +241,7 @@ class Promises(LibraryComponent):
         )
         promise = self._executor.submit(
             self._wait_for_download,
+            timeout=self._promise_timeout,
             saveAs=saveAs,
             wait_for_finish=wait_for_finished,
             download_timeout=timeout_ms,
@@ -276,6 +316,30 @@ class Promises(LibraryComponent):
         """
         self.wait_for(*self.unresolved_promises)
 
+    @keyword(tags=("Getter", "Wait"))
+    def get_promise_statistics(self) -> dict:
+        """Returns statistics of the promises created in this execution.
+
+        The returned dictionary contains:
+        | =Key= | =Description= |
+        | ``queued`` | Promises waiting for a free thread. |
+        | ``running`` | Promises running at the moment. |
+        | ``completed`` | Promises that finished successfully. |
+        | ``failed`` | Promises that failed. |
+        | ``cancelled`` | Promises cancelled before they started or stopped by the ``promise_timeout`` of the library import. |
+        | ``max_latency`` | Longest time in seconds from creating a promise until it finished. |
+
+        Example:
+        | ${promise}=    `Promise To`    Wait For Response    matcher=    timeout=3
+        | `Click`          \\#delayed_request
+        | `Wait For`       ${promise}
+        | ${stats}=      `Get Promise Statistics`
+        | Should Be Equal As Integers    ${stats}[running]    0
+        """
+        statistics = self._executor.statistics()
+        logger.info(statistics)
+        return statistics
+
     @keyword(tags=("Setter", "PageContent"))
     def promise_to_upload_file(self, path: PathLike) -> Future:
         """Returns a promise that resolves when the file from ``path`` has been uploaded.
@@ -301,7 +365,9 @@ class Promises(LibraryComponent):
         p = Path(path)
         if not p.is_file():
             raise ValueError(f"Nonexistent input file path '{p.resolve()}'")
-        promise = self._executor.submit(self._upload_file, path=str(p.resolve()))
+        promise = self._executor.submit(
+            self._upload_file, path=str(p.resolve()), timeout=self._promise_timeout
+        )
         self.unresolved_promises.add(promise)
         return promise
 
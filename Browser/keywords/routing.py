@@ -0,0 +1,148 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import mimetypes
+from pathlib import Path
+
+from ..base import LibraryComponent
+from ..generated.playwright_pb2 import Request
+from ..utils import DotDict, keyword, logger
+from ..utils.data_types import RegExp, RouteAction
+
+
+def _route_body(
+    body: str | bytes | dict | list | None, path: Path | None, headers: dict
+) -> bytes:
+    """Returns the body of a fulfilled route and sets its content type if ``headers`` has none."""
+    has_content_type = any(name.lower() == "content-type" for name in headers)
+    if path is not None:
+        content_type = mimetypes.guess_type(path.name)[0]
+        if content_type and not has_content_type:
+            headers["Content-Type"] = content_type
+        return path.read_bytes()
+    if isinstance(body, dict | list):
+        if not has_content_type:
+            headers["Content-Type"] = "application/json"
+        return json.dumps(body).encode("utf-8")
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    return body or b""
+
+
+class Routing(LibraryComponent):
+    @keyword(tags=("Setter", "HTTP"))
+    def add_route(
+        self,
+        url: str | RegExp = "",
+        action: RouteAction = RouteAction.fulfill,
+        *,
+        status: int = 200,
+        body: str | bytes | dict | list | None = None,
+        headers: dict | None = None,
+        path: Path | None = None,
+        error_code: str = "",
+        times: int | None = None,
+        not_found: str = "abort",
+    ) -> str:
+        """Routes the requests of the active context matching ``url`` and returns the id of the route.
+
+        A route answers the requests it matches within the Playwright process, so
+        for example slow third party calls can be replaced with fixed responses,
+        or blocked, without them going to the network or back to Robot Framework.
+        The route applies to all pages of the context, also ones opened later, and
+        is removed with `Remove Route` or when the context is closed. When several
+        routes match a request, the one added last is used. See `Get Routes` for
+        how many requests each route has answered.
+
+        | =Arguments= | =Description= |
+        | ``url`` | Request URL matcher. Can be a string (Glob-Pattern), a JavaScript RegExp (enclosed in ``/`` with optional trailing flags) or a JavaScript arrow-function that receives the [https://developer.mozilla.org/en-US/docs/Web/API/URL|URL] of the request and returns a boolean. See `Wait For Response` for examples. By default all requests are matched. |
+        | ``action`` | What is done with a matching request, see `RouteAction`. Defaults to ``fulfill``. |
+        | ``status`` | The status code of a fulfilled response. Defaults to 200. |
+        | ``body`` | The body of a fulfilled response. A dictionary or a list is sent as JSON. |
+        | ``headers`` | A dictionary of the headers of a fulfilled response. With ``continue``, headers which are added to the request. |
+        | ``path`` | With ``fulfill``, a file whose content is the body of the response, instead of ``body``. With ``har``, the HAR file the responses are taken from. |
+        | ``error_code`` | The error of an aborted request, e.g. ``connectionrefused`` or ``timedout``. Defaults to ``failed``. |
+        | ``times`` | How many requests the route answers before it is no longer used. ``None``, the default, means unlimited. |
+        | ``not_found`` | With ``har``, whether a request which is not found in the HAR file is aborted, with ``abort``, or sent on, with ``fallback``. Defaults to ``abort``. |
+
+        The content type of a response served from a file is taken from the file
+        extension, and of a dictionary or list body it is ``application/json``,
+        unless ``headers`` sets it. The file is read when the route is added.
+
+        A ``har`` route has no hit count and is removed, together with any other
+        route of the same ``url``, by `Remove Route`. Its HAR file is opened by
+        the Playwright process, so it must be available on that machine.
+
+        Example:
+        | ${route} =    `Add Route`    **/api/user    body={"name": "John"}
+        | `Add Route`    https://ads.example.com/**    abort
+        | `Add Route`    **/api/**    continue    headers={"X-Test": "true"}
+        | `Add Route`    **/*.png    path=${CURDIR}/placeholder.png
+        | `Add Route`    **/api/**    har    path=${CURDIR}/api.har
+        | `Remove Route`    ${route}
+        """
+        headers = dict(headers or {})
+        request = Request.Route(
+            urlOrPredicate=url,
+            action=action.name.rstrip("_"),
+            status=status,
+            errorCode=error_code,
+            times=times or 0,
+            notFound=not_found,
+        )
+        if action == RouteAction.har:
+            if path is None:
+                raise ValueError("A har route needs the path of the HAR file.")
+            request.path = str(path.resolve())
+        elif action == RouteAction.fulfill:
+            request.body = _route_body(body, path, headers)
+        if headers:
+            request.headers = json.dumps(headers)
+        with self.playwright.grpc_channel() as stub:
+            response = stub.AddRoute(request)
+            logger.info(response.log)
+            return response.body
+
+    @keyword(tags=("Setter", "HTTP"))
+    def remove_route(self, route_id: str | None = None):
+        """Removes the route of ``route_id``, returned by `Add Route`, from the active context.
+
+        Without ``route_id`` all routes added to the active context are removed.
+        If the route is not found, the keyword does not fail, it only logs that.
+
+        Removing a ``har`` route also removes every other route with the same
+        ``url``, because Playwright can not remove it on its own. Those routes
+        are no longer listed by `Get Routes` either.
+        """
+        with self.playwright.grpc_channel() as stub:
+            response = stub.RemoveRoute(Request.RouteId(id=route_id or ""))
+            logger.info(response.log)
+
+    @keyword(tags=("Getter", "HTTP"))
+    def get_routes(self) -> list[DotDict]:
+        """Returns the routes of the active context added with `Add Route`.
+
+        Each route is a dictionary with the keys ``id``, ``url``, ``action``,
+        ``times`` and ``hits``, which is the number of requests the route has
+        answered, or ``None`` for a ``har`` route.
+
+        Example:
+        | ${routes} =    `Get Routes`
+        | `Should Be Equal`    ${routes}[0][hits]    ${1}
+        """
+        with self.playwright.grpc_channel() as stub:
+            response = stub.GetRoutes(Request.Empty())
+            logger.info(response.log)
+            return [DotDict(route) for route in json.loads(response.json)]
@@ -116,14 +116,20 @@ class Waiter(LibraryComponent):
                 self.convert_timeout(timeout, False) if timeout else self.timeout / 1000
             )
             end += time.monotonic()
+            poller = self.poller()
             while True:
                 try:
-                    return self._wait_for_elements_state(
+                    result = self._wait_for_elements_state(
                         selector, state, timeout, self.strict_mode
                     )
+                    poller.record(passed=True)
+                    logger.debug(poller.statistics())
+                    return result
                 except Exception as error:
+                    poller.record(passed=False)
                     if end > time.monotonic():
                         logger.debug(f"Suppress error: {error}")
+                        poller.wait(end - time.monotonic())
                     else:
                         if message:
                             selector = self.resolve_selector(selector)
@@ -195,14 +201,20 @@ class Waiter(LibraryComponent):
             self.convert_timeout(timeout, False) if timeout else self.timeout / 1000
         )
         end += time.monotonic()
+        poller = self.poller()
         while True:
             try:
-                return self._wait_for_function(
+                result = self._wait_for_function(
                     function, selector, polling, timeout, self.strict_mode
                 )
+                poller.record(passed=True)
+                logger.debug(poller.statistics())
+                return result
             except Exception as error:
+                poller.record(passed=False)
                 if end > time.monotonic():
                     logger.debug(f"Suppress {error}")
+                    poller.wait(end - time.monotonic())
                 else:
                     if message:
                         selector = self.resolve_selector(selector)
@@ -0,0 +1,131 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import re
+import threading
+import uuid
+from collections import deque
+
+import grpc  # type: ignore
+
+from Browser.generated import playwright_pb2_grpc
+from Browser.generated.playwright_pb2 import Request
+
+START_TIMEOUT = 10
+
+
+class NetworkRecorder:
+    """Responses of the active context, streamed by ``RecordNetworkTraffic``.
+
+    The Node.js side listens to the responses of the context with one listener
+    and writes each of them to the stream, followed by its body when bodies are
+    recorded. The newest ``max_entries`` responses are kept. Stopping waits
+    until the responses received before it are read, so none of them is lost.
+    """
+
+    def __init__(
+        self,
+        channel: grpc.Channel,
+        matcher: str = "",
+        max_body_size: int = 0,
+        max_entries: int = 1000,
+    ):
+        self._lock = threading.Lock()
+        self._entries: deque[dict] = deque(maxlen=max_entries)
+        self._max_body_size = max_body_size
+        self._started = threading.Event()
+        self._error: str | None = None
+        self.dropped = 0
+        self._stub = playwright_pb2_grpc.PlaywrightStub(channel)
+        self._request = Request.NetworkRecording(
+            id=uuid.uuid4().hex, urlOrPredicate=matcher, maxBodySize=max_body_size
+        )
+        self._events = self._stub.RecordNetworkTraffic(self._request)
+        self._reader = threading.Thread(
+            target=self._read, name="network-recorder", daemon=True
+        )
+        self._reader.start()
+        if not self._started.wait(START_TIMEOUT):
+            self._events.cancel()
+            raise AssertionError("Network recording did not start.")
+        if self._error is not None:
+            raise AssertionError(self._error)
+
+    @property
+    def alive(self) -> bool:
+        return self._reader.is_alive()
+
+    def _read(self):
+        entry: dict | None = None
+        body_parts: list[str] = []
+        try:
+            for message in self._events:
+                if message.json:
+                    self._add(entry, body_parts)
+                    entry, body_parts = json.loads(message.json), []
+                elif message.bodyPart:
+                    body_parts.append(message.bodyPart)
+                else:
+                    self._started.set()
+        except grpc.RpcError as error:
+            if error.code() != grpc.StatusCode.CANCELLED:
+                self._error = error.details()
+        self._add(entry, body_parts)
+        self._started.set()
+
+    def _add(self, entry: dict | None, body_parts: list[str]):
+        if entry is None:
+            return
+        if "bodySize" in entry:
+            recorded = entry["bodySize"] <= self._max_body_size
+            entry["body"] = "".join(body_parts) if recorded else None
+        with self._lock:
+            if len(self._entries) == self._entries.maxlen:
+                self.dropped += 1
+            self._entries.append(entry)
+
+    def entries(
+        self,
+        url: str | None = None,
+        method: str | None = None,
+        status: int | None = None,
+        resource_type: str | None = None,
+    ) -> list[dict]:
+        """Returns the recorded responses, oldest first.
+
+        ``url`` is a regular expression searched in the url of a response, the
+        other filters must equal the value of the response.
+        """
+        with self._lock:
+            entries = list(self._entries)
+        return [
+            entry
+            for entry in entries
+            if (url is None or re.search(url, entry["url"]))
+            and (method is None or entry["method"] == method.upper())
+            and (status is None or entry["status"] == status)
+            and (resource_type is None or entry["resourceType"] == resource_type)
+        ]
+
+    def stop(self, timeout: float = START_TIMEOUT):
+        if self.alive:
+            try:
+                self._stub.StopNetworkRecording(self._request, timeout=timeout)
+            except grpc.RpcError:
+                # The recording has ended already, or the Node.js side is gone.
+                self._events.cancel()
+        self._reader.join(timeout=timeout)
+        if self._reader.is_alive():
+            self._events.cancel()
@@ -17,9 +17,14 @@ import contextlib
 import ipaddress
 import os
 import platform
+import select
 import signal
 import sys
+import tempfile
+import threading
 import time
+import uuid
+from collections.abc import Callable
 from functools import cached_property
 from pathlib import Path
 from subprocess import DEVNULL, STDOUT, CalledProcessError, Popen, run
@@ -32,9 +37,12 @@ from Browser.entry.constant import (
     ensure_playwright_browsers_path,
 )
 from Browser.generated import playwright_pb2_grpc
-from Browser.generated.playwright_pb2 import Request
+from Browser.generated.playwright_pb2 import Request, Response
 
 from .base import LibraryComponent
+from .process_pool import POOL_ENV, PoolLease, lease_process
+from .promise_executor import promise_deadline
+from .session_stream import SessionStream, SessionStub, session_stream_enabled
 from .utils import (
     AutoClosingLevel,
     PlaywrightLogTypes,
@@ -48,6 +56,13 @@ if TYPE_CHECKING:
 
 
 NO_HTTP_PROXY_OPTIONS = (("grpc.enable_http_proxy", 0),)
+UNIX_SOCKET_PREFIX = "unix:"
+# sun_path holds 104 bytes on macOS and 108 on Linux, including the terminating null.
+MAX_UNIX_SOCKET_PATH = 100
+READY_FD_ENV = "ROBOT_FRAMEWORK_BROWSER_READY_FD"
+READY_TIMEOUT = 15
+KEYWORD_CALL_BANNER_METADATA = "kw-call-banner-bin"
+PEER_ID_METADATA = "rfbrowser-peer-id"
 
 
 def is_local_host(host: str | None) -> bool:
@@ -73,6 +88,207 @@ def grpc_channel_options(host: str | None) -> tuple[tuple[str, int], ...]:
     return NO_HTTP_PROXY_OPTIONS if is_local_host(host) else ()
 
 
+def use_unix_socket(host: str | None) -> bool:
+    """Return True when a Playwright process started for ``host`` should listen on a unix socket.
+
+    A unix socket avoids the loopback TCP stack and the race for a free port.
+    Windows keeps TCP, as does a host which asks for a network interface,
+    like ``0.0.0.0``, so that other machines can still connect.
+    """
+    if sys.platform == "win32" or not is_local_host(host):
+        return False
+    if not host:
+        return True
+    try:
+        return not ipaddress.ip_address(host.strip().strip("[]")).is_unspecified
+    except ValueError:
+        return True
+
+
+def unix_socket_path(directory: Path) -> Path:
+    name = f"playwright-{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+    path = directory.resolve() / name
+    if len(str(path)) > MAX_UNIX_SOCKET_PATH:
+        path = Path(tempfile.mkdtemp(prefix="rfbrowser-")) / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# Setters of the browser, context or page whose failure does not depend on the
+# page content. Actions, waits and getters go out on their own, so their errors
+# stay with the keyword which made the call and its retries see them.
+BATCHABLE_METHODS = frozenset(
+    {
+        "AddCookie",
+        "AdvanceClock",
+        "ClearPermissions",
+        "ClockPauseAt",
+        "ClockResume",
+        "CloseTraceGroup",
+        "DeleteAllCookies",
+        "GrantPermissions",
+        "OpenTraceGroup",
+        "SetGeolocation",
+        "SetOffline",
+        "SetRFContext",
+        "SetTime",
+        "SetTimeout",
+        "SetViewportSize",
+    }
+)
+
+
+def is_batchable(method: str) -> bool:
+    """Return True for the rpcs in ``BATCHABLE_METHODS``.
+
+    Nothing waits on the result of such a call, so it can be queued and sent
+    with its neighbours in one ``ExecuteBatch`` request.
+    """
+    return method in BATCHABLE_METHODS
+
+
+class BatchingStub:
+    """PlaywrightStub stand-in used inside `Playwright.batch`.
+
+    Batchable calls are queued and answered with a placeholder response, any
+    other call first sends the queue so that it sees the effects of the
+    calls made before it.
+    """
+
+    def __init__(
+        self,
+        stub: "playwright_pb2_grpc.PlaywrightStub | SessionStub | DeadlineStub | BannerStub",
+        steps: list,
+    ):
+        self._stub = stub
+        self._steps = steps
+
+    def __getattr__(self, method: str):
+        if not is_batchable(method):
+            self.flush()
+            return getattr(self._stub, method)
+
+        def queue(request):
+            self._steps.append(
+                Request.BatchStep(method=method, request=request.SerializeToString())
+            )
+            return Response.Empty(log=f"{method} queued for batched execution.")
+
+        return queue
+
+    def flush(self):
+        if not self._steps:
+            return
+        steps = list(self._steps)
+        self._steps.clear()
+        response = self._stub.ExecuteBatch(Request.Batch(steps=steps))
+        logger.debug(response.log)
+        for result in response.results:
+            if not result.ok:
+                message = f"Batched call {result.method} failed: {result.error}"
+                skipped = len(steps) - len(response.results)
+                if skipped:
+                    message += f"\n{skipped} queued call(s) after it were not run."
+                raise AssertionError(message)
+            logger.debug(Response.Empty.FromString(result.response).log)
+
+
+class DeadlineStub:
+    """PlaywrightStub stand-in used by promises which have a deadline.
+
+    Every call gets the time left until the deadline as its gRPC timeout, so
+    it is cancelled, also in the Node side, when the deadline is reached.
+    """
+
+    def __init__(self, stub: playwright_pb2_grpc.PlaywrightStub, deadline: float):
+        self._stub = stub
+        self._deadline = deadline
+
+    def __getattr__(self, method: str):
+        rpc = getattr(self._stub, method)
+
+        def call(request, **kwargs):
+            timeout = max(self._deadline - time.monotonic(), 0)
+            passed = kwargs.pop("timeout", None)
+            if passed is not None:
+                timeout = min(passed, timeout)
+            return rpc(request, timeout=timeout, **kwargs)
+
+        return call
+
+
+class BannerStub:
+    """PlaywrightStub stand-in which sends the pending keyword call banner.
+
+    The banner goes as metadata of the next call, and the Playwright process
+    paints it on the active page before handling that call, so showing the
+    banner needs no call of its own.
+    """
+
+    def __init__(
+        self,
+        stub: playwright_pb2_grpc.PlaywrightStub,
+        take_banner: Callable[[], str | None],
+    ):
+        self._stub = stub
+        self._take_banner = take_banner
+
+    def __getattr__(self, method: str):
+        rpc = getattr(self._stub, method)
+        banner = self._take_banner()
+        if banner is None:
+            return rpc
+
+        def call(request, **kwargs):
+            metadata = ((KEYWORD_CALL_BANNER_METADATA, banner.encode("utf-8")),)
+            return rpc(request, metadata=metadata, **kwargs)
+
+        return call
+
+
+class _CallDetails(grpc.ClientCallDetails):
+    def __init__(self, details: grpc.ClientCallDetails, metadata: tuple):
+        self.method = details.method
+        self.timeout = details.timeout
+        self.metadata = metadata
+        self.credentials = details.credentials
+        self.wait_for_ready = details.wait_for_ready
+        self.compression = details.compression
+
+
+class PeerIdInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """Sends the peer id of this process as metadata of every call.
+
+    The Node.js side keeps one state per peer. Every client of a unix socket
+    has the same peer address, so the id tells the clients apart.
+    """
+
+    def __init__(self, peer_id: str):
+        self._peer_id = peer_id
+
+    def _with_peer_id(self, details: grpc.ClientCallDetails) -> _CallDetails:
+        return _CallDetails(
+            details, (*(details.metadata or ()), (PEER_ID_METADATA, self._peer_id))
+        )
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(self._with_peer_id(client_call_details), request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return continuation(self._with_peer_id(client_call_details), request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, requests):
+        return continuation(self._with_peer_id(client_call_details), requests)
+
+    def intercept_stream_stream(self, continuation, client_call_details, requests):
+        return continuation(self._with_peer_id(client_call_details), requests)
+
+
 def batteries_grpc_server():
     try:
         from BrowserBatteries import start_grpc_server  # noqa: PLC0415
@@ -103,7 +319,8 @@ def spawn_wrapper_process(  # noqa: PLR0917
     stopped being a pkg binary, and NODE_V8_COVERAGE was silently ignored there
     for as long as the two were separate.
     """
-    logger.info(f"Starting Browser process {script} using at {host}:{port}")
+    address = port if port.startswith(UNIX_SOCKET_PREFIX) else f"{host}:{port}"
+    logger.info(f"Starting Browser process {script} using at {address}")
     if enable_playwright_debug == PlaywrightLogTypes.playwright:
         logger.trace("Enabling Playwright debug logging")
         os.environ["DEBUG"] = "pw:api"
@@ -125,14 +342,61 @@ def spawn_wrapper_process(  # noqa: PLR0917
         os.environ["NODE_V8_COVERAGE"] = str(v8_coverage_dir)
         logger.info(f"V8 coverage enabled, writing to {v8_coverage_dir}")
     logger.trace(f"Node startup parameters: {node_args}")
-    return Popen(
-        node_args,
-        shell=False,
-        cwd=cwd,
-        env=os.environ,
-        stdout=logfile,
-        stderr=STDOUT,
+    if sys.platform == "win32":
+        return Popen(
+            node_args,
+            shell=False,
+            cwd=cwd,
+            env=os.environ,
+            stdout=logfile,
+            stderr=STDOUT,
+        )
+    read_fd, write_fd = os.pipe()
+    started = time.perf_counter()
+    try:
+        process = Popen(
+            node_args,
+            shell=False,
+            cwd=cwd,
+            env={**os.environ, READY_FD_ENV: str(write_fd)},
+            stdout=logfile,
+            stderr=STDOUT,
+            pass_fds=(write_fd,),
+        )
+    finally:
+        os.close(write_fd)
+    spawned = time.perf_counter()
+    try:
+        wait_for_readiness(read_fd, process)
+    except RuntimeError:
+        close_process_tree(process)
+        raise
+    finally:
+        os.close(read_fd)
+    logger.debug(
+        f"Playwright process startup: spawn {(spawned - started) * 1000:.1f} ms, "
+        f"bind {(time.perf_counter() - spawned) * 1000:.1f} ms"
     )
+    return process
+
+
+def wait_for_readiness(read_fd: int, process: Popen, timeout: float = READY_TIMEOUT):
+    """Block until the NodeJS side reports over the pipe that its server is bound.
+
+    A process that does not report in time is left to the Health polling of
+    `Playwright.wait_until_server_up`, only a reported failure raises.
+    """
+    ready, _, _ = select.select([read_fd], [], [], timeout)
+    if not ready:
+        logger.debug(f"No readiness signal from Playwright process in {timeout}s")
+        return
+    message = os.read(read_fd, 4096).decode("utf-8", errors="replace").strip()
+    if message.startswith("error"):
+        raise RuntimeError(f"Playwright process failed to start: {message[6:]}")
+    if message != "ready":
+        logger.debug(
+            f"Playwright process closed the readiness pipe, exit code {process.poll()}"
+        )
 
 
 class Playwright(LibraryComponent):
@@ -140,13 +404,16 @@ class Playwright(LibraryComponent):
 
     port: str | None
     _node_dependencies_checked = False
+    _pool_lease: PoolLease | None = None
+    _unix_socket: Path | None = None
+    _keyword_call_banner: str | None = None
 
     def __init__(
         self,
         library: "Browser",
         enable_playwright_debug: PlaywrightLogTypes | bool,
         host: str | None = None,
-        port: int | None = None,
+        port: int | str | None = None,
         playwright_log: Path | TextIO | None = Path(Path.cwd()),
     ):
         LibraryComponent.__init__(self, library)
@@ -161,9 +428,12 @@ class Playwright(LibraryComponent):
         max_attempts = 2 if platform.system() == "Darwin" else 1
         last_error: RuntimeError | None = None
         for attempt in range(1, max_attempts + 1):
-            process = self.start_playwright()
+            process = None
             try:
+                process = self.start_playwright()
                 self.wait_until_server_up()
+                self._adopt_pool_lease()
+                self._send_rf_context()
                 atexit.register(self.close)
                 if platform.system() == "Darwin":
                     time.sleep(
@@ -174,6 +444,7 @@ class Playwright(LibraryComponent):
                 last_error = err
                 if process:
                     close_process_tree(process)
+                self._release_pool_lease()
                 # Reset host/port so next attempt starts a fresh process on a fresh port.
                 self.host = None
                 self.port = None
@@ -280,8 +551,24 @@ class Playwright(LibraryComponent):
                     f"ROBOT_FRAMEWORK_BROWSER_NODE_PORT {existing_port} defined in env, skipping Browser process start"
                 )
             return None
+        pool_directory = os.environ.get(POOL_ENV)
+        if pool_directory:
+            lease = lease_process(Path(pool_directory))
+            if lease is not None:
+                logger.info(
+                    f"Leased warm Playwright process at {lease.host}:{lease.port} from {pool_directory}"
+                )
+                self._pool_lease = lease
+                self.host = lease.host
+                self.port = lease.port
+                return None
+            logger.debug(f"No warm Playwright process left in {pool_directory}")
+        if use_unix_socket(self.host):
+            self._unix_socket = unix_socket_path(self.browser_output)
+            port = f"{UNIX_SOCKET_PREFIX}{self._unix_socket}"
+        else:
+            port = str(find_free_port())
         host = str(self.host) if self.host is not None else "127.0.0.1"
-        port = str(find_free_port())
         self.host = host
         self.port = port
         start_grpc_server = batteries_grpc_server()
@@ -312,33 +599,116 @@ class Playwright(LibraryComponent):
             coverage_output=self.browser_output,
         )
 
+    def _adopt_pool_lease(self):
+        """Take over the state, and the browser in it, prepared by ``rfbrowser pool``."""
+        lease = self._pool_lease
+        if lease is None:
+            return
+        stub = playwright_pb2_grpc.PlaywrightStub(self._channel)
+        try:
+            stub.SetPeerId(Request().Index(index=lease.peer))
+        except grpc.RpcError as error:
+            raise RuntimeError(
+                f"Could not take over the pooled playwright process: {error}"
+            ) from error
+        self.library._playwright_state.browser_arg_mapping.update(lease.browsers)
+
+    def _send_rf_context(self):
+        """Tell the process which suite and test are running.
+
+        Contexts and pages are attributed to them for auto closing, and keywords
+        run before the process was started have not sent it yet.
+        """
+        stub = playwright_pb2_grpc.PlaywrightStub(self._channel)
+        with contextlib.suppress(grpc.RpcError):
+            stub.SetRFContext(Request().RFContext(**self.library._rf_context.context()))
+
+    def _release_pool_lease(self):
+        lease, self._pool_lease = self._pool_lease, None
+        if lease is not None:
+            lease.release()
+
+    @property
+    def target(self) -> str:
+        """gRPC target of the Playwright process, ``host:port`` or ``unix:/path``.
+
+        A ``unix:`` target is kept in ``port``, so that it can be shared like a
+        port number with ``ROBOT_FRAMEWORK_BROWSER_NODE_PORT``.
+        """
+        if self.port and self.port.startswith(UNIX_SOCKET_PREFIX):
+            return self.port
+        return f"{self.host}:{self.port}"
+
     def wait_until_server_up(self):
-        for _ in range(150):  # About 15 seconds
-            logger.debug(
-                f"Waiting for Playwright server at {self.host}:{self.port} to start..."
-            )
+        started = time.perf_counter()
+        for attempt in range(1, 151):  # About 15 seconds
+            logger.debug(f"Waiting for Playwright server at {self.target} to start...")
             with grpc.insecure_channel(
-                f"{self.host}:{self.port}", options=grpc_channel_options(self.host)
+                self.target, options=grpc_channel_options(self.host)
             ) as channel:
                 try:
                     stub = playwright_pb2_grpc.PlaywrightStub(channel)
                     response = stub.Health(Request().Empty())
                     logger.trace(
-                        f"Connected to the playwright process at {self.host}:{self.port}: {response}"
+                        f"Connected to the playwright process at {self.target}: {response}"
+                    )
+                    logger.debug(
+                        f"First Health OK after {attempt} attempt(s) in "
+                        f"{(time.perf_counter() - started) * 1000:.1f} ms"
                     )
                     return
                 except grpc.RpcError as err:
                     logger.debug(err)
                     time.sleep(0.1)
         raise RuntimeError(
-            f"Could not connect to the playwright process at {self.host}:{self.port}."
+            f"Could not connect to the playwright process at {self.target}."
         )
 
     @cached_property
     def _channel(self):
-        return grpc.insecure_channel(
-            f"{self.host}:{self.port}", options=grpc_channel_options(self.host)
+        channel = grpc.insecure_channel(
+            self.target, options=grpc_channel_options(self.host)
         )
+        if not self.target.startswith(UNIX_SOCKET_PREFIX):
+            # Over TCP a Python process has a connection, and so a state, of its own.
+            return channel
+        return grpc.intercept_channel(channel, PeerIdInterceptor(f"unix-{os.getpid()}"))
+
+    @cached_property
+    def _session(self) -> SessionStream:
+        logger.debug("Opening session stream to the playwright process")
+        return SessionStream(self._channel)
+
+    @cached_property
+    def _batch(self) -> threading.local:
+        return threading.local()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Send the setter calls made in this block, see `is_batchable`, in one request.
+
+        Other calls still go out on their own, after the queued ones. Errors of queued calls surface when the queue is sent, so they
+        are reported by a later keyword or at the end of the block. Batching is
+        per thread and nested blocks join the outermost one.
+        """
+        if getattr(self._batch, "steps", None) is not None:
+            yield
+            return
+        self._batch.steps = []
+        try:
+            yield
+        except BaseException:
+            try:
+                with self.grpc_channel() as stub:
+                    stub.flush()
+            except AssertionError as error:
+                logger.debug(f"Sending the batch after an error failed: {error}")
+            raise
+        else:
+            with self.grpc_channel() as stub:
+                stub.flush()
+        finally:
+            self._batch.steps = None
 
     @contextlib.contextmanager
     def grpc_channel(self, original_error=False):
@@ -353,8 +723,20 @@ class Playwright(LibraryComponent):
                 raise ConnectionError(
                     f"Playwright process has been terminated with code {returncode}"
                 )
+        stub: (
+            playwright_pb2_grpc.PlaywrightStub | SessionStub | DeadlineStub | BannerStub
+        )
+        stub = playwright_pb2_grpc.PlaywrightStub(self._channel)
+        deadline = promise_deadline()
+        if deadline is not None:
+            stub = DeadlineStub(stub, deadline)
+        elif self._keyword_call_banner is not None:
+            stub = BannerStub(stub, self._take_keyword_call_banner)
+        elif session_stream_enabled():
+            stub = SessionStub(self._session, stub)
+        steps = getattr(self._batch, "steps", None)
         try:
-            yield playwright_pb2_grpc.PlaywrightStub(self._channel)
+            yield stub if steps is None else BatchingStub(stub, steps)
         except grpc.RpcError as error:
             if original_error:
                 raise error
@@ -363,6 +745,14 @@ class Playwright(LibraryComponent):
             logger.debug(f"Unknown error received: {error}")
             raise AssertionError(str(error))
 
+    def queue_keyword_call_banner(self, content: str):
+        """Sends the keyword call banner ``content`` with the next call."""
+        self._keyword_call_banner = content
+
+    def _take_keyword_call_banner(self) -> str | None:
+        banner, self._keyword_call_banner = self._keyword_call_banner, None
+        return banner
+
     def close(self):
         if self._auto_closing_level == AutoClosingLevel.KEEP:
             logger.debug(
@@ -375,6 +765,9 @@ class Playwright(LibraryComponent):
             with self.grpc_channel() as stub:
                 response = stub.CloseAllBrowsers(Request().Empty())
                 logger.debug(response.log)
+            session = self.__dict__.get("_session")
+            if session:
+                session.close()
             self._channel.close()
         except Exception as exc:
             logger.debug(f"Failed to close browsers: {exc}")
@@ -403,5 +796,8 @@ class Playwright(LibraryComponent):
                         f"Graceful shutdown failed, falling back to kill: {exc}"
                     )
             close_process_tree(playwright_process)
+            if self._unix_socket is not None:
+                self._unix_socket.unlink(missing_ok=True)
         else:
+            self._release_pool_lease()
             logger.trace("Disconnected from external Playwright process")
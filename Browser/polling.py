@@ -0,0 +1,83 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections.abc import Callable
+
+from .utils.data_types import PollingStrategy
+
+FIXED_INTERVAL = 0.01
+MAX_BACKOFF = 0.5
+# Waiting for a change is capped, so that a change which fires no event, like
+# scrolling, is still noticed.
+MAX_CHANGE_WAIT = 0.5
+CHANGE_STRATEGIES = (PollingStrategy.mutation, PollingStrategy.network_idle)
+
+
+class Poller:
+    """Waits between the tries of a retry loop as its `PollingStrategy` says.
+
+    ``wait_for_change`` is called with the strategy name and the seconds to
+    wait at most, and returns True when the page changed before that. Without
+    it, or when it fails, the change strategies sleep like ``fixed``.
+
+    A wakeup is wasted when the try after it fails again.
+    """
+
+    def __init__(
+        self,
+        strategy: PollingStrategy = PollingStrategy.fixed,
+        wait_for_change: Callable[[str, float], bool] | None = None,
+    ):
+        self.strategy = strategy
+        self._wait_for_change = wait_for_change
+        self._delay = FIXED_INTERVAL
+        self.tries = 0
+        self.wakeups = 0
+        self.change_wakeups = 0
+        self.wasted_wakeups = 0
+
+    def record(self, passed: bool):
+        self.tries += 1
+        if not passed and self.wakeups:
+            self.wasted_wakeups += 1
+
+    def wait(self, remaining: float):
+        """Waits before the next try, at most ``remaining`` seconds."""
+        if remaining <= 0:
+            return
+        self.wakeups += 1
+        if self.strategy == PollingStrategy.backoff:
+            time.sleep(min(self._delay, remaining))
+            self._delay = min(self._delay * 2, MAX_BACKOFF)
+            return
+        if self.strategy in CHANGE_STRATEGIES and self._wait_for_change:
+            try:
+                changed = self._wait_for_change(
+                    self.strategy.name, min(MAX_CHANGE_WAIT, remaining)
+                )
+            except AssertionError:
+                pass
+            else:
+                self.change_wakeups += changed
+                return
+        time.sleep(min(FIXED_INTERVAL, remaining))
+
+    def statistics(self) -> str:
+        return (
+            f"Polling strategy: {self.strategy.name}\n"
+            f"Total tries: {self.tries}\n"
+            f"Woken by a page change: {self.change_wakeups}\n"
+            f"Wasted wakeups: {self.wasted_wakeups}"
+        )
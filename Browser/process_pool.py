@@ -0,0 +1,176 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pool of warm Playwright processes shared through a registry directory.
+
+``rfbrowser pool`` keeps processes with a browser already running and writes
+one JSON file per process to the ``ready`` folder of the registry. A library
+leases a process by moving its file to the ``leased`` folder, adding its own
+pid to the file name. A rename is atomic, so two libraries can never
+lease the same process. The pool replaces a leased process once the library
+removes the file or its pid is gone.
+"""
+
+import contextlib
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import psutil  # type: ignore[import-untyped]
+
+from .utils import PlaywrightLogTypes, SupportedBrowsers, logger
+
+if TYPE_CHECKING:
+    from .browser import Browser
+
+POOL_ENV = "ROBOT_FRAMEWORK_BROWSER_POOL"
+READY = "ready"
+LEASED = "leased"
+
+
+@dataclass
+class PoolLease:
+    path: Path
+    host: str
+    port: str
+    peer: str
+    browsers: dict[int, str] = field(default_factory=dict)
+
+    def release(self):
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+
+def lease_process(directory: Path) -> PoolLease | None:
+    """Take a warm process from the pool in ``directory``, None if there is none."""
+    leased = directory / LEASED
+    for entry in sorted((directory / READY).glob("*.json")):
+        target = leased / f"{entry.stem}.{os.getpid()}.json"
+        try:
+            entry.rename(target)
+        except OSError:
+            continue
+        try:
+            record = json.loads(target.read_text(encoding="utf-8"))
+            return PoolLease(
+                path=target,
+                host=record["host"],
+                port=str(record["port"]),
+                peer=record["peer"],
+                browsers={int(key): value for key, value in record["browsers"].items()},
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+            # Without the lease file the pool sees the process as released and stops it.
+            logger.warn(f"Skipping the broken pool record {entry.name}: {error}")
+            target.unlink(missing_ok=True)
+    return None
+
+
+class ProcessPool:
+    def __init__(
+        self,
+        directory: Path,
+        size: int,
+        browser: SupportedBrowsers = SupportedBrowsers.chromium,
+        headless: bool = True,
+    ):
+        self.directory = directory
+        self.size = size
+        self.browser = browser
+        self.headless = headless
+        self.processes: dict[str, Browser] = {}
+        for folder in (READY, LEASED, "logs"):
+            (directory / folder).mkdir(parents=True, exist_ok=True)
+
+    def _ready_file(self, process_id: str) -> Path:
+        return self.directory / READY / f"{process_id}.json"
+
+    def _leases(self, process_id: str) -> list[Path]:
+        return list((self.directory / LEASED).glob(f"{process_id}.*.json"))
+
+    def fill(self):
+        while len(list((self.directory / READY).glob("*.json"))) < self.size:
+            try:
+                self.start()
+            except Exception as error:
+                logger.warn(f"Starting a warm process failed: {error}")
+                return
+
+    def start(self) -> str:
+        from .browser import Browser  # noqa: PLC0415
+
+        process_id = uuid.uuid4().hex
+        library = Browser(enable_playwright_debug=PlaywrightLogTypes.disabled)
+        library._playwright_log = self.directory / "logs" / f"{process_id}.log"
+        self.processes[process_id] = library
+        peer = f"pool-{process_id}"
+        try:
+            library.set_peer_id(peer)
+            library.new_browser(browser=self.browser, headless=self.headless)
+        except Exception:
+            self.stop(process_id)
+            raise
+        record = {
+            "host": library.playwright.host,
+            "port": library.playwright.port,
+            "peer": peer,
+            "browsers": library._playwright_state.browser_arg_mapping,
+        }
+        temporary = self.directory / f"{process_id}.tmp"
+        temporary.write_text(json.dumps(record), encoding="utf-8")
+        temporary.replace(self._ready_file(process_id))
+        logger.info(f"Started warm process {process_id} at port {record['port']}")
+        return process_id
+
+    def _is_running(self, process_id: str) -> bool:
+        process = self.processes[process_id].playwright.__dict__.get(
+            "_playwright_process"
+        )
+        return process is not None and process.poll() is None
+
+    def _is_in_use(self, process_id: str) -> bool:
+        if self._ready_file(process_id).exists():
+            return True
+        leases = self._leases(process_id)
+        return any(psutil.pid_exists(int(lease.name.split(".")[1])) for lease in leases)
+
+    def reap(self):
+        """Stop the processes which have been released or whose client has died."""
+        for process_id in list(self.processes):
+            if self._is_running(process_id) and self._is_in_use(process_id):
+                continue
+            self.stop(process_id)
+
+    def stop(self, process_id: str):
+        library = self.processes.pop(process_id)
+        logger.info(f"Stopping pooled process {process_id}")
+        self._ready_file(process_id).unlink(missing_ok=True)
+        for lease in self._leases(process_id):
+            lease.unlink(missing_ok=True)
+        with contextlib.suppress(Exception):
+            library.playwright.close()
+
+    def run(self, interval: float = 0.5):
+        try:
+            while True:
+                self.reap()
+                self.fill()
+                time.sleep(interval)
+        finally:
+            for process_id in list(self.processes):
+                self.stop(process_id)
@@ -0,0 +1,100 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+MAX_WORKERS = 256
+
+_promise = threading.local()
+
+
+def promise_deadline() -> float | None:
+    """Returns the ``time.monotonic`` deadline of the promise running in this thread."""
+    return getattr(_promise, "deadline", None)
+
+
+class PromiseExecutor:
+    """Runs promises on a bounded pool of threads and counts them.
+
+    A promise given a ``timeout`` gets a deadline. The gRPC calls it makes
+    carry the time left as their deadline, so the call, and the wait in the
+    Node side, stops when the deadline is reached. A promise still queued at
+    its deadline is not started at all. Both count as cancelled.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.max_latency = 0.0
+
+    def submit(
+        self, function: Callable, *args, timeout: float | None = None, **kwargs
+    ) -> Future:
+        submitted = time.monotonic()
+        deadline = submitted + timeout if timeout else None
+
+        def run():
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            try:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Promise was not started within its timeout of {timeout}s."
+                    )
+                _promise.deadline = deadline
+                return function(*args, **kwargs)
+            finally:
+                _promise.deadline = None
+                with self._lock:
+                    self.running -= 1
+
+        with self._lock:
+            self.queued += 1
+        future = self._pool.submit(run)
+        future.add_done_callback(lambda done: self._finished(done, submitted, deadline))
+        return future
+
+    def _finished(self, future: Future, submitted: float, deadline: float | None):
+        finished = time.monotonic()
+        with self._lock:
+            self.max_latency = max(self.max_latency, finished - submitted)
+            if future.cancelled():
+                self.queued -= 1
+                self.cancelled += 1
+            elif future.exception() is None:
+                self.completed += 1
+            elif deadline is not None and finished >= deadline:
+                self.cancelled += 1
+            else:
+                self.failed += 1
+
+    def statistics(self) -> dict[str, int | float]:
+        with self._lock:
+            return {
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "max_latency": round(self.max_latency, 3),
+            }
@@ -0,0 +1,151 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+import grpc  # type: ignore
+from google.protobuf import message_factory
+
+from Browser.generated import playwright_pb2_grpc
+from Browser.generated.playwright_pb2 import DESCRIPTOR, Request
+
+from .utils import logger
+
+SESSION_STREAM_ENV = "ROBOT_FRAMEWORK_BROWSER_SESSION_STREAM"
+PLAYWRIGHT_SERVICE = DESCRIPTOR.services_by_name["Playwright"]
+STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+
+def session_stream_enabled() -> bool:
+    return os.environ.get(SESSION_STREAM_ENV, "").lower() in ("1", "true")
+
+
+class SessionRpcError(grpc.RpcError):
+    """Error of a call made over the session stream, shaped like the one of a unary call."""
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self._code = code
+        self._details = details
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+
+class SessionStream:
+    """One ``Session`` stream to the Playwright process, shared by all threads.
+
+    Each call is sent as an envelope with its own id and the thread making it
+    waits for the envelope coming back with that id. Responses are read by a
+    single background thread, so calls from several threads can be in flight
+    at the same time, like with unary calls.
+    """
+
+    def __init__(self, channel: grpc.Channel):
+        self._requests: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._closed = False
+        stub = playwright_pb2_grpc.PlaywrightStub(channel)
+        self._responses = stub.Session(iter(self._requests.get, None))
+        self._reader = threading.Thread(
+            target=self._read, name="browser-session-stream", daemon=True
+        )
+        self._reader.start()
+
+    def call(self, method: str, request) -> bytes:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise SessionRpcError(
+                    grpc.StatusCode.UNAVAILABLE, "Session stream is closed."
+                )
+            envelope_id = next(self._ids)
+            self._pending[envelope_id] = future
+        self._requests.put(
+            Request.Envelope(
+                id=envelope_id, method=method, request=request.SerializeToString()
+            )
+        )
+        return future.result()
+
+    def _read(self):
+        error = SessionRpcError(grpc.StatusCode.UNAVAILABLE, "Session stream ended.")
+        try:
+            for envelope in self._responses:
+                with self._lock:
+                    future = self._pending.pop(envelope.id, None)
+                if future is None:
+                    continue
+                if envelope.code:
+                    future.set_exception(
+                        SessionRpcError(
+                            STATUS_CODES.get(envelope.code, grpc.StatusCode.UNKNOWN),
+                            envelope.error,
+                        )
+                    )
+                else:
+                    future.set_result(envelope.response)
+        except grpc.RpcError as rpc_error:
+            logger.debug(f"Session stream failed: {rpc_error}")
+            error = SessionRpcError(rpc_error.code(), rpc_error.details())
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            future.set_exception(error)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+        self._requests.put(None)
+        self._reader.join(timeout=5)
+
+
+class SessionStub:
+    """PlaywrightStub stand-in which sends unary calls over a `SessionStream`.
+
+    Streaming methods have no envelope form and go to the regular stub.
+    """
+
+    def __init__(
+        self, session: SessionStream, stub: playwright_pb2_grpc.PlaywrightStub
+    ):
+        self._session = session
+        self._stub = stub
+
+    def __getattr__(self, method: str):
+        descriptor = PLAYWRIGHT_SERVICE.methods_by_name.get(method)
+        if (
+            descriptor is None
+            or descriptor.client_streaming
+            or descriptor.server_streaming
+        ):
+            return getattr(self._stub, method)
+        response_class = message_factory.GetMessageClass(descriptor.output_type)
+
+        def call(request):
+            return response_class.FromString(self._session.call(method, request))
+
+        return call
@@ -38,6 +38,7 @@ from .data_types import (
     HighLightElement,
     HighlightMode,
     HttpCredentials,
+    HttpMode,
     InstallableBrowser,
     InstallationOptions,
     LambdaFunction,
@@ -48,6 +49,7 @@ from .data_types import (
     PdfFormat,
     PdfMarging,
     PlaywrightLogTypes,
+    PollingStrategy,
     Proxy,
     RecordHar,
     RecordVideo,
@@ -55,6 +57,7 @@ from .data_types import (
     ReducedMotion,
     ReloadPages,
     RequestMethod,
+    RouteAction,
     Scale,
     Scope,
     ScreenshotFileTypes,
@@ -83,4 +86,5 @@ from .misc import (
     close_process_tree,
 )
 from .settings_stack import ScopedSetting, SettingsStack
+from .streaming import SPILL_THRESHOLD_BYTES, StreamedBody
 from robot.utils import DotDict
@@ -1109,6 +1109,32 @@ class RequestMethod(Enum):
     PUT = auto()
 
 
+class HttpMode(Enum):
+    """Defines how `HTTP` sends the request.
+
+    - ``page`` Uses ``fetch`` of the active page. The request needs an open page and is bound by the CORS rules of it.
+    - ``context`` Uses the request client of the active context, which shares its cookies, or without a context a client of its own. No page is needed, CORS does not apply and the body can be binary.
+    """
+
+    page = auto()
+    context = auto()
+
+
+class RouteAction(Enum):
+    """Defines what `Add Route` does with a matching request.
+
+    - ``fulfill`` Answers the request with the given status, headers and body, without sending it.
+    - ``abort`` Fails the request with the given error code.
+    - ``continue`` Sends the request on, with the given headers added to it.
+    - ``har`` Answers the request from a HAR file.
+    """
+
+    fulfill = auto()
+    abort = auto()
+    continue_ = auto()
+    har = auto()
+
+
 class MouseButtonAction(Enum):
     """Enum that defines which `Mouse Button` action to perform."""
 
@@ -1732,6 +1758,23 @@ class ClientCredential(TypedDict):
     publicKey: Secret
 
 
+class PollingStrategy(Enum):
+    """Defines how long keywords wait before trying again, see `Assertions` and `Wait For Condition`.
+
+    - ``fixed`` Tries again after 10 milliseconds.
+    - ``backoff`` Doubles the wait after each try, from 10 milliseconds up to half a second.
+    - ``mutation`` Tries again when the DOM of the page changes or an input event happens, at the latest after half a second.
+    - ``network_idle`` Tries again when the requests of the page have ended, at the latest after half a second.
+
+    ``mutation`` and ``network_idle`` save calls on pages which change only once in a while.
+    """
+
+    fixed = auto()
+    backoff = auto()
+    mutation = auto()
+    network_idle = auto()
+
+
 class TracingGroupMode(Enum):
     """Defines in what detail level keywords are written to Playwright trace.
 
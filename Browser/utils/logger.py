@@ -12,48 +12,74 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import threading
-from collections.abc import Callable
 from typing import Any
 
 from robot.api import logger
 from robot.api.logger import LOGLEVEL
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 
-_THREAD_STASHES: dict[int, list[list[Callable]]] = {}
+LEVELS = {"TRACE": 0, "DEBUG": 1, "INFO": 2, "WARN": 3, "ERROR": 4, "NONE": 7}
 
+# A message is stashed unrendered, as its level, message and html flag.
+_THREAD_STASHES: dict[int, list[list[tuple[LOGLEVEL, Any, bool]]]] = {}
 
-def _stashing_logger(funk: Callable):
-    def func(msg: Any, html=False):
-        if threading.get_ident() in _THREAD_STASHES:
-            _THREAD_STASHES[threading.get_ident()][-1].append(lambda: funk(msg, html))
-        else:
-            funk(msg, html)
 
-    return func
+def is_logged(level: LOGLEVEL) -> bool:
+    """Tells if messages of ``level`` get to the log with the current ``${LOG LEVEL}``.
+
+    Outside of a Robot Framework execution all messages are logged.
+    """
+    try:
+        current = BuiltIn().get_variable_value("${LOG_LEVEL}")
+    except RobotNotRunningError:
+        return True
+    if current is None:
+        return True
+    return LEVELS[level] >= LEVELS.get(str(current).upper(), 0)
+
+
+def _log(level: LOGLEVEL, msg: Any, html: bool):
+    # Only lazy messages are worth checking the level for, Robot Framework
+    # filters the rest anyway.
+    if callable(msg):
+        if not is_logged(level):
+            return
+        msg = msg()
+    logger.write(msg, level, html)
+
+
+def _stash_or_log(level: LOGLEVEL, msg: Any, html: bool):
+    stashes = _THREAD_STASHES.get(threading.get_ident())
+    if stashes is not None:
+        stashes[-1].append((level, msg, html))
+    else:
+        _log(level, msg, html)
 
 
-@_stashing_logger
 def info(msg: Any, html=False):
-    logger.info(msg, html)
+    """Logs ``msg`` on INFO level.
+
+    ``msg`` can be a callable returning the message, which is then only called
+    when the message gets to the log. Use that for messages which are
+    expensive to build.
+    """
+    _stash_or_log("INFO", msg, html)
 
 
-@_stashing_logger
 def debug(msg: Any, html=False):
-    logger.debug(msg, html)
+    _stash_or_log("DEBUG", msg, html)
 
 
-@_stashing_logger
 def trace(msg: Any, html=False):
-    logger.trace(msg, html)
+    _stash_or_log("TRACE", msg, html)
 
 
-@_stashing_logger
 def warn(msg: Any, html=False):
-    logger.warn(msg, html)
+    _stash_or_log("WARN", msg, html)
 
 
-@_stashing_logger
 def error(msg: Any, html=False):
-    logger.error(msg, html)
+    _stash_or_log("ERROR", msg, html)
 
 
 def console(msg: Any):
@@ -61,18 +87,10 @@ def console(msg: Any):
 
 
 def write(msg: Any, loglevel: LOGLEVEL, html=False):
-    if loglevel == "TRACE":
-        trace(msg, html)
-    elif loglevel == "DEBUG":
-        debug(msg, html)
-    elif loglevel == "INFO":
-        info(msg, html)
-    elif loglevel == "CONSOLE":
+    if loglevel == "CONSOLE":
         console(msg)
-    elif loglevel == "WARN":
-        warn(msg, html)
-    elif loglevel == "ERROR":
-        error(msg, html)
+    elif loglevel in LEVELS and loglevel != "NONE":
+        _stash_or_log(loglevel, msg, html)
     else:
         raise ValueError(f"Unknown log level: {loglevel}")
 
@@ -92,9 +110,9 @@ def clear_thread_stash():
 def flush_and_delete_thread_stash():
     stashes = _THREAD_STASHES[threading.get_ident()]
     if len(stashes) == 1:
-        for logging_call in stashes[0]:
-            logging_call()
         del _THREAD_STASHES[threading.get_ident()]
+        for level, msg, html in stashes[0]:
+            _log(level, msg, html)
     else:
         last = stashes.pop()
         stashes[-1].extend(last)
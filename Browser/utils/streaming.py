@@ -0,0 +1,65 @@
+# Copyright 2020-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import tempfile
+from collections.abc import Callable, Iterable
+from typing import Any
+
+SPILL_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+class StreamedBody:
+    """Collects the chunks of a streamed response body.
+
+    Chunks are written as bytes to a buffer, which moves to a temporary file
+    when it grows over ``spill_threshold`` bytes, so a body is joined in linear
+    time and decoded only once. A ``spill_threshold`` of 0 keeps the body in
+    memory. Use it with ``contextlib.closing`` to remove the temporary file.
+    """
+
+    def __init__(self, spill_threshold: int = SPILL_THRESHOLD_BYTES):
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=spill_threshold)  # noqa: SIM115
+        self.size = 0
+
+    def write(self, chunk: str | bytes):
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        self.size += self._buffer.write(chunk)
+
+    def read_responses(
+        self, responses: Iterable, field: str, log: Callable[[str], Any] | None = None
+    ) -> Any:
+        """Writes ``field`` of every response and returns the last response."""
+        response = None
+        for response in responses:
+            if log is not None:
+                log(response.log)
+            self.write(getattr(response, field))
+        return response
+
+    def bytes(self) -> bytes:
+        self._buffer.seek(0)
+        return self._buffer.read()
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.bytes().decode(encoding)
+
+    def json(self) -> Any:
+        """Parses the body as JSON. Raises ``json.JSONDecodeError`` if it is not."""
+        self._buffer.seek(0)
+        return json.load(self._buffer)
+
+    def close(self):
+        self._buffer.close()
@@ -0,0 +1,115 @@
+/// <reference types="jest" />
+
+import { describe, expect, it } from '@jest/globals';
+
+jest.mock('../browser_logger', () => ({
+    logger: { info: jest.fn(), error: jest.fn() },
+}));
+
+jest.mock('../getters', () => ({
+    getText: jest.fn(),
+    getDomProperty: jest.fn(),
+    getElementAttribute: jest.fn(),
+    getElementCount: jest.fn(),
+    getStyle: jest.fn(),
+}));
+
+import { assertPoll, compileCheck } from '../assertion-poll';
+import { getText } from '../getters';
+
+const mockGetText = jest.mocked(getText);
+
+function pollRequest(operator: string, expected: unknown) {
+    return {
+        getter: 'Text',
+        selector: 'h1',
+        strict: true,
+        argument: '',
+        pseudo: '',
+        operator,
+        expected: JSON.stringify(expected),
+        timeout: 1000,
+        retryFor: 200,
+        polling: '',
+    };
+}
+
+function makeState(evaluate: jest.Mock = jest.fn().mockResolvedValue(true)) {
+    return { getActivePage: () => ({ evaluate }) } as any;
+}
+
+describe('compileCheck', () => {
+    it('converts the expected value of a number like the library does', () => {
+        expect(compileCheck('==', '3')!(3)).toBe(true);
+        expect(compileCheck('>', '3')!(2)).toBe(false);
+        expect(compileCheck('==', '3')!('3')).toBe(true);
+    });
+
+    it('checks strings with the regex operators', () => {
+        expect(compileCheck('^=', 'Wel')!('Welcome')).toBe(true);
+        expect(compileCheck('$=', 'come')!('Welcome')).toBe(true);
+        expect(compileCheck('$', 'l+c')!('Welcome')).toBe(true);
+        expect(compileCheck('*=', 'x')!('Welcome')).toBe(false);
+        expect(compileCheck('not contains', 'x')!('Welcome')).toBe(true);
+    });
+
+    it('compares the start and end of strings literally', () => {
+        expect(compileCheck('^=', '1+1')!('1+1=2')).toBe(true);
+        expect(compileCheck('^=', '1+1')!('11=2')).toBe(false);
+        expect(compileCheck('$=', 'a.b')!('x.a.b')).toBe(true);
+        expect(compileCheck('$=', 'a.b')!('xaxb')).toBe(false);
+    });
+
+    it('leaves operators and patterns it can not check to the library', () => {
+        expect(compileCheck('validate', 'value')).toBeUndefined();
+        expect(compileCheck('$', '(?P<name>a)')).toBeUndefined();
+    });
+});
+
+describe('assertPoll', () => {
+    it('retries when the page changes until the value passes', async () => {
+        mockGetText.mockReset();
+        mockGetText
+            .mockResolvedValueOnce({ items: ['Loading'], log: '' })
+            .mockResolvedValueOnce({ items: ['Loading'], log: '' })
+            .mockResolvedValueOnce({ items: ['Done'], log: '' });
+        const evaluate = jest.fn().mockResolvedValue(true);
+
+        const response = await assertPoll(pollRequest('==', 'Done'), makeState(evaluate));
+
+        expect(response.status).toBe('passed');
+        expect(JSON.parse(response.value)).toBe('Done');
+        expect(response.tries).toBe(3);
+        expect(response.mutationWakeups).toBe(2);
+        expect(response.wastedWakeups).toBe(1);
+    });
+
+    it('stops retrying once the retry time has passed', async () => {
+        mockGetText.mockReset();
+        mockGetText.mockResolvedValue({ items: ['Loading'], log: '' });
+        const request = { ...pollRequest('==', 'Done'), retryFor: 0 };
+
+        const response = await assertPoll(request, makeState());
+
+        expect(response.status).toBe('failed');
+        expect(response.tries).toBe(1);
+    });
+
+    it('reports the error of a failing getter', async () => {
+        mockGetText.mockReset();
+        mockGetText.mockRejectedValue(new Error('Timeout 1000ms exceeded'));
+        const request = { ...pollRequest('==', 'Done'), retryFor: 0 };
+
+        const response = await assertPoll(request, makeState());
+
+        expect(response.status).toBe('error');
+        expect(response.error).toBe('Timeout 1000ms exceeded');
+    });
+
+    it('does not poll an unsupported assertion', async () => {
+        mockGetText.mockReset();
+        const response = await assertPoll(pollRequest('validate', 'True'), makeState());
+        expect(response.status).toBe('unsupported');
+        expect(mockGetText).not.toHaveBeenCalled();
+    });
+});
@@ -13,7 +13,7 @@ jest.mock('../browser_logger', () => ({
     logger: { info: jest.fn(), error: jest.fn() },
 }));
 
-import { takeScreenshot } from '../browser-control';
+import { takeScreenshot, takeScreenshotBytes } from '../browser-control';
 import { findLocator } from '../playwright-invoke';
 
 const mockFindLocator = jest.mocked(findLocator);
@@ -105,3 +105,22 @@ describe('takeScreenshot', () => {
         await expect(takeScreenshot(req, state)).rejects.toThrow('Tried to take screenshot, but no page was open.');
     });
 });
+
+describe('takeScreenshotBytes', () => {
+    beforeEach(() => {
+        jest.clearAllMocks();
+    });
+
+    it('returns the image without saving it', async () => {
+        const image = Buffer.from('image');
+        const mockPage = makeMockPage({ screenshot: jest.fn().mockResolvedValue(image) });
+        const state = makeMockState(mockPage);
+        const req = makeRequest('', { fileType: 'jpeg' }, []);
+
+        const res = await takeScreenshotBytes(req, state);
+
+        expect(mockPage.screenshot).toHaveBeenCalledWith(expect.objectContaining({ type: 'jpeg' }));
+        expect(mockPage.screenshot.mock.calls[0][0]).not.toHaveProperty('path');
+        expect(Buffer.concat(Array.from(res, (chunk) => chunk.body))).toEqual(image);
+    });
+});
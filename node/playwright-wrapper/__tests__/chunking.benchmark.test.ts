@@ -0,0 +1,38 @@
+/// <reference types="jest" />
+
+import { describe, expect, it } from '@jest/globals';
+
+import { iterateUtf8Chunks, MAX_RESPONSE_CHUNK_BYTES } from '../chunking';
+
+// Mixes 1, 2, 3 and 4 byte characters, so that chunk boundaries fall inside characters.
+const PATTERN = 'abcdefgh<div class="x">äöå€日本語🔥</div>\n';
+
+function body(megabytes: number): string {
+    const bytes = megabytes * 1024 * 1024;
+    return PATTERN.repeat(Math.ceil(bytes / Buffer.byteLength(PATTERN, 'utf8')));
+}
+
+// The benchmark builds bodies of up to 50 MB, so it only runs when asked for, with
+// ROBOT_FRAMEWORK_BROWSER_BENCHMARK=1 npm test -- chunking.benchmark
+const describeBenchmark = process.env.ROBOT_FRAMEWORK_BROWSER_BENCHMARK ? describe : describe.skip;
+
+describeBenchmark('iterateUtf8Chunks benchmark', () => {
+    it.each([1, 10, 50])('chunks a %i MB body', (megabytes) => {
+        const text = body(megabytes);
+        const started = process.hrtime.bigint();
+        let bytes = 0;
+        let chunks = 0;
+        let characters = 0;
+        for (const chunk of iterateUtf8Chunks(text, MAX_RESPONSE_CHUNK_BYTES)) {
+            const size = Buffer.byteLength(chunk, 'utf8');
+            expect(size).toBeLessThanOrEqual(MAX_RESPONSE_CHUNK_BYTES);
+            bytes += size;
+            characters += chunk.length;
+            chunks++;
+        }
+        const milliseconds = Number(process.hrtime.bigint() - started) / 1e6;
+        console.log(`${megabytes} MB in ${chunks} chunks took ${milliseconds.toFixed(1)} ms`);
+        expect(bytes).toBe(Buffer.byteLength(text, 'utf8'));
+        expect(characters).toBe(text.length);
+    });
+});
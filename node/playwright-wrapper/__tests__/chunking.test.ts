@@ -1,8 +1,9 @@
 /// <reference types="jest" />
 
 import { describe, expect, it } from '@jest/globals';
+import { Writable } from 'stream';
 
-import { splitUtf8ByMaxBytes } from '../chunking';
+import { iterateUtf8Chunks, splitBufferByMaxBytes, splitUtf8ByMaxBytes, writeChunks } from '../chunking';
 
 describe('splitUtf8ByMaxBytes', () => {
     it('returns empty array for empty string', () => {
@@ -68,3 +69,50 @@ describe('splitUtf8ByMaxBytes', () => {
         expect(result).toEqual(['aaa', 'aaa', 'aaa', 'a']);
     });
 });
+
+describe('splitBufferByMaxBytes', () => {
+    it('returns empty array for empty buffer', () => {
+        expect(splitBufferByMaxBytes(Buffer.alloc(0), 100)).toEqual([]);
+    });
+
+    it('splits a buffer into chunks of at most maxBytes', () => {
+        const buffer = Buffer.from([1, 2, 3, 4, 5, 6, 7]);
+        const result = splitBufferByMaxBytes(buffer, 3);
+        expect(result.map((chunk) => chunk.length)).toEqual([3, 3, 1]);
+        expect(Buffer.concat(result)).toEqual(buffer);
+    });
+});
+
+describe('iterateUtf8Chunks', () => {
+    it('backs off to the start of a character at the chunk boundary', () => {
+        // 'a' is 1 byte and 'ä' 2 bytes, so a 2 byte chunk would end inside 'ä'
+        expect(Array.from(iterateUtf8Chunks('aää', 2))).toEqual(['a', 'ä', 'ä']);
+    });
+
+    it('gives a character longer than maxBytes a chunk of its own', () => {
+        expect(Array.from(iterateUtf8Chunks('a🔥b', 2))).toEqual(['a', '🔥', 'b']);
+    });
+
+    it('yields chunks lazily', () => {
+        const chunks = iterateUtf8Chunks('abcdef', 2);
+        expect(chunks.next().value).toBe('ab');
+        expect(chunks.next().value).toBe('cd');
+    });
+});
+
+describe('writeChunks', () => {
+    it('waits for the stream to drain before writing more', async () => {
+        const written: string[] = [];
+        const stream = new Writable({
+            objectMode: true,
+            highWaterMark: 1,
+            write(chunk, _encoding, callback) {
+                written.push(chunk);
+                setImmediate(callback);
+            },
+        });
+        await writeChunks(stream, ['a', 'b', 'c']);
+        stream.end();
+        expect(written).toEqual(['a', 'b', 'c']);
+    });
+});
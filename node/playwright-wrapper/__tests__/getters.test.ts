@@ -2,7 +2,9 @@
 
 import { beforeEach, describe, expect, it } from '@jest/globals';
 
-import { getElementStates, getText } from '../getters';
+import { gunzipSync } from 'zlib';
+
+import { getElementStates, getPageSourceBytes, getText } from '../getters';
 
 // Mock playwright-invoke so findLocator returns our controlled mock locator
 jest.mock('../playwright-invoke', () => ({
@@ -413,3 +415,24 @@ describe('getText', () => {
         });
     });
 });
+
+describe('getPageSourceBytes', () => {
+    const html = '<html><body>äö</body></html>';
+    const page = { content: jest.fn().mockResolvedValue(html) } as any;
+
+    it('returns the source as UTF-8 bytes', async () => {
+        const chunks = await getPageSourceBytes({ compression: '' }, page);
+        expect(Buffer.concat(Array.from(chunks, (chunk) => chunk.body)).toString('utf8')).toBe(html);
+    });
+
+    it('compresses the source with gzip', async () => {
+        const chunks = await getPageSourceBytes({ compression: 'gzip' }, page);
+        expect(gunzipSync(Buffer.concat(Array.from(chunks, (chunk) => chunk.body))).toString('utf8')).toBe(html);
+    });
+
+    it('fails for unknown compression', async () => {
+        await expect(getPageSourceBytes({ compression: 'zip' }, page)).rejects.toThrow(
+            'Compression zip is not supported.',
+        );
+    });
+});
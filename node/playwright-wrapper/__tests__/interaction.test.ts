@@ -2,13 +2,14 @@
 
 import { beforeEach, describe, expect, it } from '@jest/globals';
 import { EventEmitter } from 'events';
+import fs from 'fs';
 
 jest.mock('../browser_logger', () => ({
     logger: { info: jest.fn(), error: jest.fn() },
 }));
 
 import { logger } from '../browser_logger';
-import { handleAlert } from '../interaction';
+import { FileUploadStream, handleAlert } from '../interaction';
 
 const mockLogger = jest.mocked(logger);
 
@@ -146,3 +147,41 @@ describe('handleAlert', () => {
         );
     });
 });
+
+describe('FileUploadStream', () => {
+    function chunk(fields: Record<string, any>) {
+        return { path: [], selector: 'id=file', strict: true, name: '', mimeType: '', buffer: '', ...fields } as any;
+    }
+
+    it('writes streamed files to temporary files and removes them', async () => {
+        const upload = new FileUploadStream();
+        await upload.add(chunk({ fileName: 'a.txt', fileIndex: 1, content: Buffer.from('hello ') }));
+        await upload.add(chunk({ fileName: 'a.txt', fileIndex: 1, content: Buffer.from('world') }));
+        await upload.add(chunk({ fileName: 'a.txt', fileIndex: 2, content: Buffer.alloc(0) }));
+
+        const request = await upload.finish();
+
+        expect(request.path).toHaveLength(2);
+        expect(request.path[0]).not.toBe(request.path[1]);
+        expect(fs.readFileSync(request.path[0], 'utf8')).toBe('hello world');
+        expect(fs.readFileSync(request.path[1], 'utf8')).toBe('');
+        await upload.cleanup();
+        expect(fs.existsSync(request.path[0])).toBe(false);
+    });
+
+    it('joins the chunks of a buffer', async () => {
+        const upload = new FileUploadStream();
+        await upload.add(chunk({ name: 'a.txt', content: Buffer.from([0xc3]) }));
+        await upload.add(chunk({ name: 'a.txt', content: Buffer.from([0xa4]) }));
+
+        const request = await upload.finish();
+
+        expect(request.path).toEqual([]);
+        expect(Buffer.from(request.content).toString('utf8')).toBe('ä');
+        await upload.cleanup();
+    });
+
+    it('fails when nothing was received', async () => {
+        await expect(new FileUploadStream().finish()).rejects.toThrow('No data received for uploadFileBySelector');
+    });
+});
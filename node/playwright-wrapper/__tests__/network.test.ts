@@ -9,7 +9,18 @@ jest.mock('uuid', () => ({
 }));
 
 import { logger } from '../browser_logger';
-import { waitForRequest } from '../network';
+import { EventEmitter } from 'events';
+
+import {
+    apiRequest,
+    deserializeUrlOrPredicate,
+    globToRegExp,
+    MAX_COMPILED_PREDICATES,
+    recordNetworkTraffic,
+    stopNetworkRecording,
+    timeoutWithinDeadline,
+    waitForRequest,
+} from '../network';
 
 const mockLogger = jest.mocked(logger);
 
@@ -222,3 +233,211 @@ describe('waitForRequest', () => {
         expect(result.log).toContain('10000ms');
     });
 });
+
+describe('timeoutWithinDeadline', () => {
+    it('keeps the timeout when the call has no deadline', () => {
+        expect(timeoutWithinDeadline(5000, Infinity)).toBe(5000);
+    });
+
+    it('shortens the timeout to the deadline', () => {
+        const timeout = timeoutWithinDeadline(60000, new Date(Date.now() + 2000));
+        expect(timeout).toBeGreaterThan(0);
+        expect(timeout).toBeLessThanOrEqual(2000);
+    });
+
+    it('limits a wait without timeout to the deadline', () => {
+        expect(timeoutWithinDeadline(0, Date.now() + 2000)).toBeLessThanOrEqual(2000);
+    });
+
+    it('keeps a shorter timeout', () => {
+        expect(timeoutWithinDeadline(1000, Date.now() + 60000)).toBe(1000);
+    });
+
+    it('never returns 0, which would wait forever', () => {
+        expect(timeoutWithinDeadline(1000, Date.now() - 10)).toBe(1);
+    });
+});
+
+describe('apiRequest', () => {
+    function makeState(body: Buffer, pageUrl = 'http://localhost:7272/index.html') {
+        const response = {
+            body: jest.fn().mockResolvedValue(body),
+            dispose: jest.fn().mockResolvedValue(undefined),
+            status: () => 200,
+            statusText: () => 'OK',
+            headers: () => ({ 'content-type': 'text/plain' }),
+            url: () => 'http://localhost:7272/api/get/text',
+            ok: () => true,
+        };
+        const requestContext = { fetch: jest.fn().mockResolvedValue(response) };
+        const state = {
+            getApiRequestContext: jest.fn().mockResolvedValue(requestContext),
+            getActivePage: () => ({ url: () => pageUrl }),
+        } as any;
+        return { state, requestContext, response };
+    }
+
+    function makeHttpRequest(overrides: Record<string, unknown> = {}) {
+        return {
+            url: '/api/get/text',
+            method: 'GET',
+            body: '',
+            binaryBody: Buffer.alloc(0),
+            headers: '{}',
+            ...overrides,
+        } as any;
+    }
+
+    it('resolves a relative url against the active page and disposes the response', async () => {
+        const { state, requestContext, response } = makeState(Buffer.from('HELLO'));
+
+        const result = Array.from(await apiRequest(makeHttpRequest(), state));
+
+        expect(requestContext.fetch).toHaveBeenCalledWith('http://localhost:7272/api/get/text', {
+            method: 'GET',
+            headers: {},
+            data: undefined,
+        });
+        expect(response.dispose).toHaveBeenCalled();
+        expect(result).toHaveLength(1);
+        expect(result[0].body).toEqual(Buffer.from('HELLO'));
+        expect(JSON.parse(result[0].json)).toMatchObject({ status: 200, ok: true, redirected: false });
+    });
+
+    it('sends a binary body as a buffer', async () => {
+        const { state, requestContext } = makeState(Buffer.alloc(0));
+
+        await apiRequest(makeHttpRequest({ method: 'POST', binaryBody: Buffer.from([1, 2]) }), state);
+
+        expect(requestContext.fetch.mock.calls[0][1]).toMatchObject({ data: Buffer.from([1, 2]) });
+    });
+
+    it('streams a large body in chunks with the metadata in the first one', async () => {
+        const body = Buffer.alloc(5 * 1024 * 1024, 1);
+        const { state } = makeState(body);
+
+        const result = Array.from(await apiRequest(makeHttpRequest(), state));
+
+        expect(result.length).toBeGreaterThan(1);
+        expect(result[0].json).not.toBe('');
+        expect(result.slice(1).every((message) => message.json === '')).toBe(true);
+        expect(Buffer.concat(result.map((message) => message.body))).toEqual(body);
+    });
+});
+
+describe('globToRegExp', () => {
+    it('matches the documented wildcards', () => {
+        expect(globToRegExp('**/api/get/text').test('http://localhost:7272/api/get/text')).toBe(true);
+        expect(globToRegExp('http://host/*.js').test('http://host/app.js')).toBe(true);
+        expect(globToRegExp('http://host/*.js').test('http://host/lib/app.js')).toBe(false);
+        expect(globToRegExp('http://host/v?').test('http://host/v2')).toBe(true);
+        expect(globToRegExp('**/[a-c].png').test('http://host/b.png')).toBe(true);
+        expect(globToRegExp('**/*.{png,jpg}').test('http://host/a.jpg')).toBe(true);
+    });
+
+    it('matches the whole url and special characters literally', () => {
+        expect(globToRegExp('http://host/a+b').test('http://host/aab')).toBe(false);
+        expect(globToRegExp('http://host/a.b').test('http://host/aXb')).toBe(false);
+        expect(globToRegExp('http://host/a').test('http://host/a/b')).toBe(false);
+    });
+});
+
+describe('recordNetworkTraffic', () => {
+    function makeResponse(url: string, body = 'BODY') {
+        return {
+            url: () => url,
+            status: () => 200,
+            statusText: () => 'OK',
+            ok: () => true,
+            headers: () => ({ 'content-type': 'text/plain' }),
+            body: jest.fn().mockResolvedValue(Buffer.from(body)),
+            request: () => ({
+                method: () => 'GET',
+                resourceType: () => 'fetch',
+                headers: () => ({}),
+                timing: () => ({ startTime: 1 }),
+            }),
+        };
+    }
+
+    function makeState() {
+        const context = new EventEmitter();
+        const state = { getActiveContext: () => context, networkRecordings: new Map() } as any;
+        return { context, state };
+    }
+
+    function record(state: any, urlOrPredicate = '', maxBodySize = 0) {
+        const messages: any[] = [];
+        const end = jest.fn();
+        recordNetworkTraffic({ id: 'rec', urlOrPredicate, maxBodySize }, state, (m) => messages.push(m), end);
+        return { messages, end };
+    }
+
+    it('writes a start message and the matching responses with their bodies', async () => {
+        const { context, state } = makeState();
+        const { messages, end } = record(state, '**/api/**', 10);
+
+        context.emit('response', makeResponse('http://host/api/a'));
+        context.emit('response', makeResponse('http://host/page'));
+        context.emit('response', makeResponse('http://host/api/large', 'x'.repeat(11)));
+        await stopNetworkRecording({ id: 'rec', urlOrPredicate: '', maxBodySize: 0 }, state);
+
+        expect(messages[0].json).toBe('');
+        const entries = messages.filter((m) => m.json).map((m) => JSON.parse(m.json));
+        expect(entries.map((e) => [e.url, e.bodySize])).toEqual([
+            ['http://host/api/a', 4],
+            ['http://host/api/large', 11],
+        ]);
+        expect(messages.filter((m) => m.bodyPart).map((m) => m.bodyPart)).toEqual(['BODY']);
+        expect(end).toHaveBeenCalledTimes(1);
+        expect(context.listenerCount('response')).toBe(0);
+        expect(state.networkRecordings.size).toBe(0);
+    });
+
+    it('does not read bodies without maxBodySize', async () => {
+        const { context, state } = makeState();
+        const { messages } = record(state);
+        const response = makeResponse('http://host/a');
+
+        context.emit('response', response);
+        await stopNetworkRecording({ id: 'rec', urlOrPredicate: '', maxBodySize: 0 }, state);
+
+        expect(response.body).not.toHaveBeenCalled();
+        expect(JSON.parse(messages[1].json)).not.toHaveProperty('bodySize');
+    });
+
+    it('ends when the context is closed', async () => {
+        const { context, state } = makeState();
+        const { end } = record(state);
+
+        context.emit('close');
+        await new Promise(setImmediate);
+
+        expect(end).toHaveBeenCalledTimes(1);
+        await expect(stopNetworkRecording({ id: 'rec', urlOrPredicate: '', maxBodySize: 0 }, state)).rejects.toThrow(
+            'No network recording rec is running.',
+        );
+    });
+});
+
+describe('deserializeUrlOrPredicate', () => {
+    it('compiles a predicate once', () => {
+        const predicate = deserializeUrlOrPredicate('response => response.ok()');
+        expect(typeof predicate).toBe('function');
+        expect(deserializeUrlOrPredicate('response => response.ok()')).toBe(predicate);
+    });
+
+    it('keeps only the most recently used predicates', () => {
+        const first = deserializeUrlOrPredicate('request => request.first');
+        for (let n = 0; n < MAX_COMPILED_PREDICATES; n++) {
+            deserializeUrlOrPredicate(`request => request.n${n}`);
+        }
+        const last = `request => request.n${MAX_COMPILED_PREDICATES - 1}`;
+        expect(deserializeUrlOrPredicate(last)).toBe(deserializeUrlOrPredicate(last));
+        expect(deserializeUrlOrPredicate('request => request.first')).not.toBe(first);
+    });
+
+    it('returns a new RegExp each time', () => {
+        expect(deserializeUrlOrPredicate('/api/g')).not.toBe(deserializeUrlOrPredicate('/api/g'));
+    });
+});
@@ -1,6 +1,9 @@
 /// <reference types="jest" />
 
 import { beforeEach, describe, expect, it } from '@jest/globals';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
 import type { Browser } from 'playwright';
 
 jest.mock('../browser_logger', () => ({
@@ -16,8 +19,14 @@ import {
     closeAllBrowsers,
     closeBrowser,
     closeBrowserServer,
+    closeConcurrency,
+    closeContextsById,
+    closeScope,
+    extensionKeywordCall,
+    initializeExtension,
     locatorCache,
     PlaywrightState,
+    runWithLimit,
 } from '../playwright-state';
 
 function makeBrowserState(id: string): BrowserState {
@@ -142,6 +151,372 @@ describe('PlaywrightState', () => {
 
         await expect(state.closeServer(server)).rejects.toThrow('BrowserServer not found.');
     });
+
+    it('paints the keyword call banner on the active page', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=banner');
+        attachSingleContextWithPage(browserState);
+        state.browserStack.push(browserState);
+        const evaluate = jest.fn().mockResolvedValue(undefined);
+        Object.assign(state.getActivePage() as any, { evaluate, on: jest.fn() });
+
+        state.showKeywordCallBanner('body::before{}');
+        await state.keywordCallBanner;
+
+        expect(evaluate).toHaveBeenCalledWith(expect.any(Function), 'body::before{}');
+    });
+
+    it('paints the last keyword call banner again on new pages and documents', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=banner');
+        attachSingleContextWithPage(browserState);
+        state.browserStack.push(browserState);
+        const first = { evaluate: jest.fn().mockResolvedValue(undefined), on: jest.fn() };
+        Object.assign(state.getActivePage() as any, first);
+        state.showKeywordCallBanner('body::before{}');
+        state.showKeywordCallBanner();
+        expect(first.evaluate).toHaveBeenCalledTimes(1);
+
+        const [event, onLoad] = first.on.mock.calls[0];
+        expect(event).toBe('domcontentloaded');
+        onLoad();
+        expect(first.evaluate).toHaveBeenCalledTimes(2);
+
+        const second = { evaluate: jest.fn().mockResolvedValue(undefined), on: jest.fn() };
+        browserState.context!.pageStack.push({ ...browserState.context!.pageStack[0], p: second as any, id: 'page=2' });
+        state.showKeywordCallBanner();
+        await state.keywordCallBanner;
+
+        expect(second.evaluate).toHaveBeenCalledWith(expect.any(Function), 'body::before{}');
+    });
+
+    it('does not fail when the keyword call banner can not be painted', async () => {
+        const state = new PlaywrightState();
+        state.showKeywordCallBanner('body::before{}');
+        const browserState = makeBrowserState('browser=banner');
+        attachSingleContextWithPage(browserState);
+        state.browserStack.push(browserState);
+        Object.assign(state.getActivePage() as any, {
+            evaluate: jest.fn().mockRejectedValue(new Error('Target closed')),
+            on: jest.fn(),
+        });
+
+        state.showKeywordCallBanner('body::before{}');
+
+        await expect(state.keywordCallBanner).resolves.toBeUndefined();
+    });
+});
+
+describe('browser catalog watch', () => {
+    it('adds the title and url of the pages to the catalog', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=details');
+        attachSingleContextWithPage(browserState, 'page=details');
+        state.browserStack.push(browserState);
+        Object.assign(state.getActivePage() as any, {
+            url: () => 'https://example.com/',
+            title: jest.fn().mockResolvedValue('Example'),
+        });
+
+        const catalog = await state.getCatalog();
+
+        expect(catalog[0].contexts[0].pages[0]).toMatchObject({
+            id: 'page=details',
+            title: 'Example',
+            url: 'https://example.com/',
+        });
+        expect(await state.getCatalog(false)).toEqual(state.getCatalogSnapshot());
+    });
+
+    it('sends the current catalog when watching starts', () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=watched');
+        attachSingleContextWithPage(browserState, 'page=watched');
+        state.browserStack.push(browserState);
+        const events: any[] = [];
+
+        state.watchCatalog((event) => events.push(event));
+
+        expect(events).toHaveLength(1);
+        expect(JSON.parse(events[0].json)).toEqual(state.getCatalogSnapshot());
+        expect(JSON.parse(events[0].json)[0].contexts[0].activePage).toBe('page=watched');
+    });
+
+    it('publishes opened and activated ids only when the catalog changed', () => {
+        const state = new PlaywrightState();
+        const events: any[] = [];
+        state.watchCatalog((event) => events.push(event));
+
+        state.publishCatalog();
+        expect(events).toHaveLength(1);
+
+        const browserState = makeBrowserState('browser=new');
+        attachSingleContextWithPage(browserState, 'page=new');
+        state.browserStack.push(browserState);
+        state.publishCatalog();
+
+        expect(events).toHaveLength(2);
+        expect(events[1].version).toBe(events[0].version + 1);
+        expect(events[1].changes).toEqual(
+            expect.arrayContaining([
+                { kind: 'opened', id: 'browser=new' },
+                { kind: 'opened', id: 'context=1' },
+                { kind: 'opened', id: 'page=new' },
+                { kind: 'activated', id: 'page=new' },
+            ]),
+        );
+    });
+
+    it('publishes closed ids and stops after unwatching', () => {
+        const state = new PlaywrightState();
+        state.browserStack.push(makeBrowserState('browser=closing'));
+        const events: any[] = [];
+        const unwatch = state.watchCatalog((event) => events.push(event));
+
+        state.popBrowser();
+        state.publishCatalog();
+        expect(events[1].changes).toEqual([{ kind: 'closed', id: 'browser=closing' }]);
+
+        unwatch();
+        state.browserStack.push(makeBrowserState('browser=unwatched'));
+        state.publishCatalog();
+        expect(events).toHaveLength(2);
+    });
+});
+
+describe('closeScope', () => {
+    function makeClosableContext(id: string, pages: any[], traceFile = '') {
+        return {
+            c: {
+                close: jest.fn().mockResolvedValue(undefined),
+                tracing: { stop: jest.fn().mockResolvedValue(undefined) },
+            } as any,
+            id,
+            traceFile,
+            pageStack: pages,
+            options: {},
+        } as any;
+    }
+
+    function makeClosablePage(id: string) {
+        const page = makeIndexedPage(id);
+        page.p = { close: jest.fn().mockResolvedValue(undefined), video: () => null };
+        return page;
+    }
+
+    function closeRequest(scopeId: string, saveTrace = true) {
+        return { scopeId, saveTrace, runBeforeUnload: false, traceGroup: undefined, concurrency: 0 };
+    }
+
+    it('closes contexts and pages opened in the scope only', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=1');
+        state.browserStack.push(browserState);
+        state.enterScope('s1');
+        const suiteContext = makeClosableContext('context=suite', [makeClosablePage('page=suite')]);
+        browserState.pushContext(suiteContext);
+        state.enterScope('s1-t1');
+        const testPage = makeClosablePage('page=test');
+        suiteContext.pageStack.push(testPage);
+        const testContext = makeClosableContext('context=test', [makeClosablePage('page=in-context')]);
+        browserState.pushContext(testContext);
+        state.enterScope('s1');
+
+        const response = await closeScope(closeRequest('s1-t1'), state);
+
+        expect(JSON.parse(response.json)).toEqual({
+            contexts: ['context=test'],
+            pages: ['page=test'],
+            traces: [],
+            videos: [],
+            errors: [],
+        });
+        expect(testContext.c.close).toHaveBeenCalledTimes(1);
+        expect(testPage.p.close).toHaveBeenCalledWith({ runBeforeUnload: false });
+        expect(suiteContext.c.close).not.toHaveBeenCalled();
+        expect(browserState.contextStack).toEqual([suiteContext]);
+        expect(suiteContext.pageStack.map((page: any) => page.id)).toEqual(['page=suite']);
+    });
+
+    it('closes what tests of a suite left open but not sibling suites', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=1');
+        state.browserStack.push(browserState);
+        state.enterScope('s1-s1-t1');
+        const inSuite = makeClosableContext('context=in-suite', []);
+        browserState.pushContext(inSuite);
+        state.enterScope('s1-s10-t1');
+        const inSibling = makeClosableContext('context=in-sibling', []);
+        browserState.pushContext(inSibling);
+
+        const response = await closeScope(closeRequest('s1-s1'), state);
+
+        expect(JSON.parse(response.json).contexts).toEqual(['context=in-suite']);
+        expect(inSibling.c.close).not.toHaveBeenCalled();
+    });
+
+    it('saves the trace only when asked to', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=1');
+        state.browserStack.push(browserState);
+        state.enterScope('s1-t1');
+        const saved = makeClosableContext('context=saved', [], 'saved.zip');
+        browserState.pushContext(saved);
+        await closeScope(closeRequest('s1-t1'), state);
+
+        const discarded = makeClosableContext('context=discarded', [], 'discarded.zip');
+        browserState.pushContext(discarded);
+        await closeScope(closeRequest('s1-t1', false), state);
+
+        expect(saved.c.tracing.stop).toHaveBeenCalledWith({ path: 'saved.zip' });
+        expect(discarded.c.tracing.stop).not.toHaveBeenCalled();
+        expect(discarded.c.close).toHaveBeenCalledTimes(1);
+    });
+
+    it('reports a failing close and still closes the rest', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=1');
+        state.browserStack.push(browserState);
+        state.enterScope('s1-t1');
+        const failing = makeClosableContext('context=failing', []);
+        failing.c.close.mockRejectedValue(new Error('Target closed'));
+        const closing = makeClosableContext('context=closing', []);
+        browserState.pushContext(failing);
+        browserState.pushContext(closing);
+
+        const result = JSON.parse((await closeScope(closeRequest('s1-t1'), state)).json);
+
+        expect(result.errors).toEqual(['context=failing: Target closed']);
+        expect(closing.c.close).toHaveBeenCalledTimes(1);
+        expect(browserState.contextStack).toEqual([]);
+    });
+
+    it('closes the pages after the contexts to stay within the concurrency', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=1');
+        state.browserStack.push(browserState);
+        state.enterScope('s1');
+        const suiteContext = makeClosableContext('context=suite', []);
+        browserState.pushContext(suiteContext);
+        state.enterScope('s1-t1');
+        const order: string[] = [];
+        const testPage = makeClosablePage('page=test');
+        testPage.p.close.mockImplementation(async () => order.push('page'));
+        suiteContext.pageStack.push(testPage);
+        const testContext = makeClosableContext('context=test', []);
+        testContext.c.close.mockImplementation(async () => {
+            await new Promise((resolve) => setTimeout(resolve, 5));
+            order.push('context');
+        });
+        browserState.pushContext(testContext);
+
+        await closeScope({ ...closeRequest('s1-t1'), concurrency: 1 }, state);
+
+        expect(order).toEqual(['context', 'page']);
+    });
+
+    it('reports saved traces and videos', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=1');
+        state.browserStack.push(browserState);
+        state.enterScope('s1-t1');
+        const page = makeClosablePage('page=1');
+        page.p.video = () => ({ path: jest.fn().mockResolvedValue('video/1.webm') });
+        browserState.pushContext(makeClosableContext('context=1', [page], 'trace/1.zip'));
+
+        const result = JSON.parse((await closeScope(closeRequest('s1-t1'), state)).json);
+
+        expect(result.traces).toEqual(['trace/1.zip']);
+        expect(result.videos).toEqual(['video/1.webm']);
+    });
+});
+
+describe('closing contexts concurrently', () => {
+    function makeSlowContext(id: string, running: { now: number; max: number }) {
+        const close = jest.fn(async () => {
+            running.now++;
+            running.max = Math.max(running.max, running.now);
+            await new Promise((resolve) => setTimeout(resolve, 5));
+            running.now--;
+        });
+        return { c: { close, tracing: { stop: jest.fn() } }, id, traceFile: '', pageStack: [], options: {} } as any;
+    }
+
+    it('runs at most the given number of tasks at a time and keeps their order', async () => {
+        const running = { now: 0, max: 0 };
+        const results = await runWithLimit([5, 1, 3, 2, 4], 2, async (item) => {
+            running.now++;
+            running.max = Math.max(running.max, running.now);
+            await new Promise((resolve) => setTimeout(resolve, item));
+            running.now--;
+            return item * 10;
+        });
+        expect(results).toEqual([50, 10, 30, 20, 40]);
+        expect(running.max).toBe(2);
+    });
+
+    it('uses the requested concurrency, then the environment, then the default', () => {
+        process.env.ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY = '7';
+        expect(closeConcurrency(2)).toBe(2);
+        expect(closeConcurrency()).toBe(7);
+        process.env.ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY = 'many';
+        expect(closeConcurrency()).toBe(4);
+        delete process.env.ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY;
+    });
+
+    it('streams a result for each requested context', async () => {
+        const state = new PlaywrightState();
+        const browserState = makeBrowserState('browser=1');
+        state.browserStack.push(browserState);
+        const running = { now: 0, max: 0 };
+        for (const id of ['context=1', 'context=2', 'context=3']) {
+            browserState.pushContext(makeSlowContext(id, running));
+        }
+        const results: any[] = [];
+
+        await closeContextsById(
+            { ids: ['context=1', 'context=3', 'context=missing'], saveTrace: true, concurrency: 1 },
+            state,
+            (closed) => results.push(closed),
+        );
+
+        expect(results.map((closed) => [closed.id, closed.error])).toEqual([
+            ['context=missing', 'No context for id context=missing'],
+            ['context=1', ''],
+            ['context=3', ''],
+        ]);
+        expect(running.max).toBe(1);
+        expect(browserState.contextStack.map((context) => context.id)).toEqual(['context=2']);
+    });
+
+    it('closes all browsers with a bounded number of contexts at a time', async () => {
+        const state = new PlaywrightState();
+        const running = { now: 0, max: 0 };
+        for (const browserId of ['browser=1', 'browser=2']) {
+            const browserState = makeBrowserState(browserId);
+            for (const n of [1, 2, 3]) {
+                browserState.pushContext(makeSlowContext(`context=${browserId}-${n}`, running));
+            }
+            state.browserStack.push(browserState);
+        }
+
+        await state.closeAll(3);
+
+        expect(running.max).toBe(3);
+        expect(state.browserStack).toEqual([]);
+    });
+
+    it('disposes the request client of its own when closing all browsers', async () => {
+        const state = new PlaywrightState();
+        const requestContext = { dispose: jest.fn().mockResolvedValue(undefined) };
+        (state as any).ownApiRequestContext = requestContext;
+
+        await state.closeAll();
+        await state.closeAll();
+
+        expect(requestContext.dispose).toHaveBeenCalledTimes(1);
+        expect((state as any).ownApiRequestContext).toBeUndefined();
+    });
 });
 
 describe('locatorCache', () => {
@@ -328,3 +703,69 @@ describe('close helpers', () => {
         );
     });
 });
+
+describe('extension keywords', () => {
+    function writeExtension(source: string): string {
+        const directory = fs.mkdtempSync(path.join(os.tmpdir(), 'rfbrowser-extension-'));
+        const file = path.join(directory, 'extension.js');
+        fs.writeFileSync(file, source);
+        return file;
+    }
+
+    const extension = writeExtension(`
+        exports.joinValues = async function (first, logger, second = 'b') {
+            logger('joining');
+            return first + second;
+        };
+        exports.pageUrl = async function (page) {
+            return page === undefined ? 'no page' : 'page';
+        };
+    `);
+
+    it('reads the argument names when the extension is loaded', async () => {
+        const state = new PlaywrightState();
+        const response = await initializeExtension({ path: extension } as any, state);
+
+        expect(response.keywords).toEqual(['joinValues', 'pageUrl']);
+        expect(state.extensionKeywords.get('joinValues')).toMatchObject({
+            argNames: ['first', 'logger', 'second'],
+            needsBrowser: false,
+        });
+        expect(state.extensionKeywords.get('pageUrl')?.needsBrowser).toBe(true);
+    });
+
+    it('fills in positional values around the API arguments', async () => {
+        const state = new PlaywrightState();
+        await initializeExtension({ path: extension } as any, state);
+        const call = { write: jest.fn() } as any;
+
+        const responses = await extensionKeywordCall(
+            { name: 'joinValues', arguments: '', positionalArguments: '["a", "c"]' } as any,
+            call,
+            state,
+        );
+
+        expect(Array.from(responses, (response) => response.bodyPart)).toEqual(['"ac"']);
+        expect(call.write).toHaveBeenCalledTimes(1);
+    });
+
+    it('still accepts named arguments', async () => {
+        const state = new PlaywrightState();
+        await initializeExtension({ path: extension } as any, state);
+        const named = JSON.stringify({ arguments: [['first', 'x'], ['logger', 'RESERVED'], ['second', 'y']] });
+
+        const responses = await extensionKeywordCall(
+            { name: 'joinValues', arguments: named, positionalArguments: '' } as any,
+            { write: jest.fn() } as any,
+            state,
+        );
+
+        expect(Array.from(responses, (response) => response.bodyPart)).toEqual(['"xy"']);
+    });
+
+    it('fails for an unknown keyword', async () => {
+        await expect(
+            extensionKeywordCall({ name: 'missing', positionalArguments: '[]' } as any, {} as any, new PlaywrightState()),
+        ).rejects.toThrow('Could not find keyword missing');
+    });
+});
@@ -0,0 +1,72 @@
+/// <reference types="jest" />
+
+import { describe, expect, it } from '@jest/globals';
+import { EventEmitter } from 'events';
+
+import { Poller, waitForChange, waitForNetworkIdle } from '../polling';
+
+function makeState(page: any) {
+    return { getActivePage: () => page } as any;
+}
+
+describe('Poller', () => {
+    it('doubles the backoff delay up to its cap', async () => {
+        jest.useFakeTimers();
+        const poller = new Poller(makeState(undefined), 'backoff');
+        const delays: number[] = [];
+        for (let i = 0; i < 8; i++) {
+            const started = Date.now();
+            const waiting = poller.wait(10_000);
+            await jest.runOnlyPendingTimersAsync();
+            await waiting;
+            delays.push(Date.now() - started);
+        }
+        jest.useRealTimers();
+        expect(delays).toEqual([10, 20, 40, 80, 160, 320, 500, 500]);
+    });
+
+    it('counts wakeups after which the try failed again as wasted', async () => {
+        const evaluate = jest.fn().mockResolvedValue(true);
+        const poller = new Poller(makeState({ evaluate }), 'mutation');
+        poller.record(false);
+        await poller.wait(1000);
+        poller.record(false);
+        await poller.wait(1000);
+        poller.record(true);
+        expect([poller.tries, poller.changeWakeups, poller.wastedWakeups]).toEqual([3, 2, 1]);
+        expect(evaluate).toHaveBeenCalledWith(expect.any(Function), 100);
+    });
+
+    it('does not wait past the remaining time', async () => {
+        const evaluate = jest.fn().mockResolvedValue(false);
+        const poller = new Poller(makeState({ evaluate }), 'mutation');
+        await poller.wait(30);
+        await poller.wait(0);
+        expect(evaluate).toHaveBeenCalledTimes(1);
+        expect(evaluate).toHaveBeenCalledWith(expect.any(Function), 30);
+    });
+});
+
+describe('waitForChange', () => {
+    it('sleeps when there is no page', async () => {
+        expect(await waitForChange(makeState(undefined), 'mutation', 5)).toBe(false);
+    });
+
+    it('resolves once requests have ended and the network stays quiet', async () => {
+        const page = new EventEmitter();
+        const idle = waitForNetworkIdle(page as any, 5000);
+        page.emit('request');
+        page.emit('request');
+        page.emit('requestfinished');
+        page.emit('requestfailed');
+        expect(await idle).toBe(true);
+        expect(page.listenerCount('request')).toBe(0);
+    });
+
+    it('resolves false when the network stays busy', async () => {
+        const page = new EventEmitter();
+        const idle = waitForNetworkIdle(page as any, 20);
+        page.emit('request');
+        expect(await idle).toBe(false);
+    });
+});
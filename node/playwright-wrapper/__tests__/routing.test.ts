@@ -0,0 +1,146 @@
+/// <reference types="jest" />
+
+import { describe, expect, it } from '@jest/globals';
+
+jest.mock('../browser_logger', () => ({
+    logger: { info: jest.fn(), error: jest.fn() },
+}));
+
+jest.mock('uuid', () => ({
+    v4: jest.fn().mockReturnValue('route-1'),
+}));
+
+import { v4 as uuidv4 } from 'uuid';
+
+import { addRoute, getRoutes, removeRoute } from '../routing';
+
+function makeRouteRequest(overrides: Record<string, unknown> = {}) {
+    return {
+        urlOrPredicate: '**/api/**',
+        action: 'fulfill',
+        status: 0,
+        headers: '',
+        body: Buffer.alloc(0),
+        path: '',
+        errorCode: '',
+        times: 0,
+        notFound: '',
+        ...overrides,
+    } as any;
+}
+
+function makeState() {
+    const context = {
+        route: jest.fn().mockResolvedValue(undefined),
+        unroute: jest.fn().mockResolvedValue(undefined),
+        routeFromHAR: jest.fn().mockResolvedValue(undefined),
+    };
+    const state = { getActiveContext: () => context } as any;
+    return { context, state };
+}
+
+function makeRoute() {
+    return {
+        fulfill: jest.fn().mockResolvedValue(undefined),
+        abort: jest.fn().mockResolvedValue(undefined),
+        continue: jest.fn().mockResolvedValue(undefined),
+        request: () => ({ headers: () => ({ accept: '*/*' }) }),
+    };
+}
+
+describe('addRoute', () => {
+    it('fulfills from memory and counts the hits', async () => {
+        const { context, state } = makeState();
+        const response = await addRoute(
+            makeRouteRequest({ body: Buffer.from('OK'), headers: '{"content-type": "text/plain"}', times: 2 }),
+            state,
+        );
+
+        expect(response.body).toBe('route-1');
+        const [matcher, handler, options] = context.route.mock.calls[0] as any[];
+        expect(matcher).toBe('**/api/**');
+        expect(options).toEqual({ times: 2 });
+        const route = makeRoute();
+        await handler(route);
+        await handler(route);
+        expect(route.fulfill).toHaveBeenCalledWith({
+            status: 200,
+            headers: { 'content-type': 'text/plain' },
+            body: Buffer.from('OK'),
+        });
+        const routes = JSON.parse((await getRoutes(state)).json);
+        expect(routes).toEqual([{ id: 'route-1', url: '**/api/**', action: 'fulfill', times: 2, hits: 2 }]);
+    });
+
+    it('compiles a predicate once', async () => {
+        const { context, state } = makeState();
+        await addRoute(makeRouteRequest({ urlOrPredicate: 'url => url.pathname === "/a"' }), state);
+
+        const matcher = context.route.mock.calls[0][0] as any;
+        expect(matcher(new URL('http://host/a'))).toBe(true);
+        expect(matcher(new URL('http://host/b'))).toBe(false);
+    });
+
+    it('aborts and continues with added headers', async () => {
+        const { context, state } = makeState();
+        await addRoute(makeRouteRequest({ action: 'abort', errorCode: 'timedout' }), state);
+        await addRoute(makeRouteRequest({ action: 'continue', headers: '{"x-test": "1"}' }), state);
+
+        const route = makeRoute();
+        await (context.route.mock.calls[0][1] as any)(route);
+        await (context.route.mock.calls[1][1] as any)(route);
+        expect(route.abort).toHaveBeenCalledWith('timedout');
+        expect(route.continue).toHaveBeenCalledWith({ headers: { accept: '*/*', 'x-test': '1' } });
+    });
+
+    it('routes from a HAR file', async () => {
+        const { context, state } = makeState();
+        await addRoute(makeRouteRequest({ action: 'har', path: '/tmp/a.har', notFound: 'fallback' }), state);
+
+        expect(context.routeFromHAR).toHaveBeenCalledWith('/tmp/a.har', { url: '**/api/**', notFound: 'fallback' });
+        expect(JSON.parse((await getRoutes(state)).json)[0].hits).toBeNull();
+    });
+
+    it('fails for an unknown action', async () => {
+        const { state } = makeState();
+        await expect(addRoute(makeRouteRequest({ action: 'teleport' }), state)).rejects.toThrow(
+            'Unknown route action teleport.',
+        );
+    });
+});
+
+describe('removeRoute', () => {
+    it('removes the route with its own handler', async () => {
+        const { context, state } = makeState();
+        await addRoute(makeRouteRequest(), state);
+        const [matcher, handler] = context.route.mock.calls[0];
+
+        await removeRoute({ id: 'route-1' }, state);
+
+        expect(context.unroute).toHaveBeenCalledWith(matcher, handler);
+        expect(JSON.parse((await getRoutes(state)).json)).toEqual([]);
+    });
+
+    it('forgets every route of the url of a removed HAR route', async () => {
+        const { context, state } = makeState();
+        (uuidv4 as jest.Mock).mockReturnValueOnce('route-1').mockReturnValueOnce('har-1').mockReturnValueOnce('other');
+        await addRoute(makeRouteRequest(), state);
+        await addRoute(makeRouteRequest({ action: 'har', path: '/tmp/a.har' }), state);
+        await addRoute(makeRouteRequest({ urlOrPredicate: '**/img/**' }), state);
+
+        const response = await removeRoute({ id: 'har-1' }, state);
+
+        expect(context.unroute).toHaveBeenCalledWith('**/api/**', undefined);
+        expect(response.log).toBe('Removed 2 route(s).');
+        expect(JSON.parse((await getRoutes(state)).json).map((route: any) => route.id)).toEqual(['other']);
+    });
+
+    it('logs an unknown route', async () => {
+        const { context, state } = makeState();
+
+        const response = await removeRoute({ id: 'nope' }, state);
+
+        expect(response.log).toBe('No route nope found.');
+        expect(context.unroute).not.toHaveBeenCalled();
+    });
+});
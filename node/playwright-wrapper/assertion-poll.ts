@@ -0,0 +1,166 @@
+// Copyright 2020-     Robot Framework Foundation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+import { isDeepStrictEqual } from 'util';
+
+import { logger } from './browser_logger';
+import * as pb from './generated/playwright';
+import { getDomProperty, getElementAttribute, getElementCount, getStyle, getText } from './getters';
+import { PlaywrightState } from './playwright-state';
+import { Poller } from './polling';
+
+type Getter = (request: pb.Request_AssertPoll, state: PlaywrightState) => Promise<unknown>;
+type Check = (value: unknown) => boolean;
+
+const getters: Record<string, Getter> = {
+    Text: async (request, state) => {
+        const response = await getText(
+            { selector: request.selector, strict: request.strict, textType: 'ROBOT_FRAMEWORK_BROWSER_NO_SET' },
+            state,
+        );
+        return response.items[0];
+    },
+    Property: async (request, state) => {
+        const response = await getDomProperty(
+            { selector: request.selector, property: request.argument, strict: request.strict },
+            state,
+        );
+        return response.body ? JSON.parse(response.body) : null;
+    },
+    Attribute: async (request, state) => {
+        const response = await getElementAttribute(
+            { selector: request.selector, property: request.argument, strict: request.strict },
+            state,
+        );
+        return JSON.parse(response.body);
+    },
+    ElementCount: async (request, state) => {
+        const response = await getElementCount({ selector: request.selector, strict: false, force: false }, state);
+        return response.body;
+    },
+    Style: async (request, state) => {
+        const response = await getStyle(
+            {
+                selector: request.selector,
+                styleKey: request.argument === 'ALL' ? '' : request.argument,
+                pseudo: request.pseudo,
+                strict: request.strict,
+            },
+            state,
+        );
+        return JSON.parse(response.json);
+    },
+};
+
+function contains(value: unknown, expected: unknown): boolean {
+    if (typeof value === 'string') return value.includes(String(expected));
+    if (Array.isArray(value)) return value.some((item) => isDeepStrictEqual(item, expected));
+    return false;
+}
+
+function regexCheck(pattern: string): Check {
+    const regex = new RegExp(pattern);
+    return (value) => typeof value === 'string' && regex.test(value);
+}
+
+/**
+ * Builds the check of an AssertionOperator, undefined when it can not be done here. The Python side
+ * verifies the final value again, so a check which differs in an edge case only costs extra tries.
+ */
+export function compileCheck(operator: string, expected: unknown): Check | undefined {
+    // Keywords returning numbers convert the expected value, see int_str_verify_assertion.
+    const typed = (value: unknown) =>
+        typeof value === 'number' && typeof expected === 'string' ? Number(expected) : expected;
+    const compare = (value: unknown) => value as number;
+    try {
+        switch (operator) {
+            case '==':
+                return (value) => isDeepStrictEqual(value, typed(value));
+            case '!=':
+                return (value) => !isDeepStrictEqual(value, typed(value));
+            case '<':
+                return (value) => compare(value) < compare(typed(value));
+            case '>':
+                return (value) => compare(value) > compare(typed(value));
+            case '<=':
+                return (value) => compare(value) <= compare(typed(value));
+            case '>=':
+                return (value) => compare(value) >= compare(typed(value));
+            case '*=':
+                return (value) => contains(value, expected);
+            case 'not contains':
+                return (value) => !contains(value, expected);
+            case '^=':
+                return (value) => typeof value === 'string' && value.startsWith(String(expected));
+            case '$=':
+                return (value) => typeof value === 'string' && value.endsWith(String(expected));
+            case '$':
+                return regexCheck(String(expected));
+        }
+    } catch (e) {
+        logger.info(`Assertion ${operator} ${expected} is left to the library: ${e}`);
+    }
+    return undefined;
+}
+
+function pollResponse(status: string, value: unknown, error: string, poller?: Poller): pb.Response_AssertPoll {
+    return {
+        status,
+        value: JSON.stringify(value ?? null),
+        error,
+        tries: poller?.tries ?? 0,
+        mutationWakeups: poller?.changeWakeups ?? 0,
+        wastedWakeups: poller?.wastedWakeups ?? 0,
+        log: `Assertion ${status} after ${poller?.log ?? 'no tries'}.`,
+    };
+}
+
+export async function assertPoll(
+    request: pb.Request_AssertPoll,
+    state: PlaywrightState,
+): Promise<pb.Response_AssertPoll> {
+    const getter = getters[request.getter] as Getter | undefined;
+    let check: Check | undefined;
+    try {
+        check = getter && compileCheck(request.operator, JSON.parse(request.expected));
+    } catch {
+        check = undefined;
+    }
+    if (!getter || !check) {
+        return pollResponse('unsupported', null, '');
+    }
+    const poller = new Poller(state, request.polling || 'mutation');
+    const deadline = Date.now() + request.timeout;
+    let retryDeadline: number | undefined;
+    for (;;) {
+        let value: unknown = null;
+        let error = '';
+        try {
+            value = await getter(request, state);
+        } catch (e) {
+            error = e instanceof Error ? e.message : String(e);
+        }
+        const passed = !error && check(value);
+        poller.record(passed);
+        if (passed) {
+            return pollResponse('passed', value, '', poller);
+        }
+        const now = Date.now();
+        retryDeadline ??= Math.min(deadline, now + request.retryFor);
+        if (now >= retryDeadline) {
+            return pollResponse(error ? 'error' : 'failed', value, error, poller);
+        }
+        await poller.wait(retryDeadline - now);
+    }
+}
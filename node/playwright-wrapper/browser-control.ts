@@ -15,6 +15,7 @@
 import { BrowserContext, Page } from 'playwright';
 
 import { logger } from './browser_logger';
+import { iterateBufferChunks, mapChunks, MAX_RESPONSE_CHUNK_BYTES } from './chunking';
 import * as pb from './generated/playwright';
 import { exists, findLocator } from './playwright-invoke';
 import { PlaywrightState } from './playwright-state';
@@ -77,16 +78,15 @@ export async function goTo(request: pb.Request_UrlOptions, page: Page): Promise<
     return stringResponse(response?.status().toString() || '', `Successfully opened URL ${url}`);
 }
 
-export async function takeScreenshot(
-    request: pb.Request_ScreenshotOptions,
-    state: PlaywrightState,
-): Promise<pb.Response_String> {
+async function screenshot(request: pb.Request_ScreenshotOptions, state: PlaywrightState) {
     const selector = request.selector;
     const options = JSON.parse(request.options);
     const mask = JSON.parse(request.mask);
     const strictMode = request.strict;
     const page = state.getActivePage();
     exists(page, 'Tried to take screenshot, but no page was open.');
+    // The banner is cleared for screenshots, which must not capture it before that is done.
+    await state.keywordCallBanner;
     if (mask) {
         const mask_locators = [];
         for (const sel of mask) {
@@ -94,18 +94,40 @@ export async function takeScreenshot(
         }
         options.mask = mask_locators;
     }
+    if (!options.path) {
+        // Without a file extension Playwright needs to be told the image type.
+        options.type = options.fileType;
+    }
     logger.info({ 'Take screenshot with options: ': options });
     if (selector) {
         logger.info({ 'Using selecotr: ': selector });
         const locator = await findLocator(state, selector, strictMode, true);
-        await locator.screenshot(options);
-    } else {
-        await page.screenshot(options);
+        return { options, image: await locator.screenshot(options) };
     }
+    return { options, image: await page.screenshot(options) };
+}
+
+export async function takeScreenshot(
+    request: pb.Request_ScreenshotOptions,
+    state: PlaywrightState,
+): Promise<pb.Response_String> {
+    const { options } = await screenshot(request, state);
     const message = 'Screenshot successfully captured to: ' + options.path;
     return stringResponse(options.path, message);
 }
 
+export async function takeScreenshotBytes(
+    request: pb.Request_ScreenshotOptions,
+    state: PlaywrightState,
+): Promise<Iterable<pb.Response_Bytes>> {
+    const { options, image } = await screenshot(request, state);
+    const count = Math.ceil(image.length / MAX_RESPONSE_CHUNK_BYTES);
+    return mapChunks(iterateBufferChunks(image, MAX_RESPONSE_CHUNK_BYTES), (body, index) => ({
+        log: `Screenshot of ${image.length} bytes captured as ${options.type}, chunk ${index + 1}/${count}`,
+        body,
+    }));
+}
+
 export async function setTimeout(request: pb.Request_Timeout, context?: BrowserContext): Promise<pb.Response_Empty> {
     if (!context) {
         return emptyWithLog(`No context open.`);
@@ -12,28 +12,82 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
+import { Writable } from 'stream';
+
 export const MAX_RESPONSE_CHUNK_BYTES = 1000000;
 
+function isContinuationByte(byte: number): boolean {
+    return (byte & 0xc0) === 0x80;
+}
+
+/**
+ * End of the chunk starting at start, at most maxBytes later and backed off to the start of a character. A
+ * character longer than maxBytes gets a chunk of its own.
+ */
+function utf8ChunkEnd(buffer: Buffer, start: number, maxBytes: number): number {
+    let end = start + maxBytes;
+    if (end >= buffer.length) return buffer.length;
+    while (end > start && isContinuationByte(buffer[end])) end--;
+    if (end === start) {
+        end = start + 1;
+        while (end < buffer.length && isContinuationByte(buffer[end])) end++;
+    }
+    return end;
+}
+
+/**
+ * Yields the text in chunks of at most maxBytes UTF-8 bytes, never splitting a character. The text is encoded
+ * once and each chunk is decoded from its byte range only when it is needed.
+ */
+export function* iterateUtf8Chunks(text: string, maxBytes: number): Generator<string> {
+    const buffer = Buffer.from(text, 'utf8');
+    for (let start = 0; start < buffer.length; ) {
+        const end = utf8ChunkEnd(buffer, start, maxBytes);
+        yield buffer.toString('utf8', start, end);
+        start = end;
+    }
+}
+
 export function splitUtf8ByMaxBytes(text: string, maxBytes: number): string[] {
-    if (!text) {
-        return [];
+    return Array.from(iterateUtf8Chunks(text, maxBytes));
+}
+
+export function* iterateBufferChunks(buffer: Buffer, maxBytes: number): Generator<Buffer> {
+    for (let start = 0; start < buffer.length; start += maxBytes) {
+        yield buffer.subarray(start, start + maxBytes);
     }
-    const chunks: string[] = [];
-    let current = '';
-    let currentBytes = 0;
-    for (const char of text) {
-        const charBytes = Buffer.byteLength(char, 'utf8');
-        if (currentBytes + charBytes > maxBytes && current.length > 0) {
-            chunks.push(current);
-            current = char;
-            currentBytes = charBytes;
-        } else {
-            current += char;
-            currentBytes += charBytes;
-        }
+}
+
+export function splitBufferByMaxBytes(buffer: Buffer, maxBytes: number): Buffer[] {
+    return Array.from(iterateBufferChunks(buffer, maxBytes));
+}
+
+export function* mapChunks<T, R>(chunks: Iterable<T>, toResponse: (chunk: T, index: number) => R): Generator<R> {
+    let index = 0;
+    for (const chunk of chunks) {
+        yield toResponse(chunk, index++);
     }
-    if (current.length > 0) {
-        chunks.push(current);
+}
+
+function drained(stream: Writable): Promise<void> {
+    return new Promise((resolve) => {
+        const done = () => {
+            stream.off('drain', done);
+            stream.off('close', done);
+            resolve();
+        };
+        stream.on('drain', done);
+        stream.on('close', done);
+    });
+}
+
+/**
+ * Writes the chunks to a streamed gRPC response one by one, waiting while the stream is full, so that only the
+ * chunks not yet sent are held in memory.
+ */
+export async function writeChunks<T>(stream: Writable, chunks: Iterable<T>): Promise<void> {
+    for (const chunk of chunks) {
+        if (stream.destroyed) return;
+        if (!stream.write(chunk)) await drained(stream);
     }
-    return chunks;
 }
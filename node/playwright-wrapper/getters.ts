@@ -14,9 +14,11 @@
 
 import { ElementHandle, Locator, Page } from 'playwright';
 import { errors } from 'playwright';
+import { promisify } from 'util';
+import { gzip } from 'zlib';
 
 import { logger } from './browser_logger';
-import { MAX_RESPONSE_CHUNK_BYTES, splitUtf8ByMaxBytes } from './chunking';
+import { iterateBufferChunks, iterateUtf8Chunks, mapChunks, MAX_RESPONSE_CHUNK_BYTES } from './chunking';
 import * as pb from './generated/playwright';
 import { exists, findLocator } from './playwright-invoke';
 import { PlaywrightState } from './playwright-state';
@@ -377,23 +379,39 @@ export async function getBoundingBox(
     return jsonResponse(JSON.stringify(boundingBox), 'Got bounding box successfully.');
 }
 
-export async function getPageSource(page: Page): Promise<pb.Response_Json[]> {
+export async function getPageSource(page: Page): Promise<Iterable<pb.Response_Json>> {
     const result = await page.content();
-    logger.info(result);
+    logger.info(`Page source of ${result.length} characters obtained.`);
     const body = JSON.stringify(result);
-    const responseChunks = [];
-    const bodyChunks = splitUtf8ByMaxBytes(body, MAX_RESPONSE_CHUNK_BYTES);
-    if (bodyChunks.length > 1) {
-        for (let i = 0; i < bodyChunks.length; i++) {
-            const chunk = bodyChunks[i];
-            const response = jsonResponse('{}', `Page source obtained, chunk ${i}`, chunk);
-            responseChunks.push(response);
-        }
-    } else {
-        const response = jsonResponse('{}', 'Page source obtained successfully.', body);
-        responseChunks.push(response);
+    if (Buffer.byteLength(body, 'utf8') <= MAX_RESPONSE_CHUNK_BYTES) {
+        return [jsonResponse('{}', 'Page source obtained successfully.', body)];
+    }
+    return mapChunks(iterateUtf8Chunks(body, MAX_RESPONSE_CHUNK_BYTES), (chunk, index) =>
+        jsonResponse('{}', `Page source obtained, chunk ${index}`, chunk),
+    );
+}
+
+const compressors: Record<string, (buffer: Buffer) => Promise<Buffer>> = {
+    gzip: promisify(gzip),
+};
+
+export async function getPageSourceBytes(
+    request: pb.Request_PageSource,
+    page: Page,
+): Promise<Iterable<pb.Response_Bytes>> {
+    const source = Buffer.from(await page.content(), 'utf8');
+    let body: Buffer = source;
+    if (request.compression) {
+        const compress = compressors[request.compression] as ((buffer: Buffer) => Promise<Buffer>) | undefined;
+        if (!compress) throw new Error(`Compression ${request.compression} is not supported.`);
+        body = await compress(source);
     }
-    return responseChunks;
+    const count = Math.ceil(body.length / MAX_RESPONSE_CHUNK_BYTES);
+    logger.info(`Page source of ${source.length} bytes obtained, sent as ${body.length} bytes.`);
+    return mapChunks(iterateBufferChunks(body, MAX_RESPONSE_CHUNK_BYTES), (chunk, index) => ({
+        log: `Page source chunk ${index + 1}/${count}`,
+        body: chunk,
+    }));
 }
 
 export async function getTableCellIndex(
@@ -12,12 +12,21 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
-import { sendUnaryData, ServerReadableStream, ServerUnaryCall, ServerWritableStream } from '@grpc/grpc-js';
+import {
+    sendUnaryData,
+    ServerDuplexStream,
+    ServerReadableStream,
+    ServerUnaryCall,
+    ServerWritableStream,
+    status,
+} from '@grpc/grpc-js';
 import { ServerSurfaceCall } from '@grpc/grpc-js/build/src/server-call';
 import { Page } from 'playwright';
 
+import * as assertionPoll from './assertion-poll';
 import { errorType, logger } from './browser_logger';
 import * as browserControl from './browser-control';
+import { writeChunks } from './chunking';
 import * as clock from './clock';
 import * as cookie from './cookie';
 import * as credential from './credential';
@@ -32,7 +41,46 @@ import * as network from './network';
 import * as pdf from './pdf';
 import * as playwrightState from './playwright-state';
 import { PlaywrightState } from './playwright-state';
+import * as polling from './polling';
 import { emptyWithLog, errorResponse, stringResponse } from './response-util';
+import * as routing from './routing';
+
+const KEYWORD_CALL_BANNER_METADATA = 'kw-call-banner-bin';
+// Tells apart clients which share a peer address, like all the clients of a unix socket.
+const PEER_ID_METADATA = 'rfbrowser-peer-id';
+
+type ServiceMethod = keyof typeof pb.PlaywrightService;
+type UnaryHandler = (call: ServerUnaryCall<unknown, unknown>, callback: sendUnaryData<unknown>) => Promise<void>;
+
+const unaryMethods: Map<string, ServiceMethod> = new Map(
+    (Object.keys(pb.PlaywrightService) as ServiceMethod[])
+        .filter((key) => !pb.PlaywrightService[key].requestStream && !pb.PlaywrightService[key].responseStream)
+        .map((key) => [pb.PlaywrightService[key].path.replace('/Playwright/', ''), key]),
+);
+
+/**
+ * Shortens the timeout of the request to the deadline of its call, so Playwright stops waiting when the caller
+ * has given up.
+ */
+function withinCallDeadline<T extends { timeout: number }, K>(
+    handler: (call: ServerUnaryCall<T, K>, callback: sendUnaryData<K>) => Promise<void>,
+): (call: ServerUnaryCall<T, K>, callback: sendUnaryData<K>) => Promise<void> {
+    return (call, callback) => {
+        if (call.request !== null) {
+            call.request.timeout = network.timeoutWithinDeadline(call.request.timeout, call.getDeadline());
+        }
+        return handler(call, callback);
+    };
+}
+
+function dispatchErrorMessage(e: unknown): string {
+    if (e instanceof Error) return e.message;
+    return (e as { message?: string } | null)?.message ?? String(e);
+}
+
+function dispatchErrorCode(e: unknown): number {
+    return (e as { code?: number } | null)?.code ?? status.UNKNOWN;
+}
 
 @class_async_logger
 export class PlaywrightServer {
@@ -46,15 +94,21 @@ export class PlaywrightServer {
         return this.states[key];
     };
 
+    private peerKey = (peer: ServerSurfaceCall): string => {
+        const peerId = peer.metadata?.get(PEER_ID_METADATA)[0];
+        return peerId !== undefined ? peerId.toString() : peer.getPeer();
+    };
+
     private getState = (peer: ServerSurfaceCall): PlaywrightState => {
-        const mapPeer = this.peerMap[peer.getPeer()];
-        if (mapPeer) {
-            return this.createState(mapPeer);
-        } else {
-            this.peerMap[peer.getPeer()] = peer.getPeer();
-            const p = peer.getPeer();
-            return this.createState(p);
+        const key = this.peerKey(peer);
+        if (!this.peerMap[key]) {
+            this.peerMap[key] = key;
         }
+        const state = this.createState(this.peerMap[key]);
+        // The library sends the keyword call banner along with the next call instead of in a call of its own.
+        // Without one the last banner is still painted on a page which has become active since.
+        state.showKeywordCallBanner(peer.metadata?.get(KEYWORD_CALL_BANNER_METADATA)[0]?.toString());
+        return state;
     };
     private getActiveBrowser = (peer: ServerSurfaceCall) => this.getState(peer).getActiveBrowser();
     private getActiveContext = (peer: ServerSurfaceCall) => this.getState(peer).getActiveContext();
@@ -64,15 +118,22 @@ export class PlaywrightServer {
         return page;
     };
 
+    /**
+     * Wraps a handler taking the request and the state of the peer. With ``changesCatalog`` the browser catalog
+     * is sent to its watchers after the call, for calls which open, close or switch browsers, contexts or pages.
+     */
     private wrapping = <T, K>(
         func: (request: T, state: PlaywrightState) => Promise<K>,
+        changesCatalog = false,
     ): ((call: ServerUnaryCall<T, K>, callback: sendUnaryData<K>) => Promise<void>) => {
         return async (call: ServerUnaryCall<T, K>, callback: sendUnaryData<K>) => {
             try {
                 const request = call.request;
                 if (request === null) throw Error('No request');
                 logger.info({ event_kind: 'grpc', action: func.name, status: 'started' });
-                const response = await func(request, this.getState(call));
+                const state = this.getState(call);
+                const response = await func(request, state);
+                if (changesCatalog) state.publishCatalog();
                 logger.info({ event_kind: 'grpc', action: func.name, status: 'succeeded' });
                 callback(null, response);
             } catch (e) {
@@ -102,11 +163,14 @@ export class PlaywrightServer {
 
     private wrappingState = <T, K>(
         func: (state: PlaywrightState) => Promise<K>,
+        changesCatalog = false,
     ): ((call: ServerUnaryCall<T, K>, callback: sendUnaryData<K>) => Promise<void>) => {
         return async (call: ServerUnaryCall<T, K>, callback: sendUnaryData<K>) => {
             try {
                 logger.info({ event_kind: 'grpc', action: func.name, status: 'started' });
-                const response = await func(this.getState(call));
+                const state = this.getState(call);
+                const response = await func(state);
+                if (changesCatalog) state.publishCatalog();
                 logger.info({ event_kind: 'grpc', action: func.name, status: 'succeeded' });
                 callback(null, response);
             } catch (e) {
@@ -152,6 +216,89 @@ export class PlaywrightServer {
         };
     };
 
+    /**
+     * Runs a unary rpc by its proto method name with a serialized request, through the same
+     * handler and peer state a direct call would use, and returns the serialized response.
+     */
+    private dispatchUnary = async (method: string, payload: Buffer, parent: ServerSurfaceCall): Promise<Buffer> => {
+        const key = unaryMethods.get(method);
+        if (!key) throw Error(`${method} can not be called through dispatch`);
+        const definition = pb.PlaywrightService[key];
+        // The step answers to the peer id, keyword call banner and deadline of the call it came with.
+        const call = {
+            request: definition.requestDeserialize(payload),
+            metadata: parent.metadata,
+            getPeer: () => parent.getPeer(),
+            getDeadline: () => parent.getDeadline(),
+        } as unknown as ServerUnaryCall<unknown, unknown>;
+        const handler = (this as unknown as Record<ServiceMethod, UnaryHandler>)[key];
+        const response = await new Promise((resolve, reject) => {
+            void handler.call(this, call, (error, value) => (error ? reject(error) : resolve(value)));
+        });
+        return definition.responseSerialize(response as never);
+    };
+
+    async executeBatch(
+        call: ServerUnaryCall<pb.Request_Batch, pb.Response_Batch>,
+        callback: sendUnaryData<pb.Response_Batch>,
+    ): Promise<void> {
+        try {
+            const request = call.request;
+            if (request === null) throw Error('No request');
+            // Paints a keyword call banner sent with the batch, also when the batch has no steps.
+            this.getState(call);
+            const results: pb.Response_BatchStepResult[] = [];
+            for (const step of request.steps) {
+                try {
+                    if (step.method === 'ExecuteBatch') throw Error('ExecuteBatch can not be nested');
+                    const response = await this.dispatchUnary(step.method, Buffer.from(step.request), call);
+                    results.push({ method: step.method, ok: true, response, error: '' });
+                } catch (e) {
+                    results.push({
+                        method: step.method,
+                        ok: false,
+                        response: Buffer.alloc(0),
+                        error: dispatchErrorMessage(e),
+                    });
+                    break;
+                }
+            }
+            callback(null, { log: `Executed ${results.length}/${request.steps.length} batched steps.`, results });
+        } catch (e) {
+            callback(errorResponse(e), null);
+        }
+    }
+
+    async session(call: ServerDuplexStream<pb.Request_Envelope, pb.Response_Envelope>): Promise<void> {
+        const inFlight = new Set<Promise<void>>();
+        call.on('data', (envelope: pb.Request_Envelope) => {
+            const handled = (async () => {
+                try {
+                    const response = await this.dispatchUnary(envelope.method, Buffer.from(envelope.request), call);
+                    call.write({ id: envelope.id, response, code: status.OK, error: '' });
+                } catch (e) {
+                    call.write({
+                        id: envelope.id,
+                        response: Buffer.alloc(0),
+                        code: dispatchErrorCode(e),
+                        error: dispatchErrorMessage(e),
+                    });
+                }
+            })();
+            inFlight.add(handled);
+            void handled.finally(() => inFlight.delete(handled));
+        });
+        call.on('error', (e) => {
+            logger.error(
+                { event_kind: 'internal_error', status: 'failed', error_type: errorType(e) },
+                'Stream error in session',
+            );
+        });
+        call.on('end', () => {
+            void Promise.allSettled(inFlight).then(() => call.end());
+        });
+    }
+
     initializeExtension = this.wrapping(playwrightState.initializeExtension);
 
     async callExtensionKeyword(call: ServerWritableStream<pb.Request_KeywordCall, pb.Response_Json>): Promise<void> {
@@ -159,9 +306,7 @@ export class PlaywrightServer {
             const request = call.request;
             if (request === null) throw Error('No request');
             const results = await playwrightState.extensionKeywordCall(request, call, this.getState(call));
-            for (const result of results) {
-                call.write(result);
-            }
+            await writeChunks(call, results);
         } catch (e) {
             logger.error(
                 { event_kind: 'internal_error', status: 'failed', error_type: errorType(e) },
@@ -172,15 +317,44 @@ export class PlaywrightServer {
         call.end();
     }
 
-    closeBrowser = this.wrappingState(playwrightState.closeBrowser);
+    closeBrowser = this.wrappingState(playwrightState.closeBrowser, true);
     closeBrowserServer = this.wrapping(playwrightState.closeBrowserServer);
-    closeAllBrowsers = this.wrappingState(playwrightState.closeAllBrowsers);
-    closeContext = this.wrapping(playwrightState.closeContext);
-    closePage = this.wrapping(playwrightState.closePage);
+    closeAllBrowsers = this.wrappingState(playwrightState.closeAllBrowsers, true);
+    closeContext = this.wrapping(playwrightState.closeContext, true);
+    closePage = this.wrapping(playwrightState.closePage, true);
+    closeScope = this.wrapping(playwrightState.closeScope, true);
+
+    async closeContexts(
+        call: ServerWritableStream<pb.Request_CloseContexts, pb.Response_ClosedContext>,
+    ): Promise<void> {
+        try {
+            const request = call.request;
+            if (request === null) throw Error('No request');
+            const state = this.getState(call);
+            await playwrightState.closeContextsById(request, state, (closed) => call.write(closed));
+            state.publishCatalog();
+        } catch (e) {
+            call.emit('error', errorResponse(e));
+        }
+        call.end();
+    }
+
     openTraceGroup = this.wrapping(playwrightState.openTraceGroup);
     closeTraceGroup = this.wrappingState(playwrightState.closeTraceGroup);
     setRfContext = this.wrappingDebug(playwrightState.setRFContext);
     getBrowserCatalog = this.wrapping(playwrightState.getBrowserCatalog);
+
+    async watchBrowserCatalog(call: ServerWritableStream<pb.Request_Empty, pb.Response_CatalogEvent>): Promise<void> {
+        try {
+            const unwatch = this.getState(call).watchCatalog((event) => call.write(event));
+            call.on('cancelled', unwatch);
+            call.on('error', unwatch);
+        } catch (e) {
+            call.emit('error', errorResponse(e));
+            call.end();
+        }
+    }
+
     getConsoleLog = this.wrapping(playwrightState.getConsoleLog);
     getErrorMessages = this.wrapping(playwrightState.getErrorMessages);
 
@@ -236,6 +410,7 @@ export class PlaywrightServer {
             const request = call.request;
             if (request === null) throw Error('No request');
             const response = await playwrightState.switchPage(request, this.getActiveBrowser(call));
+            this.getState(call).publishCatalog();
             callback(null, response);
         } catch (e) {
             callback(errorResponse(e), null);
@@ -250,6 +425,7 @@ export class PlaywrightServer {
             const request = call.request;
             if (request === null) throw Error('No request');
             const response = await playwrightState.switchContext(request, this.getActiveBrowser(call));
+            this.getState(call).publishCatalog();
             callback(null, response);
         } catch (e) {
             callback(errorResponse(e), null);
@@ -284,16 +460,16 @@ export class PlaywrightServer {
         }
     }
 
-    switchBrowser = this.wrapping(playwrightState.switchBrowser);
-    newPage = this.wrapping(playwrightState.newPage);
-    newContext = this.wrapping(playwrightState.newContext);
-    newBrowser = this.wrapping(playwrightState.newBrowser);
+    switchBrowser = this.wrapping(playwrightState.switchBrowser, true);
+    newPage = this.wrapping(playwrightState.newPage, true);
+    newContext = this.wrapping(playwrightState.newContext, true);
+    newBrowser = this.wrapping(playwrightState.newBrowser, true);
     startCoverage = this.wrapping(playwrightState.startCoverage);
     stopCoverage = this.wrapping(playwrightState.stopCoverage);
     mergeCoverage = this.wrapping(playwrightState.mergeCoverage);
     launchBrowserServer = this.wrapping(playwrightState.launchBrowserServer);
-    newPersistentContext = this.wrapping(playwrightState.newPersistentContext);
-    connectToBrowser = this.wrapping(playwrightState.connectToBrowser);
+    newPersistentContext = this.wrapping(playwrightState.newPersistentContext, true);
+    connectToBrowser = this.wrapping(playwrightState.connectToBrowser, true);
     goTo = this.wrappingPage(browserControl.goTo);
     pdf = this.wrapping(pdf.savePageAsPdf);
     emulateMedia = this.wrapping(pdf.emulateMedia);
@@ -326,12 +502,34 @@ export class PlaywrightServer {
     getBoundingBox = this.wrapping(getters.getBoundingBox);
     ariaSnapShot = this.wrappingStatePage(getters.getAriaSnapshot);
 
+    async takeScreenshotBytes(
+        call: ServerWritableStream<pb.Request_ScreenshotOptions, pb.Response_Bytes>,
+    ): Promise<void> {
+        try {
+            const request = call.request;
+            if (request === null) throw Error('No request');
+            await writeChunks(call, await browserControl.takeScreenshotBytes(request, this.getState(call)));
+        } catch (e) {
+            call.emit('error', errorResponse(e));
+        }
+        call.end();
+    }
+
     async getPageSource(call: ServerWritableStream<pb.Request_Empty, pb.Response_Json>): Promise<void> {
         try {
             const results = await getters.getPageSource(this.getActivePage(call));
-            for (const result of results) {
-                call.write(result);
-            }
+            await writeChunks(call, results);
+        } catch (e) {
+            call.emit('error', errorResponse(e));
+        }
+        call.end();
+    }
+
+    async getPageSourceBytes(call: ServerWritableStream<pb.Request_PageSource, pb.Response_Bytes>): Promise<void> {
+        try {
+            const request = call.request;
+            if (request === null) throw Error('No request');
+            await writeChunks(call, await getters.getPageSourceBytes(request, this.getActivePage(call)));
         } catch (e) {
             call.emit('error', errorResponse(e));
         }
@@ -384,6 +582,8 @@ export class PlaywrightServer {
     getElementAttribute = this.wrapping(getters.getElementAttribute);
     getElementStates = this.wrapping(getters.getElementStates);
     getStyle = this.wrapping(getters.getStyle);
+    assertPoll = this.wrapping(assertionPoll.assertPoll);
+    waitForPageChange = this.wrapping(polling.waitForPageChange);
     getTableCellIndex = this.wrapping(getters.getTableCellIndex);
     getTableRowIndex = this.wrapping(getters.getTableRowIndex);
     scrollToElement = this.wrapping(interaction.scrollToElement);
@@ -426,16 +626,14 @@ export class PlaywrightServer {
     clockPauseAt = this.wrapping(clock.clockPauseAt);
     advanceClock = this.wrapping(clock.advanceClock);
     waitForElementsState = this.wrapping(evaluation.waitForElementState);
-    waitForRequest = this.wrappingPage(network.waitForRequest);
+    waitForRequest = withinCallDeadline(this.wrappingPage(network.waitForRequest));
     async waitForResponse(call: ServerWritableStream<pb.Request_HttpCapture, pb.Response_Json>): Promise<void> {
         try {
             const request = call.request;
             if (request === null) throw Error('No request');
+            request.timeout = network.timeoutWithinDeadline(request.timeout, call.getDeadline());
             const results = await network.waitForResponse(request, this.getActivePage(call));
-            for (const result of results) {
-                logger.info(`Sending response ${result.log}`);
-                call.write(result);
-            }
+            await writeChunks(call, results);
         } catch (e) {
             call.emit('error', errorResponse(e));
         }
@@ -479,6 +677,39 @@ export class PlaywrightServer {
     setViewportSize = this.wrappingPage(browserControl.setViewportSize);
     httpRequest = this.wrappingPage(network.httpRequest);
 
+    async recordNetworkTraffic(
+        call: ServerWritableStream<pb.Request_NetworkRecording, pb.Response_Json>,
+    ): Promise<void> {
+        try {
+            const request = call.request;
+            if (request === null) throw Error('No request');
+            const state = this.getState(call);
+            network.recordNetworkTraffic(request, state, (message) => call.write(message), () => call.end());
+            const stop = () => state.networkRecordings.get(request.id)?.();
+            call.on('cancelled', stop);
+            call.on('error', stop);
+        } catch (e) {
+            call.emit('error', errorResponse(e));
+            call.end();
+        }
+    }
+
+    stopNetworkRecording = this.wrapping(network.stopNetworkRecording);
+    addRoute = this.wrapping(routing.addRoute);
+    removeRoute = this.wrapping(routing.removeRoute);
+    getRoutes = this.wrappingState(routing.getRoutes);
+
+    async apiRequest(call: ServerWritableStream<pb.Request_HttpRequest, pb.Response_HttpResponse>): Promise<void> {
+        try {
+            const request = call.request;
+            if (request === null) throw Error('No request');
+            await writeChunks(call, await network.apiRequest(request, this.getState(call)));
+        } catch (e) {
+            call.emit('error', errorResponse(e));
+        }
+        call.end();
+    }
+
     async getDevice(
         call: ServerUnaryCall<pb.Request_Device, pb.Response_Json>,
         callback: sendUnaryData<pb.Response_Json>,
@@ -510,42 +741,23 @@ export class PlaywrightServer {
         call: ServerReadableStream<pb.Request_FileBySelector, pb.Response_Empty>,
         callback: sendUnaryData<pb.Response_Empty>,
     ): Promise<void> {
-        let buffer = '';
-        let lastRequest: pb.Request_FileBySelector | undefined;
-        call.on('data', (request: pb.Request_FileBySelector) => {
-            void (async () => {
-                try {
-                    logger.info(`Reading multiplepart uploadFileBySelector`);
-                    const newBuffer = request.buffer;
-                    buffer += newBuffer;
-                    lastRequest = request;
-                } catch (e) {
-                    callback(errorResponse(e), null);
-                }
-            })();
-        });
-        call.on('error', (e) => {
+        const upload = new interaction.FileUploadStream();
+        try {
+            // Reading one message at a time keeps the library from sending faster than files are written.
+            for await (const request of call as AsyncIterable<pb.Request_FileBySelector>) {
+                await upload.add(request);
+            }
+            const request = await upload.finish();
+            callback(null, await interaction.uploadFileBySelector(request, this.getState(call)));
+        } catch (e) {
             logger.error(
                 { event_kind: 'internal_error', status: 'failed', error_type: errorType(e) },
                 'Stream error in uploadFileBySelector',
             );
             callback(errorResponse(e), null);
-        });
-        call.on('end', () => {
-            void (async () => {
-                try {
-                    if (!lastRequest) {
-                        callback(errorResponse(new Error('No data received for uploadFileBySelector')), null);
-                        return;
-                    }
-                    const finalRequest = { ...lastRequest, buffer };
-                    const result = await interaction.uploadFileBySelector(finalRequest, this.getState(call));
-                    callback(null, result);
-                } catch (e) {
-                    callback(errorResponse(e), null);
-                }
-            })();
-        });
+        } finally {
+            await upload.cleanup();
+        }
     }
 
     uploadFile = this.wrappingPage(interaction.uploadFile);
@@ -607,8 +819,9 @@ export class PlaywrightServer {
         try {
             const request = call.request;
             if (request === null) throw Error('No request');
-            const oldPeer = this.peerMap[call.getPeer()];
-            this.peerMap[call.getPeer()] = request.index;
+            const key = this.peerKey(call);
+            const oldPeer = this.peerMap[key];
+            this.peerMap[key] = request.index;
             callback(null, stringResponse(oldPeer, 'Successfully overrode peer id'));
         } catch (e) {
             callback(errorResponse(e), null);
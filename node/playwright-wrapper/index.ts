@@ -13,6 +13,7 @@
 // limitations under the License.
 
 import { Server, ServerCredentials, UntypedServiceImplementation } from '@grpc/grpc-js';
+import { closeSync, writeSync } from 'fs';
 
 import { logger } from './browser_logger';
 import { PlaywrightService } from './generated/playwright';
@@ -31,11 +32,32 @@ if (!port) {
     throw new Error(`No port defined`);
 }
 
+// Set by the Python side to the write end of a pipe it blocks on until the server is bound.
+const readyFd = process.env.ROBOT_FRAMEWORK_BROWSER_READY_FD;
+delete process.env.ROBOT_FRAMEWORK_BROWSER_READY_FD;
+
+function signalReadiness(error: Error | null) {
+    if (!readyFd) return;
+    try {
+        writeSync(Number(readyFd), error ? `error ${error.message}\n` : 'ready\n');
+        closeSync(Number(readyFd));
+    } catch (e) {
+        logger.error(`Could not signal readiness: ${e}`);
+    }
+}
+
 const server = new Server();
 server.addService(PlaywrightService, new PlaywrightServer() as unknown as UntypedServiceImplementation);
 
-server.bindAsync(`${host}:${port}`, ServerCredentials.createInsecure(), () => {
-    logger.info(`Listening on ${host}:${port}`);
+// A unix socket target comes in place of the port, as `unix:/path/to/socket`.
+const address = port.startsWith('unix:') ? port : `${host}:${port}`;
+server.bindAsync(address, ServerCredentials.createInsecure(), (error: Error | null) => {
+    if (error) {
+        logger.error(`Binding to ${address} failed: ${error.message}`);
+    } else {
+        logger.info(`Listening on ${address}`);
+    }
+    signalReadiness(error);
 });
 
 process.on('SIGTERM', () => {
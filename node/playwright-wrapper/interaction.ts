@@ -12,9 +12,15 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
 import { Dialog, Page } from 'playwright';
+import { finished } from 'stream';
+import { promisify } from 'util';
 
 import { logger } from './browser_logger';
+import { writeChunks } from './chunking';
 import * as pb from './generated/playwright';
 import { getSelections } from './getters';
 import { exists } from './playwright-invoke';
@@ -193,6 +199,73 @@ export async function uncheckCheckbox(
     return emptyWithLog(`Unchecked checkbox: ${selector} with force: ${force}`);
 }
 
+/**
+ * Collects the messages of an `UploadFileBySelector` stream. Files streamed by the library are written to a
+ * temporary directory chunk by chunk as they arrive, so that even a large file is never held in memory, and
+ * the content of a `FileUploadBuffer` is joined from its chunks.
+ */
+export class FileUploadStream {
+    private request: pb.Request_FileBySelector | undefined;
+    private text = '';
+    private content: Buffer[] = [];
+    private directory: string | undefined;
+    private files: string[] = [];
+    private file: fs.WriteStream | undefined;
+    private fileIndex = 0;
+
+    async add(request: pb.Request_FileBySelector): Promise<void> {
+        this.request = request;
+        this.text += request.buffer;
+        if (request.fileName) {
+            await this.write(request);
+        } else if (request.content.length) {
+            this.content.push(Buffer.from(request.content));
+        }
+    }
+
+    private async write(request: pb.Request_FileBySelector): Promise<void> {
+        if (request.fileIndex !== this.fileIndex) {
+            await this.closeFile();
+            this.directory ??= await fs.promises.mkdtemp(path.join(os.tmpdir(), 'rfbrowser-upload-'));
+            // A directory per file keeps two files with the same name apart.
+            const directory = path.join(this.directory, String(request.fileIndex));
+            await fs.promises.mkdir(directory);
+            const file = path.join(directory, path.basename(request.fileName));
+            this.file = fs.createWriteStream(file);
+            this.files.push(file);
+            this.fileIndex = request.fileIndex;
+        }
+        await writeChunks(this.file as fs.WriteStream, [request.content]);
+    }
+
+    private async closeFile(): Promise<void> {
+        if (!this.file) return;
+        const file = this.file;
+        this.file = undefined;
+        file.end();
+        await promisify(finished)(file);
+    }
+
+    /** Returns the request to upload with, once the stream has ended. */
+    async finish(): Promise<pb.Request_FileBySelector> {
+        if (!this.request) throw new Error('No data received for uploadFileBySelector');
+        await this.closeFile();
+        return {
+            ...this.request,
+            path: [...this.request.path, ...this.files],
+            buffer: this.text,
+            content: Buffer.concat(this.content),
+        };
+    }
+
+    async cleanup(): Promise<void> {
+        this.file?.destroy();
+        if (this.directory) {
+            await fs.promises.rm(this.directory, { recursive: true, force: true });
+        }
+    }
+}
+
 export async function uploadFileBySelector(
     request: pb.Request_FileBySelector,
     state: PlaywrightState,
@@ -204,9 +277,9 @@ export async function uploadFileBySelector(
     if (path.length === 0) {
         const name = request.name;
         const mimeType = request.mimeType;
-        const buffer = request.buffer;
+        const buffer = request.content.length ? Buffer.from(request.content) : Buffer.from(request.buffer);
         logger.info(`Uploading file ${name} as buffer to ${selector}`);
-        await locator.setInputFiles({ name: name, mimeType: mimeType, buffer: Buffer.from(buffer) });
+        await locator.setInputFiles({ name: name, mimeType: mimeType, buffer: buffer });
         return emptyWithLog('Successfully uploaded buffer as file');
     } else {
         logger.info(`Uploading file(s) ${path.join(', ')} to ${selector}`);
@@ -13,11 +13,11 @@
 // limitations under the License.
 
 import * as path from 'path';
-import { Page } from 'playwright';
+import { Page, Response } from 'playwright';
 import { v4 as uuidv4 } from 'uuid';
 
 import { logger } from './browser_logger';
-import { MAX_RESPONSE_CHUNK_BYTES, splitUtf8ByMaxBytes } from './chunking';
+import { iterateBufferChunks, iterateUtf8Chunks, mapChunks, MAX_RESPONSE_CHUNK_BYTES } from './chunking';
 import * as pb from './generated/playwright';
 import { PlaywrightState } from './playwright-state';
 import { emptyWithLog, jsonResponse, parseRegExpOrKeepString } from './response-util';
@@ -52,9 +52,65 @@ export async function httpRequest(request: pb.Request_HttpRequest, page: Page):
     return jsonResponse(JSON.stringify(response), 'Request performed successfully.');
 }
 
-export function deserializeUrlOrPredicate(
-    urlOrPredicate: string,
-): RegExp | string | ((request: unknown) => boolean | Promise<boolean>) {
+/**
+ * Sends the request with Playwright's request client instead of the page's fetch, so no page is needed, CORS does
+ * not apply and the body does not pass through the renderer. A relative url is resolved against the active page.
+ */
+export async function apiRequest(
+    request: pb.Request_HttpRequest,
+    state: PlaywrightState,
+): Promise<Iterable<pb.Response_HttpResponse>> {
+    const requestContext = await state.getApiRequestContext();
+    const pageUrl = state.getActivePage()?.url();
+    const url = pageUrl?.startsWith('http') ? new URL(request.url, pageUrl).href : request.url;
+    let data: string | Buffer | undefined;
+    if (request.binaryBody.length) {
+        data = Buffer.from(request.binaryBody);
+    } else if (request.method !== 'GET') {
+        data = request.body;
+    }
+    const response = await requestContext.fetch(url, {
+        method: request.method,
+        headers: JSON.parse(request.headers),
+        data,
+    });
+    let body: Buffer;
+    try {
+        body = await response.body();
+    } finally {
+        await response.dispose();
+    }
+    const json = JSON.stringify({
+        status: response.status(),
+        statusText: response.statusText(),
+        headers: JSON.stringify(response.headers()),
+        url: response.url(),
+        ok: response.ok(),
+        redirected: response.url() !== url,
+    });
+    const log = `${request.method} ${response.url()} answered ${response.status()} with ${body.length} bytes.`;
+    if (body.length <= MAX_RESPONSE_CHUNK_BYTES) {
+        return [{ log, json, body }];
+    }
+    return mapChunks(iterateBufferChunks(body, MAX_RESPONSE_CHUNK_BYTES), (chunk, index) =>
+        index === 0 ? { log, json, body: chunk } : { log: '', json: '', body: chunk },
+    );
+}
+
+type UrlPredicate = (request: unknown) => boolean | Promise<boolean>;
+
+// Functions compiled by deserializeUrlOrPredicate, by their source, as the same one is often given to many calls.
+// The least recently used ones are dropped beyond MAX_COMPILED_PREDICATES, Map keeps them in that order.
+export const MAX_COMPILED_PREDICATES = 256;
+const compiledPredicates = new Map<string, UrlPredicate>();
+
+export function deserializeUrlOrPredicate(urlOrPredicate: string): RegExp | string | UrlPredicate {
+    const compiled = compiledPredicates.get(urlOrPredicate);
+    if (compiled !== undefined) {
+        compiledPredicates.delete(urlOrPredicate);
+        compiledPredicates.set(urlOrPredicate, compiled);
+        return compiled;
+    }
     // if the matcher is a function or arrow function, wrap it in parens and evaluate.
     if (
         /^function.*{.*}$/.test(urlOrPredicate) ||
@@ -63,6 +119,11 @@ export function deserializeUrlOrPredicate(
         // eslint-disable-next-line @typescript-eslint/no-implied-eval
         const fn = new Function(`return (${urlOrPredicate})`)();
         if (typeof fn === 'function' || Object.prototype.toString.call(fn) === '[object Function]') {
+            compiledPredicates.set(urlOrPredicate, fn);
+            if (compiledPredicates.size > MAX_COMPILED_PREDICATES) {
+                const [oldest] = compiledPredicates.keys();
+                compiledPredicates.delete(oldest);
+            }
             return fn;
         }
     }
@@ -70,7 +131,23 @@ export function deserializeUrlOrPredicate(
     return parseRegExpOrKeepString(urlOrPredicate);
 }
 
-export async function waitForResponse(request: pb.Request_HttpCapture, page: Page): Promise<pb.Response_Json[]> {
+/**
+ * Shortens a Playwright wait ``timeout`` to end at the gRPC ``deadline`` of the call, so that the wait, and
+ * the listener it holds, ends when the library has cancelled the call. A ``timeout`` of 0 waits forever.
+ */
+export function timeoutWithinDeadline(timeout: number, deadline: Date | number): number {
+    const remaining = (deadline instanceof Date ? deadline.getTime() : deadline) - Date.now();
+    if (!Number.isFinite(remaining)) {
+        return timeout;
+    }
+    const withinDeadline = Math.max(Math.ceil(remaining), 1);
+    return timeout > 0 ? Math.min(timeout, withinDeadline) : withinDeadline;
+}
+
+export async function waitForResponse(
+    request: pb.Request_HttpCapture,
+    page: Page,
+): Promise<Iterable<pb.Response_Json>> {
     const urlOrPredicate = deserializeUrlOrPredicate(request.urlOrPredicate);
     const timeout = request.timeout;
     const data = await page.waitForResponse(urlOrPredicate, { timeout });
@@ -92,27 +169,153 @@ export async function waitForResponse(request: pb.Request_HttpCapture, page: Pag
             postData: data.request().postData(),
         },
     });
-    const responseChunks = [];
-    if (body !== null) {
-        const bodyChunks = splitUtf8ByMaxBytes(body, MAX_RESPONSE_CHUNK_BYTES);
-        if (bodyChunks.length > 1) {
-            logger.info(`body.length: ${body.length}`);
-            for (let i = 0; i < bodyChunks.length; i++) {
-                const response = jsonResponse(jsonData, `Response received, chunk ${i}`, bodyChunks[i]);
-                logger.info(`chunked response: ${i}`);
-                responseChunks.push(response);
-            }
-        } else {
-            responseChunks.push(jsonResponse(jsonData, 'Response received', body));
-        }
-    } else {
+    if (body === null) {
         const jsonDataMap = JSON.parse(jsonData);
         jsonDataMap.body = null;
-        responseChunks.push(jsonResponse(JSON.stringify(jsonDataMap), 'Response received with empty body', ''));
+        return [jsonResponse(JSON.stringify(jsonDataMap), 'Response received with empty body', '')];
     }
-    logger.info(`responseChunks.length: ${responseChunks.length}`);
-    return responseChunks;
+    if (Buffer.byteLength(body, 'utf8') <= MAX_RESPONSE_CHUNK_BYTES) {
+        return [jsonResponse(jsonData, 'Response received', body)];
+    }
+    logger.info(`body.length: ${body.length}`);
+    return mapChunks(iterateUtf8Chunks(body, MAX_RESPONSE_CHUNK_BYTES), (chunk, index) =>
+        jsonResponse(jsonData, `Response received, chunk ${index}`, chunk),
+    );
 }
+/**
+ * Turns a url glob, as Playwright takes it in ``page.waitForResponse``, into a RegExp matching the whole url.
+ */
+export function globToRegExp(glob: string): RegExp {
+    let source = '';
+    let inBraces = false;
+    for (let i = 0; i < glob.length; i++) {
+        const char = glob[i];
+        const closingBracket = char === '[' ? glob.indexOf(']', i + 1) : -1;
+        if (char === '*' && glob[i + 1] === '*') {
+            source += '.*';
+            i++;
+        } else if (char === '*') {
+            source += '[^/]*';
+        } else if (char === '?') {
+            source += '[^/]';
+        } else if (closingBracket > i) {
+            source += glob.slice(i, closingBracket + 1);
+            i = closingBracket;
+        } else if (char === '{') {
+            inBraces = true;
+            source += '(';
+        } else if (char === '}' && inBraces) {
+            inBraces = false;
+            source += ')';
+        } else if (char === ',' && inBraces) {
+            source += '|';
+        } else {
+            source += char.replace(/[.*+?^${}()|[\]\\/]/g, '\\$&');
+        }
+    }
+    return new RegExp(`^${source}$`);
+}
+
+type ResponseMatcher = (response: Response) => unknown;
+
+function responseMatcher(urlOrPredicate: string): ResponseMatcher {
+    if (!urlOrPredicate) {
+        return () => true;
+    }
+    const matcher = deserializeUrlOrPredicate(urlOrPredicate);
+    if (typeof matcher === 'function') {
+        return matcher;
+    }
+    const regExp = typeof matcher === 'string' ? globToRegExp(matcher) : matcher;
+    return (response) => {
+        regExp.lastIndex = 0;
+        return regExp.test(response.url());
+    };
+}
+
+async function recordResponse(
+    response: Response,
+    matches: ResponseMatcher,
+    maxBodySize: number,
+    write: (message: pb.Response_Json) => void,
+): Promise<void> {
+    if (!(await matches(response))) {
+        return;
+    }
+    const request = response.request();
+    const entry: Record<string, unknown> = {
+        url: response.url(),
+        method: request.method(),
+        resourceType: request.resourceType(),
+        status: response.status(),
+        statusText: response.statusText(),
+        ok: response.ok(),
+        requestHeaders: request.headers(),
+        headers: response.headers(),
+        startTime: request.timing().startTime,
+    };
+    let body = '';
+    if (maxBodySize > 0) {
+        try {
+            const buffer = await response.body();
+            entry.bodySize = buffer.length;
+            body = buffer.length <= maxBodySize ? buffer.toString('utf8') : '';
+        } catch (e) {
+            logger.info(`Could not read the body of ${response.url()}: ${String(e)}`);
+        }
+    }
+    // The messages of one response are written together, so they are not mixed with those of another one.
+    write(jsonResponse(JSON.stringify(entry), `Recorded ${entry.method} ${entry.url} ${entry.status}`));
+    for (const chunk of iterateUtf8Chunks(body, MAX_RESPONSE_CHUNK_BYTES)) {
+        write(jsonResponse('', '', chunk));
+    }
+}
+
+/**
+ * Records the responses of the active context with one listener, writing a ``Response.Json`` for each of
+ * them, followed by its body in ``bodyPart`` messages. The first message, without ``json``, tells that the
+ * listener is in place. Recording ends, and ``end`` is called, when it is stopped or the context is closed.
+ */
+export function recordNetworkTraffic(
+    request: pb.Request_NetworkRecording,
+    state: PlaywrightState,
+    write: (message: pb.Response_Json) => void,
+    end: () => void,
+): void {
+    const context = state.getActiveContext();
+    if (!context) throw Error('No context is open for recording network traffic.');
+    if (state.networkRecordings.has(request.id)) throw Error(`Network recording ${request.id} is already running.`);
+    const matches = responseMatcher(request.urlOrPredicate);
+    const pending = new Set<Promise<void>>();
+    const onResponse = (response: Response) => {
+        const recorded: Promise<void> = recordResponse(response, matches, request.maxBodySize, write)
+            .catch((e) => logger.info(`Recording ${response.url()} failed: ${String(e)}`))
+            .finally(() => pending.delete(recorded));
+        pending.add(recorded);
+    };
+    const stop = async () => {
+        if (!state.networkRecordings.delete(request.id)) return;
+        context.off('response', onResponse);
+        context.off('close', stop);
+        await Promise.all(pending);
+        end();
+    };
+    context.on('response', onResponse);
+    context.on('close', stop);
+    state.networkRecordings.set(request.id, stop);
+    write(jsonResponse('', `Network recording ${request.id} started.`));
+}
+
+export async function stopNetworkRecording(
+    request: pb.Request_NetworkRecording,
+    state: PlaywrightState,
+): Promise<pb.Response_Empty> {
+    const stop = state.networkRecordings.get(request.id);
+    if (!stop) throw Error(`No network recording ${request.id} is running.`);
+    await stop();
+    return emptyWithLog(`Network recording ${request.id} stopped.`);
+}
+
 export async function waitForRequest(request: pb.Request_HttpCapture, page: Page): Promise<pb.Response_Json> {
     const urlOrPredicate = deserializeUrlOrPredicate(request.urlOrPredicate);
     const timeout = request.timeout;
@@ -13,12 +13,14 @@
 // limitations under the License.
 
 import { ServerWritableStream } from '@grpc/grpc-js';
+import { EventEmitter } from 'events';
 import fs from 'fs';
 import { createRequire } from 'module';
 import { CoverageReport, CoverageReportOptions } from 'monocart-coverage-reports';
 import * as path from 'path';
 import * as playwright from 'playwright';
 import {
+    APIRequestContext,
     Browser,
     BrowserContext,
     BrowserServer,
@@ -40,11 +42,13 @@ import {
     setRFSuiteContext,
     setRFTestContext,
 } from './browser_logger';
-import { MAX_RESPONSE_CHUNK_BYTES, splitUtf8ByMaxBytes } from './chunking';
+import { iterateUtf8Chunks, mapChunks, MAX_RESPONSE_CHUNK_BYTES } from './chunking';
 import {
     Request_Bool,
     Request_Browser,
     Request_ClosePage,
+    Request_CloseContexts,
+    Request_CloseScope,
     Request_ConnectBrowser,
     Request_Context,
     Request_CoverageMerge,
@@ -60,6 +64,9 @@ import {
     Request_StorageState,
     Request_TraceGroup,
     Request_UrlOptions,
+    Response_CatalogChange,
+    Response_CatalogEvent,
+    Response_ClosedContext,
     Response_Empty,
     Response_Json,
     Response_Keywords,
@@ -84,6 +91,13 @@ function lastItem<T>(array: T[]): T | undefined {
     return array[array.length - 1];
 }
 
+/*
+ * Popups and pages closed by themselves change a page stack outside of any rpc.
+ * Watched states listen to this to publish their catalog again.
+ * */
+const pageStackChanges = new EventEmitter();
+pageStackChanges.setMaxListeners(0);
+
 interface IBrowserState {
     browser: BrowserState;
     newBrowser: boolean;
@@ -123,20 +137,35 @@ const extractArgumentsStringFromJavascript = (javascript: string): string => {
     return '*args';
 };
 
+/** An extension keyword with the argument names read from its source when the extension was loaded. */
+export interface ExtensionKeyword {
+    fn: (...args: unknown[]) => unknown;
+    argNames: string[];
+    // The browser is resolved only for keywords which take page, context or browser.
+    needsBrowser: boolean;
+}
+
 export async function initializeExtension(
     request: Request_FilePath,
     state: PlaywrightState,
 ): Promise<Response_Keywords> {
     logger.info(`Initializing extension: ${request.path}`);
     const extension: Record<string, (...args: unknown[]) => unknown> = require(request.path); // eslint-disable-line
-    state.extensions.push(extension);
     const kws = Object.keys(extension).filter((key) => extension[key] instanceof Function && !key.startsWith('__'));
     logger.info(`Adding ${kws.length} keywords from JS Extension`);
+    const argumentTexts = kws.map((v) => extractArgumentsStringFromJavascript(extension[v].toString()));
+    kws.forEach((kw, index) => {
+        if (state.extensionKeywords.has(kw)) return;
+        const argNames = getArgumentNames(argumentTexts[index]);
+        state.extensionKeywords.set(kw, {
+            fn: extension[kw],
+            argNames,
+            needsBrowser: argNames.some((name) => name === 'page' || name === 'context' || name === 'browser'),
+        });
+    });
     return keywordsResponse(
         kws,
-        kws.map((v) => {
-            return extractArgumentsStringFromJavascript(extension[v].toString());
-        }),
+        argumentTexts,
         kws.map((v) => {
             const typedV = extension[v] as { rfdoc?: string };
             return typedV.rfdoc ?? 'TODO: Add rfdoc string to exposed function to create documentation';
@@ -145,45 +174,50 @@ export async function initializeExtension(
     );
 }
 
-const getArgumentNamesFromJavascriptKeyword = (keyword: CallableFunction) =>
-    extractArgumentsStringFromJavascript(keyword.toString())
-        .split(',')
-        .map((s) => s.trim().match(/^\w*/)?.[0] || s.trim());
+const getArgumentNames = (argumentsText: string) =>
+    argumentsText.split(',').map((s) => s.trim().match(/^\w*/)?.[0] || s.trim());
+
+const EXTENSION_API_ARGUMENTS = new Set(['page', 'context', 'browser', 'logger', 'playwright']);
 
 export async function extensionKeywordCall(
     request: Request_KeywordCall,
     call: ServerWritableStream<Request_KeywordCall, Response_Json>,
     state: PlaywrightState,
-): Promise<Response_Json[]> {
+): Promise<Iterable<Response_Json>> {
     const keywordName = request.name;
-    const args = JSON.parse(request.arguments) as { arguments: [string, unknown][] };
-    const extension = state.extensions.find((extension) => Object.keys(extension).includes(keywordName));
-    if (!extension) throw Error(`Could not find keyword ${keywordName}`);
-    const keyword = extension[keywordName];
-    const namedArguments = Object.fromEntries(args['arguments']);
+    const keyword = state.extensionKeywords.get(keywordName);
+    if (!keyword) throw Error(`Could not find keyword ${keywordName}`);
     const apiArguments = new Map();
-    const argNames = getArgumentNamesFromJavascriptKeyword(keyword);
-    // Resolve the browser only when the keyword asks for something that needs
-    // one. So if it has arguments like page, context or browser.
-    if (argNames.some((name) => name === 'page' || name === 'context' || name === 'browser')) {
+    if (keyword.needsBrowser) {
         apiArguments.set('browser', state.getActiveBrowser().browser);
     }
     apiArguments.set('page', state.getActivePage());
     apiArguments.set('context', state.getActiveContext());
     apiArguments.set('logger', (msg: string) => call.write(jsonResponse('', msg)));
     apiArguments.set('playwright', playwright);
-    const functionArguments = argNames.map((argName) => apiArguments.get(argName) || namedArguments[argName]);
-    const result = await keyword(...functionArguments);
+    let functionArguments: unknown[];
+    if (request.positionalArguments) {
+        // Values of the arguments other than the API ones, in the order the function takes them.
+        const values = JSON.parse(request.positionalArguments) as unknown[];
+        let index = 0;
+        functionArguments = keyword.argNames.map((argName) =>
+            EXTENSION_API_ARGUMENTS.has(argName) ? apiArguments.get(argName) : values[index++],
+        );
+    } else {
+        const args = JSON.parse(request.arguments) as { arguments: [string, unknown][] };
+        const namedArguments = Object.fromEntries(args['arguments']);
+        functionArguments = keyword.argNames.map((argName) => apiArguments.get(argName) || namedArguments[argName]);
+    }
+    const result = await keyword.fn(...functionArguments);
     if (result === undefined) {
         return [jsonResponse('', 'ok')];
     }
     const body = JSON.stringify(result);
-    const bodyChunks = splitUtf8ByMaxBytes(body, MAX_RESPONSE_CHUNK_BYTES);
-    if (bodyChunks.length === 0) {
-        return [jsonResponse('', 'ok')];
+    if (Buffer.byteLength(body, 'utf8') <= MAX_RESPONSE_CHUNK_BYTES) {
+        return [jsonResponse('', 'ok', body)];
     }
-    return bodyChunks.map((chunk, index) =>
-        jsonResponse('', index === bodyChunks.length - 1 ? 'ok' : `ok chunk ${index}`, chunk),
+    return mapChunks(iterateUtf8Chunks(body, MAX_RESPONSE_CHUNK_BYTES), (chunk, index) =>
+        jsonResponse('', `ok chunk ${index}`, chunk),
     );
 }
 
@@ -294,6 +328,7 @@ async function _createIndexedContext(
     }
     indexedContext.c.on('page', async (page) => {
         indexedContext.pageStack.unshift(await _newPage(indexedContext, page));
+        pageStackChanges.emit('change');
     });
     return indexedContext;
 }
@@ -347,20 +382,51 @@ async function _newPage(context: IndexedContext, page: Page | undefined = undefi
         if (oldPageStackLength != filteredPageStack.length) {
             context.pageStack = filteredPageStack;
             logger.info('Removed ' + contextPage.id + ' from ' + context.id + ' page stack');
+            pageStackChanges.emit('change');
         }
     });
     return contextPage;
 }
 
+type CatalogListener = (event: Response_CatalogEvent) => void;
+
+async function pageDetails(page: IndexedPage): Promise<{ title: string; url: string }> {
+    const url = page.p.url();
+    const titleTimeout = new Promise<never>((_r, rej) => setTimeout(() => rej(new Error('title timeout')), 350));
+    let title = '';
+    try {
+        title = await Promise.race([page.p.title(), titleTimeout]);
+    } catch (e) {} // eslint-disable-line
+    return { title, url };
+}
+
+function paintKeywordCallBanner(content: string) {
+    let kwCallBanner = document.getElementById('kwCallBanner');
+    if (!kwCallBanner) {
+        kwCallBanner = document.createElement('style');
+        kwCallBanner.setAttribute('id', 'kwCallBanner');
+        document.head.appendChild(kwCallBanner);
+    }
+    kwCallBanner.textContent = content;
+}
+
 export class PlaywrightState {
     constructor() {
         this.browserStack = [];
-        this.extensions = [];
         this.browserServer = [];
     }
-    extensions: Record<string, (...args: unknown[]) => unknown>[];
+    extensionKeywords = new Map<string, ExtensionKeyword>();
+    // Stops the network recording of the id, see network.recordNetworkTraffic.
+    networkRecordings = new Map<string, () => Promise<void>>();
     public browserStack: BrowserState[];
     private browserServer: BrowserServer[];
+    private catalogListeners = new Set<CatalogListener>();
+    private catalogVersion = 0;
+    private publishedCatalog: BrowserCatalog = [];
+    private publishedCatalogJson = '[]';
+    private rfScope = '';
+    // Resolves when the last keyword call banner is painted, for calls which must not capture it half way.
+    public keywordCallBanner: Promise<void> = Promise.resolve();
     get activeBrowser() {
         return lastItem(this.browserStack);
     }
@@ -397,14 +463,17 @@ export class PlaywrightState {
         }
     }
 
-    public async closeAll(): Promise<void> {
+    public async closeAll(concurrency: number = closeConcurrency()): Promise<void> {
         const browsers = this.browserStack;
+        const targets = browsers.flatMap((browser) => browser.contextStack.map((context) => ({ browser, context })));
+        await closeContexts(targets, { saveTrace: true, saveCoverage: false, concurrency });
         for (const browser of browsers) {
             try {
                 await browser.close();
             } catch (e) {} // eslint-disable-line
         }
         this.browserStack = [];
+        await this.disposeApiRequestContext();
     }
 
     public async closeAllServers(): Promise<void> {
@@ -429,48 +498,85 @@ export class PlaywrightState {
         await selectedServer.close();
     }
 
-    public async getCatalog(includePageDetails: boolean = true) {
-        const pageToContents = async (page: IndexedPage) => {
-            let title = null;
-            let url = '';
-            if (includePageDetails) {
-                url = page.p.url();
-                const titlePromise = page.p.title();
-                const titleTimeout = new Promise((_r, rej) => setTimeout(() => rej(new Error('title timeout')), 350));
-                try {
-                    title = await Promise.race([titlePromise, titleTimeout]);
-                } catch (e) {} // eslint-disable-line
-            }
-            return {
-                type: 'page',
-                title: title || '',
-                url,
-                id: page.id,
-                timestamp: page.timestamp,
-            };
-        };
-
-        const contextToContents = async (context: IndexedContext) => {
-            const activePage = lastItem(context.pageStack)?.id;
-            return {
+    /**
+     * Catalog without page details, which needs no calls to the browser.
+     */
+    public getCatalogSnapshot() {
+        return this.browserStack.map((browser) => ({
+            type: browser.name,
+            id: browser.id,
+            contexts: browser.contextStack.map((context) => ({
                 type: 'context',
                 id: context?.id,
-                activePage: activePage,
-                pages: await Promise.all(context.pageStack.map(pageToContents)),
-            };
+                activePage: lastItem(context.pageStack)?.id,
+                pages: context.pageStack.map((page) => ({
+                    type: 'page',
+                    title: '',
+                    url: '',
+                    id: page.id,
+                    timestamp: page.timestamp,
+                })),
+            })),
+            activeContext: browser.context?.id,
+            activeBrowser: this.activeBrowser === browser,
+        }));
+    }
+
+    /**
+     * Calls the listener with the current catalog and then again after each change to it,
+     * returns the function which stops watching.
+     */
+    public watchCatalog(listener: CatalogListener): () => void {
+        if (this.catalogListeners.size === 0) {
+            pageStackChanges.on('change', this.publishCatalog);
+        }
+        this.broadcastCatalog();
+        this.catalogListeners.add(listener);
+        listener({ version: this.catalogVersion, changes: [], json: this.publishedCatalogJson });
+        return () => {
+            this.catalogListeners.delete(listener);
+            if (this.catalogListeners.size === 0) {
+                pageStackChanges.off('change', this.publishCatalog);
+            }
         };
+    }
 
-        return Promise.all(
-            this.browserStack.map(async (browser) => {
-                return {
-                    type: browser.name,
-                    id: browser.id,
-                    contexts: await Promise.all(browser.contextStack.map(contextToContents)),
-                    activeContext: browser.context?.id,
-                    activeBrowser: this.activeBrowser === browser,
-                };
-            }),
+    /**
+     * Sends the catalog to the watchers if it has changed since it was last sent.
+     */
+    public publishCatalog = (): void => {
+        if (this.catalogListeners.size > 0) {
+            this.broadcastCatalog();
+        }
+    };
+
+    private broadcastCatalog(): void {
+        const catalog = this.getCatalogSnapshot();
+        const json = JSON.stringify(catalog);
+        if (json === this.publishedCatalogJson) return;
+        const changes = catalogChanges(this.publishedCatalog, catalog);
+        this.catalogVersion += 1;
+        this.publishedCatalog = catalog;
+        this.publishedCatalogJson = json;
+        const event = { version: this.catalogVersion, changes, json };
+        for (const listener of this.catalogListeners) {
+            listener(event);
+        }
+    }
+
+    public async getCatalog(includePageDetails: boolean = true) {
+        const catalog = this.getCatalogSnapshot();
+        if (!includePageDetails) return catalog;
+        await Promise.all(
+            this.browserStack.flatMap((browser, b) =>
+                browser.contextStack.flatMap((context, c) =>
+                    context.pageStack.map(async (page, p) => {
+                        Object.assign(catalog[b].contexts[c].pages[p], await pageDetails(page));
+                    }),
+                ),
+            ),
         );
+        return catalog;
     }
 
     public addBrowser(browserAndConfs: BrowserAndConfs): BrowserState {
@@ -497,6 +603,7 @@ export class PlaywrightState {
                 };
                 indexedContext.c.on('page', async (page) => {
                     indexedContext.pageStack.unshift(await _newPage(indexedContext, page));
+                    pageStackChanges.emit('change');
                 });
                 browserState?.pushContext(indexedContext);
             }
@@ -505,6 +612,33 @@ export class PlaywrightState {
         return browserState;
     }
 
+    /**
+     * Marks the contexts and pages opened since the last call as opened in the current scope.
+     * Called before the scope changes and before a scope is closed, popups included.
+     */
+    public claimScope(): void {
+        for (const browserState of this.browserStack) {
+            for (const context of browserState.contextStack) {
+                context.scope ??= this.rfScope;
+                for (const page of context.pageStack) {
+                    page.scope ??= this.rfScope;
+                }
+            }
+        }
+    }
+
+    public enterScope(scope: string): void {
+        this.claimScope();
+        this.rfScope = scope;
+    }
+
+    /**
+     * Drops persistent context browsers whose context has been closed, they have nothing left to them.
+     */
+    public removeClosedPersistentBrowsers(): void {
+        this.browserStack = this.browserStack.filter((b) => b.browser !== null || b.contextStack.length > 0);
+    }
+
     public addBrowserServer = (browserServer: BrowserServer): void => {
         this.browserServer.push(browserServer);
     };
@@ -525,6 +659,55 @@ export class PlaywrightState {
         return this.activeBrowser?.page?.p;
     };
 
+    // The last keyword call banner the library sent, and the banner each page was painted with.
+    private keywordCallBannerContent: string | undefined;
+    private paintedBanners = new WeakMap<Page, string>();
+
+    /**
+     * Paints the keyword call banner on the active page without making the call that carried it wait.
+     * The library sends the banner only when its text changes, so the last one is kept and painted also
+     * on pages which become active later, and again after a page has loaded a new document.
+     */
+    public showKeywordCallBanner = (content?: string): void => {
+        if (content !== undefined) this.keywordCallBannerContent = content;
+        const page = this.getActivePage();
+        const banner = this.keywordCallBannerContent;
+        if (!page || banner === undefined || this.paintedBanners.get(page) === banner) return;
+        if (!this.paintedBanners.has(page)) {
+            page.on('domcontentloaded', () => this.paintBannerOn(page));
+        }
+        this.paintedBanners.set(page, banner);
+        this.paintBannerOn(page);
+    };
+
+    private paintBannerOn(page: Page) {
+        const banner = this.paintedBanners.get(page) ?? '';
+        this.keywordCallBanner = page.evaluate(paintKeywordCallBanner, banner).catch((e) => {
+            logger.info(`Keyword call banner could not be painted: ${e}`);
+        });
+    }
+
+    private ownApiRequestContext: APIRequestContext | undefined;
+
+    /**
+     * Returns the request client of the active context, which shares its cookies, or without a context one of
+     * this state's own. Both keep their connections open between requests.
+     */
+    public getApiRequestContext = async (): Promise<APIRequestContext> => {
+        const context = this.getActiveContext();
+        if (context) return context.request;
+        this.ownApiRequestContext ??= await playwright.request.newContext();
+        return this.ownApiRequestContext;
+    };
+
+    private async disposeApiRequestContext(): Promise<void> {
+        const requestContext = this.ownApiRequestContext;
+        this.ownApiRequestContext = undefined;
+        try {
+            await requestContext?.dispose();
+        } catch (e) {} // eslint-disable-line
+    }
+
     public getActivePageId = (): string | undefined => {
         return this.activeBrowser?.page?.id;
     };
@@ -540,6 +723,39 @@ export class PlaywrightState {
     };
 }
 
+type BrowserCatalog = ReturnType<PlaywrightState['getCatalogSnapshot']>;
+
+function catalogChanges(before: BrowserCatalog, after: BrowserCatalog): Response_CatalogChange[] {
+    const summarize = (catalog: BrowserCatalog) => {
+        const ids = new Set<string>();
+        const active = new Set<string>();
+        for (const browser of catalog) {
+            ids.add(browser.id);
+            if (browser.activeBrowser) active.add(browser.id);
+            if (browser.activeContext) active.add(browser.activeContext);
+            for (const context of browser.contexts) {
+                ids.add(context.id);
+                if (context.activePage) active.add(context.activePage);
+                for (const page of context.pages) ids.add(page.id);
+            }
+        }
+        return { ids, active };
+    };
+    const previous = summarize(before);
+    const current = summarize(after);
+    const changes: Response_CatalogChange[] = [];
+    for (const id of current.ids) {
+        if (!previous.ids.has(id)) changes.push({ kind: 'opened', id });
+    }
+    for (const id of previous.ids) {
+        if (!current.ids.has(id)) changes.push({ kind: 'closed', id });
+    }
+    for (const id of current.active) {
+        if (!previous.active.has(id)) changes.push({ kind: 'activated', id });
+    }
+    return changes;
+}
+
 class LocatorCache {
     private cache: Map<string, playwright.Locator>;
 
@@ -579,6 +795,8 @@ type IndexedContext = {
     traceFile: string;
     pageStack: IndexedPage[];
     options?: Record<string, unknown>;
+    // Robot Framework suite or test id which was running when this was opened, see PlaywrightState.claimScope.
+    scope?: string;
     // A restore which timed out keeps running, see setStorageState.
     storageStateRestorePending?: boolean;
 };
@@ -606,6 +824,7 @@ export type IndexedPage = {
     consoleIndex: number;
     activeDownloads: Map<Uuid, DownloadInfo>;
     coverage: CoverageOptions | undefined;
+    scope?: string;
 };
 
 type Uuid = string;
@@ -628,19 +847,17 @@ export class BrowserState {
     id: Uuid;
     headless: boolean;
 
-    public async close(): Promise<void> {
-        for (const context of this.contextStack) {
-            const traceFile = context.traceFile;
-            if (traceFile) {
-                await context.c.tracing.stop({ path: traceFile });
-            }
-            await context.c.close();
-        }
+    public async close(concurrency: number = closeConcurrency()): Promise<void> {
+        const targets = this.contextStack.map((context) => ({ browser: this, context }));
+        const results = await closeContexts(targets, { saveTrace: true, saveCoverage: false, concurrency });
         this._contextStack = [];
-        if (this.browser === null) {
-            return;
+        if (this.browser !== null) {
+            await this.browser.close();
+        }
+        const failed = results.find((result) => result.error);
+        if (failed) {
+            throw new Error(`Closing ${failed.id} failed: ${failed.error}`);
         }
-        await this.browser.close();
     }
 
     public async getOrCreateActiveContext(defaultTimeout: number | undefined): Promise<IIndexedContext> {
@@ -673,6 +890,10 @@ export class BrowserState {
         } else logger.info('Set active context to undefined');
     }
 
+    removeContext(context: IndexedContext) {
+        this._contextStack = this._contextStack.filter((c) => c !== context);
+    }
+
     unshiftContext(newContext: IndexedContext) {
         this._contextStack.unshift(newContext);
     }
@@ -784,6 +1005,169 @@ export async function closePage(
     return pageReportResponse(`Successfully closed Page with runBeforeUnload ${unload}`, closedPage);
 }
 
+const DEFAULT_CLOSE_CONCURRENCY = 4;
+
+/**
+ * How many contexts are closed at the same time: the requested count, else
+ * ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY, else 4. Saving traces and videos makes closing slow.
+ */
+export function closeConcurrency(requested: number = 0): number {
+    const concurrency = requested || Number(process.env.ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY);
+    return concurrency >= 1 ? Math.floor(concurrency) : DEFAULT_CLOSE_CONCURRENCY;
+}
+
+/**
+ * Runs task for each item with at most limit of them running at a time, results are in item order.
+ */
+export async function runWithLimit<T, R>(items: T[], limit: number, task: (item: T) => Promise<R>): Promise<R[]> {
+    const results: R[] = new Array(items.length);
+    let next = 0;
+    const worker = async () => {
+        while (next < items.length) {
+            const index = next++;
+            results[index] = await task(items[index]);
+        }
+    };
+    await Promise.all(Array.from({ length: Math.min(Math.max(limit, 1), items.length) }, worker));
+    return results;
+}
+
+function errorMessage(e: unknown): string {
+    return e instanceof Error ? e.message : String(e);
+}
+
+type ContextToClose = { browser: BrowserState; context: IndexedContext };
+
+/**
+ * Closes the contexts with a bounded concurrency and removes them from their browser, failures
+ * are reported in the results instead of stopping the others. Each result is also given to
+ * onClosed as soon as its context is closed.
+ */
+async function closeContexts(
+    targets: ContextToClose[],
+    options: { saveTrace: boolean; saveCoverage: boolean; concurrency: number },
+    onClosed?: (closed: Response_ClosedContext) => void,
+): Promise<Response_ClosedContext[]> {
+    return runWithLimit(targets, options.concurrency, async ({ browser, context }) => {
+        const closed: Response_ClosedContext = {
+            id: context.id,
+            browserId: browser.id,
+            traceFile: '',
+            videos: [],
+            error: '',
+        };
+        try {
+            if (context.traceFile && options.saveTrace) {
+                await context.c.tracing.stop({ path: context.traceFile });
+                closed.traceFile = context.traceFile;
+            }
+            if (options.saveCoverage) {
+                for (const page of context.pageStack) {
+                    await _saveCoverageReport(page);
+                }
+            }
+            const videos = context.pageStack.flatMap((page) => page.p.video() ?? []);
+            await context.c.close();
+            // A video is complete once its context is closed, its path is not known for remote browsers.
+            const paths = await Promise.allSettled(videos.map((video) => video.path()));
+            closed.videos = paths.flatMap((path) => (path.status === 'fulfilled' ? [path.value] : []));
+        } catch (e) {
+            closed.error = errorMessage(e);
+        } finally {
+            browser.removeContext(context);
+        }
+        onClosed?.(closed);
+        return closed;
+    });
+}
+
+function isInScope(owner: string | undefined, scope: string): boolean {
+    // Robot Framework ids nest: test s1-s2-t3 runs inside suites s1-s2 and s1.
+    return owner !== undefined && (owner === scope || owner.startsWith(`${scope}-`));
+}
+
+async function _closeScopePage(context: IndexedContext, page: IndexedPage, runBeforeUnload: boolean) {
+    try {
+        await _saveCoverageReport(page);
+        await page.p.close({ runBeforeUnload });
+        return '';
+    } catch (e) {
+        return `${page.id}: ${errorMessage(e)}`;
+    } finally {
+        context.pageStack = context.pageStack.filter((p) => p !== page);
+    }
+}
+
+export async function closeScope(request: Request_CloseScope, openBrowsers: PlaywrightState): Promise<Response_Json> {
+    const scope = request.scopeId;
+    if (!scope) throw new Error('No scope id given');
+    openBrowsers.claimScope();
+    const traceGroup = request.traceGroup;
+    if (traceGroup?.name) {
+        await openTraceGroup(traceGroup, openBrowsers);
+    }
+    const contexts: ContextToClose[] = [];
+    const pages: { context: IndexedContext; page: IndexedPage }[] = [];
+    for (const browser of openBrowsers.browserStack) {
+        for (const context of browser.contextStack) {
+            if (isInScope(context.scope, scope)) {
+                contexts.push({ browser, context });
+            } else {
+                for (const page of context.pageStack.filter((p) => isInScope(p.scope, scope))) {
+                    pages.push({ context, page });
+                }
+            }
+        }
+    }
+    const concurrency = closeConcurrency(request.concurrency);
+    const closedContexts = await closeContexts(contexts, {
+        saveTrace: request.saveTrace,
+        saveCoverage: true,
+        concurrency,
+    });
+    // The pages are closed after the contexts, so that together they stay within the concurrency.
+    const pageErrors = await runWithLimit(pages, concurrency, ({ context, page }) =>
+        _closeScopePage(context, page, request.runBeforeUnload),
+    );
+    openBrowsers.removeClosedPersistentBrowsers();
+    if (traceGroup?.name) {
+        await closeTraceGroup(openBrowsers);
+    }
+    const result = {
+        contexts: closedContexts.map((closed) => closed.id),
+        pages: pages.map(({ page }) => page.id),
+        traces: closedContexts.map((closed) => closed.traceFile).filter((traceFile) => traceFile),
+        videos: closedContexts.flatMap((closed) => closed.videos),
+        errors: [
+            ...closedContexts.filter((closed) => closed.error).map((closed) => `${closed.id}: ${closed.error}`),
+            ...pageErrors.filter((error) => error),
+        ],
+    };
+    return jsonResponse(
+        JSON.stringify(result),
+        `Closed ${result.contexts.length} context(s) and ${result.pages.length} page(s) opened in ${scope}`,
+    );
+}
+
+export async function closeContextsById(
+    request: Request_CloseContexts,
+    openBrowsers: PlaywrightState,
+    onClosed: (closed: Response_ClosedContext) => void,
+): Promise<void> {
+    const targets = openBrowsers.browserStack.flatMap((browser) =>
+        browser.contextStack
+            .filter((context) => request.ids.includes(context.id))
+            .map((context) => ({ browser, context })),
+    );
+    const found = new Set(targets.map(({ context }) => context.id));
+    for (const id of request.ids.filter((id) => !found.has(id))) {
+        onClosed({ id, browserId: '', traceFile: '', videos: [], error: `No context for id ${id}` });
+    }
+    const concurrency = closeConcurrency(request.concurrency);
+    await closeContexts(targets, { saveTrace: request.saveTrace, saveCoverage: true, concurrency }, onClosed);
+    openBrowsers.removeClosedPersistentBrowsers();
+}
+
 export async function newPage(
     request: Request_UrlOptions,
     openBrowsers: PlaywrightState,
@@ -990,9 +1374,10 @@ export async function closeTraceGroup(openBrowsers: PlaywrightState): Promise<Re
     return emptyWithLog('Closed trace group');
 }
 
-export async function setRFContext(request: Request_RFContext): Promise<Response_Empty> {
+export async function setRFContext(request: Request_RFContext, openBrowsers: PlaywrightState): Promise<Response_Empty> {
     setRFTestContext(request.testId, request.testName);
     setRFSuiteContext(request.suiteId, request.suiteName);
+    openBrowsers.enterScope(request.testId || request.suiteId);
     return emptyWithLog('RF context updated');
 }
 
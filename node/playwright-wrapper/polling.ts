@@ -0,0 +1,156 @@
+// Copyright 2020-     Robot Framework Foundation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+import { Page } from 'playwright';
+
+import * as pb from './generated/playwright';
+import { PlaywrightState } from './playwright-state';
+import { boolResponse } from './response-util';
+
+const FIXED_INTERVAL = 10;
+const MAX_BACKOFF = 500;
+// Waiting for a change is capped, so that a change which fires no event, like scrolling, is still noticed.
+const MAX_CHANGE_WAIT: Record<string, number> = { mutation: 100, network_idle: 500 };
+// Network is idle once no request has been running for this long.
+const NETWORK_QUIET_TIME = 100;
+
+function sleep(ms: number): Promise<void> {
+    return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+/**
+ * Resolves true on the first DOM mutation or input event in the page, false after ms.
+ */
+export function waitForMutation(page: Page, ms: number): Promise<boolean> {
+    return page.evaluate(
+        (ms) =>
+            new Promise<boolean>((resolve) => {
+                const done = (changed: boolean) => {
+                    observer.disconnect();
+                    document.removeEventListener('input', onInput, true);
+                    clearTimeout(timer);
+                    resolve(changed);
+                };
+                const onInput = () => done(true);
+                const observer = new MutationObserver(() => done(true));
+                const timer = setTimeout(() => done(false), ms);
+                observer.observe(document, {
+                    subtree: true,
+                    childList: true,
+                    attributes: true,
+                    characterData: true,
+                });
+                document.addEventListener('input', onInput, true);
+            }),
+        ms,
+    );
+}
+
+/**
+ * Resolves true when a request ends and the page then makes no request for a while, false after ms.
+ */
+export function waitForNetworkIdle(page: Page, ms: number): Promise<boolean> {
+    return new Promise((resolve) => {
+        let running = 0;
+        let quiet: NodeJS.Timeout | undefined;
+        const done = (idle: boolean) => {
+            clearTimeout(timer);
+            clearTimeout(quiet);
+            page.off('request', onRequest);
+            page.off('requestfinished', onRequestEnd);
+            page.off('requestfailed', onRequestEnd);
+            resolve(idle);
+        };
+        const onRequest = () => {
+            running++;
+            clearTimeout(quiet);
+        };
+        const onRequestEnd = () => {
+            running = Math.max(running - 1, 0);
+            if (running === 0) {
+                clearTimeout(quiet);
+                quiet = setTimeout(() => done(true), NETWORK_QUIET_TIME);
+            }
+        };
+        const timer = setTimeout(() => done(false), ms);
+        page.on('request', onRequest);
+        page.on('requestfinished', onRequestEnd);
+        page.on('requestfailed', onRequestEnd);
+    });
+}
+
+/**
+ * Waits for a change of the kind, mutation or network_idle, in the active page. Without a page, or
+ * while it navigates, this sleeps a short while instead. Returns true when woken by a change.
+ */
+export async function waitForChange(state: PlaywrightState, kind: string, ms: number): Promise<boolean> {
+    const page = state.getActivePage();
+    try {
+        if (!page) throw new Error('No page open');
+        if (kind === 'network_idle') return await waitForNetworkIdle(page, ms);
+        return await waitForMutation(page, ms);
+    } catch {
+        await sleep(Math.min(ms, FIXED_INTERVAL));
+        return false;
+    }
+}
+
+export async function waitForPageChange(request: pb.Request_PageChange, state: PlaywrightState) {
+    const changed = await waitForChange(state, request.kind, request.timeout);
+    return boolResponse(changed, changed ? `Page changed: ${request.kind}` : 'Page did not change');
+}
+
+/**
+ * Waits between the tries of a retry loop as the polling strategy says, fixed, backoff, mutation or
+ * network_idle, and counts the tries. A wakeup is wasted when the try after it fails again.
+ */
+export class Poller {
+    tries = 0;
+    wakeups = 0;
+    changeWakeups = 0;
+    wastedWakeups = 0;
+    private delay = FIXED_INTERVAL;
+
+    constructor(
+        private state: PlaywrightState,
+        private strategy: string,
+    ) {}
+
+    record(passed: boolean): void {
+        this.tries++;
+        if (!passed && this.wakeups > 0) this.wastedWakeups++;
+    }
+
+    async wait(remaining: number): Promise<void> {
+        if (remaining <= 0) return;
+        this.wakeups++;
+        if (this.strategy in MAX_CHANGE_WAIT) {
+            if (await waitForChange(this.state, this.strategy, Math.min(MAX_CHANGE_WAIT[this.strategy], remaining))) {
+                this.changeWakeups++;
+            }
+        } else if (this.strategy === 'backoff') {
+            await sleep(Math.min(this.delay, remaining));
+            this.delay = Math.min(this.delay * 2, MAX_BACKOFF);
+        } else {
+            await sleep(Math.min(FIXED_INTERVAL, remaining));
+        }
+    }
+
+    get log(): string {
+        return (
+            `${this.tries} tries, ${this.changeWakeups} woken by a page change, ` +
+            `${this.wastedWakeups} wasted wakeups`
+        );
+    }
+}
@@ -0,0 +1,142 @@
+// Copyright 2020-     Robot Framework Foundation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+import { BrowserContext, Route } from 'playwright';
+import { v4 as uuidv4 } from 'uuid';
+
+import { logger } from './browser_logger';
+import * as pb from './generated/playwright';
+import { deserializeUrlOrPredicate } from './network';
+import { exists } from './playwright-invoke';
+import { PlaywrightState } from './playwright-state';
+import { emptyWithLog, jsonResponse, stringResponse } from './response-util';
+
+type UrlMatcher = string | RegExp | ((url: URL) => boolean | Promise<boolean>);
+
+interface ContextRoute {
+    id: string;
+    url: string;
+    action: string;
+    // Compiled once when the route is added, and needed again to remove it.
+    matcher: UrlMatcher;
+    handler?: (route: Route) => Promise<void>;
+    times: number;
+    hits: number;
+}
+
+// The routes the library has added, by context. They go away with the context.
+const contextRoutes = new WeakMap<BrowserContext, Map<string, ContextRoute>>();
+
+function routesOf(context: BrowserContext): Map<string, ContextRoute> {
+    let routes = contextRoutes.get(context);
+    if (routes === undefined) {
+        routes = new Map();
+        contextRoutes.set(context, routes);
+    }
+    return routes;
+}
+
+/**
+ * Builds the handler of a route. Everything it answers with is prepared here, so a routed request is
+ * answered within the Node.js process.
+ */
+function routeHandler(request: pb.Request_Route, entry: ContextRoute): (route: Route) => Promise<void> {
+    const headers: Record<string, string> | undefined = request.headers ? JSON.parse(request.headers) : undefined;
+    switch (request.action) {
+        case 'fulfill': {
+            const body = Buffer.from(request.body);
+            const status = request.status || 200;
+            return async (route) => {
+                entry.hits++;
+                await route.fulfill({ status, headers, body });
+            };
+        }
+        case 'abort': {
+            const errorCode = request.errorCode || undefined;
+            return async (route) => {
+                entry.hits++;
+                await route.abort(errorCode);
+            };
+        }
+        case 'continue':
+            return async (route) => {
+                entry.hits++;
+                await route.continue(headers ? { headers: { ...route.request().headers(), ...headers } } : undefined);
+            };
+    }
+    throw new Error(`Unknown route action ${request.action}.`);
+}
+
+export async function addRoute(request: pb.Request_Route, state: PlaywrightState): Promise<pb.Response_String> {
+    const context = state.getActiveContext();
+    exists(context, 'No context is open for routing.');
+    const url = request.urlOrPredicate || '**/*';
+    const entry: ContextRoute = {
+        id: uuidv4(),
+        url,
+        action: request.action,
+        matcher: deserializeUrlOrPredicate(url) as UrlMatcher,
+        times: request.times,
+        hits: 0,
+    };
+    if (request.action === 'har') {
+        if (typeof entry.matcher === 'function') throw new Error('A HAR route needs a glob or RegExp url.');
+        await context.routeFromHAR(request.path, {
+            url: entry.matcher,
+            notFound: request.notFound === 'fallback' ? 'fallback' : 'abort',
+        });
+    } else {
+        entry.handler = routeHandler(request, entry);
+        await context.route(entry.matcher, entry.handler, { times: request.times || undefined });
+    }
+    routesOf(context).set(entry.id, entry);
+    logger.info(`Added route ${entry.id}: ${request.action} ${url}`);
+    return stringResponse(entry.id, `Route ${entry.id} added for ${url}.`);
+}
+
+export async function removeRoute(request: pb.Request_RouteId, state: PlaywrightState): Promise<pb.Response_Empty> {
+    const context = state.getActiveContext();
+    exists(context, 'No context is open for routing.');
+    const routes = routesOf(context);
+    const removed = request.id ? [routes.get(request.id)] : [...routes.values()];
+    if (removed[0] === undefined) {
+        return emptyWithLog(request.id ? `No route ${request.id} found.` : 'No routes to remove.');
+    }
+    const before = routes.size;
+    for (const route of removed) {
+        if (route === undefined || !routes.has(route.id)) continue;
+        await context.unroute(route.matcher, route.handler);
+        routes.delete(route.id);
+        if (route.handler === undefined) {
+            // A HAR route has no handler of ours, so Playwright removes every route of the same url with it.
+            for (const other of routes.values()) {
+                if (other.url === route.url) routes.delete(other.id);
+            }
+        }
+    }
+    return emptyWithLog(`Removed ${before - routes.size} route(s).`);
+}
+
+export async function getRoutes(state: PlaywrightState): Promise<pb.Response_Json> {
+    const context = state.getActiveContext();
+    const routes = context ? [...routesOf(context).values()] : [];
+    const report = routes.map(({ id, url, action, times, hits }) => ({
+        id,
+        url,
+        action,
+        times,
+        // Playwright keeps no count for a HAR route.
+        hits: action === 'har' ? null : hits,
+    }));
+    return jsonResponse(JSON.stringify(report), `${routes.length} route(s) in the active context.`);
+}
@@ -20,6 +20,13 @@ def ctx(response):
     get_text.GetText = MagicMock(return_value=response)
     enter = MagicMock(return_value=get_text)
     grpc.__enter__ = enter
+    grpc.__exit__ = MagicMock(return_value=False)
     pw.grpc_channel.return_value = grpc
     ctx.playwright = pw
     return ctx
+
+
+@pytest.fixture
+def stub(ctx):
+    """The stub ``ctx.playwright.grpc_channel()`` yields."""
+    return ctx.playwright.grpc_channel.return_value.__enter__.return_value
@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock
+
+import pytest
+from assertionengine import AssertionOperator
+
+from Browser.generated.playwright_pb2 import Response
+from Browser.keywords import Getters
+from Browser.utils import PollingStrategy
+
+
+class TextResponse:
+    log = ""
+
+    def __init__(self, text):
+        self.items = [text]
+
+
+@pytest.fixture
+def getter(ctx):
+    ctx.poll_assertions_in_node = True
+    ctx.presenter_mode = False
+    ctx.polling_strategy = PollingStrategy.mutation
+    ctx._get_assertion_formatter.return_value = []
+    ctx.scope_stack = {
+        "timeout": MagicMock(get=MagicMock(return_value=2000)),
+        "retry_assertions_for": MagicMock(get=MagicMock(return_value=500)),
+        "strict_mode": MagicMock(get=MagicMock(return_value=True)),
+        "selector_prefix": MagicMock(get=MagicMock(return_value=None)),
+    }
+    getter = Getters(ctx)
+    getter._get_text = MagicMock(return_value=TextResponse("done"))  # type: ignore[method-assign]
+    return getter
+
+
+def test_passed_assertion_is_read_once(getter, stub):
+    stub.AssertPoll.return_value = Response.AssertPoll(status="passed", tries=4)
+    assert getter.get_text("h1", AssertionOperator["=="], "done") == "done"
+    request = stub.AssertPoll.call_args.args[0]
+    assert request.getter == "Text"
+    assert request.selector == "h1"
+    assert request.operator == "=="
+    assert request.expected == '"done"'
+    assert request.retryFor == 500  # noqa: PLR2004
+    assert request.polling == "mutation"
+    getter._get_text.assert_called_once()
+
+
+def test_failed_assertion_is_not_retried_again(getter, stub):
+    stub.AssertPoll.return_value = Response.AssertPoll(
+        status="failed", tries=9, value='"old"'
+    )
+    getter._get_text.return_value = TextResponse("old")
+    with pytest.raises(AssertionError, match="should be 'done'"):
+        getter.get_text("h1", AssertionOperator["=="], "done")
+    getter._get_text.assert_called_once()
+
+
+def test_failed_number_comparison_is_retried_here(getter, stub):
+    stub.AssertPoll.return_value = Response.AssertPoll(
+        status="failed", tries=9, value="2"
+    )
+    stub.GetDomProperty.side_effect = [
+        Response.String(body="2"),
+        Response.String(body="3"),
+    ]
+    assert getter.get_property("input", "value", AssertionOperator[">"], 2) == 3  # noqa: PLR2004
+    assert stub.GetDomProperty.call_count == 2  # noqa: PLR2004
+
+
+def test_failing_getter_raises_its_error(getter, stub):
+    stub.AssertPoll.return_value = Response.AssertPoll(
+        status="error", error="Timeout 2000ms exceeded"
+    )
+    with pytest.raises(AssertionError, match="Timeout 2000ms exceeded"):
+        getter.get_text("h1", AssertionOperator["=="], "done")
+    getter._get_text.assert_not_called()
+
+
+def test_property_name_is_sent_as_argument(getter, stub):
+    stub.AssertPoll.return_value = Response.AssertPoll(status="passed")
+    stub.GetDomProperty.return_value = Response.String(body="3")
+    assert getter.get_property("input", "value", AssertionOperator[">"], 2) == 3  # noqa: PLR2004
+    request = stub.AssertPoll.call_args.args[0]
+    assert (request.getter, request.argument, request.expected) == (
+        "Property",
+        "value",
+        "2",
+    )
+
+
+def test_getter_without_assertion_is_not_polled(getter, stub):
+    assert getter.get_text("h1") == "done"
+    stub.AssertPoll.assert_not_called()
+
+
+def test_formatter_keeps_assertion_in_library(getter, stub):
+    getter.library._get_assertion_formatter.return_value = [str.strip]
+    getter.get_text("h1", AssertionOperator["=="], "done")
+    stub.AssertPoll.assert_not_called()
@@ -0,0 +1,120 @@
+import pytest
+
+import Browser.playwright
+from Browser.generated.playwright_pb2 import Request, Response
+from Browser.playwright import Playwright, is_batchable
+
+
+class RecordingStub:
+    def __init__(self, channel=None, fail_at=None):
+        self.calls = []
+        self.fail_at = fail_at
+
+    def ExecuteBatch(self, request):  # noqa: N802
+        self.calls.append(("ExecuteBatch", [step.method for step in request.steps]))
+        results = []
+        for index, step in enumerate(request.steps):
+            if index == self.fail_at:
+                results.append(
+                    Response.BatchStepResult(method=step.method, error="Boom")
+                )
+                break
+            results.append(
+                Response.BatchStepResult(
+                    method=step.method,
+                    ok=True,
+                    response=Response.Empty(log=step.method).SerializeToString(),
+                )
+            )
+        return Response.Batch(log="done", results=results)
+
+    def GetTitle(self, request):  # noqa: N802
+        self.calls.append(("GetTitle", None))
+        return Response.String(body="Title")
+
+    def Click(self, request):  # noqa: N802
+        self.calls.append(("Click", request.selector))
+        return Response.Empty()
+
+    def SetOffline(self, request):  # noqa: N802
+        self.calls.append(("SetOffline", request.value))
+        return Response.Empty()
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    stub = RecordingStub()
+    monkeypatch.setattr(
+        Browser.playwright.playwright_pb2_grpc, "PlaywrightStub", lambda _: stub
+    )
+    return stub
+
+
+@pytest.fixture
+def playwright():
+    playwright = object.__new__(Playwright)
+    playwright.__dict__["_playwright_process"] = None
+    playwright.__dict__["_channel"] = None
+    return playwright
+
+
+def test_only_setters_are_batchable():
+    assert is_batchable("SetOffline")
+    assert is_batchable("SetViewportSize")
+    assert not is_batchable("Click")
+    assert not is_batchable("WaitForElementsState")
+    assert not is_batchable("GetTitle")
+    assert not is_batchable("GetPageSource")
+    assert not is_batchable("UploadFileBySelector")
+    assert not is_batchable("ExecuteBatch")
+    assert not is_batchable("NoSuchMethod")
+
+
+def test_calls_outside_batch_are_sent_directly(stub, playwright):
+    with playwright.grpc_channel() as grpc_stub:
+        grpc_stub.Click(Request.ElementSelectorWithOptions(selector="#a"))
+    assert stub.calls == [("Click", "#a")]
+
+
+def test_batch_sends_queued_calls_once(stub, playwright):
+    with playwright.batch():
+        for value in (True, False, True):
+            with playwright.grpc_channel() as grpc_stub:
+                response = grpc_stub.SetOffline(Request.Bool(value=value))
+                assert "queued" in response.log
+        assert stub.calls == []
+    assert stub.calls == [("ExecuteBatch", ["SetOffline", "SetOffline", "SetOffline"])]
+
+
+def test_other_calls_send_queue_first(stub, playwright):
+    with playwright.batch(), playwright.grpc_channel() as grpc_stub:
+        grpc_stub.SetOffline(Request.Bool(value=True))
+        grpc_stub.Click(Request.ElementSelectorWithOptions(selector="#a"))
+        assert grpc_stub.GetTitle(Request.Empty()).body == "Title"
+    assert stub.calls == [
+        ("ExecuteBatch", ["SetOffline"]),
+        ("Click", "#a"),
+        ("GetTitle", None),
+    ]
+
+
+def test_nested_batches_join_the_outer_one(stub, playwright):
+    with playwright.batch():
+        with playwright.batch(), playwright.grpc_channel() as grpc_stub:
+            grpc_stub.SetOffline(Request.Bool(value=True))
+        with playwright.grpc_channel() as grpc_stub:
+            grpc_stub.SetOffline(Request.Bool(value=False))
+    assert stub.calls == [("ExecuteBatch", ["SetOffline", "SetOffline"])]
+
+
+def test_failing_step_is_reported_when_batch_is_sent(stub, playwright):
+    stub.fail_at = 1
+    with pytest.raises(AssertionError) as error, playwright.batch():  # noqa: PT012
+        for value in (True, False, True):
+            with playwright.grpc_channel() as grpc_stub:
+                grpc_stub.SetOffline(Request.Bool(value=value))
+    assert "Batched call SetOffline failed: Boom" in str(error.value)
+    assert "1 queued call(s) after it were not run." in str(error.value)
+    with playwright.grpc_channel() as grpc_stub:
+        grpc_stub.Click(Request.ElementSelectorWithOptions(selector="#d"))
+    assert stub.calls[-1] == ("Click", "#d")
@@ -0,0 +1,155 @@
+import json
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import grpc
+import pytest
+
+from Browser.catalog_feed import CatalogFeed
+from Browser.generated import playwright_pb2_grpc
+from Browser.generated.playwright_pb2 import Response
+from Browser.keywords.playwright_state import PlaywrightState
+
+FETCHED = [{"id": "browser=fetched", "contexts": []}]
+
+
+def _catalog(browser_id: str) -> str:
+    return json.dumps([{"id": browser_id, "contexts": []}])
+
+
+class CatalogServicer(playwright_pb2_grpc.PlaywrightServicer):
+    def __init__(self):
+        self.events: queue.SimpleQueue = queue.SimpleQueue()
+        self.fetches = 0
+
+    def GetBrowserCatalog(self, request, context):  # noqa: N802
+        self.fetches += 1
+        return Response.Json(json=json.dumps(FETCHED))
+
+    def WatchBrowserCatalog(self, request, context):  # noqa: N802
+        version = 0
+        while context.is_active():
+            try:
+                browser_id = self.events.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            version += 1
+            yield Response.CatalogEvent(
+                version=version,
+                changes=[Response.CatalogChange(kind="opened", id=browser_id)],
+                json=_catalog(browser_id),
+            )
+
+
+class UnimplementedServicer(playwright_pb2_grpc.PlaywrightServicer):
+    def GetBrowserCatalog(self, request, context):  # noqa: N802
+        return Response.Json(json=json.dumps(FETCHED))
+
+
+def _serve(servicer):
+    server = grpc.server(ThreadPoolExecutor(max_workers=4))
+    playwright_pb2_grpc.add_PlaywrightServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, grpc.insecure_channel(f"127.0.0.1:{port}")
+
+
+@pytest.fixture
+def servicer():
+    servicer = CatalogServicer()
+    server, channel = _serve(servicer)
+    yield servicer, channel
+    channel.close()
+    server.stop(None)
+
+
+def _wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out"
+        time.sleep(0.01)
+
+
+def _fetch_fails():
+    raise AssertionError("Catalog was fetched")
+
+
+def test_catalog_is_read_from_stream(servicer):
+    catalog_servicer, channel = servicer
+    feed = CatalogFeed(channel)
+    catalog_servicer.events.put("browser=1")
+    _wait_until(lambda: feed._generation == 1)
+    assert feed.catalog(_fetch_fails) == json.loads(_catalog("browser=1"))
+    catalog_servicer.events.put("browser=2")
+    _wait_until(lambda: feed._generation == 2)  # noqa: PLR2004
+    assert feed.catalog(_fetch_fails) == json.loads(_catalog("browser=2"))
+    feed.close()
+    assert not feed.alive
+
+
+def test_invalidated_catalog_is_fetched_once(servicer):
+    catalog_servicer, channel = servicer
+    feed = CatalogFeed(channel)
+    catalog_servicer.events.put("browser=1")
+    _wait_until(lambda: feed._generation == 1)
+    feed.invalidate()
+    fetch = MagicMock(return_value=json.dumps(FETCHED))
+    assert feed.catalog(fetch) == FETCHED
+    assert feed.catalog(fetch) == FETCHED
+    fetch.assert_called_once()
+    feed.close()
+
+
+def test_fetched_catalog_is_not_kept_when_event_arrives_meanwhile(servicer):
+    catalog_servicer, channel = servicer
+    feed = CatalogFeed(channel)
+
+    def fetch_while_changing():
+        catalog_servicer.events.put("browser=new")
+        _wait_until(lambda: feed._generation == 1)
+        return json.dumps(FETCHED)
+
+    assert feed.catalog(fetch_while_changing) == FETCHED
+    assert feed.catalog(_fetch_fails) == json.loads(_catalog("browser=new"))
+    feed.close()
+
+
+def test_without_stream_catalog_is_always_fetched():
+    server, channel = _serve(UnimplementedServicer())
+    try:
+        feed = CatalogFeed(channel)
+        _wait_until(lambda: not feed.alive)
+        fetch = MagicMock(return_value=json.dumps(FETCHED))
+        feed.catalog(fetch)
+        feed.catalog(fetch)
+        assert fetch.call_count == 2  # noqa: PLR2004
+    finally:
+        channel.close()
+        server.stop(None)
+
+
+def test_keyword_component_uses_feed_for_id_only_catalog(servicer):
+    catalog_servicer, channel = servicer
+
+    @contextmanager
+    def grpc_channel():
+        yield playwright_pb2_grpc.PlaywrightStub(channel)
+
+    library = MagicMock()
+    library.playwright = SimpleNamespace(_channel=channel, grpc_channel=grpc_channel)
+    state = PlaywrightState(library)
+    assert state._get_browser_catalog(include_page_details=False) == FETCHED
+    catalog_servicer.events.put("browser=pushed")
+    _wait_until(lambda: state._catalog_feed._generation == 1)
+    for _ in range(3):
+        assert state._get_browser_catalog(include_page_details=False) == json.loads(
+            _catalog("browser=pushed")
+        )
+    assert catalog_servicer.fetches == 1
+    state._get_browser_catalog()
+    assert catalog_servicer.fetches == 2  # noqa: PLR2004
+    state._catalog_feed.close()
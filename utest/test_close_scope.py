@@ -0,0 +1,100 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from Browser import Browser
+from Browser.generated.playwright_pb2 import Response
+from Browser.keywords.playwright_state import PlaywrightState, close_concurrency
+
+
+@pytest.fixture
+def library(ctx, stub):
+    ctx.timeout = 10000
+    ctx.tracing_contexts = []
+    stub.CloseScope.return_value = MagicMock(
+        log="Closed",
+        json=json.dumps({"contexts": ["context=1"], "pages": ["page=2"], "errors": []}),
+    )
+    return ctx
+
+
+def test_close_scope_sends_one_request(library, stub):
+    state = PlaywrightState(library)
+    closed = state._close_scope("s1-t1", "Auto Closing", save_trace=False)
+    assert closed["contexts"] == ["context=1"]
+    stub.CloseScope.assert_called_once()
+    request = stub.CloseScope.call_args.args[0]
+    assert request.scopeId == "s1-t1"
+    assert not request.saveTrace
+    assert request.traceGroup.name == ""
+
+
+def test_close_scope_groups_traces_and_forgets_closed_contexts(library, stub):
+    library.tracing_contexts = ["context=1", "context=3"]
+    state = PlaywrightState(library)
+    state._close_scope("s1", "Auto Closing", file="suite.robot", line=3)
+    request = stub.CloseScope.call_args.args[0]
+    assert request.traceGroup.name == "Auto Closing"
+    assert request.traceGroup.file == "suite.robot"
+    assert library.tracing_contexts == ["context=3"]
+    library._context_cache.remove.assert_called_once_with("context=1")
+
+
+def test_auto_closing_closes_scope_of_ended_test():
+    browser = Browser()
+    browser._playwright = MagicMock()
+    browser._playwright_state = MagicMock()
+    browser._execution_stack.append("s1-t1")
+    browser.execute_auto_closing(
+        "Test", {"source": "suite.robot", "lineno": 3}, "Test", "PASS"
+    )
+    browser._playwright_state._close_scope.assert_called_once()
+    assert browser._playwright_state._close_scope.call_args.args[0] == "s1-t1"
+    assert browser._execution_stack == []
+
+
+def test_auto_closing_without_process_does_not_start_it():
+    browser = Browser()
+    browser._playwright_state = MagicMock()
+    browser._execution_stack.append("s1")
+    browser.execute_auto_closing("Suite", {}, "Suite", "FAIL")
+    browser._playwright_state._close_scope.assert_not_called()
+    assert browser._execution_stack == []
+
+
+def test_close_contexts_streams_one_request(library, stub, monkeypatch):
+    monkeypatch.setenv("ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY", "2")
+    library.outputdir = "/out"
+    stub.CloseContexts.return_value = iter(
+        [
+            Response.ClosedContext(
+                id="context=1",
+                traceFile="/out/trace.zip",
+                videos=["/out/video/1.webm"],
+            ),
+            Response.ClosedContext(id="context=2", error="Target closed"),
+        ]
+    )
+    state = PlaywrightState(library)
+    with pytest.raises(AssertionError, match="context=2: Target closed"):
+        state._close_pw_context([{"id": "context=1"}, {"id": "context=2"}])
+    request = stub.CloseContexts.call_args.args[0]
+    assert list(request.ids) == ["context=1", "context=2"]
+    assert request.saveTrace
+    assert request.concurrency == 2  # noqa: PLR2004
+    library._context_cache.remove.assert_any_call("context=2")
+
+
+def test_close_contexts_timeout_covers_every_round(library, stub, monkeypatch):
+    monkeypatch.setenv("ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY", "2")
+    stub.CloseContexts.return_value = iter([])
+    state = PlaywrightState(library)
+    state._close_pw_context([{"id": f"context={n}"} for n in range(5)])
+    assert stub.CloseContexts.call_args.kwargs["timeout"] == state.timeout * 2 * 3
+
+
+@pytest.mark.parametrize(("value", "expected"), [("", 0), ("3", 3), ("x", 0)])
+def test_close_concurrency(value, expected, monkeypatch):
+    monkeypatch.setenv("ROBOT_FRAMEWORK_BROWSER_CLOSE_CONCURRENCY", value)
+    assert close_concurrency() == expected
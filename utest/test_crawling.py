@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from Browser.keywords.crawling import Crawling
+
+SITE = {
+    "http://site/": ["http://site/a", "http://site/b", "http://other/"],
+    "http://site/a": ["http://site/", "http://site/b", "http://site/c"],
+    "http://site/b": ["http://site/a"],
+    "http://site/c": [],
+}
+
+
+@pytest.fixture
+def library():
+    library = MagicMock()
+    library.get_page_ids.return_value = ["page=1"]
+    library.new_page.side_effect = [{"page_id": "page=2"}, {"page_id": "page=3"}]
+    pages: dict[str, str] = {}
+
+    def go_to(href, wait_until):
+        pages[library.switch_page.call_args.args[0]] = href
+
+    def gather_links(*args, **kwargs):
+        return SITE[pages[library.switch_page.call_args.args[0]]]
+
+    library.go_to.side_effect = go_to
+    library.evaluate_javascript.side_effect = gather_links
+    return library
+
+
+@pytest.fixture(autouse=True)
+def builtin():
+    with patch("Browser.keywords.crawling.BuiltIn") as builtin:
+        yield builtin
+
+
+def test_links_are_gathered_with_one_call_per_page(library):
+    crawled = Crawling(library)._crawl("http://site/", "kw", 100, 10)
+    assert crawled == [
+        "http://site/",
+        "http://site/a",
+        "http://site/b",
+        "http://site/c",
+    ]
+    assert library.evaluate_javascript.call_count == len(crawled)
+    library.new_page.assert_not_called()
+
+
+def test_pages_load_concurrently(library):
+    crawled = Crawling(library)._crawl("http://site/", "kw", 100, 10, 3)
+    assert sorted(crawled) == sorted(SITE)
+    assert library.new_page.call_count == 2  # noqa: PLR2004
+    closed = [call.args[0] for call in library.close_page.call_args_list]
+    assert closed == ["page=2", "page=3"]
+    assert library.switch_page.call_args.args[0] == "page=1"
+
+
+def test_limits_are_kept(library):
+    assert Crawling(library)._crawl("http://site/", "kw", 2, 10, 3) == [
+        "http://site/",
+        "http://site/a",
+    ]
+    assert Crawling(library)._crawl("http://site/", "kw", 100, 0) == ["http://site/"]
+
+
+def test_failing_page_is_skipped(library):
+    library.wait_for_load_state.side_effect = [None, AssertionError("Failed"), None]
+    crawled = Crawling(library)._crawl("http://site/", "kw", 100, 1)
+    assert crawled == ["http://site/", "http://site/b"]
@@ -0,0 +1,21 @@
+import json
+from unittest.mock import MagicMock
+
+from Browser import Browser
+from Browser.base import LibraryComponent
+from Browser.utils import SPILL_THRESHOLD_BYTES
+
+
+def test_generated_keyword_sends_values_positionally(ctx, stub):
+    ctx.streamed_body_memory_limit = SPILL_THRESHOLD_BYTES
+    stub.CallExtensionKeyword.return_value = [
+        MagicMock(log="ok", bodyPart="", json='"done"')
+    ]
+    component = LibraryComponent(ctx)
+    Browser()._jskeyword_call(
+        component, "myKeyword", "page, selector, logger, count=1, args", "Doc."
+    )
+    assert component.myKeyword("id=button", 3, "x", "y") == "done"
+    request = stub.CallExtensionKeyword.call_args.args[0]
+    assert request.name == "myKeyword"
+    assert json.loads(request.positionalArguments) == ["id=button", 3, ["x", "y"]]
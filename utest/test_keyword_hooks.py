@@ -1,11 +1,13 @@
 import json
 from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
 import Browser.keywords.keyword_call as keyword_call_module
 from Browser import Browser
+from Browser.playwright import KEYWORD_CALL_BANNER_METADATA, BannerStub
 
 
 TRANSLATION = {
@@ -339,3 +341,30 @@ def test_plugin_secret_without_any_type_hints_is_found_by_name(
     assert browser_with_plugin._keyword_call.is_secret_keyword(
         "Plugin Login Without Type Hints"
     )
+
+
+def test_unchanged_banner_is_not_sent_again(browser: Browser):
+    playwright = MagicMock()
+    browser._playwright = playwright
+    browser._keyword_call.set_banner("Click    id=button")
+    browser._keyword_call.set_banner("Click    id=button")
+    browser._keyword_call.set_banner()
+    browser._keyword_call.set_banner()
+    sent = [
+        call.args[0] for call in playwright.queue_keyword_call_banner.call_args_list
+    ]
+    assert len(sent) == 2  # noqa: PLR2004
+    assert "content: 'Click    id=button';" in sent[0]
+    assert sent[1] == "body::before{}"
+
+
+def test_banner_goes_as_metadata_of_the_next_call_only():
+    stub = MagicMock()
+    banners = ["body::before{}"]
+    banner_stub = BannerStub(stub, lambda: banners.pop() if banners else None)
+    banner_stub.GetTitle("request")
+    banner_stub.GetUrl("request")
+    assert stub.GetTitle.call_args.kwargs["metadata"] == (
+        (KEYWORD_CALL_BANNER_METADATA, b"body::before{}"),
+    )
+    stub.GetUrl.assert_called_once_with("request")
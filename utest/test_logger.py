@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from Browser.utils import logger
+
+
+@pytest.fixture
+def robot_logger():
+    with patch("Browser.utils.logger.logger") as robot_logger:
+        yield robot_logger
+
+
+@pytest.fixture
+def log_level():
+    with patch("Browser.utils.logger.BuiltIn") as builtin:
+        builtin.return_value.get_variable_value.return_value = "INFO"
+        yield builtin.return_value.get_variable_value
+
+
+def test_lazy_message_is_not_rendered_below_log_level(robot_logger, log_level):
+    render = MagicMock(return_value="catalog")
+    logger.debug(render)
+    render.assert_not_called()
+    robot_logger.write.assert_not_called()
+
+
+def test_lazy_message_is_rendered_on_log_level(robot_logger, log_level):
+    log_level.return_value = "DEBUG"
+    logger.debug(lambda: "catalog")
+    logger.info(lambda: "<b>catalog</b>", True)
+    assert robot_logger.write.call_args_list[0].args == ("catalog", "DEBUG", False)
+    assert robot_logger.write.call_args_list[1].args == ("<b>catalog</b>", "INFO", True)
+
+
+def test_plain_message_does_not_read_log_level(robot_logger, log_level):
+    logger.debug("100% plain")
+    logger.info("<b>plain</b>", True)
+    log_level.assert_not_called()
+    assert [call.args for call in robot_logger.write.call_args_list] == [
+        ("100% plain", "DEBUG", False),
+        ("<b>plain</b>", "INFO", True),
+    ]
+
+
+def test_stash_keeps_messages_unrendered_until_flushed(robot_logger, log_level):
+    render = MagicMock(return_value="late")
+    logger.stash_this_thread()
+    logger.info(render)
+    logger.stash_this_thread()
+    logger.warn("inner")
+    logger.flush_and_delete_thread_stash()
+    render.assert_not_called()
+    robot_logger.write.assert_not_called()
+    logger.flush_and_delete_thread_stash()
+    assert [call.args for call in robot_logger.write.call_args_list] == [
+        ("late", "INFO", False),
+        ("inner", "WARN", False),
+    ]
+
+
+def test_cleared_stash_is_not_logged(robot_logger, log_level):
+    logger.stash_this_thread()
+    logger.info("dropped")
+    logger.clear_thread_stash()
+    logger.flush_and_delete_thread_stash()
+    robot_logger.write.assert_not_called()
+
+
+def test_unknown_level_fails():
+    with pytest.raises(ValueError, match="Unknown log level: NONE"):
+        logger.write("msg", "NONE")  # type: ignore[arg-type]
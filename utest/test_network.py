@@ -1,6 +1,9 @@
 import json
+from unittest.mock import patch
 
-from Browser.keywords.network import _format_response
+from Browser.generated.playwright_pb2 import Response
+from Browser.keywords.network import Network, _decode_body, _format_response
+from Browser.utils import StreamedBody
 
 
 def test_response_parsing_lowercase():
@@ -101,3 +104,35 @@ def testtest_format_response_with_json_byte_body():
     )
     assert response["body"] == b"byte"
     assert response["headers"]["content-type"] == "application/json"
+
+
+def test_decode_body_uses_charset():
+    body = "äö".encode("latin-1")
+    assert _decode_body(body, {"Content-Type": "text/plain; charset=latin-1"}) == "äö"
+
+
+def test_decode_body_defaults_to_utf8():
+    assert _decode_body('{"a": "ä"}'.encode(), {}) == '{"a": "ä"}'
+
+
+def test_decode_body_keeps_binary_content_as_bytes():
+    body = b"\x89PNG\r\n"
+    assert _decode_body(body, {"content-type": "image/png"}) == body
+
+
+def test_decode_body_keeps_undecodable_text_as_bytes():
+    body = b"\xff\xfe"
+    assert _decode_body(body, {"content-type": "text/plain"}) == body
+
+
+def test_response_body_uses_library_memory_limit(ctx):
+    ctx.streamed_body_memory_limit = 4
+    ctx.get_timeout.return_value = 1000
+    stub = ctx.playwright.grpc_channel.return_value.__enter__.return_value
+    stub.WaitForResponse.return_value = iter(
+        [Response.Json(json='{"body": "", "headers": "{}"}', bodyPart='"large"')]
+    )
+    with patch("Browser.keywords.network.StreamedBody", wraps=StreamedBody) as body:
+        response = Network(ctx)._wait_for_http_response("**", None)
+    body.assert_called_once_with(4)
+    assert response["body"] == "large"
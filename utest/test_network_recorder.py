@@ -0,0 +1,121 @@
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+import pytest
+
+from Browser.generated import playwright_pb2_grpc
+from Browser.generated.playwright_pb2 import Response
+from Browser.network_recorder import NetworkRecorder
+
+MAX_BODY_SIZE = 10
+
+
+def _entry(url: str, method: str = "GET", status: int = 200, **extra) -> str:
+    return json.dumps(
+        {
+            "url": url,
+            "method": method,
+            "status": status,
+            "resourceType": "fetch",
+            **extra,
+        }
+    )
+
+
+class RecordingServicer(playwright_pb2_grpc.PlaywrightServicer):
+    def __init__(self):
+        self.messages: queue.SimpleQueue = queue.SimpleQueue()
+        self.stopped = threading.Event()
+        self.requests: list = []
+
+    def RecordNetworkTraffic(self, request, context):  # noqa: N802
+        self.requests.append(request)
+        yield Response.Json(log="started")
+        while context.is_active():
+            try:
+                yield self.messages.get(timeout=0.05)
+            except queue.Empty:
+                if self.stopped.is_set():
+                    return
+
+    def StopNetworkRecording(self, request, context):  # noqa: N802
+        self.stopped.set()
+        return Response.Empty(log="stopped")
+
+
+class FailingServicer(playwright_pb2_grpc.PlaywrightServicer):
+    def RecordNetworkTraffic(self, request, context):  # noqa: N802
+        context.abort(grpc.StatusCode.UNKNOWN, "No context is open")
+
+
+def _serve(servicer):
+    server = grpc.server(ThreadPoolExecutor(max_workers=4))
+    playwright_pb2_grpc.add_PlaywrightServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, grpc.insecure_channel(f"127.0.0.1:{port}")
+
+
+@pytest.fixture
+def servicer():
+    servicer = RecordingServicer()
+    server, channel = _serve(servicer)
+    yield servicer, channel
+    channel.close()
+    server.stop(None)
+
+
+def test_stop_keeps_responses_sent_before_it(servicer):
+    servicer, channel = servicer
+    recorder = NetworkRecorder(channel, "**/api/**", max_body_size=MAX_BODY_SIZE)
+    assert servicer.requests[0].urlOrPredicate == "**/api/**"
+    assert servicer.requests[0].maxBodySize == MAX_BODY_SIZE
+    servicer.messages.put(Response.Json(json=_entry("http://x/api/a", bodySize=4)))
+    servicer.messages.put(Response.Json(bodyPart='{"a"'))
+    servicer.messages.put(Response.Json(json=_entry("http://x/api/b", bodySize=20)))
+    recorder.stop()
+    assert not recorder.alive
+    assert [(e["url"], e["body"]) for e in recorder.entries()] == [
+        ("http://x/api/a", '{"a"'),
+        ("http://x/api/b", None),
+    ]
+
+
+def test_entries_are_filtered(servicer):
+    servicer, channel = servicer
+    recorder = NetworkRecorder(channel)
+    servicer.messages.put(Response.Json(json=_entry("http://x/api/a")))
+    servicer.messages.put(Response.Json(json=_entry("http://x/api/b", "POST", 500)))
+    servicer.messages.put(Response.Json(json=_entry("http://x/page")))
+    recorder.stop()
+    assert [e["url"] for e in recorder.entries()][-1] == "http://x/page"
+    assert [e["url"] for e in recorder.entries(url="/api/")] == [
+        "http://x/api/a",
+        "http://x/api/b",
+    ]
+    assert [e["url"] for e in recorder.entries(method="post")] == ["http://x/api/b"]
+    assert recorder.entries(status=500, resource_type="fetch")[0]["method"] == "POST"
+    assert "body" not in recorder.entries()[0]
+
+
+def test_oldest_entries_are_dropped(servicer):
+    servicer, channel = servicer
+    recorder = NetworkRecorder(channel, max_entries=2)
+    for name in "abc":
+        servicer.messages.put(Response.Json(json=_entry(f"http://x/{name}")))
+    recorder.stop()
+    assert [e["url"] for e in recorder.entries()] == ["http://x/b", "http://x/c"]
+    assert recorder.dropped == 1
+
+
+def test_start_failure_is_raised():
+    server, channel = _serve(FailingServicer())
+    try:
+        with pytest.raises(AssertionError, match="No context is open"):
+            NetworkRecorder(channel)
+    finally:
+        channel.close()
+        server.stop(None)
@@ -0,0 +1,54 @@
+import gzip
+import hashlib
+
+import pytest
+
+from Browser.generated.playwright_pb2 import Response
+from Browser.keywords import Getters
+
+SOURCE = "<html><body>" + "äö" * 10 + "</body></html>"
+
+
+def chunked(data: bytes, size: int = 7):
+    return [Response.Bytes(body=data[i : i + size]) for i in range(0, len(data), size)]
+
+
+@pytest.fixture
+def stub(stub):
+    stub.GetPageSourceBytes.side_effect = lambda request: iter(
+        chunked(
+            gzip.compress(SOURCE.encode())
+            if request.compression == "gzip"
+            else SOURCE.encode()
+        )
+    )
+    return stub
+
+
+@pytest.fixture
+def getters(ctx, stub):
+    ctx.presenter_mode = False
+    ctx._get_assertion_formatter.return_value = []
+    return Getters(ctx)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_source_is_decoded_across_chunks(getters, stub, compress):
+    assert getters.get_page_source(compress=compress) == SOURCE
+    request = stub.GetPageSourceBytes.call_args.args[0]
+    assert request.compression == ("gzip" if compress else "")
+
+
+def test_truncated_source(getters):
+    assert getters.get_page_source(max_length=14) == SOURCE[:14]
+
+
+def test_hashed_source(getters):
+    expected = hashlib.sha256(SOURCE.encode()).hexdigest()
+    assert getters.get_page_source(hash_algorithm="sha256", compress=True) == expected
+
+
+def test_source_is_written_to_file(getters, tmp_path):
+    path = tmp_path / "page.html"
+    assert getters.get_page_source(file_path=path) == str(path)
+    assert path.read_text(encoding="utf-8") == SOURCE
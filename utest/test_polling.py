@@ -0,0 +1,60 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from Browser.polling import MAX_BACKOFF, MAX_CHANGE_WAIT, Poller
+from Browser.utils import PollingStrategy
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_fixed_waits_ten_milliseconds(sleeps):
+    poller = Poller(PollingStrategy.fixed, MagicMock())
+    poller.wait(5)
+    poller.wait(0.004)
+    poller.wait(0)
+    assert sleeps == [0.01, 0.004]
+    assert poller.wakeups == 2  # noqa: PLR2004
+
+
+def test_backoff_doubles_up_to_cap(sleeps):
+    poller = Poller(PollingStrategy.backoff)
+    for _ in range(8):
+        poller.wait(60)
+    assert sleeps == [0.01, 0.02, 0.04, 0.08, 0.16, 0.32, MAX_BACKOFF, MAX_BACKOFF]
+
+
+def test_mutation_waits_for_change_on_page(sleeps):
+    wait_for_change = MagicMock(side_effect=[True, False])
+    poller = Poller(PollingStrategy.mutation, wait_for_change)
+    poller.wait(10)
+    poller.wait(0.2)
+    assert wait_for_change.call_args_list[0].args == ("mutation", MAX_CHANGE_WAIT)
+    assert wait_for_change.call_args_list[1].args == ("mutation", 0.2)
+    assert poller.change_wakeups == 1
+    assert sleeps == []
+
+
+def test_change_wait_failing_falls_back_to_sleep(sleeps):
+    poller = Poller(
+        PollingStrategy.network_idle, MagicMock(side_effect=AssertionError("No page"))
+    )
+    poller.wait(10)
+    assert sleeps == [0.01]
+
+
+def test_failed_tries_after_wakeup_are_wasted(sleeps):
+    poller = Poller(PollingStrategy.fixed)
+    poller.record(passed=False)
+    poller.wait(1)
+    poller.record(passed=False)
+    poller.wait(1)
+    poller.record(passed=True)
+    assert (poller.tries, poller.wasted_wakeups) == (3, 1)
+    assert "Wasted wakeups: 1" in poller.statistics()
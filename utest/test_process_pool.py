@@ -0,0 +1,94 @@
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from Browser.playwright import Playwright
+from Browser.process_pool import (
+    LEASED,
+    POOL_ENV,
+    READY,
+    ProcessPool,
+    lease_process,
+)
+
+
+def _add_ready(directory, process_id, port=1234):
+    record = {
+        "host": "127.0.0.1",
+        "port": str(port),
+        "peer": f"pool-{process_id}",
+        "browsers": {"42": "browser=1"},
+    }
+    (directory / READY / f"{process_id}.json").write_text(json.dumps(record))
+
+
+@pytest.fixture
+def pool(tmp_path):
+    return ProcessPool(tmp_path, size=2)
+
+
+def test_lease_takes_each_process_once(pool, tmp_path):
+    _add_ready(tmp_path, "a", 1111)
+    _add_ready(tmp_path, "b", 2222)
+    first = lease_process(tmp_path)
+    second = lease_process(tmp_path)
+    assert {first.port, second.port} == {"1111", "2222"}
+    assert lease_process(tmp_path) is None
+    assert first.path.name == f"a.{os.getpid()}.json"
+    assert first.path.parent == tmp_path / LEASED
+    assert first.browsers == {42: "browser=1"}
+
+
+def test_broken_record_is_released_and_skipped(pool, tmp_path):
+    (tmp_path / READY / "a.json").write_text("{not json")
+    _add_ready(tmp_path, "b", 2222)
+    lease = lease_process(tmp_path)
+    assert lease.port == "2222"
+    assert not pool._leases("a")
+
+
+def test_release_removes_lease(pool, tmp_path):
+    _add_ready(tmp_path, "a")
+    lease = lease_process(tmp_path)
+    lease.release()
+    assert not lease.path.exists()
+    lease.release()
+
+
+def test_released_or_orphaned_processes_are_not_in_use(pool, tmp_path):
+    _add_ready(tmp_path, "ready")
+    assert pool._is_in_use("ready")
+    _add_ready(tmp_path, "leased")
+    lease = lease_process(tmp_path)
+    assert pool._is_in_use(lease.path.name.split(".")[0])
+    lease.path.rename(lease.path.with_name("leased.999999999.json"))
+    assert not pool._is_in_use("leased")
+    assert not pool._is_in_use("released")
+
+
+def test_reap_stops_released_processes(pool, tmp_path, monkeypatch):
+    library = MagicMock()
+    library.playwright.__dict__["_playwright_process"] = MagicMock(
+        poll=MagicMock(return_value=None)
+    )
+    pool.processes["released"] = library
+    pool.reap()
+    assert pool.processes == {}
+    library.playwright.close.assert_called_once()
+
+
+def test_playwright_leases_from_pool(tmp_path, monkeypatch):
+    ProcessPool(tmp_path, size=1)
+    _add_ready(tmp_path, "a", 3333)
+    monkeypatch.setenv(POOL_ENV, str(tmp_path))
+    monkeypatch.delenv("ROBOT_FRAMEWORK_BROWSER_NODE_PORT", raising=False)
+    playwright = object.__new__(Playwright)
+    playwright.host = None
+    playwright.port = None
+    assert playwright.start_playwright() is None
+    assert playwright.port == "3333"
+    assert playwright._pool_lease.peer == "pool-a"
+    playwright._release_pool_lease()
+    assert not list((tmp_path / LEASED).iterdir())
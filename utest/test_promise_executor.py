@@ -0,0 +1,72 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from Browser.playwright import DeadlineStub
+from Browser.promise_executor import PromiseExecutor, promise_deadline
+
+
+def test_statistics_count_finished_promises():
+    executor = PromiseExecutor(max_workers=2)
+    executor.submit(lambda: "ok").result()
+    failing = executor.submit(lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        failing.result()
+    statistics = executor.statistics()
+    assert statistics["completed"] == 1
+    assert statistics["failed"] == 1
+    assert statistics["queued"] == statistics["running"] == 0
+
+
+def test_promise_sees_its_deadline_only_while_running():
+    executor = PromiseExecutor()
+    before = time.monotonic()
+    deadline = executor.submit(promise_deadline, timeout=5).result()
+    assert before + 5 <= deadline <= time.monotonic() + 5
+    assert executor.submit(promise_deadline).result() is None
+    assert promise_deadline() is None
+
+
+def test_queued_promise_past_its_deadline_is_cancelled():
+    executor = PromiseExecutor(max_workers=1)
+    release = threading.Event()
+    blocking = executor.submit(release.wait)
+    late = executor.submit(lambda: "never", timeout=0.01)
+    assert executor.statistics()["queued"] == 1
+    time.sleep(0.05)
+    release.set()
+    blocking.result()
+    with pytest.raises(TimeoutError):
+        late.result()
+    assert executor.statistics()["cancelled"] == 1
+
+
+def test_cancelled_future_is_counted():
+    executor = PromiseExecutor(max_workers=1)
+    release = threading.Event()
+    executor.submit(release.wait)
+    queued = executor.submit(lambda: "never")
+    assert queued.cancel()
+    release.set()
+    statistics = executor.statistics()
+    assert statistics["cancelled"] == 1
+    assert statistics["queued"] == 0
+
+
+def test_deadline_stub_passes_time_left_as_grpc_timeout():
+    stub = MagicMock()
+    DeadlineStub(stub, time.monotonic() + 2).WaitForResponse("request")
+    timeout = stub.WaitForResponse.call_args.kwargs["timeout"]
+    assert 0 < timeout <= 2  # noqa: PLR2004
+    DeadlineStub(stub, time.monotonic() - 1).WaitForRequest("request")
+    assert stub.WaitForRequest.call_args.kwargs["timeout"] == 0
+
+
+def test_deadline_stub_keeps_the_shorter_of_passed_timeout_and_time_left():
+    stub = MagicMock()
+    DeadlineStub(stub, time.monotonic() + 60).CloseBrowser("request", timeout=3)
+    assert stub.CloseBrowser.call_args.kwargs["timeout"] == 3  # noqa: PLR2004
+    DeadlineStub(stub, time.monotonic() + 2).CloseBrowser("request", timeout=30)
+    assert stub.CloseBrowser.call_args.kwargs["timeout"] <= 2  # noqa: PLR2004
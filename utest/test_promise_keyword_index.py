@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from Browser.keywords.promises import Promises
+
+
+def click(selector: str, clickCount: int = 1):
+    return selector, clickCount
+
+
+@pytest.fixture
+def library():
+    library = MagicMock()
+    library.promise_timeout = None
+    library.keywords = {"click": click, "wait_for_elements_state": MagicMock()}
+    library.get_keyword_names.side_effect = lambda: sorted(library.keywords)
+    library.get_keyword_arguments.return_value = ["selector", ("clickCount", 1)]
+    library.get_keyword_types.return_value = {"selector": str, "clickCount": int}
+    return library
+
+
+def test_keyword_names_are_normalized_once(library):
+    promises = Promises(library)
+    assert promises.get_known_keyword("Wait For Elements State") == (
+        "wait_for_elements_state"
+    )
+    assert promises.get_known_keyword("Click") == "click"
+    assert promises.get_known_keyword("Unknown") == ""
+    library.get_keyword_names.assert_called_once()
+
+
+def test_index_is_rebuilt_when_keywords_are_added(library):
+    promises = Promises(library)
+    assert promises.get_known_keyword("My Extension Keyword") == ""
+    library.keywords["my_extension_keyword"] = MagicMock()
+    assert promises.get_known_keyword("My Extension Keyword") == (
+        "my_extension_keyword"
+    )
+
+
+def test_argument_types_are_looked_up_once_per_keyword(library):
+    promises = Promises(library)
+    assert promises.resolve_arguments("click", "id=button", "clickCount=2") == (
+        ("id=button",),
+        {"clickCount": 2},
+    )
+    assert promises.resolve_arguments("click", "id=other", "3") == (
+        ("id=other", 3),
+        {},
+    )
+    library.get_keyword_arguments.assert_called_once_with("click")
+    library.get_keyword_types.assert_called_once_with("click")
+
+
+def test_promise_is_running_when_returned(library):
+    promises = Promises(library)
+    promises.unresolved_promises = set()
+    promise = promises.promise_to("Click", "id=button", "clickCount=2")
+    assert promise.running() or promise.done()
+    assert promises.wait_for(promise) == ("id=button", 2)
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from Browser.generated.playwright_pb2 import Response
+from Browser.keywords.routing import Routing, _route_body
+from Browser.utils.data_types import RouteAction
+
+
+@pytest.fixture
+def routing(ctx, stub):
+    stub.AddRoute.return_value = Response.String(log="added", body="route-1")
+    return Routing(ctx)
+
+
+def test_dict_body_is_sent_as_json():
+    headers: dict = {}
+    assert _route_body({"a": 1}, None, headers) == b'{"a": 1}'
+    assert headers == {"Content-Type": "application/json"}
+
+
+def test_file_body_gets_content_type_of_its_extension(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"\x89PNG")
+    headers: dict = {}
+    assert _route_body(None, path, headers) == b"\x89PNG"
+    assert headers == {"Content-Type": "image/png"}
+
+
+def test_given_content_type_is_kept():
+    headers = {"content-type": "text/plain"}
+    assert _route_body(["x"], None, headers) == b'["x"]'
+    assert headers == {"content-type": "text/plain"}
+
+
+def test_fulfill_route(routing, stub):
+    route_id = routing.add_route("**/api/**", body="OK", status=201, times=2)
+    assert route_id == "route-1"
+    request = stub.AddRoute.call_args.args[0]
+    assert request.urlOrPredicate == "**/api/**"
+    assert request.action == "fulfill"
+    assert request.body == b"OK"
+    assert request.status == 201  # noqa: PLR2004
+    assert request.times == 2  # noqa: PLR2004
+    assert request.headers == ""
+
+
+def test_continue_route_sends_headers_without_body(routing, stub):
+    routing.add_route("**/*", RouteAction.continue_, body="x", headers={"X-A": "1"})
+    request = stub.AddRoute.call_args.args[0]
+    assert request.action == "continue"
+    assert request.body == b""
+    assert json.loads(request.headers) == {"X-A": "1"}
+
+
+def test_har_route_needs_path(routing, stub, tmp_path):
+    with pytest.raises(ValueError, match="HAR file"):
+        routing.add_route("**/*", RouteAction.har)
+    routing.add_route("**/*", RouteAction.har, path=tmp_path / "a.har")
+    request = stub.AddRoute.call_args.args[0]
+    assert request.path == str((tmp_path / "a.har").resolve())
+    assert request.notFound == "abort"
+
+
+def test_get_routes(routing, stub):
+    stub.GetRoutes.return_value = Response.Json(
+        log="", json=json.dumps([{"id": "route-1", "hits": 3}])
+    )
+    assert routing.get_routes()[0].hits == 3  # noqa: PLR2004
@@ -0,0 +1,95 @@
+import base64
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from Browser.generated.playwright_pb2 import Response
+from Browser.keywords import Control
+from Browser.utils.data_types import ScreenshotReturnType
+
+
+@pytest.fixture
+def stub(stub):
+    stub.TakeScreenshotBytes.side_effect = lambda request: iter(
+        [Response.Bytes(log="1/2", body=b"ima"), Response.Bytes(log="2/2", body=b"ge")]
+    )
+    return stub
+
+
+@pytest.fixture
+def control(ctx, stub, tmp_path):
+    ctx.outputdir = str(tmp_path)
+    ctx.scope_stack = {
+        "timeout": MagicMock(get=MagicMock(return_value=10000)),
+        "strict_mode": MagicMock(get=MagicMock(return_value=True)),
+        "selector_prefix": MagicMock(get=MagicMock(return_value=None)),
+    }
+    control = Control(ctx)
+    control._get_screenshot_path = MagicMock()  # type: ignore[method-assign]
+    control._embed_to_log = MagicMock()  # type: ignore[method-assign]
+    return control
+
+
+def test_embedded_screenshot_is_not_saved(control, stub):
+    assert control.take_screenshot("EMBED") == "EMBED"
+    control._embed_to_log.assert_called_once_with(base64.b64encode(b"image"))
+    stub.TakeScreenshot.assert_not_called()
+    control._get_screenshot_path.assert_not_called()
+    options = json.loads(stub.TakeScreenshotBytes.call_args.args[0].options)
+    assert "path" not in options
+
+
+@pytest.mark.parametrize(
+    ("return_as", "expected"),
+    [
+        (ScreenshotReturnType.bytes, b"image"),
+        (ScreenshotReturnType.base64, base64.b64encode(b"image").decode()),
+    ],
+)
+def test_screenshot_data_is_streamed(control, stub, return_as, expected):
+    result = control.take_screenshot("shot", log_screenshot=False, return_as=return_as)
+    assert result == expected
+    stub.TakeScreenshot.assert_not_called()
+
+
+def test_logged_screenshot_is_saved(control, stub, tmp_path):
+    path = tmp_path / "shot.png"
+    path.write_bytes(b"image")
+    control._get_screenshot_path.return_value = tmp_path / "shot"
+    stub.TakeScreenshot.return_value = Response.String(body=str(path))
+    control._log_image_link = MagicMock()
+    assert control.take_screenshot("shot", return_as=ScreenshotReturnType.bytes) == (
+        b"image"
+    )
+    stub.TakeScreenshotBytes.assert_not_called()
+    assert path.exists()
+
+
+def test_queued_screenshot_is_logged_when_drained(control, stub, tmp_path):
+    control._get_screenshot_path.return_value = tmp_path / "fail.v1"
+    control._log_image_link = MagicMock()
+    with control.screenshots_in_background(True):
+        assert control.take_screenshot("fail.v{index}") is None
+    assert not control._in_background
+    control._log_image_link.assert_not_called()
+    control._log_queued_screenshots()
+    control._log_image_link.assert_called_once_with(str(tmp_path / "fail.v1.png"))
+    assert (tmp_path / "fail.v1.png").read_bytes() == b"image"
+    assert not control._reserved_screenshot_paths
+
+
+def test_queued_screenshots_are_embedded_in_order(control, stub):
+    stub.TakeScreenshotBytes.side_effect = [
+        iter([Response.Bytes(body=b"first")]),
+        iter([Response.Bytes(body=b"second")]),
+    ]
+    with control.screenshots_in_background(True):
+        control.take_screenshot("EMBED")
+        control.take_screenshot("EMBED")
+    control._log_queued_screenshots()
+    assert [call.args[0] for call in control._embed_to_log.call_args_list] == [
+        base64.b64encode(b"first"),
+        base64.b64encode(b"second"),
+    ]
+    control._get_screenshot_path.assert_not_called()
@@ -0,0 +1,136 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+import pytest
+
+from Browser.generated import playwright_pb2_grpc
+from Browser.generated.playwright_pb2 import Request, Response
+from Browser.playwright import Playwright
+from Browser.session_stream import (
+    SESSION_STREAM_ENV,
+    SessionRpcError,
+    SessionStream,
+    SessionStub,
+)
+
+CALLS = 300
+
+
+class LoopbackServicer(playwright_pb2_grpc.PlaywrightServicer):
+    """Answers Health directly and over the session stream, like the node side does."""
+
+    def Health(self, request, context):  # noqa: N802
+        return Response.String(body="OK")
+
+    def Session(self, request_iterator, context):  # noqa: N802
+        for envelope in request_iterator:
+            if envelope.method == "Health":
+                yield Response.Envelope(
+                    id=envelope.id,
+                    response=Response.String(body="OK").SerializeToString(),
+                )
+            else:
+                yield Response.Envelope(
+                    id=envelope.id,
+                    code=grpc.StatusCode.RESOURCE_EXHAUSTED.value[0],
+                    error=f"Error: {envelope.method} failed",
+                )
+
+
+@pytest.fixture(scope="module")
+def server_port():
+    server = grpc.server(ThreadPoolExecutor(max_workers=4))
+    playwright_pb2_grpc.add_PlaywrightServicer_to_server(LoopbackServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    yield port
+    server.stop(None)
+
+
+@pytest.fixture
+def channel(server_port):
+    with grpc.insecure_channel(f"127.0.0.1:{server_port}") as channel:
+        yield channel
+
+
+@pytest.fixture
+def session(channel):
+    session = SessionStream(channel)
+    yield session
+    session.close()
+
+
+def test_unary_call_over_session(channel, session):
+    stub = SessionStub(session, playwright_pb2_grpc.PlaywrightStub(channel))
+    assert stub.Health(Request.Empty()).body == "OK"
+
+
+def test_error_keeps_status_code_and_details(channel, session):
+    stub = SessionStub(session, playwright_pb2_grpc.PlaywrightStub(channel))
+    with pytest.raises(SessionRpcError) as error:
+        stub.GetTitle(Request.Empty())
+    assert error.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    assert error.value.details() == "Error: GetTitle failed"
+
+
+def test_calls_from_many_threads_get_their_own_response(channel, session):
+    stub = SessionStub(session, playwright_pb2_grpc.PlaywrightStub(channel))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        bodies = list(
+            executor.map(lambda _: stub.Health(Request.Empty()).body, range(50))
+        )
+    assert bodies == ["OK"] * 50
+
+
+def test_call_after_close_fails(session):
+    session.close()
+    with pytest.raises(SessionRpcError) as error:
+        session.call("Health", Request.Empty())
+    assert error.value.code() == grpc.StatusCode.UNAVAILABLE
+
+
+def test_playwright_uses_session_when_enabled(server_port, monkeypatch):
+    monkeypatch.setenv(SESSION_STREAM_ENV, "1")
+    playwright = object.__new__(Playwright)
+    playwright.host = "127.0.0.1"
+    playwright.port = str(server_port)
+    playwright.__dict__["_playwright_process"] = None
+    with playwright.grpc_channel() as stub:
+        assert isinstance(stub, SessionStub)
+        assert stub.Health(Request.Empty()).body == "OK"
+    with (
+        pytest.raises(AssertionError, match="Error: GetUrl failed"),
+        playwright.grpc_channel() as stub,
+    ):
+        stub.GetUrl(Request.Empty())
+    playwright._session.close()
+    playwright._channel.close()
+
+
+def _latencies(call) -> list[float]:
+    for _ in range(20):
+        call()
+    latencies = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(name: str, latencies: list[float]) -> str:
+    percentiles = statistics.quantiles(latencies, n=100)
+    return f"{name}: p50 {percentiles[49]:.3f} ms, p99 {percentiles[98]:.3f} ms"
+
+
+def test_latency_of_unary_and_session_calls(channel, session):
+    """Micro benchmark over loopback, run with ``-s`` to see the numbers."""
+    unary = playwright_pb2_grpc.PlaywrightStub(channel)
+    streamed = SessionStub(session, unary)
+    unary_latencies = _latencies(lambda: unary.Health(Request.Empty()))
+    session_latencies = _latencies(lambda: streamed.Health(Request.Empty()))
+    print(f"\n{_report('unary  ', unary_latencies)}")  # noqa: T201
+    print(_report("session", session_latencies))  # noqa: T201
+    assert len(session_latencies) == len(unary_latencies) == CALLS
@@ -23,7 +23,7 @@ def test_shared_playwright_port():
     assert browser.playwright.port
     port: str = browser.playwright.port
 
-    browser2 = Browser.Browser(playwright_process_port=int(port))
+    browser2 = Browser.Browser(playwright_process_port=port)
     browser2.new_context()
     assert browser.playwright.port == browser2.playwright.port
 
@@ -44,7 +44,7 @@ def test_forcibly_same_peer_id():
     assert browser.playwright.port
     port: str = browser.playwright.port
 
-    browser2 = Browser.Browser(playwright_process_port=int(port))
+    browser2 = Browser.Browser(playwright_process_port=port)
     browser2.set_peer_id("new_id")
     browser2.new_page("https://google.com")
 
@@ -65,7 +65,7 @@ def test_forcefully_different_peer_id():
     assert browser.playwright.port
     port: str = browser.playwright.port
 
-    browser2 = Browser.Browser(playwright_process_port=int(port))
+    browser2 = Browser.Browser(playwright_process_port=port)
     assert browser.playwright.port == browser2.playwright.port
     assert browser.get_browser_catalog() == browser2.get_browser_catalog()
     old_id = browser2.set_peer_id("different")
@@ -0,0 +1,86 @@
+import contextlib
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from Browser.playwright import spawn_wrapper_process, wait_for_readiness
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Readiness pipe is not used on Windows"
+)
+
+FAKE_WRAPPER = """
+import os, sys, time
+fd = int(os.environ["ROBOT_FRAMEWORK_BROWSER_READY_FD"])
+os.write(fd, sys.argv[2].encode())
+os.close(fd)
+time.sleep(5)
+"""
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    for fd in (read_fd, write_fd):
+        with contextlib.suppress(OSError):
+            os.close(fd)
+
+
+def test_ready_message_returns(pipe):
+    read_fd, write_fd = pipe
+    os.write(write_fd, b"ready\n")
+    wait_for_readiness(read_fd, MagicMock())
+
+
+def test_error_message_raises(pipe):
+    read_fd, write_fd = pipe
+    os.write(write_fd, b"error No address added out of total 1 resolved\n")
+    with pytest.raises(RuntimeError, match="No address added"):
+        wait_for_readiness(read_fd, MagicMock())
+
+
+def test_silent_process_is_left_to_health_polling(pipe):
+    read_fd, _ = pipe
+    started = time.perf_counter()
+    wait_for_readiness(read_fd, MagicMock(), timeout=0.05)
+    assert time.perf_counter() - started < 1
+
+
+def test_closed_pipe_is_left_to_health_polling(pipe):
+    read_fd, write_fd = pipe
+    os.close(write_fd)
+    wait_for_readiness(read_fd, MagicMock())
+
+
+def _spawn(tmp_path, message):
+    script = tmp_path / "index.py"
+    script.write_text(FAKE_WRAPPER)
+    with (tmp_path / "log.txt").open("w") as logfile:
+        return spawn_wrapper_process(
+            node_executable=sys.executable,
+            script=script,
+            cwd=tmp_path,
+            logfile=logfile,
+            host="127.0.0.1",
+            port=message,
+            enable_playwright_debug=False,
+        )
+
+
+def test_spawn_returns_once_process_is_ready(tmp_path):
+    process = _spawn(tmp_path, "ready")
+    try:
+        assert process.poll() is None
+        assert "ROBOT_FRAMEWORK_BROWSER_READY_FD" not in os.environ
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_spawn_closes_process_failing_to_bind(tmp_path):
+    with pytest.raises(RuntimeError, match="failed to start: port in use"):
+        _spawn(tmp_path, "error port in use")
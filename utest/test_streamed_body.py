@@ -0,0 +1,52 @@
+import json
+from contextlib import closing
+from types import SimpleNamespace
+
+import pytest
+
+from Browser.utils.streaming import StreamedBody
+
+
+def test_joins_text_and_byte_chunks():
+    with closing(StreamedBody()) as body:
+        body.write("ä")
+        body.write(b'{"a": 1}')
+        assert body.size == len("ä".encode()) + 8
+        assert body.text() == 'ä{"a": 1}'
+
+
+def test_parses_json_body():
+    with closing(StreamedBody()) as body:
+        for chunk in ['{"items": [', "1, 2", "]}"]:
+            body.write(chunk)
+        assert body.json() == {"items": [1, 2]}
+
+
+def test_invalid_json_raises_and_text_is_still_readable():
+    with closing(StreamedBody()) as body:
+        body.write("not json")
+        with pytest.raises(json.JSONDecodeError):
+            body.json()
+        assert body.text() == "not json"
+
+
+def test_spills_to_file_over_threshold():
+    with closing(StreamedBody(spill_threshold=4)) as body:
+        body.write(b"12")
+        assert not body._buffer._rolled
+        body.write(b"345")
+        assert body._buffer._rolled
+        assert body.bytes() == b"12345"
+
+
+def test_read_responses_logs_and_returns_last_response():
+    responses = [
+        SimpleNamespace(log="first", bodyPart='"a', json=""),
+        SimpleNamespace(log="last", bodyPart='b"', json="{}"),
+    ]
+    logged = []
+    with closing(StreamedBody()) as body:
+        last = body.read_responses(responses, "bodyPart", logged.append)
+        assert last is responses[-1]
+        assert logged == ["first", "last"]
+        assert body.json() == "ab"
@@ -0,0 +1,106 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import grpc
+import pytest
+
+from Browser.generated import playwright_pb2_grpc
+from Browser.generated.playwright_pb2 import Request, Response
+from Browser.playwright import (
+    MAX_UNIX_SOCKET_PATH,
+    PEER_ID_METADATA,
+    Playwright,
+    unix_socket_path,
+    use_unix_socket,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix sockets are not used on Windows"
+)
+
+
+class HealthServicer(playwright_pb2_grpc.PlaywrightServicer):
+    def __init__(self):
+        self.peers = []
+
+    def Health(self, request, context):  # noqa: N802
+        self.peers.append(dict(context.invocation_metadata()).get(PEER_ID_METADATA))
+        return Response.String(body="OK")
+
+
+def _playwright(host, port):
+    playwright = object.__new__(Playwright)
+    playwright.host = host
+    playwright.port = port
+    return playwright
+
+
+@pytest.mark.parametrize(
+    ("host", "expected"),
+    [
+        (None, True),
+        ("127.0.0.1", True),
+        ("localhost", True),
+        ("::1", True),
+        ("0.0.0.0", False),
+        ("[::]", False),
+        ("192.0.2.10", False),
+    ],
+)
+def test_unix_socket_only_for_loopback(host, expected):
+    assert use_unix_socket(host) is expected
+
+
+def test_target_is_host_and_port_or_socket():
+    assert _playwright("127.0.0.1", "1234").target == "127.0.0.1:1234"
+    assert _playwright("127.0.0.1", "unix:/tmp/a.sock").target == "unix:/tmp/a.sock"
+
+
+def test_socket_path_is_under_given_directory(tmp_path):
+    path = unix_socket_path(tmp_path / "browser")
+    assert path.parent == (tmp_path / "browser").resolve()
+    assert path.parent.is_dir()
+    assert path.suffix == ".sock"
+
+
+def test_too_long_socket_path_falls_back_to_temp_dir(tmp_path):
+    path = unix_socket_path(tmp_path / ("x" * MAX_UNIX_SOCKET_PATH))
+    assert len(str(path)) <= MAX_UNIX_SOCKET_PATH
+    assert path.parent.name.startswith("rfbrowser-")
+    path.parent.rmdir()
+
+
+def test_started_process_gets_socket_in_browser_output(tmp_path, monkeypatch):
+    monkeypatch.delenv("ROBOT_FRAMEWORK_BROWSER_NODE_PORT", raising=False)
+    monkeypatch.delenv("ROBOT_FRAMEWORK_BROWSER_POOL", raising=False)
+    monkeypatch.setattr("Browser.playwright.batteries_grpc_server", lambda: None)
+    playwright = _playwright(None, None)
+    playwright.library = MagicMock(browser_output=tmp_path)
+    started = []
+    playwright._start_playwright_from_node = lambda log, host, port: started.append(
+        (host, port)
+    )
+    playwright._get_logfile = lambda: None
+    playwright.start_playwright()
+    assert started == [("127.0.0.1", f"unix:{playwright._unix_socket}")]
+    assert playwright._unix_socket.parent == tmp_path.resolve()
+
+
+def test_channel_connects_over_socket(tmp_path):
+    socket = Path(unix_socket_path(tmp_path))
+    servicer = HealthServicer()
+    server = grpc.server(ThreadPoolExecutor(max_workers=2))
+    playwright_pb2_grpc.add_PlaywrightServicer_to_server(servicer, server)
+    server.add_insecure_port(f"unix:{socket}")
+    server.start()
+    try:
+        playwright = _playwright("127.0.0.1", f"unix:{socket}")
+        with playwright._channel as channel:
+            stub = playwright_pb2_grpc.PlaywrightStub(channel)
+            assert stub.Health(Request.Empty()).body == "OK"
+        assert servicer.peers == [f"unix-{os.getpid()}"]
+    finally:
+        server.stop(None)
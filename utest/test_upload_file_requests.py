@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from Browser.keywords import interaction
+from Browser.keywords.interaction import (
+    _file_path_requests,
+    _streamed_file_requests,
+    _upload_buffer_requests,
+)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(interaction, "UPLOAD_CHUNK_BYTES", 4)
+
+
+def test_local_upload_sends_paths_only():
+    (request,) = _file_path_requests("id=file", True, ["/tmp/a.txt", "/tmp/b.txt"])
+    assert list(request.path) == ["/tmp/a.txt", "/tmp/b.txt"]
+    assert request.content == b""
+
+
+def test_streamed_files_are_sent_in_chunks(tmp_path: Path, small_chunks):
+    first = tmp_path / "first.bin"
+    first.write_bytes(b"0123456789")
+    second = tmp_path / "empty.txt"
+    second.write_bytes(b"")
+    requests = list(
+        _streamed_file_requests("id=file", False, [str(first), str(second)])
+    )
+    assert [(r.fileIndex, r.fileName, r.content) for r in requests] == [
+        (1, "first.bin", b"0123"),
+        (1, "first.bin", b"4567"),
+        (1, "first.bin", b"89"),
+        (2, "empty.txt", b""),
+    ]
+    assert all(not r.path for r in requests)
+
+
+def test_buffer_is_chunked_by_bytes_not_characters(small_chunks):
+    requests = list(
+        _upload_buffer_requests("id=file", True, "a.txt", "text/plain", "äöå")
+    )
+    assert [r.content for r in requests] == [b"\xc3\xa4\xc3\xb6", b"\xc3\xa5"]
+    assert b"".join(r.content for r in requests).decode("utf-8") == "äöå"
+    assert {(r.name, r.mimeType) for r in requests} == {("a.txt", "text/plain")}
+
+
+def test_empty_buffer_is_sent_once():
+    (request,) = _upload_buffer_requests("id=file", True, "a.txt", "text/plain", "")
+    assert request.content == b""